@@ -8,6 +8,7 @@
 
 
 import numpy as np
+import multiprocessing as mp
 import sys, math, time
 from TouchAuxiliary import *
 from helper import *
@@ -46,6 +47,10 @@ colormap=setColorMap(curcolset)
 
 cancel=False
 
+# Mandelbrot: Zeilen je Streifen und Anzahl paralleler Prozesse
+TILEROWS=16
+CPUS=mp.cpu_count()
+
 class FtcGuiApplication(TouchApplication):
     
     def __init__(self, args):
@@ -642,25 +647,59 @@ def mandelbrot_set2(xmin,xmax,ymin,ymax,width,height,maxiter, precision,progress
       r1 = np.linspace(xmin, xmax, width, np.longdouble)
       r2 = np.linspace(ymin, ymax, height, np.longdouble)
     
-    c = r1 + r2[:,None]*1j
-    n3 = mandelbrot_numpy(c,maxiter, precision, progress, e)
+    n3 = mandelbrot_tiled(r1, r2, maxiter, precision, progress, e)
     return (r1,r2,n3.T) 
 
-def mandelbrot_numpy(c, maxiter, precision, progress, e):
-    output = np.zeros(c.shape, int)
+def mandelbrot_tiled(r1, r2, maxiter, precision, progress, e):
+    # das Bild wird in Streifen zu TILEROWS Zeilen zerlegt, die auf
+    # Mehrkernsystemen parallel berechnet werden
+    output = np.zeros((len(r2), len(r1)), int)
+    tiles = [ (row, r1, r2[row:row+TILEROWS], maxiter, precision) for row in range(0, len(r2), TILEROWS) ]
+    
+    pool = None
+    if CPUS>1:
+        pool = mp.Pool(CPUS)
+        results = pool.imap_unordered(mandelbrot_tile, tiles)
+    else:
+        results = map(mandelbrot_tile, tiles)
+    
+    done=0
+    for (row, tile) in results:
+        output[row:row+tile.shape[0]] = tile
+        done=done+1
+        progress.setValue(100*done/len(tiles))
+        e.processEvents()
+    
+    if pool!=None:
+        pool.close()
+        pool.join()
+    
+    output[output == 0] = 1
+    output[output == maxiter-1] = 0
+    return output
+
+def mandelbrot_tile(tile):
+    # ein Streifen; entkommene Punkte fliegen aus der Rechnung raus
+    (row, r1, r2, maxiter, precision) = tile
+    c = (r1 + r2[:,None]*1j).ravel()
     if precision=="single":
           z = np.zeros(c.shape, np.complex64)
     else: z = np.zeros(c.shape, np.complex128)
     
+    output = np.full(c.shape, maxiter-1, int)
+    live = np.arange(c.size)
+    
     for it in range(maxiter):
         notdone = np.less(z.real*z.real + z.imag*z.imag, 4.0)
-        output[notdone] = it
-        z[notdone] = z[notdone]**2 + c[notdone]
-        e.processEvents()
-        progress.setValue(100*it/maxiter)
-    output[output == 0] = 1
-    output[output == maxiter-1] = 0
-    return output
+        if not notdone.all():
+            output[live[~notdone]] = it-1
+            live = live[notdone]
+            if live.size == 0: break
+            z = z[notdone]
+            c = c[notdone]
+        z[:] = z**2 + c
+    
+    return (row, output.reshape(len(r2), len(r1)))
   
   
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# pipelined command transport for the ftDuino
+#
+# The ftduino_direct firmware answers every command with exactly one line.
+# Instead of one USB round trip per command, FtdPipe writes a whole batch
+# of commands in one go and then collects the replies in the same order.
+# Callers sharing one ftDuino between threads have to serialize the calls.
+#
+
+class FtdPipe(object):
+
+    def __init__(self, duino):
+        self.duino=duino
+
+    def comm(self, command):
+        return self.duino.comm(command)
+
+    def batch(self, commands):
+        # returns the list of replies, one per command
+        if len(commands)==0: return []
+
+        ser=getattr(self.duino, "ftduino", None)
+        if not hasattr(ser, "readline"):
+            return [self.duino.comm(c) for c in commands]
+
+        try:
+            ser.flushInput()
+            ser.write("".join([c+"\n" for c in commands]).encode("utf-8"))
+            ret=[]
+            for c in commands:
+                ret.append(ser.readline().decode("utf-8").strip())
+            return ret
+        except:
+            return ["Fail"]*len(commands)
+
+    def readAll(self, inputs=8, counters=4, distance=False):
+        # all inputs and counters in one USB turnaround,
+        # returns a dict "I1".."I8", "C1".."C4" (and "D1") -> reply
+        keys=[]
+        commands=[]
+        for i in range(1,inputs+1):
+            keys.append("I"+str(i))
+            commands.append("input_get I"+str(i))
+        for i in range(1,counters+1):
+            keys.append("C"+str(i))
+            commands.append("counter_get C"+str(i))
+        if distance:
+            keys.append("D1")
+            commands.append("ultrasonic_get")
+        return dict(zip(keys, self.batch(commands)))
@@ -10,6 +10,7 @@ from PyQt4.QtCore import QTimer
 import queue, pty, subprocess, select, os
 import urllib.request, urllib.parse, urllib.error
 import avrdude_widget
+from ftdpipe import FtdPipe
 
 MAX_TEXT_LINES=50
 
@@ -418,40 +419,41 @@ class FtcGuiApplication(TouchApplication):
         outType=self.ioFun.currentIndex()
         dist=self.iDCType.currentIndex()
         
+        # mehrere Befehle je USB Zugriff
+        pipe=FtdPipe(self.act_duino)
 
         if outType==0:
             self.iDCType.hide()
             self.iTextField.show()
             self.oOut.hide()
             self.oMot.hide()
-            for n in range(1,9):
-                i=self.act_duino.comm("input_set_mode I"+str(n)+" Switch")
+            i=pipe.batch(["input_set_mode I"+str(n)+" Switch" for n in range(1,9)])
         elif outType==1:
             self.iDCType.hide()
             self.iTextField.show()
             self.oOut.hide()
             self.oMot.hide()
-            for n in range(1,9):
-                i=self.act_duino.comm("input_set_mode I"+str(n)+" Voltage")
+            i=pipe.batch(["input_set_mode I"+str(n)+" Voltage" for n in range(1,9)])
         elif outType==2:
             self.iDCType.hide()
             self.iTextField.show()
             self.oOut.hide()
             self.oMot.hide()
-            for n in range(1,9):
-                i=self.act_duino.comm("input_set_mode I"+str(n)+" Resistance")
+            i=pipe.batch(["input_set_mode I"+str(n)+" Resistance" for n in range(1,9)])
         elif outType==3:
             self.iDCType.show()
             self.iTextField.show()
             self.oOut.hide()
             self.oMot.hide()
+            cmds=[]
             for n in range(1,5):
-                i=self.act_duino.comm("counter_set_mode C"+str(n)+" Any")
-                i=self.act_duino.comm("counter_clear C"+str(n))
+                cmds.append("counter_set_mode C"+str(n)+" Any")
+                cmds.append("counter_clear C"+str(n))
             if dist==0: #counters Only
-                i=self.act_duino.comm("ultrasonic_enable false")
+                cmds.append("ultrasonic_enable false")
             else: # dist + counters
-                i=self.act_duino.comm("ultrasonic_enable true")
+                cmds.append("ultrasonic_enable true")
+            i=pipe.batch(cmds)
         elif outType==4:
             self.iDCType.hide()
             self.iTextField.hide()
@@ -468,9 +470,10 @@ class FtcGuiApplication(TouchApplication):
             time.sleep(0.05)
             s=""
             if outType<3:
+                inputs=pipe.readAll(8, 0)
                 for n in range(1,9):
                     s=s+"I"+str(n)+": "
-                    i=self.act_duino.comm("input_get I"+str(n))
+                    i=inputs["I"+str(n)]
                     if outType==0:
                         if i=="1":      s=s+"True"
                         elif i=="0":    s=s+"False"
@@ -484,18 +487,19 @@ class FtcGuiApplication(TouchApplication):
                         s=s+a[-5:]+" Ohm\n"              
                 self.iTextField.setText(s)
             elif outType==3:
+                counters=pipe.readAll(0, 4, dist!=0)
                 if dist==0:
-                    a="     "+self.act_duino.comm("counter_get C1")
+                    a="     "+counters["C1"]
                     s="C1: "+a[-5:]+"\n"
                 else:
-                    a=self.act_duino.comm("ultrasonic_get")
+                    a=counters["D1"]
                     if a!="-1":
                         a="     "+a
                         s="D1: "+a[-5:]+" cm\n"
                     else: s="D1:  Fail\n"
                 for n in range(2,5):
                     s=s+"C"+str(n)+": "
-                    a="     "+self.act_duino.comm("counter_get C"+str(n))
+                    a="     "+counters["C"+str(n)]
                     s=s+a[-5:]+"\n"
                 self.iTextField.setText(s)
                 
@@ -0,0 +1,132 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# .arr array files for startIDE
+#
+# Two formats share the .arr extension and are told apart by their start:
+#   text    "1;2;3;" as written by all former versions
+#   binary  ARRMAGIC, the header <c typecode> <7x> <Q length> and then
+#           length items of the typecode ("b", "h", "i" or "q"), all little
+#           endian. The data starts at ARRDATA, aligned to 8 bytes.
+#
+# Binary files are read through mmap with a single copy into the typed
+# array, nothing is parsed per element. appendArray() adds items to the end
+# of a file and rewrites only the header, so arrays can be recorded
+# incrementally. Values that do not fit into the typecode of a binary file
+# widen the file to "q" once.
+#
+
+import os, sys, struct, mmap
+from array import array
+
+ARRMAGIC=b"startIDE-array\n\0"
+ARRHEADER=struct.Struct("<cxxxxxxxQ")
+ARRDATA=len(ARRMAGIC)+ARRHEADER.size
+
+# integer typecodes from small to large with their value range
+ARRTYPES=[("b", -2**7, 2**7-1), ("h", -2**15, 2**15-1), ("i", -2**31, 2**31-1), ("q", -2**63, 2**63-1)]
+
+def isBinary(fname):
+    try:
+        with open(fname, "rb") as f:
+            return f.read(len(ARRMAGIC))==ARRMAGIC
+    except OSError:
+        return False
+
+def fitType(data, typecode="b"):
+    # smallest typecode, at least typecode, that holds all values of data
+    if len(data)==0: return typecode
+    lo=min(data)
+    hi=max(data)
+    start=[t[0] for t in ARRTYPES].index(typecode)
+    for (t, a, b) in ARRTYPES[start:]:
+        if lo>=a and hi<=b: return t
+    raise OverflowError("value out of range")
+
+def littleEndian(a):
+    if sys.byteorder=="big": a.byteswap()
+    return a
+
+def readHeader(f):
+    # (typecode, length) of a binary file, length limited to the data present
+    f.seek(0)
+    if f.read(len(ARRMAGIC))!=ARRMAGIC: return None
+    (typecode, n)=ARRHEADER.unpack(f.read(ARRHEADER.size))
+    typecode=typecode.decode("ascii")
+    size=os.fstat(f.fileno()).st_size
+    n=min(n, (size-ARRDATA)//array(typecode).itemsize)
+    return (typecode, n)
+
+def parseText(text):
+    # values of the text format, the last ";" and blanks are optional,
+    # anything else raises ValueError
+    return [int(t) for t in text.split(";") if t.strip()!=""]
+
+def readArray(fname, typecode="q"):
+    # array of the given typecode from a text or binary file
+    with open(fname, "rb") as f:
+        header=readHeader(f)
+        if header==None:
+            f.seek(0)
+            return array(typecode, parseText(f.read().decode("utf-8")))
+
+        (tc, n)=header
+        a=array(tc)
+        if n>0:
+            m=mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with memoryview(m) as v:
+                with v[ARRDATA:ARRDATA+n*a.itemsize] as d: a.frombytes(d)
+            m.close()
+            littleEndian(a)
+        if tc==typecode: return a
+        return array(typecode, a)
+
+def binaryData(data, typecode):
+    return littleEndian(array(typecode, data)).tobytes()
+
+def writeArray(fname, data, binary=False):
+    # replaces fname; binary files use the smallest typecode for data
+    if not binary:
+        with open(fname, "w", encoding="utf-8") as f:
+            if len(data)>0: f.write(";".join(map(str, data))+";")
+        return
+
+    tc=fitType(data)
+    with open(fname, "wb") as f:
+        f.write(ARRMAGIC+ARRHEADER.pack(tc.encode("ascii"), len(data)))
+        f.write(binaryData(data, tc))
+
+def appendArray(fname, data):
+    # appends data in the format of fname, new files are binary
+    if not os.path.exists(fname):
+        with open(fname, "wb") as f:
+            f.write(ARRMAGIC+ARRHEADER.pack(b"q", 0))
+
+    with open(fname, "r+b") as f:
+        header=readHeader(f)
+        if header==None:
+            f.seek(0, 2)
+            if len(data)>0: f.write((";".join(map(str, data))+";").encode("utf-8"))
+            return
+
+        (tc, n)=header
+        if fitType(data, tc)!=tc:
+            # zu klein fuer die neuen Werte, einmalig auf "q" umstellen
+            old=readArray(fname)
+            f.seek(0)
+            f.truncate()
+            f.write(ARRMAGIC+ARRHEADER.pack(b"q", len(old))+binaryData(old, "q"))
+            (tc, n)=("q", len(old))
+
+        # erst die Daten, dann die Laenge im Kopf
+        f.seek(ARRDATA+n*array(tc).itemsize)
+        f.truncate()
+        f.write(binaryData(data, tc))
+        f.seek(len(ARRMAGIC))
+        f.write(ARRHEADER.pack(tc.encode("ascii"), n+len(data)))
+
+def toText(fname):
+    # content of any .arr file in the text format
+    data=readArray(fname)
+    if len(data)==0: return ""
+    return ";".join(map(str, data))+";"
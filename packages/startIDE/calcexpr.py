@@ -0,0 +1,84 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# infix expressions for the startIDE Expr command
+#
+#   Expr <variable> <expression>
+#
+# The expression combines integer numbers and variables with the operators
+# of Calc, e.g. "Expr t (r * 1000) / (5000 - r) + offset". Every operator
+# is evaluated exactly like one Calc line (float operands, integer result),
+# so an Expr gives the same value as the chain of Calc lines it replaces.
+#
+# Operators bind from weakest to strongest:
+#   ||
+#   &&
+#   < == != > >= <=
+#   bitOr bitXOr
+#   bitAnd
+#   bitShift
+#   + -
+#   * / div mod
+#   all other Calc operators: exp root min max sgnCpy sin cos random mean
+#                             digit sign unsign tempMeingast
+# Operators of one level are evaluated from left to right, "- x" negates.
+# Operators and operands are separated by spaces, brackets need none.
+#
+# parse() returns a tree of ints (numbers), strings (variables) and
+# (operator, left, right) tuples, or raises ValueError.
+#
+
+import re
+
+LEVELS=[ ["||"],
+         ["&&"],
+         ["<", "==", "!=", ">", ">=", "<="],
+         ["bitOr", "bitXOr"],
+         ["bitAnd"],
+         ["bitShift"],
+         ["+", "-"],
+         ["*", "/", "div", "mod"],
+         ["exp", "root", "min", "max", "sgnCpy", "sin", "cos", "random", "mean",
+          "digit", "sign", "unsign", "tempMeingast"] ]
+
+PRIORITY={}
+for level in range(len(LEVELS)):
+    for op in LEVELS[level]: PRIORITY[op]=level
+
+def tokenize(text):
+    return re.findall(r"\(|\)|[^\s()]+", text)
+
+def parse(text):
+    tokens=tokenize(text)
+    if len(tokens)==0: raise ValueError("expression missing")
+    (tree, n)=parseLevel(tokens, 0, 0)
+    if n<len(tokens): raise ValueError("unexpected '"+tokens[n]+"'")
+    return tree
+
+def parseLevel(tokens, n, level):
+    if level==len(LEVELS): return parseOperand(tokens, n)
+
+    (tree, n)=parseLevel(tokens, n, level+1)
+    while n<len(tokens) and PRIORITY.get(tokens[n])==level:
+        op=tokens[n]
+        (right, n)=parseLevel(tokens, n+1, level+1)
+        tree=(op, tree, right)
+    return (tree, n)
+
+def parseOperand(tokens, n):
+    if n>=len(tokens): raise ValueError("operand missing")
+
+    t=tokens[n]
+    if t=="(":
+        (tree, n)=parseLevel(tokens, n+1, 0)
+        if n>=len(tokens) or tokens[n]!=")": raise ValueError("')' missing")
+        return (tree, n+1)
+    if t=="-":
+        (tree, n)=parseOperand(tokens, n+1)
+        return (("-", 0, tree), n)
+    if t==")" or t in PRIORITY: raise ValueError("operand missing before '"+t+"'")
+
+    try:
+        return (int(t), n+1)
+    except ValueError:
+        return (t, n+1)
@@ -0,0 +1,206 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Python code generation for startIDE
+#
+# translate() turns a startIDE program into Python source with one function
+# per basic block. A block starts at a jump target (Tag, the line after a
+# Tag, the line after a command that may jump) and runs straight through to
+# the next block or to the first command that changes the program flow. Its
+# function returns the number of the line to continue with, so the
+# execThread only has to dispatch once per block and can check Stop and the
+# interrupt timers in between.
+#
+# Init, Calc, Expr, IfVar, Jump and Tag are translated into plain Python. All other
+# commands call their execThread handler with et.count set to their line,
+# exactly as the interpreter does, and end the block.
+#
+
+import sys
+import calcexpr
+
+# file name of the generated code objects, used to map errors to lines
+CODEFILE="<startIDE>"
+
+# Calc operators written out inline, all others go through calc()
+CALCOPS={ "+":   "int(%s+%s)",
+          "-":   "int(%s-%s)",
+          "*":   "int(%s*%s)",
+          "/":   "int(round(%s/%s))",
+          "div": "int(%s/%s)",
+          "mod": "int(%s%%%s)",
+          "min": "int(min(%s,%s))",
+          "max": "int(max(%s,%s))" }
+COMPAREOPS=["<", ">", "==", "!=", "<=", ">="]
+
+PREAMBLE=[
+    "def val(var):",
+    "    et.getVal(var)",
+    "    raise Halt",
+    "",
+    "def setv(var, v):",
+    "    et.setVar(var, v)",
+    "    raise Halt",
+    "" ]
+
+class Halt(Exception):
+    # a translated line has halted the program
+    pass
+
+class Generator(object):
+
+    def __init__(self, codeList, jmpTable, literals):
+        self.codeList=codeList
+        self.jmpTable=jmpTable
+        self.literals=literals
+        self.source=list(PREAMBLE)
+        self.lines=[-1]*len(PREAMBLE)
+
+    def emit(self, text, n=-1):
+        self.source.append(text)
+        self.lines.append(n)
+
+    def value(self, token):
+        # expression for getVal(token)
+        if token in self.literals: return repr(self.literals[token])
+        return "(int(mem[%r]) if %r in mem else val(%r))" % (token, token, token)
+
+    def fvalue(self, token):
+        if token in self.literals: return repr(float(self.literals[token]))
+        return "float(%s)" % self.value(token)
+
+    def expr(self, tree):
+        # float expression for a tree from calcexpr.parse()
+        if type(tree)==int: return repr(float(tree))
+        if type(tree)==str: return self.fvalue(tree)
+        (a, b, op)=(self.expr(tree[1]), self.expr(tree[2]), tree[0])
+        if op in CALCOPS: return "float(%s)" % (CALCOPS[op] % (a, b))
+        if op in COMPAREOPS: return "(1.0 if %s%s%s else 0.0)" % (a, op, b)
+        return "float(calc(%r,%s,%s))" % (op, a, b)
+
+    def tag(self, token):
+        n=self.jmpTable.get(token, -1)
+        if n<0: return None
+        return n
+
+    def kind(self, n):
+        # "Tag", "Line" (inline, falls through), "Branch" (inline, may jump)
+        # or "Call" (handler)
+        line=self.codeList[n]
+        stack=line.split()
+        if line[0:1]=="#" or len(stack)==0: return "Call"
+
+        cmd=stack[0]
+        if cmd=="Tag": return "Tag"
+        if cmd=="Init" and len(stack)>1: return "Line"
+        if cmd=="Calc" and len(stack)>4:
+            try:
+                if stack[2] in self.literals: float(self.literals[stack[2]])
+                if stack[4] in self.literals: float(self.literals[stack[4]])
+            except:
+                return "Call"
+            return "Line"
+        if cmd=="Expr" and len(stack)>2:
+            try:
+                self.expr(calcexpr.parse(" ".join(stack[2:])))
+            except (ValueError, OverflowError):
+                return "Call"
+            return "Line"
+        if cmd=="IfVar" and len(stack)>4 and stack[2] in COMPAREOPS:
+            n=self.tag(stack[4])
+            if n!=None and n>0: return "Branch"
+        if cmd=="Jump" and len(stack)>1 and self.tag(stack[1])!=None: return "Branch"
+        return "Call"
+
+    def line(self, n):
+        stack=self.codeList[n].split()
+        cmd=stack[0]
+
+        if cmd=="Init":
+            if len(stack)<3: stack.append("0")
+            self.emit("    mem[%r]=%s" % (stack[1], self.value(stack[2])), n)
+
+        elif cmd=="Calc":
+            (a, b, op)=(self.fvalue(stack[2]), self.fvalue(stack[4]), stack[3])
+            if op in CALCOPS: expr=CALCOPS[op] % (a, b)
+            elif op in COMPAREOPS: expr="(1 if %s%s%s else 0)" % (a, op, b)
+            else: expr="calc(%r,%s,%s)" % (op, a, b)
+            self.emit("    r=%s" % expr, n)
+            self.emit("    if %r in mem: mem[%r]=r" % (stack[1], stack[1]), n)
+            self.emit("    else: setv(%r,r)" % stack[1], n)
+
+        elif cmd=="Expr":
+            self.emit("    r=int(%s)" % self.expr(calcexpr.parse(" ".join(stack[2:]))), n)
+            self.emit("    if %r in mem: mem[%r]=r" % (stack[1], stack[1]), n)
+            self.emit("    else: setv(%r,r)" % stack[1], n)
+
+        elif cmd=="IfVar":
+            # IfVar setzt count auf Tag-1, weiter geht es also beim Tag
+            self.emit("    if %s%s%s: return %i" % (self.value(stack[1]), stack[2], self.value(stack[3]), self.tag(stack[4])), n)
+            self.emit("    return %i" % (n+1), n)
+
+        elif cmd=="Jump":
+            self.emit("    return %i" % (self.tag(stack[1])+1), n)
+
+    def call(self, n):
+        # der Befehl selbst, mit count wie im Interpreter
+        self.emit("    et.count=%i" % n, n)
+        self.emit("    h=program[%i]" % n, n)
+        self.emit("    h[0](*h[1])", n)
+        self.emit("    return et.count+1", n)
+
+    def translate(self):
+        count=len(self.codeList)
+        kinds=[self.kind(n) for n in range(count)]
+
+        leaders=set([0])
+        for n in range(count):
+            if kinds[n]=="Tag":
+                leaders.add(n)
+                leaders.add(n+1)
+            elif kinds[n]!="Line":
+                leaders.add(n+1)
+        leaders=sorted([n for n in leaders if n<count])
+
+        sizes={}
+        for start in leaders:
+            self.emit("def b%i():" % start)
+            n=start
+            while True:
+                if n>=count or (n>start and n in leaders and not (n==start+1 and kinds[start]=="Tag")):
+                    self.emit("    return %i" % n)
+                    break
+                self.emit("    # %i: %s" % (n, self.codeList[n].replace("\r"," ")), n)
+                if kinds[n]=="Call":
+                    self.call(n)
+                    n=n+1
+                    break
+                if kinds[n]!="Tag": self.line(n)
+                n=n+1
+                if kinds[n-1]=="Branch": break
+            sizes[start]=n-start
+            self.emit("")
+
+        self.emit("BLOCKS={"+", ".join(["%i: b%i" % (n, n) for n in leaders])+"}")
+        return ("\n".join(self.source)+"\n", sizes, self.lines)
+
+def translate(codeList, jmpTable, literals):
+    # returns the python source, the number of lines of each block
+    # and the program line of each source line
+    return Generator(codeList, jmpTable, literals).translate()
+
+def load(source, et, calc):
+    # compiles the source once and returns the block functions by line
+    namespace={ "et": et, "mem": et.memory, "program": et.program, "calc": calc, "Halt": Halt }
+    exec(compile(source, CODEFILE, "exec"), namespace)
+    return namespace["BLOCKS"]
+
+def errorLine(lines):
+    # program line of the innermost generated code in the current exception
+    n=-1
+    tb=sys.exc_info()[2]
+    while tb!=None:
+        if tb.tb_frame.f_code.co_filename==CODEFILE and lines[tb.tb_lineno-1]>=0:
+            n=lines[tb.tb_lineno-1]
+        tb=tb.tb_next
+    return n
@@ -0,0 +1,30 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# helpers shared by the startIDE command line editors
+#
+
+from TouchStyle import *
+from TouchAuxiliary import *
+
+def queryVarName(vari, recent):        
+        if len(vari)==0:
+            t=TouchMessageBox(QCoreApplication.translate("ecl","Variables"), None)
+            t.setCancelButton()
+            t.setText(QCoreApplication.translate("ecl","No Variables defined!"))
+            t.setTextSize(2)
+            t.setBtnTextSize(2)
+            t.setPosButton(QCoreApplication.translate("ecl","Okay"))
+            (v1,v2)=t.exec_()
+            return recent
+
+        vari.sort()
+        
+        cvari=vari[0]
+        for i in vari:
+            if i==recent: cvari=recent
+            
+        (s,r)=TouchAuxListRequester(QCoreApplication.translate("ecl","Variables"),QCoreApplication.translate("ecl","Select variable"),vari,cvari,"Okay").exec_()
+
+        if s: return r 
+        else: return recent
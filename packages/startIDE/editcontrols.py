@@ -0,0 +1,524 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# startIDE command line editors: controls and modules
+#
+# imported by startide.py when the first of these dialogs is opened
+#
+
+from TouchStyle import *
+from TouchAuxiliary import *
+from editcommon import queryVarName
+
+class editLoopTo(TouchDialog):
+    def __init__(self, cmdline, taglist, vari, parent):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","LoopTo"), parent)
+        
+        self.cmdline=cmdline
+        self.taglist=taglist
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+
+        l=QLabel(QCoreApplication.translate("ecl", "Loop target"))
+        l.setStyleSheet("font-size: 20px;")
+        self.layout.addWidget(l)
+        
+        self.tags=QListWidget()
+        self.tags.setStyleSheet("font-size: 20px;")
+        self.tags.addItems(self.taglist)
+        self.tags.setCurrentRow(0)
+        t=0
+        for tag in self.taglist:
+            if self.taglist[t]==self.cmdline.split()[1]: self.tags.setCurrentRow(t)
+            t=t+1
+            
+            
+        self.layout.addWidget(self.tags)
+        
+        self.layout.addStretch()
+
+        l=QLabel(QCoreApplication.translate("ecl", "Count"))
+        l.setStyleSheet("font-size: 20px;")
+        self.layout.addWidget(l)
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 20px;")
+        self.value.setText(self.cmdline.split()[2])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        self.layout.addWidget(self.value)
+        
+        self.layout.addStretch()
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="LoopTo " +self.tags.item(self.tags.currentRow()).text()+ " " + self.value.text()
+        self.close()
+        
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.value.setText(queryVarName(self.variables,self.value.text()))  
+    
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Number"),a,None).exec_()
+        try:
+            t=str(max(min(int(t),99999),1))
+        except:
+            t=a
+        self.value.setText(t)
+
+class editDelay(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Delay"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+    
+        self.titlebar.setCancelButton()
+        
+        self.layout=QVBoxLayout()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Type"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        self.interrupt=QComboBox()
+        self.interrupt.setStyleSheet("font-size: 18px;")
+            
+        oplist=["Fixed","Random"]
+        self.interrupt.addItems(oplist)
+        
+        if len(self.cmdline.split())>2:
+            self.interrupt.setCurrentIndex(1)
+        else:
+            self.interrupt.setCurrentIndex(0)
+        
+        self.layout.addWidget(self.interrupt)
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Time"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 18px;")
+            
+        try:
+            self.value.setText(self.cmdline.split()[1])
+        except:
+            self.value.setText("500")
+            
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+       
+        self.layout.addWidget(self.value)        
+        
+        self.layout.addStretch()
+
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="Delay " + self.value.text()
+        
+        if self.interrupt.currentIndex() == 1:
+            self.cmdline = self.cmdline + " R"
+        self.close()
+    
+    def valPress(self,sender):
+        
+        if self.timer.isActive(): self.timer.stop()
+        self.btn=1
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.value.setText(queryVarName(self.variables,self.value.text()))  
+
+            
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            self.getValue(1)
+
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Time"),a,self).exec_()
+        try:
+            v=str(max(min(int(t),99999),0))
+            self.value.setText(v)
+        except:
+            self.value.setText(a)
+
+class editIfTimer(TouchDialog):
+    def __init__(self, cmdline, taglist, vari, parent):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","IfTimer"), parent)
+        
+        self.cmdline=cmdline
+        self.taglist=taglist
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Operator"))
+        l.setStyleSheet("font-size: 20px;")
+        
+        self.layout.addWidget(l)
+        
+        self.operator=QComboBox()
+        self.operator.setStyleSheet("font-size: 20px;")
+        self.operator.addItems(["  <  ","  >  "])
+
+        if self.cmdline.split()[1]=="<": self.operator.setCurrentIndex(0)
+        if self.cmdline.split()[1]==">": self.operator.setCurrentIndex(1)
+
+        self.layout.addWidget(self.operator)
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl","Value"))
+        l.setStyleSheet("font-size: 20px;")
+        self.layout.addWidget(l)     
+        
+        self.thd=QLineEdit()
+        self.thd.setReadOnly(True)
+        self.thd.setStyleSheet("font-size: 20px;")
+        self.thd.setText(self.cmdline.split()[2])
+        self.thd.mousePressEvent=self.valPress
+        self.thd.mouseReleaseEvent=self.valRelease
+        self.layout.addWidget(self.thd)
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl","Target"))
+        l.setStyleSheet("font-size: 20px;")
+        self.layout.addWidget(l)
+        
+        self.tags=QComboBox()
+        self.tags.setStyleSheet("font-size: 20px;")
+        self.tags.addItems(self.taglist)
+
+        self.tags.setCurrentIndex(0)
+        if len(self.cmdline.split())>3:
+            cc=0
+            for i in self.taglist:
+                if self.cmdline.split()[3]==i: self.tags.setCurrentIndex(cc)
+                cc=cc+1
+
+        self.layout.addWidget(self.tags)
+        self.layout.addStretch() 
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="IfTimer " +self.operator.currentText().strip()+ " " + self.thd.text() + " " + self.tags.itemText(self.tags.currentIndex())
+        self.close()
+        
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.thd.setText(queryVarName(self.variables,self.thd.text()))  
+    
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.thd.text())
+            except:
+                self.thd.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.thd.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Timeout"),a,None).exec_()
+        try:
+            t=str(max(min(int(t),99999),0))
+        except:
+            t=a
+        self.thd.setText(t)
+
+class editInterrupt(TouchDialog):
+    def __init__(self, cmdline, modlist, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Interrupt"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+        self.modlist=modlist
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.layout=QVBoxLayout()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Interrupt"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        self.interrupt=QComboBox()
+        self.interrupt.setStyleSheet("font-size: 18px;")
+            
+        oplist=["After","Every","Off"]
+        self.interrupt.addItems(oplist)
+        
+        stack=self.cmdline.split()
+        if stack[1] in oplist:
+            self.interrupt.setCurrentIndex(oplist.index(stack[1]))
+        else:
+            self.interrupt.setCurrentIndex(0)
+        
+        # "Interrupt Off [module]", sonst "Interrupt After|Every <time> <module>"
+        if stack[1]=="Off":
+            period="500"
+            if len(stack)>2: module=stack[2]
+            else: module=None
+        else:
+            if len(stack)>2: period=stack[2]
+            else: period="500"
+            if len(stack)>3: module=stack[3]
+            else: module=""
+        
+        self.interrupt.currentIndexChanged.connect(self.setTargets)
+        self.layout.addWidget(self.interrupt)
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Time"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 18px;")
+            
+        self.value.setText(period)
+            
+        self.value.mousePressEvent=self.getValue
+        self.layout.addWidget(self.value)        
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Target module"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        # ein Modul, das es nicht mehr gibt, bleibt beim Bestaetigen erhalten
+        if module and not module in self.modlist: self.modlist=self.modlist+[module]
+        
+        self.target=QComboBox()
+        self.target.setStyleSheet("font-size: 18px;")
+        self.setTargets()
+
+        # Off ohne Modul schaltet alle Timer ab
+        if self.all and module==None: self.target.setCurrentIndex(0)
+        elif module in self.modlist: self.target.setCurrentIndex(self.modlist.index(module)+self.all)
+        else: self.target.setCurrentIndex(0)
+
+        self.layout.addWidget(self.target)
+        
+        self.layout.addStretch()
+
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def setTargets(self):
+        # bei Off steht "alle" vor den Modulen
+        module=self.target.currentIndex()-self.all if self.target.count()>0 else -1
+        self.all=int(self.interrupt.currentText()=="Off")
+        
+        self.target.clear()
+        if self.all: self.target.addItem(QCoreApplication.translate("ecl","all"))
+        self.target.addItems(self.modlist)
+        if module>=0: self.target.setCurrentIndex(module+self.all)
+        
+    def on_confirm(self):
+        self.cmdline="Interrupt " + self.interrupt.itemText(self.interrupt.currentIndex())
+        if not "Off" in self.cmdline:
+            self.cmdline=self.cmdline + " " + self.value.text() + " "
+            self.cmdline=self.cmdline + self.target.itemText(self.target.currentIndex())
+        elif self.target.currentIndex()>0:
+            # nur den Timer dieses Moduls abschalten
+            self.cmdline=self.cmdline + " " + self.target.itemText(self.target.currentIndex())
+        self.close()
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Time"),a,self).exec_()
+        try:
+            v=str(max(min(int(t),99999),0))
+            self.value.setText(v)
+        except:
+            self.value.setText(a)
+
+class editCall(TouchDialog):
+    def __init__(self, cmdline, taglist, vari, parent):
+        TouchDialog.__init__(self, cmdline.split()[0], parent)
+        
+        self.command=cmdline.split()[0]
+        self.cmdline=cmdline
+        self.taglist=taglist
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+    
+        self.titlebar.setCancelButton()
+        
+        self.layout=QVBoxLayout()
+        
+
+        l=QLabel(QCoreApplication.translate("ecl", "Module"))
+        l.setStyleSheet("font-size: 20px;")
+        self.layout.addWidget(l)
+        
+        self.tags=QListWidget()
+        self.tags.setStyleSheet("font-size: 20px;")
+        self.tags.addItems(self.taglist)
+        self.tags.setCurrentRow(0)
+        try:
+            t=0
+            for tag in self.taglist:
+               if self.taglist[t]==self.cmdline.split()[1]: self.tags.setCurrentRow(t)
+               t=t+1
+        except:
+            pass
+            
+        self.layout.addWidget(self.tags)
+        
+        self.layout.addStretch()
+
+        l=QLabel(QCoreApplication.translate("ecl", "Count"))
+        l.setStyleSheet("font-size: 20px;")
+        self.layout.addWidget(l)
+        
+        if len(self.cmdline.split())<3: self.cmdline=self.cmdline+" 1"
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 20px;")
+        self.value.setText(self.cmdline.split()[2])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        self.layout.addWidget(self.value)
+        
+        self.layout.addStretch()
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline=self.command + " " +self.tags.item(self.tags.currentRow()).text()+ " " + self.value.text()
+        self.close()
+        
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.value.setText(queryVarName(self.variables,self.value.text()))  
+    
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Number"),a,None).exec_()
+        try:
+            t=str(max(min(int(t),99999),0))
+        except:
+            t=a
+        self.value.setText(t)
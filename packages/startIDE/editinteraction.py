@@ -0,0 +1,1023 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# startIDE command line editors: graphics, touch and communication
+#
+# imported by startide.py when the first of these dialogs is opened
+#
+
+from PyQt4 import QtGui
+from TouchStyle import *
+from TouchAuxiliary import *
+from editcommon import queryVarName
+
+class editPen(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Pen"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+
+        l=QLabel(QCoreApplication.translate("ecl", "Operation"))
+        l.setStyleSheet("font-size: 18px;")
+        self.layout.addWidget(l)
+        
+        self.operator=QComboBox()
+        self.operator.setStyleSheet("font-size: 18px;")
+        oplist=["move","plot","lineTo","rectTo","boxTo","eraseTo","circleTo","discTo","areaAdd","areaDraw","text"]
+        self.operator.addItems(oplist)
+        if self.cmdline.split()[1] in oplist:
+            self.operator.setCurrentIndex(oplist.index(self.cmdline.split()[1]))
+        else:
+            self.operator.setCurrentIndex(0)
+        
+        self.layout.addWidget(self.operator)
+        
+        self.layout.addStretch()
+        l=QLabel(QCoreApplication.translate("ecl", "x position"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 18px;")
+            
+        self.value.setText(self.cmdline.split()[2])
+        
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        self.layout.addWidget(self.value)
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "y position"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        self.value2=QLineEdit()
+        self.value2.setReadOnly(True)
+        self.value2.setStyleSheet("font-size: 18px;")
+            
+        self.value2.setText(self.cmdline.split()[3])
+        self.value2.mousePressEvent=self.val2Press
+        self.value2.mouseReleaseEvent=self.val2Release
+        self.layout.addWidget(self.value2)        
+        
+        self.layout.addStretch()
+        
+
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="Pen " +self.operator.itemText(self.operator.currentIndex()) + " " + self.value.text()
+        self.cmdline=self.cmdline + " " + self.value2.text()
+        
+        self.close()
+    
+    def ifChanged(self):
+        self.valueChanged()
+    
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btn=1
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
+        else:           self.value2.setText(queryVarName(self.variables,self.value2.text())) 
+            
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","1st Op."),a,self).exec_()
+        try:
+            self.value.setText(str(int(t)))
+        except:
+            self.value.setText(a)
+        
+    def val2Press(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.btn=2
+        self.timer.start(500)
+     
+    def val2Release(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value2.text())
+            except:
+                self.value2.setText("0")  
+            self.getValue2(1)
+            
+    def getValue2(self,m):
+        a=self.value2.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","2nd Op."),a,self).exec_()
+        try:
+            t=str(int(t))
+        except:
+            t=a
+        self.value2.setText(t)
+
+class editText(TouchDialog):
+    def __init__(self, cmdline, varlist, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Text"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=varlist
+        
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        # Aussenrahmen
+        self.layout=QVBoxLayout()
+        
+        # VBox
+        l=QLabel(QCoreApplication.translate("ecl", "Font type"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        self.font=QComboBox()
+        self.font.setStyleSheet("font-size: 18px;")
+        self.font.addItems(["Times","Helvetica","Courier"])
+
+        if self.cmdline.split()[1] == "Helvetica": self.font.setCurrentIndex(1)
+        elif self.cmdline.split()[1] == "Courier": self.font.setCurrentIndex(2)
+      
+        
+        self.layout.addWidget(self.font)
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl","Font size"))
+        l.setStyleSheet("font-size: 18px;")
+        self.layout.addWidget(l)     
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 18px;")
+            
+        self.value.setText(self.cmdline.split()[2])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        self.layout.addWidget(self.value)
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl","Text"))
+        l.setStyleSheet("font-size: 18px;")
+        self.layout.addWidget(l)
+        
+        self.text=QLineEdit()
+        self.text.setStyleSheet("font-size: 18px;")
+        s=self.cmdline.split()
+        self.text.setText(" ".join(s[3:]))
+        
+        self.layout.addWidget(self.text)
+        
+        self.layout.addStretch()                
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.value.setText(queryVarName(self.variables,self.value.text()))  
+    
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+        
+    def on_confirm(self):
+        self.cmdline="Text " +self.font.currentText() + " " + self.value.text()
+        self.cmdline=self.cmdline + " " + self.text.text()
+        self.close()
+    
+    def ifChanged(self):
+        pass        
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            int(t)
+        except:
+            t=a
+        self.value.setText(str(int(t)))
+
+class editColor(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Color"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+        self.target=QComboBox()
+        self.target.addItems(["pen color","paper color"])
+        self.target.setStyleSheet("font-size: 18px;")
+        
+        if self.cmdline.split()[1]=="paper":
+            self.target.setCurrentIndex(1)
+        
+        self.layout.addWidget(self.target)
+        
+        h=QHBoxLayout()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Red:"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        h.addWidget(l)
+        
+        self.red=QLineEdit()
+        self.red.setReadOnly(True)
+        self.red.setStyleSheet("font-size: 18px;")
+            
+        self.red.setText(self.cmdline.split()[2])
+        
+        self.red.mousePressEvent=self.redPress
+        self.red.mouseReleaseEvent=self.redRelease
+        h.addWidget(self.red)
+        
+        self.layout.addLayout(h)
+        
+        h=QHBoxLayout()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Green:"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        h.addWidget(l)
+        
+        self.green=QLineEdit()
+        self.green.setReadOnly(True)
+        self.green.setStyleSheet("font-size: 18px;")
+            
+        self.green.setText(self.cmdline.split()[3])
+        
+        self.green.mousePressEvent=self.greenPress
+        self.green.mouseReleaseEvent=self.greenRelease
+        h.addWidget(self.green)
+        
+        self.layout.addLayout(h)
+        
+        h=QHBoxLayout()
+        
+        l=QLabel(QCoreApplication.translate("ecl", "Blue:"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        h.addWidget(l)
+        
+        self.blue=QLineEdit()
+        self.blue.setReadOnly(True)
+        self.blue.setStyleSheet("font-size: 18px;")
+            
+        self.blue.setText(self.cmdline.split()[4])
+        
+        self.blue.mousePressEvent=self.bluePress
+        self.blue.mouseReleaseEvent=self.blueRelease
+        h.addWidget(self.blue)
+        
+        self.layout.addLayout(h)        
+        
+        self.layout.addStretch()
+        
+        self.cbox = QPushButton()
+        self.cbox.setDisabled(True)
+        self.cbox.setAutoFillBackground(True) # This is important!!
+        color  = QtGui.QColor(int(self.red.text()),int(self.green.text()),int(self.blue.text()))
+        alpha  = 255
+        values = "{r}, {g}, {b}, {a}".format(r = color.red(),
+                                            g = color.green(),
+                                            b = color.blue(),
+                                            a = alpha
+                                            )
+        
+        self.cbox.setStyleSheet("QPushButton:disabled { background-color: rgba("+values+"); }")
+        self.layout.addWidget(self.cbox)
+        
+        self.layout.addStretch()
+        
+        self.presets=QPushButton(QCoreApplication.translate("ecl", "Presets"))
+        self.presets.setStyleSheet("font-size: 18px;")
+        
+        self.presets.clicked.connect(self.presets_clicked)
+        
+        self.layout.addWidget(self.presets)
+        
+        self.layout.addStretch()
+
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="Color " 
+        if self.target.currentIndex()==0:
+            self.cmdline=self.cmdline + "pen "
+        else:
+            self.cmdline=self.cmdline + "paper "
+        self.cmdline=self.cmdline + self.red.text() + " " +self.green.text() + " "
+        self.cmdline=self.cmdline + self.blue.text()
+        
+        self.close()
+    
+    def ifChanged(self):
+        self.valueChanged()
+    
+    def redPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btn=1
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        if self.btn==1:     self.red.setText(queryVarName(self.variables,self.red.text()))  
+        elif self.btn==2:   self.green.setText(queryVarName(self.variables,self.green.text())) 
+        elif self.btn==3:   self.blue.setText(queryVarName(self.variables,self.blue.text())) 
+        
+    def redRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.red.text())
+            except:
+                self.red.setText("0")  
+            self.getRed(1)
+    
+    def getRed(self,m):
+        a=self.red.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Red"),a,self).exec_()
+        try:
+            self.red.setText(str(int(t)))
+        except:
+            self.red.setText(a)
+        self.cbox_draw()
+        
+    def greenPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.btn=2
+        self.timer.start(500)
+     
+    def greenRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.green.text())
+            except:
+                self.green.setText("0")  
+            self.getGreen(1)
+            
+    def getGreen(self,m):
+        a=self.green.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Green"),a,self).exec_()
+        try:
+            t=str(int(t))
+        except:
+            t=a
+        self.green.setText(t)
+        self.cbox_draw()
+        
+    def bluePress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.btn=3
+        self.timer.start(500)
+     
+    def blueRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.blue.text())
+            except:
+                self.blue.setText("0")  
+            self.getBlue(1)
+            
+    def getBlue(self,m):
+        a=self.blue.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Blue"),a,self).exec_()
+        try:
+            t=str(int(t))
+        except:
+            t=a
+        self.blue.setText(t)
+        self.cbox_draw()
+        
+    def cbox_draw(self):
+        rd=max(min(int(self.red.text()),255),0)
+        gn=max(min(int(self.green.text()),255),0)
+        bl=max(min(int(self.blue.text()),255),0)
+        alpha  = 255
+        values = "{r}, {g}, {b}, {a}".format(r=rd, g=gn, b=bl, a=alpha)
+        self.cbox.setStyleSheet("QPushButton:disabled { background-color: rgba("+values+"); }")
+        self.red.setText(str(rd))
+        self.green.setText(str(gn))
+        self.blue.setText(str(bl))
+        
+    def presets_clicked(self):
+        colorlist=[QCoreApplication.translate("color","red"),
+                   QCoreApplication.translate("color","green"),
+                   QCoreApplication.translate("color","blue"),
+                   QCoreApplication.translate("color","yellow"),
+                   QCoreApplication.translate("color","cyan"),
+                   QCoreApplication.translate("color","magenta"),
+                   QCoreApplication.translate("color","cfw-blue"),
+                   QCoreApplication.translate("color","white"),
+                   QCoreApplication.translate("color","grey"),
+                   QCoreApplication.translate("color","black")]
+                   
+        (s,r)=TouchAuxListRequester(QCoreApplication.translate("color","Colors"),"",colorlist,colorlist[0],"Okay",self).exec_()        
+        if not s: return
+    
+        if r ==   QCoreApplication.translate("color","red"):
+            r=255
+            g=0
+            b=0
+        elif r == QCoreApplication.translate("color","green"):
+            r=0
+            g=255
+            b=0
+        elif r == QCoreApplication.translate("color","blue"):
+            r=0
+            g=0
+            b=255
+        elif r == QCoreApplication.translate("color","yellow"):
+            r=255
+            g=255
+            b=0
+        elif r == QCoreApplication.translate("color","cyan"):
+            r=0
+            g=255
+            b=255
+        elif r == QCoreApplication.translate("color","magenta"):
+            r=255
+            g=0
+            b=255
+        elif r == QCoreApplication.translate("color","cfw-blue"):
+            r=33
+            g=117
+            b=204
+        elif r == QCoreApplication.translate("color","white"):
+            r=255
+            g=255
+            b=255
+        elif r == QCoreApplication.translate("color","grey"):
+            r=127
+            g=127
+            b=127
+        elif r == QCoreApplication.translate("color","black"):
+            r=0
+            g=0
+            b=0
+
+        self.red.setText(str(r))
+        self.green.setText(str(g))
+        self.blue.setText(str(b))
+        self.cbox_draw()
+
+class editVarToText(TouchDialog):
+    def __init__(self, cmdline, varlist, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","VarToText"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=varlist
+        
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        # Aussenrahmen
+        self.layout=QVBoxLayout()
+        
+        # VBox
+        l=QLabel(QCoreApplication.translate("ecl", "Font type"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        self.layout.addWidget(l)
+        
+        self.font=QComboBox()
+        self.font.setStyleSheet("font-size: 18px;")
+        self.font.addItems(["Times","Helvetica","Courier"])
+
+        if self.cmdline.split()[1] == "Helvetica": self.font.setCurrentIndex(1)
+        elif self.cmdline.split()[1] == "Courier": self.font.setCurrentIndex(2)
+      
+        
+        self.layout.addWidget(self.font)
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl","Font size"))
+        l.setStyleSheet("font-size: 18px;")
+        self.layout.addWidget(l)     
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 18px;")
+            
+        self.value.setText(self.cmdline.split()[2])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        self.layout.addWidget(self.value)
+        
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl","Variable"))
+        l.setStyleSheet("font-size: 18px;")
+        self.layout.addWidget(l)
+        
+        self.text=QComboBox()
+        self.text.setStyleSheet("font-size: 18px;")
+        self.text.addItems(self.variables)
+        
+        if self.cmdline.split()[3] in self.variables:
+            self.text.setCurrentIndex(self.variables.index(self.cmdline.split()[3]))
+        
+        self.layout.addWidget(self.text)
+        
+        self.layout.addStretch()                
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.value.setText(queryVarName(self.variables,self.value.text()))  
+    
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+        
+    def on_confirm(self):
+        self.cmdline="VarToText " +self.font.currentText() + " " + self.value.text()
+        self.cmdline=self.cmdline + " " + self.text.currentText()
+        self.close()
+    
+    def ifChanged(self):
+        pass        
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            int(t)
+        except:
+            t=a
+        self.value.setText(str(int(t)))
+
+class editIfTouchArea(TouchDialog):
+    def __init__(self, cmdline, taglist, varlist, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","IfTouchArea"), parent)
+        
+        self.cmdline=cmdline
+        self.taglist=taglist
+        self.variables=varlist
+        
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        # Aussenrahmen
+        self.layout=QVBoxLayout()
+        
+        # VBox
+        
+        # HBox
+        hbm=QHBoxLayout()        
+        l=QLabel(QCoreApplication.translate("ecl","x1:"))
+        l.setStyleSheet("font-size: 18px;")
+        hbm.addWidget(l)     
+        
+        self.value1=QLineEdit()
+        self.value1.setReadOnly(True)
+        self.value1.setStyleSheet("font-size: 18px;")
+        hbm.addStretch()    
+        self.value1.setText(self.cmdline.split()[1])
+        self.value1.mousePressEvent=self.val1Press
+        self.value1.mouseReleaseEvent=self.val1Release
+        hbm.addWidget(self.value1)
+        
+        self.layout.addLayout(hbm)
+        self.layout.addStretch()
+        
+        # HBox
+        hbm=QHBoxLayout()         
+        l=QLabel(QCoreApplication.translate("ecl","y1:"))
+        l.setStyleSheet("font-size: 18px;")
+        hbm.addWidget(l)     
+        
+        self.value2=QLineEdit()
+        self.value2.setReadOnly(True)
+        self.value2.setStyleSheet("font-size: 18px;")
+        hbm.addStretch()    
+        self.value2.setText(self.cmdline.split()[2])
+        self.value2.mousePressEvent=self.val2Press
+        self.value2.mouseReleaseEvent=self.val2Release
+        hbm.addWidget(self.value2)
+        
+        self.layout.addLayout(hbm)
+        self.layout.addStretch()
+
+        # HBox
+        hbm=QHBoxLayout()         
+        l=QLabel(QCoreApplication.translate("ecl","x2:"))
+        l.setStyleSheet("font-size: 18px;")
+        hbm.addWidget(l)     
+        hbm.addStretch()
+        self.value3=QLineEdit()
+        self.value3.setReadOnly(True)
+        self.value3.setStyleSheet("font-size: 18px;")
+            
+        self.value3.setText(self.cmdline.split()[3])
+        self.value3.mousePressEvent=self.val3Press
+        self.value3.mouseReleaseEvent=self.val3Release
+        hbm.addWidget(self.value3)
+        
+        self.layout.addLayout(hbm)
+        self.layout.addStretch()
+        
+        # HBox
+        hbm=QHBoxLayout() 
+        l=QLabel(QCoreApplication.translate("ecl","y2:"))
+        l.setStyleSheet("font-size: 18px;")
+        hbm.addWidget(l)     
+        hbm.addStretch()
+        
+        self.value4=QLineEdit()
+        self.value4.setReadOnly(True)
+        self.value4.setStyleSheet("font-size: 18px;")
+            
+        self.value4.setText(self.cmdline.split()[4])
+        self.value4.mousePressEvent=self.val4Press
+        self.value4.mouseReleaseEvent=self.val4Release
+        hbm.addWidget(self.value4)
+        
+        self.layout.addLayout(hbm)
+        self.layout.addStretch()
+        
+        l=QLabel(QCoreApplication.translate("ecl","Target"))
+        l.setStyleSheet("font-size: 18px;")
+        self.layout.addWidget(l)
+        
+        self.tags=QComboBox()
+        self.tags.setStyleSheet("font-size: 18px;")
+        self.tags.addItems(self.taglist)
+        self.tags.setCurrentIndex(0)
+        if len(self.cmdline.split())>5:
+            cc=0
+            for i in self.taglist:
+                if self.cmdline.split()[5]==i: self.tags.setCurrentIndex(cc)
+                cc=cc+1
+        
+        self.layout.addWidget(self.tags)
+        
+        self.layout.addStretch()                
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def val1Press(self,sender):
+        self.vs=1
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def val1Release(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value1.text())
+            except:
+                self.value1.setText("0")  
+            self.getValue(1)
+
+    def val2Press(self,sender):
+        self.vs=2
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def val2Release(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value2.text())
+            except:
+                self.value2.setText("0")  
+            self.getValue(2)
+
+    def val3Press(self,sender):
+        self.vs=3
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def val3Release(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value3.text())
+            except:
+                self.value1.setText("0")  
+            self.getValue(3)
+
+    def val4Press(self,sender):
+        self.vs=4
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def val4Release(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value4.text())
+            except:
+                self.value1.setText("0")  
+            self.getValue(4)
+            
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        if self.vs==1: self.value1.setText(queryVarName(self.variables,self.value1.text()))  
+        elif self.vs==2: self.value2.setText(queryVarName(self.variables,self.value2.text()))
+        elif self.vs==3: self.value3.setText(queryVarName(self.variables,self.value3.text()))
+        elif self.vs==4: self.value4.setText(queryVarName(self.variables,self.value4.text()))
+    
+    def on_confirm(self):
+        self.cmdline="IfTouchArea"
+
+        self.cmdline=self.cmdline + " " + self.value1.text()
+        self.cmdline=self.cmdline + " " + self.value2.text()
+        self.cmdline=self.cmdline + " " + self.value3.text()
+        self.cmdline=self.cmdline + " " + self.value4.text()
+        
+        self.cmdline=self.cmdline + " " + self.tags.itemText(self.tags.currentIndex())
+        
+        self.close()
+    
+    def ifChanged(self):
+        pass        
+    
+    def getValue(self,m):
+        if m==1:  a=self.value1.text()
+        elif m==2: a=self.value2.text()
+        elif m==3: a=self.value3.text()
+        elif m==4: a=self.value4.text()
+        
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            int(t)
+        except:
+            t=a
+        
+        if m==1: self.value1.setText(str(int(t))) 
+        elif m==2: self.value2.setText(str(int(t))) 
+        elif m==3: self.value3.setText(str(int(t))) 
+        elif m==4: self.value4.setText(str(int(t)))
+
+def editI2CRead(cmdline, arrays, parent):
+    return editComm(cmdline, "I2CRead", arrays, parent).exec_()
+
+def editI2CWrite(cmdline, arrays, parent):
+    return editComm(cmdline, "I2CWrite", arrays, parent).exec_()
+
+def editUSBRead(cmdline, arrays, parent):
+    return editComm(cmdline, "USBRead", arrays, parent).exec_()
+
+def editUSBWrite(cmdline, arrays, parent):
+    return editComm(cmdline, "USBWrite", arrays, parent).exec_()
+
+class editComm(TouchDialog):    
+    def __init__(self, cmdline, xcmd, arrays, parent=None):
+        TouchDialog.__init__(self, xcmd, parent)
+        
+        self.cmdline=cmdline
+        self.arrays=arrays
+        self.xcmd=xcmd
+        
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+
+        
+        self.layout=QVBoxLayout()
+        
+        h=QHBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Device:"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        h.addWidget(l)
+        
+        self.layout.addLayout(h)
+
+        self.interface=QComboBox()
+        self.interface.setStyleSheet("font-size: 18px;")
+        if self.xcmd=="USBRead" or self.xcmd=="USBWrite":
+            self.interface.addItems(["SRD","FTD"])
+        else:
+            self.interface.addItems(["SRD","FTD","TXT","RPI"])
+
+        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(2)
+        elif self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(1)
+        elif self.cmdline.split()[1]=="RPI": self.interface.setCurrentIndex(3)
+        
+        h.addWidget(self.interface)
+        if self.xcmd=="USBRead" or self.xcmd=="USBWrite":
+            h=QHBoxLayout()
+            l=QLabel(QCoreApplication.translate("ecl", "Command:"))
+            l.setStyleSheet("font-size: 18px;")
+            h.addWidget(l)
+            self.layout.addLayout(h)
+            
+            self.command=QLineEdit()
+            #self.command.setReadOnly(True)
+            self.command.setStyleSheet("font-size: 18px;")
+            self.command.setText(self.cmdline.split()[2])
+        
+            self.layout.addWidget(self.command)
+        
+        h=QHBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Array:"))
+        l.setStyleSheet("font-size: 18px;")
+        
+        h.addWidget(l)
+        
+        self.array=QComboBox()
+        self.array.setStyleSheet("font-size: 18px;")
+        self.array.addItems(self.arrays)
+        self.array.setCurrentIndex(0)   
+        
+        if self.cmdline.split()[2] in self.arrays and not (self.xcmd=="USBRead" or self.xcmd=="USBWrite"):
+            self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[2]))
+        elif len(self.cmdline.split())>3:
+            if self.cmdline.split()[3] in self.arrays:
+                self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[3]))
+
+        h.addWidget(self.array)
+
+        self.layout.addLayout(h)
+        
+        if self.xcmd=="I2CScript" or self.xcmd=="I2CBurst":
+            # Skript wird in das Ergebnis-Array gelesen
+            h=QHBoxLayout()
+            l=QLabel(QCoreApplication.translate("ecl", "Result:"))
+            l.setStyleSheet("font-size: 18px;")
+            h.addWidget(l)
+            
+            self.result=QComboBox()
+            self.result.setStyleSheet("font-size: 18px;")
+            self.result.addItems(self.arrays)
+            self.result.setCurrentIndex(0)
+            if len(self.cmdline.split())>3:
+                if self.cmdline.split()[3] in self.arrays:
+                    self.result.setCurrentIndex(self.arrays.index(self.cmdline.split()[3]))
+            h.addWidget(self.result)
+            self.layout.addLayout(h)
+        
+        if self.xcmd=="I2CBurst":
+            h=QHBoxLayout()
+            l=QLabel(QCoreApplication.translate("ecl", "Period [ms]:"))
+            l.setStyleSheet("font-size: 18px;")
+            h.addWidget(l)
+            
+            self.period=QLineEdit()
+            self.period.setReadOnly(True)
+            self.period.setStyleSheet("font-size: 18px;")
+            try:
+                self.period.setText(self.cmdline.split()[4])
+            except:
+                self.period.setText("100")
+            self.period.mousePressEvent=self.getPeriod
+            h.addWidget(self.period)
+            self.layout.addLayout(h)
+        
+        self.layout.addStretch()
+        
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+
+    def getPeriod(self,m):
+        a=self.period.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Period [ms]:"),a,self).exec_()
+        try:
+            t=str(max(min(int(t),99999),0))
+        except:
+            t=a
+        self.period.setText(t)
+
+    def on_confirm(self):
+        self.cmdline = self.xcmd + " " + self.interface.itemText(self.interface.currentIndex()) + " "
+        
+        if self.xcmd=="USBRead" or self.xcmd=="USBWrite":
+            self.cmdline=self.cmdline + self.command.text() + " "
+        
+        self.cmdline = self.cmdline + self.array.itemText(self.array.currentIndex()) 
+        
+        if self.xcmd=="I2CScript" or self.xcmd=="I2CBurst":
+            self.cmdline = self.cmdline + " " + self.result.itemText(self.result.currentIndex())
+        if self.xcmd=="I2CBurst":
+            self.cmdline = self.cmdline + " " + self.period.text()
+
+        self.close()
@@ -0,0 +1,1068 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# startIDE command line editors: outputs and motors
+#
+# imported by startide.py when the first of these dialogs is opened
+#
+
+from TouchStyle import *
+from TouchAuxiliary import *
+from editcommon import queryVarName
+
+class editOutput(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Output"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+        k1=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Device"))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k1.addWidget(l)
+        
+        self.interface=QComboBox()
+        self.interface.setStyleSheet("font-size: 20px;")
+        self.interface.addItems(["RIF","TXT","FTD"])
+
+        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
+        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
+        self.interface.currentIndexChanged.connect(self.ifChanged)
+        k1.addWidget(self.interface)
+        
+        #self.layout.addStretch()
+        
+        k2=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Port"))
+        l.setStyleSheet("font-size: 20px;")
+        k2.addWidget(l)
+        
+        self.port=QComboBox()
+        self.port.setStyleSheet("font-size: 20px;")
+        self.port.addItems(["O 1","O 2","O 3","O 4","O 5","O 6","O 7","O 8"])
+
+        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
+        k2.addWidget(self.port)
+        
+        k9=QHBoxLayout()
+        k9.addLayout(k1)
+        k9.addStretch()
+        k9.addLayout(k2)
+        
+        self.layout.addLayout(k9)
+        
+        l=QLabel(QCoreApplication.translate("ecl","Value"))
+        l.setStyleSheet("font-size: 20px;")
+        self.layout.addWidget(l)     
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 20px;")
+        self.value.setText(self.cmdline.split()[3])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        self.layout.addWidget(self.value)
+        
+        self.layout.addStretch()
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="Output " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " " + self.value.text()
+        self.close()
+    
+    def ifChanged(self):
+        self.valueChanged()
+
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.value.setText(queryVarName(self.variables,self.value.text()))  
+    
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            self.value.setText(str(int(t)))
+        except:
+            
+            self.value.setText(a)
+            
+        self.valueChanged()
+        
+    def valueChanged(self):
+        try:            
+            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
+            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
+        except:
+            pass
+
+class editMotor(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Motor"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+        
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+        k1=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Device"))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k1.addWidget(l)
+        
+        self.interface=QComboBox()
+        self.interface.setStyleSheet("font-size: 20px;")
+        self.interface.addItems(["RIF","TXT","FTD","HAT"])
+
+        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
+        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
+        if self.cmdline.split()[1]=="HAT": self.interface.setCurrentIndex(3)
+        self.interface.currentIndexChanged.connect(self.ifChanged)
+        k1.addWidget(self.interface)
+        
+        #self.layout.addStretch()
+        
+        k2=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Port"))
+        l.setStyleSheet("font-size: 20px;")
+        k2.addWidget(l)
+        
+        self.port=QComboBox()
+        self.port.setStyleSheet("font-size: 20px;")
+        self.ifChanged()
+
+        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
+        k2.addWidget(self.port)
+        
+        k8=QHBoxLayout()
+        k8.addLayout(k1)
+        k8.addStretch()
+        k8.addLayout(k2)
+        
+        self.layout.addLayout(k8)        
+        
+        k3=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Value"))
+        l.setStyleSheet("font-size: 20px;")
+        k3.addWidget(l)     
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 20px;")
+        self.value.setText(self.cmdline.split()[4])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        k3.addWidget(self.value)
+        
+        k4=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Direction"))
+        l.setStyleSheet("font-size: 20px;")
+        k4.addWidget(l)
+        
+        self.direction=QComboBox()
+        self.direction.setStyleSheet("font-size: 20px;")
+        self.direction.addItems([QCoreApplication.translate("ecl","right"),QCoreApplication.translate("ecl","left"),QCoreApplication.translate("ecl","stop")])
+        if self.cmdline.split()[3][:1]=="r": self.direction.setCurrentIndex(0)
+        elif self.cmdline.split()[3][:1]=="l": self.direction.setCurrentIndex(1)
+        elif self.cmdline.split()[3][:1]=="s": self.direction.setCurrentIndex(2)
+        k4.addWidget(self.direction)
+        
+        k9=QHBoxLayout()
+        k9.addLayout(k3)
+        k9.addStretch()
+        k9.addLayout(k4)
+        
+        self.layout.addLayout(k9)
+        
+        
+        self.layout.addStretch()
+        
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="Motor " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
+        if self.direction.currentIndex()==0: d="r"
+        elif self.direction.currentIndex()==1: d="l"
+        elif self.direction.currentIndex()==2:
+            d="s"
+            self.value.setText("0")
+            
+        self.cmdline=self.cmdline + d + " " + self.value.text()
+        self.close()
+    
+    def ifChanged(self):
+        self.port.clear()
+        if self.interface.currentText()=="HAT":
+            self.port.addItems(["M 1","M 2"])
+        else:
+            self.port.addItems(["M 1","M 2","M 3","M 4"])
+                
+        self.valueChanged()
+        
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.value.setText(queryVarName(self.variables,self.value.text()))  
+    
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            self.value.setText(str(int(t)))
+        except:
+            
+            self.value.setText(a)
+            
+        self.valueChanged()
+        
+    def valueChanged(self):
+        try:            
+            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
+            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
+        except:
+            pass
+
+class editMotorPulsewheel(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","MotorP"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+        k1=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Device"))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k1.addWidget(l)
+        
+        self.interface=QComboBox()
+        self.interface.setStyleSheet("font-size: 20px;")
+        self.interface.addItems(["RIF","TXT","FTD","HAT"])
+
+        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
+        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
+        if self.cmdline.split()[1]=="HAT": self.interface.setCurrentIndex(3)
+        
+        self.interface.currentIndexChanged.connect(self.ifChanged)
+        k1.addWidget(self.interface)
+        
+        #self.layout.addStretch()
+        
+        k2=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Port"))
+        l.setStyleSheet("font-size: 20px;")
+        k2.addWidget(l)
+        
+        self.port=QComboBox()
+        self.port.setStyleSheet("font-size: 20px;")
+
+
+        k2.addWidget(self.port)
+        
+        k8=QHBoxLayout()
+        k8.addLayout(k1)
+        k8.addStretch()
+        k8.addLayout(k2)
+        
+        self.layout.addLayout(k8)        
+        
+        k3=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Value"))
+        l.setStyleSheet("font-size: 20px;")
+        k3.addWidget(l)     
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 20px;")
+        self.value.setText(self.cmdline.split()[6])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        k3.addWidget(self.value)
+        
+        k4=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Direction"))
+        l.setStyleSheet("font-size: 20px;")
+        k4.addWidget(l)
+        
+        self.direction=QComboBox()
+        self.direction.setStyleSheet("font-size: 20px;")
+        self.direction.addItems([QCoreApplication.translate("ecl","right"),QCoreApplication.translate("ecl","left"),QCoreApplication.translate("ecl","stop")])
+        if self.cmdline.split()[5][:1]=="r": self.direction.setCurrentIndex(0)
+        elif self.cmdline.split()[5][:1]=="l": self.direction.setCurrentIndex(1)
+        elif self.cmdline.split()[5][:1]=="s": self.direction.setCurrentIndex(2)
+        k4.addWidget(self.direction)
+        
+        k9=QHBoxLayout()
+        k9.addLayout(k3)
+        k9.addStretch()
+        k9.addLayout(k4)
+        
+        self.layout.addLayout(k9)
+    
+        self.layout.addStretch()
+        
+        k5=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "End Sw."))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k5.addWidget(l)
+        
+        self.endSw=QComboBox()
+        self.endSw.setStyleSheet("font-size: 20px;")
+
+        k5.addWidget(self.endSw)
+        
+        #self.layout.addStretch()
+        
+        k6=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Pulse Inp."))
+        l.setStyleSheet("font-size: 20px;")
+        k6.addWidget(l)
+        
+        self.pulseSw=QComboBox()
+        self.pulseSw.setStyleSheet("font-size: 20px;")
+        
+        k6.addWidget(self.pulseSw)
+        
+        k10=QHBoxLayout()
+        k10.addLayout(k5)
+        k10.addStretch()
+        k10.addLayout(k6)
+        
+        self.layout.addLayout(k10)
+        self.layout.addStretch()
+        
+        k13=QHBoxLayout()
+        
+        k11=QLabel("Pulses")
+        k11.setStyleSheet("font-size: 20px;")
+        
+        k13.addWidget(k11)
+        k13.addStretch()
+        
+        self.pulses=QLineEdit(self.cmdline.split()[7])
+        self.pulses.setReadOnly(True)
+        self.pulses.setStyleSheet("font-size: 20px;")
+        self.pulses.mousePressEvent=self.plsPress
+        self.pulses.mouseReleaseEvent=self.plsRelease
+        k13.addWidget(self.pulses)
+        
+        self.layout.addLayout(k13)
+        self.ifChanged()
+        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
+        self.endSw.setCurrentIndex(int(self.cmdline.split()[3])-1)
+        self.pulseSw.setCurrentIndex(int(self.cmdline.split()[4])-1)
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="MotorP " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
+        self.cmdline=self.cmdline + self.endSw.currentText()[2:] + " " + self.pulseSw.currentText()[2:] + " "
+        
+        if self.direction.currentIndex()==0: d="r"
+        elif self.direction.currentIndex()==1: d="l"
+        elif self.direction.currentIndex()==2:
+            d="s"
+            self.value.setText("0")
+            
+        self.cmdline=self.cmdline + d + " " + self.value.text()
+        self.cmdline=self.cmdline + " " + self.pulses.text()
+        self.close()
+    
+    def ifChanged(self):
+        self.port.clear()
+        self.pulseSw.clear()
+        self.endSw.clear()
+        
+        if self.interface.currentText()=="HAT":
+            self.port.addItems(["M 1","M 2"])
+            self.pulseSw.addItems(["I 1","I 2","I 3","I 4"])
+            self.endSw.addItems(["I 1","I 2","I 3","I 4"])
+        else:
+            self.port.addItems(["M 1","M 2","M 3","M 4"])
+            self.pulseSw.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
+            self.endSw.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
+
+        self.valueChanged()
+    
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btn=1
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
+        else:           self.pulses.setText(queryVarName(self.variables,self.pulses.text())) 
+            
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            self.value.setText(str(int(t)))
+        except:
+            self.value.setText(a)
+            
+        self.valueChanged()
+        
+    def valueChanged(self):
+        try:            
+            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
+            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
+        except:
+            pass
+        
+    def plsPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.btn=2
+        self.timer.start(500)
+     
+    def plsRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.pulses.text())
+            except:
+                self.pulses.setText("0")  
+            self.getPulses(1)
+            
+    def getPulses(self,m):
+        a=self.pulses.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Pulses"),a,self).exec_()
+        try:
+            if int(t)<0: t=str(0)
+            if int(t)>9999: t=str(9999)
+            t=str(int(t))
+        except:
+            t=a
+        self.pulses.setText(t)
+
+class editMotorEncoder(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","MotorE"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+        k1=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Device"))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k1.addWidget(l)
+        
+        self.interface=QComboBox()
+        self.interface.setStyleSheet("font-size: 20px;")
+        self.interface.addItems(["TXT"])
+
+        self.interface.currentIndexChanged.connect(self.ifChanged)
+        k1.addWidget(self.interface)
+        
+        #self.layout.addStretch()
+        
+        k2=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Port"))
+        l.setStyleSheet("font-size: 20px;")
+        k2.addWidget(l)
+        
+        self.port=QComboBox()
+        self.port.setStyleSheet("font-size: 20px;")
+        self.port.addItems(["M 1","M 2","M 3","M 4"])
+
+        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
+        k2.addWidget(self.port)
+        
+        k8=QHBoxLayout()
+        k8.addLayout(k1)
+        k8.addStretch()
+        k8.addLayout(k2)
+        
+        self.layout.addLayout(k8)        
+        
+        k3=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Value"))
+        l.setStyleSheet("font-size: 20px;")
+        k3.addWidget(l)     
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 20px;")
+        self.value.setText(self.cmdline.split()[5])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        k3.addWidget(self.value)
+        
+        k4=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Direction"))
+        l.setStyleSheet("font-size: 20px;")
+        k4.addWidget(l)
+        
+        self.direction=QComboBox()
+        self.direction.setStyleSheet("font-size: 20px;")
+        self.direction.addItems([QCoreApplication.translate("ecl","right"),QCoreApplication.translate("ecl","left"),QCoreApplication.translate("ecl","stop")])
+        if self.cmdline.split()[4][:1]=="r": self.direction.setCurrentIndex(0)
+        elif self.cmdline.split()[4][:1]=="l": self.direction.setCurrentIndex(1)
+        elif self.cmdline.split()[4][:1]=="s": self.direction.setCurrentIndex(2)
+        k4.addWidget(self.direction)
+        
+        k9=QHBoxLayout()
+        k9.addLayout(k3)
+        k9.addStretch()
+        k9.addLayout(k4)
+        
+        self.layout.addLayout(k9)
+    
+        self.layout.addStretch()
+        
+        k5=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "End Sw."))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k5.addWidget(l)
+        
+        self.endSw=QComboBox()
+        self.endSw.setStyleSheet("font-size: 20px;")
+        self.endSw.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
+        self.endSw.setCurrentIndex(int(self.cmdline.split()[3])-1)
+
+        k5.addWidget(self.endSw)
+        
+        #self.layout.addStretch()
+
+        self.layout.addLayout(k5)
+        self.layout.addStretch()
+        
+        k13=QHBoxLayout()
+        
+        k11=QLabel("Pulses")
+        k11.setStyleSheet("font-size: 20px;")
+        
+        k13.addWidget(k11)
+        k13.addStretch()
+        
+        self.pulses=QLineEdit(self.cmdline.split()[6])
+        self.pulses.setReadOnly(True)
+        self.pulses.setStyleSheet("font-size: 20px;")
+        self.pulses.mousePressEvent=self.plsPress
+        self.pulses.mouseReleaseEvent=self.plsRelease
+        k13.addWidget(self.pulses)
+        
+        self.layout.addLayout(k13)
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="MotorE " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
+        self.cmdline=self.cmdline + self.endSw.currentText()[2:] + " "
+        
+        if self.direction.currentIndex()==0: d="r"
+        elif self.direction.currentIndex()==1: d="l"
+        elif self.direction.currentIndex()==2:
+            d="s"
+            self.value.setText("0")
+            
+        self.cmdline=self.cmdline + d + " " + self.value.text()
+        self.cmdline=self.cmdline + " " + self.pulses.text()
+        self.close()
+    
+    def ifChanged(self):
+        self.valueChanged()
+        
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btn=1
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
+        else:           self.pulses.setText(queryVarName(self.variables,self.pulses.text())) 
+            
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            self.value.setText(str(int(t)))
+        except:
+            self.value.setText(a)
+            
+        self.valueChanged()
+        
+    def valueChanged(self):
+        try:            
+            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
+            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
+        except:
+            pass
+        
+    def plsPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.btn=2
+        self.timer.start(500)
+     
+    def plsRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.pulses.text())
+            except:
+                self.pulses.setText("0")  
+            self.getPulses(1)
+            
+    def getPulses(self,m):
+        a=self.pulses.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Pulses"),a,self).exec_()
+        try:
+            if int(t)<0: t=str(0)
+            if int(t)>9999: t=str(9999)
+            t=str(int(t))
+        except:
+            t=a
+        self.pulses.setText(t)
+
+class editMotorEncoderSync(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","MotorES"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+        k1=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Device"))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k1.addWidget(l)
+        
+        self.interface=QComboBox()
+        self.interface.setStyleSheet("font-size: 20px;")
+        self.interface.addItems(["TXT"])
+
+        self.interface.currentIndexChanged.connect(self.ifChanged)
+        k1.addWidget(self.interface)
+        
+        #self.layout.addStretch()
+        
+        k2=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Port"))
+        l.setStyleSheet("font-size: 20px;")
+        k2.addWidget(l)
+        
+        self.port=QComboBox()
+        self.port.setStyleSheet("font-size: 20px;")
+        self.port.addItems(["M 1","M 2","M 3","M 4"])
+
+        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
+        k2.addWidget(self.port)
+        
+        k8=QHBoxLayout()
+        k8.addLayout(k1)
+        k8.addStretch()
+        k8.addLayout(k2)
+        
+        self.layout.addLayout(k8)        
+        
+        k3=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Value"))
+        l.setStyleSheet("font-size: 20px;")
+        k3.addWidget(l)     
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 20px;")
+        self.value.setText(self.cmdline.split()[5])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        k3.addWidget(self.value)
+        
+        k4=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Direction"))
+        l.setStyleSheet("font-size: 20px;")
+        k4.addWidget(l)
+        
+        self.direction=QComboBox()
+        self.direction.setStyleSheet("font-size: 20px;")
+        self.direction.addItems([QCoreApplication.translate("ecl","right"),QCoreApplication.translate("ecl","left"),QCoreApplication.translate("ecl","stop")])
+        if self.cmdline.split()[4][:1]=="r": self.direction.setCurrentIndex(0)
+        elif self.cmdline.split()[4][:1]=="l": self.direction.setCurrentIndex(1)
+        elif self.cmdline.split()[4][:1]=="s": self.direction.setCurrentIndex(2)
+        k4.addWidget(self.direction)
+        
+        k9=QHBoxLayout()
+        k9.addLayout(k3)
+        k9.addStretch()
+        k9.addLayout(k4)
+        
+        self.layout.addLayout(k9)
+    
+        self.layout.addStretch()
+        
+        k5=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Sync to"))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k5.addWidget(l)
+        
+        self.syncTo=QComboBox()
+        self.syncTo.setStyleSheet("font-size: 20px;")
+        self.syncTo.addItems(["M 1","M 2","M 3","M 4"])
+        self.syncTo.setCurrentIndex(int(self.cmdline.split()[3])-1)
+
+        k5.addWidget(self.syncTo)
+        
+        #self.layout.addStretch()
+
+        self.layout.addLayout(k5)
+        self.layout.addStretch()
+        
+        k13=QHBoxLayout()
+        
+        k11=QLabel("Pulses")
+        k11.setStyleSheet("font-size: 20px;")
+        
+        k13.addWidget(k11)
+        k13.addStretch()
+        
+        self.pulses=QLineEdit(self.cmdline.split()[6])
+        self.pulses.setReadOnly(True)
+        self.pulses.setStyleSheet("font-size: 20px;")
+        self.pulses.mousePressEvent=self.plsPress
+        self.pulses.mouseReleaseEvent=self.plsRelease
+        k13.addWidget(self.pulses)
+        
+        self.layout.addLayout(k13)
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="MotorES " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
+        self.cmdline=self.cmdline + self.syncTo.currentText()[2:] + " "
+        
+        if self.direction.currentIndex()==0: d="r"
+        elif self.direction.currentIndex()==1: d="l"
+        elif self.direction.currentIndex()==2:
+            d="s"
+            self.value.setText("0")
+            self.pulses.setText("0")
+            
+        self.cmdline=self.cmdline + d + " " + self.value.text()
+        self.cmdline=self.cmdline + " " + self.pulses.text()
+        self.close()
+    
+    def ifChanged(self):
+        self.valueChanged()
+        
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btn=1
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
+        else:           self.pulses.setText(queryVarName(self.variables,self.pulses.text())) 
+            
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            self.value.setText(str(int(t)))
+        except:
+            self.value.setText(a)
+            
+        self.valueChanged()
+        
+    def valueChanged(self):
+        try:            
+            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
+            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
+        except:
+            pass
+        
+    def plsPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.btn=2
+        self.timer.start(500)
+     
+    def plsRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.pulses.text())
+            except:
+                self.pulses.setText("0")  
+            self.getPulses(1)
+            
+    def getPulses(self,m):
+        a=self.pulses.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Pulses"),a,self).exec_()
+        try:
+            if int(t)<0: t=str(0)
+            if int(t)>9999: t=str(9999)
+            t=str(int(t))
+        except:
+            t=a
+        self.pulses.setText(t)
+
+class editServo(TouchDialog):
+    def __init__(self, cmdline, vari, parent=None):
+        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Servo"), parent)
+        
+        self.cmdline=cmdline
+        self.variables=vari
+    
+    def exec_(self):
+    
+        self.confirm = self.titlebar.addConfirm()
+        self.confirm.clicked.connect(self.on_confirm)
+    
+        self.titlebar.setCancelButton()
+        
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timedOut)
+        
+        self.layout=QVBoxLayout()
+        
+        k1=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl", "Device"))
+        l.setStyleSheet("font-size: 20px;")
+        
+        k1.addWidget(l)
+        
+        self.interface=QComboBox()
+        self.interface.setStyleSheet("font-size: 20px;")
+        self.interface.addItems(["SRD","FTD","TXT"])
+
+        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(2)
+        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(1)
+        self.interface.currentIndexChanged.connect(self.ifChanged)
+        k1.addWidget(self.interface)
+        
+        #self.layout.addStretch()
+        
+        k2=QVBoxLayout()
+        l=QLabel(QCoreApplication.translate("ecl","Port"))
+        l.setStyleSheet("font-size: 20px;")
+        k2.addWidget(l)
+        
+        self.port=QComboBox()
+        self.port.setStyleSheet("font-size: 20px;")
+        self.port.addItems(["S00","S01","S02","S03","S04","S05","S06","S07","S08","S09","S10","S11","S12","S13","S14","S15"])
+        p=self.cmdline.split()[2]
+        self.port.setCurrentIndex(int(p[1:]))
+        k2.addWidget(self.port)
+        
+        k9=QHBoxLayout()
+        k9.addLayout(k1)
+        k9.addStretch()
+        k9.addLayout(k2)
+        
+        self.layout.addLayout(k9)
+        
+        l=QLabel(QCoreApplication.translate("ecl","Value"))
+        l.setStyleSheet("font-size: 20px;")
+        self.layout.addWidget(l)     
+        
+        self.value=QLineEdit()
+        self.value.setReadOnly(True)
+        self.value.setStyleSheet("font-size: 20px;")
+        self.value.setText(self.cmdline.split()[3])
+        self.value.mousePressEvent=self.valPress
+        self.value.mouseReleaseEvent=self.valRelease
+        self.layout.addWidget(self.value)
+        
+        self.layout.addStretch()
+        
+        self.centralWidget.setLayout(self.layout)
+        
+        TouchDialog.exec_(self)
+        return self.cmdline
+    
+    def on_confirm(self):
+        self.cmdline="Servo " +self.interface.currentText()+ " " + self.port.currentText() + " " + self.value.text()
+        self.close()
+    
+    def ifChanged(self):
+        self.valueChanged()
+
+    def valPress(self,sender):
+        if self.timer.isActive(): self.timer.stop()
+        self.btnTimedOut=False
+        self.timer.start(500)
+    
+    def timedOut(self):
+        self.btnTimedOut=True
+        self.timer.stop()
+        self.value.setText(queryVarName(self.variables,self.value.text()))  
+    
+    def valRelease(self,sender):
+        self.timer.stop()
+        if not self.btnTimedOut:
+            try:
+                int(self.value.text())
+            except:
+                self.value.setText("0")  
+            self.getValue(1)
+    
+    def getValue(self,m):
+        a=self.value.text()
+        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
+        try:
+            self.value.setText(str(int(t)))
+        except:
+            
+            self.value.setText(a)
+            
+        self.valueChanged()
+        
+    def valueChanged(self):
+        try:            
+            self.value.setText(str(max(0,min(4095,int(self.value.text())))))
+        except:
+            pass
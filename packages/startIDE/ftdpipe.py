@@ -0,0 +1,40 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# pipelined command transport for the ftDuino
+#
+# The ftduino_direct firmware answers every command with exactly one line.
+# Instead of one USB round trip per command, FtdPipe writes a whole batch
+# of commands in one go and then collects the replies in the same order.
+# Callers sharing one ftDuino between threads have to serialize the calls.
+#
+# The apps are installed one by one, so each ships its own copy. This one
+# follows packages/ftDuinIO/ftdpipe.py without readAll(), which only
+# ftDuinIO uses; changes to comm() and batch() belong into both.
+#
+
+class FtdPipe(object):
+
+    def __init__(self, duino):
+        self.duino=duino
+
+    def comm(self, command):
+        return self.duino.comm(command)
+
+    def batch(self, commands):
+        # returns the list of replies, one per command
+        if len(commands)==0: return []
+
+        ser=getattr(self.duino, "ftduino", None)
+        if not hasattr(ser, "readline"):
+            return [self.duino.comm(c) for c in commands]
+
+        try:
+            ser.flushInput()
+            ser.write("".join([c+"\n" for c in commands]).encode("utf-8"))
+            ret=[]
+            for c in commands:
+                ret.append(ser.readline().decode("utf-8").strip())
+            return ret
+        except:
+            return ["Fail"]*len(commands)
@@ -0,0 +1,422 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# headless runner for startIDE projects
+#
+# Runs a project through the execThread of startide.py without the touch
+# GUI and without hardware. TXT, ftDuino, RoboInterface and HAT are replaced
+# by stand-ins that read their inputs from a scripted trace and record
+# everything that is sent to outputs and motors. The canvas is replaced by a
+# stand-in that records the drawing commands.
+#
+# usage: headless.py [-t trace.json] [-n runs] [-l seconds] [-o] [-g] project [project ...]
+#
+#   project   file name in projects/ or path to a json code file
+#   -t        input trace, see below
+#   -n        number of runs per project, the best run is reported
+#   -l        stop the program after this time, for endless programs
+#   -o        print the stream of output commands
+#   -g        print the Python code generated for projects using #PYTHON
+#
+# The input trace is a json dict of devices ("TXT", "FTD", "RIF", "HAT")
+# with a dict of channels each. A channel is either a constant or a list of
+# [time in ms, value] pairs, the value holds from its time on:
+#
+#   { "TXT": { "I1": [[0,0],[500,1],[600,0]], "C1": [[0,0],[1000,25]] },
+#     "FTD": { "I2": 1, "D1": 30 },
+#     "ANSWER": [ "5", "1" ] }
+#
+# Channel names are I1..I8 (inputs), C1..C4 (counters), D1/D2, A1/A2, AX,
+# AY and IR as far as the device knows them. "ANSWER" holds the replies to
+# FromKeypad, FromDial, FromButtons and the array requesters in order.
+#
+# startide.py is imported as it is. Neither a display, a TXT nor an
+# interface is needed, and PyQt4 and the TouchStyle modules are replaced by
+# the stand-ins of qtstandin.py where they are not installed.
+#
+
+import sys, os, json, time
+import threading as thd
+from array import array
+
+hostdir = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, hostdir)
+
+import qtstandin
+qtstandin.install()
+
+from PyQt4.QtCore import QObject, QCoreApplication, pyqtSignal
+import startide
+
+class InputTrace():
+    def __init__(self, trace=None):
+        if trace==None: trace={}
+        self.trace=trace
+        self.answers=list(trace.get("ANSWER",[]))
+        self.t0=time.time()
+
+    def start(self):
+        self.t0=time.time()
+
+    def value(self, dev, channel, default=0):
+        v=self.trace.get(dev,{}).get(channel,default)
+        if not isinstance(v, list): return v
+        t=(time.time()-self.t0)*1000
+        r=default
+        for e in v:
+            if e[0]>t: break
+            r=e[1]
+        return r
+
+    def answer(self, default):
+        if len(self.answers)>0: return str(self.answers.pop(0))
+        return str(default)
+
+class OutputLog():
+    def __init__(self):
+        self.t0=time.time()
+        self.events=[]
+
+    def start(self):
+        self.t0=time.time()
+        self.events=[]
+
+    def add(self, source, *what):
+        self.events.append((int((time.time()-self.t0)*1000), source)+what)
+
+#
+# interface stand-ins
+#
+
+class SimTXTInput():
+    def __init__(self, txt, n):
+        self.txt=txt
+        self.channel="I"+str(n)
+
+    def state(self):
+        return int(self.txt.trace.value("TXT", self.channel))
+
+    def value(self):
+        return int(self.txt.trace.value("TXT", self.channel, 15000))
+
+    def voltage(self):
+        return int(self.txt.trace.value("TXT", self.channel))
+
+    def distance(self):
+        return int(self.txt.trace.value("TXT", self.channel, 1023))
+
+class SimTXTOutput():
+    def __init__(self, txt, n):
+        self.txt=txt
+        self.n=n
+
+    def setLevel(self, v):
+        self.txt.log.add("TXT", "O"+str(self.n), v)
+
+class SimTXTMotor():
+    def __init__(self, txt, n):
+        self.txt=txt
+        self.n=n
+
+    def setSpeed(self, v):
+        self.txt.log.add("TXT", "M"+str(self.n), v)
+
+    def stop(self):
+        self.txt.log.add("TXT", "M"+str(self.n), 0)
+
+    def setDistance(self, n, syncto=None):
+        self.txt.log.add("TXT", "M"+str(self.n)+" distance", n)
+
+    def finished(self):
+        return True
+
+class SimTXT():
+    C_OUTPUT = 0
+    C_MOTOR = 1
+    C_SWITCH = 1
+    C_RESISTOR = 1
+    C_VOLTAGE = 0
+    C_ULTRASONIC = 3
+    C_DIGITAL = 0
+    C_ANALOG = 1
+
+    def __init__(self, trace, log):
+        self.trace=trace
+        self.log=log
+        self.counterOffset=[0,0,0,0]
+
+    def setConfig(self, M, I): pass
+    def updateConfig(self): pass
+
+    def updateWait(self):
+        # the real TXT exchanges its I/O every 10ms
+        time.sleep(0.01)
+
+    def input(self, n): return SimTXTInput(self, n)
+    def resistor(self, n): return SimTXTInput(self, n)
+    def voltage(self, n): return SimTXTInput(self, n)
+    def ultrasonic(self, n): return SimTXTInput(self, n)
+    def output(self, n): return SimTXTOutput(self, n)
+    def motor(self, n): return SimTXTMotor(self, n)
+
+    def getCurrentCounterValue(self, i):
+        return int(self.trace.value("TXT", "C"+str(i+1)))-self.counterOffset[i]
+
+    def incrCounterCmdId(self, i):
+        self.counterOffset[i]=int(self.trace.value("TXT", "C"+str(i+1)))
+
+    def setPwm(self, i, v):
+        self.log.add("TXT", "O"+str(i+1), v)
+
+    def play_sound(self, snd, loop, vol):
+        self.log.add("TXT", "sound", snd, loop, vol)
+
+class SimSerial():
+    def __init__(self):
+        self.timeout=0.1
+
+class SimFTD():
+    def __init__(self, trace, log):
+        self.trace=trace
+        self.log=log
+        self.ftduino=SimSerial()
+
+    def comm(self, command):
+        c=command.split()
+        if c[0]=="input_get":
+            return str(self.trace.value("FTD", c[1].upper()))
+        elif c[0]=="counter_get":
+            return str(self.trace.value("FTD", c[1].upper()))
+        elif c[0]=="ultrasonic_get":
+            return str(self.trace.value("FTD", "D1", 1023))
+        elif c[0]=="ftduino_id_get":
+            return "headless"
+        elif c[0]=="i2c_read":
+            return str(self.trace.value("FTD", "I2C", ""))
+        self.log.add("FTD", command)
+        return "Ok"
+
+class SimRIF():
+    def __init__(self, trace, log):
+        self.trace=trace
+        self.log=log
+
+    def GetDeviceTypeString(self): return "Robo Interface"
+
+    def Digital(self, n): return int(self.trace.value("RIF", "I"+str(n)))
+    def GetA1(self): return int(self.trace.value("RIF", "A1"))
+    def GetA2(self): return int(self.trace.value("RIF", "A2"))
+    def GetAX(self): return int(self.trace.value("RIF", "AX"))
+    def GetAX_Slave1(self): return int(self.trace.value("RIF", "AX"))
+    def GetAX_Slave2(self): return int(self.trace.value("RIF", "AX"))
+    def GetAX_Slave3(self): return int(self.trace.value("RIF", "AX"))
+    def GetAY(self): return int(self.trace.value("RIF", "AY"))
+    def GetD1(self): return int(self.trace.value("RIF", "D1"))
+    def GetD2(self): return int(self.trace.value("RIF", "D2"))
+    def GetIR(self): return int(self.trace.value("RIF", "IR"))
+
+    def SetOutput(self, n, v):
+        self.log.add("RIF", "O"+str(n), v)
+
+    def SetMotor(self, n, d, v):
+        self.log.add("RIF", "M"+str(n), d, v)
+
+class SimHAT():
+    def __init__(self, trace, log):
+        self.trace=trace
+        self.log=log
+
+    def get_input(self, i):
+        return bool(self.trace.value("HAT", i))
+
+    def m_set_pwm(self, motor, v):
+        self.log.add("HAT", motor, v)
+
+    def m_set_mode(self, motor, mode):
+        self.log.add("HAT", motor, mode)
+
+#
+# GUI stand-in
+#
+
+class HeadlessParent(QObject):
+    # signals the execThread connects to in the GUI
+    msgBack=pyqtSignal(int)
+    IMsgBack=pyqtSignal(str)
+    gfxData=pyqtSignal(int, int, int, int, int, int, int)
+    mousePos=pyqtSignal(int, int)
+    stop=pyqtSignal()
+    click=pyqtSignal()
+    release=pyqtSignal()
+    outputClicked=pyqtSignal()
+
+    def processEvents(self):
+        QCoreApplication.processEvents()
+
+class HeadlessRunner():
+    def __init__(self, code, trace=None):
+        self.code=code
+        self.trace=InputTrace(trace)
+        self.log=OutputLog()
+        self.parent=HeadlessParent()
+
+        # only the interfaces the code refers to are "connected"
+        self.TXT=None
+        self.FTD=None
+        self.RIF=None
+        self.hat=None
+        if self.uses("TXT"): self.TXT=SimTXT(self.trace, self.log)
+        if self.uses("FTD"): self.FTD=SimFTD(self.trace, self.log)
+        if self.uses("RIF"): self.RIF=SimRIF(self.trace, self.log)
+        if self.uses("HAT"): self.hat=SimHAT(self.trace, self.log)
+
+        # canvas stand-in
+        self.xpos=0
+        self.ypos=0
+        self.pen=(0,0,0)
+        self.pixels={}
+
+    def uses(self, dev):
+        for line in self.code:
+            a=line.split()
+            if len(a)>1 and dev in a[1]: return True
+        return False
+
+    def run(self, limit=None):
+        # returns wall time [s] and the number of executed lines
+        self.et=startide.execThread(list(self.code), None, None, self.RIF, self.TXT, self.FTD, self.hat, self.parent)
+        et=self.et
+        et.textReady.connect(self.updateText)
+        et.showMessage.connect(self.showMessage)
+        et.requestKeyboard.connect(self.requestKeyboard)
+        et.requestDial.connect(self.requestDial)
+        et.requestBtn.connect(self.requestButton)
+        et.requestArray.connect(self.requestArray)
+        et.canvasSig.connect(self.canvasSig)
+        et.canvasFlush.connect(self.canvasFlush)
+
+        self.trace.start()
+        self.log.start()
+        if limit!=None:
+            timer=thd.Timer(limit, et.stop)
+            timer.start()
+        t=time.time()
+        et.run()
+        t=time.time()-t
+        if limit!=None: timer.cancel()
+        return t, et.steps
+
+    def updateText(self):
+        # called directly from the exec thread, so no line is ever skipped
+        (cleared, skipped, lines)=self.et.takeText()
+        if cleared: self.log.add("Clear")
+        for line in lines: self.log.add("Print", line)
+
+    # the exec thread waits for all of these to be answered
+
+    def showMessage(self, message):
+        self.log.add("Message", message)
+        self.et.msgBack(1)
+
+    def requestKeyboard(self, v, title):
+        self.et.IMsgBack(self.trace.answer(v))
+        self.et.msgBack(1)
+
+    def requestDial(self, msg, v, miv, mav, title):
+        self.et.IMsgBack(self.trace.answer(v))
+        self.et.msgBack(1)
+
+    def requestButton(self, title, msg, buttons):
+        self.et.IMsgBack(self.trace.answer(1))
+        self.et.msgBack(1)
+
+    def requestArray(self, title, files, select):
+        if not (select in files): select=files[0]
+        self.et.IMsgBack(self.trace.answer(select))
+        self.et.msgBack(1)
+
+    def canvasSig(self, stack):
+        self.canvasFlush()
+        if stack=="requestData":
+            r,g,b=self.pixels.get((self.xpos, self.ypos), (0,0,0))
+            self.et.gfxData(240, 240, self.xpos, self.ypos, r, g, b)
+        elif stack=="requestPos":
+            self.et.mousePos(self.xpos, self.ypos)
+        elif stack=="requestRaster":
+            # plotted pixels, black elsewhere
+            (x, y, w, h)=self.et.rasterRect
+            px=array("I", [0xFF000000])*(w*h)
+            for (px_x, px_y), (r, g, b) in self.pixels.items():
+                if x<=px_x<x+w and y<=px_y<y+h:
+                    px[(px_y-y)*w+px_x-x]=0xFF000000|(r<<16)|(g<<8)|b
+            self.et.rasterData=px.tobytes()
+            self.et.msgBack(1)
+
+    def canvasFlush(self):
+        queue=self.et.canvasQueue
+        while len(queue)>0:
+            s=queue.popleft()
+            if s[0]=="Raster":
+                (x, y, w, h)=s[1:5]
+                self.log.add("Canvas", "Raster %i %i %i %i" % (x, y, w, h))
+                px=array("I", s[5])
+                for i in range(len(px)):
+                    self.pixels[(x+i%w, y+i//w)]=((px[i]>>16)&255, (px[i]>>8)&255, px[i]&255)
+                continue
+            self.log.add("Canvas", " ".join([str(i) for i in s]))
+            if s[0]=="Pen" and len(s)>3 and (s[1] in startide.CANVASPAINTOPS or s[1]=="move"):
+                try:
+                    self.xpos=int(s[2])
+                    self.ypos=int(s[3])
+                except:
+                    continue
+                if s[1]=="plot": self.pixels[(self.xpos, self.ypos)]=self.pen
+            elif s[0]=="Color" and len(s)>4 and s[1]=="pen":
+                self.pen=(int(s[2]), int(s[3]), int(s[4]))
+
+def loadCode(name):
+    if not os.path.exists(name): name=os.path.join(startide.projdir, name)
+    with open(name, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+if __name__ == "__main__":
+    app=QCoreApplication(sys.argv)
+
+    trace=None
+    runs=1
+    limit=None
+    output=False
+    source=False
+    projects=[]
+
+    args=sys.argv[1:]
+    while len(args)>0:
+        a=args.pop(0)
+        if a=="-t":
+            with open(args.pop(0), "r", encoding="utf-8") as f:
+                trace=json.load(f)
+        elif a=="-n": runs=max(1, int(args.pop(0)))
+        elif a=="-l": limit=float(args.pop(0))
+        elif a=="-o": output=True
+        elif a=="-g": source=True
+        else: projects.append(a)
+
+    if len(projects)==0:
+        print("usage: headless.py [-t trace.json] [-n runs] [-l seconds] [-o] [-g] project [project ...]")
+        sys.exit(1)
+
+    for name in projects:
+        code=loadCode(name)
+        best=None
+        for i in range(runs):
+            runner=HeadlessRunner(code, trace)
+            dt, steps=runner.run(limit)
+            if best==None or dt<best[0]: best=(dt, steps)
+
+        dt, steps=best
+        if output:
+            for e in runner.log.events:
+                print("%8i %s" % (e[0], " ".join([str(i) for i in e[1:]])))
+        if source:
+            print(runner.et.pySource)
+        print("%s: %i lines in %.3f s, %i lines/s" % (os.path.basename(name), steps, dt, steps/max(dt, 1e-9)))
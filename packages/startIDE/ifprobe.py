@@ -0,0 +1,48 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# concurrent interface probing for startIDE
+#
+# Looking for the Robo interfaces, the TXT, the ftDuino and the HAT takes
+# from a few ms up to seconds per interface, mostly spent waiting for
+# timeouts and for devices to settle. IFProbe runs all probes at the same
+# time, each in a thread of its own, and reports every interface as soon
+# as its probe has finished. The GUI stays usable in the meantime.
+#
+
+import threading, time
+
+class IFProbe(object):
+
+    def __init__(self, probes, found=None):
+        # probes: dict name -> function returning the interface or None
+        # found:  function name, called by the probing thread when the
+        #         result of name is available
+
+        self.found=found
+        self.names=list(probes)
+        self.results={}     # name -> interface or None
+        self.times={}       # name -> seconds since start
+        self.start=time.time()
+
+        self.threads=[]
+        for name in self.names:
+            t=threading.Thread(target=self.probe, args=(name, probes[name]), name="IFProbe "+name)
+            t.daemon=True
+            self.threads.append(t)
+        for t in self.threads: t.start()
+
+    def probe(self, name, function):
+        try:
+            r=function()
+        except:
+            r=None
+        self.times[name]=time.time()-self.start
+        self.results[name]=r
+        if self.found!=None: self.found(name)
+
+    def finished(self):
+        return len(self.results)==len(self.names)
+
+    def wait(self):
+        for t in self.threads: t.join()
@@ -0,0 +1,60 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# decoded image cache for the startIDE canvas
+#
+# Canvas load and Canvas blit take their images from an ImageCache, so a
+# png file is decoded only once as long as it is in use. The cache keeps
+# the most recently used images up to a total size in bytes and drops the
+# least recently used ones first. An image is loaded again when its file
+# has changed.
+#
+
+import os
+from collections import OrderedDict
+
+class ImageCache(object):
+
+    def __init__(self, directory, load, size, maxbytes):
+        # load:     function path -> decoded image, None if that fails
+        # size:     function image -> bytes used
+        # maxbytes: memory cap of all cached images
+        self.directory=directory
+        self.load=load
+        self.size=size
+        self.maxbytes=maxbytes
+        self.entries=OrderedDict()  # name -> (mtime, image, bytes), oldest first
+        self.bytes=0
+
+    def get(self, name):
+        path=os.path.join(self.directory, name)
+        try:
+            mtime=os.path.getmtime(path)
+        except OSError:
+            return None
+
+        e=self.entries.get(name)
+        if e!=None:
+            if e[0]==mtime:
+                self.entries.move_to_end(name)
+                return e[1]
+            self.drop(name)
+
+        image=self.load(path)
+        if image==None: return None
+
+        n=self.size(image)
+        self.entries[name]=(mtime, image, n)
+        self.bytes=self.bytes+n
+        # das neue Bild bleibt auf jeden Fall, auch wenn es allein zu gross ist
+        while self.bytes>self.maxbytes and len(self.entries)>1:
+            self.drop(next(iter(self.entries)))
+        return image
+
+    def drop(self, name):
+        e=self.entries.pop(name)
+        self.bytes=self.bytes-e[2]
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes=0
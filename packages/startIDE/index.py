@@ -4,6 +4,9 @@
 import translator as tr
 import htmlhelper as hth
 import cgi, os, json, sys
+from collections import deque
+from logwriter import readLog
+import arrfile
 from codecs import *
 
 def mainpage():
@@ -55,6 +58,10 @@ def mainpage():
     hth.link(tr.translate("logfile"),"index.py?action=LogCSV") 
     hth.text(tr.translate("to .CSV"))
     hth.lf(2)
+    hth.text(tr.translate("<b>Download</b> a"))
+    hth.link(tr.translate("profiler report"),"index.py?action=ProfDown") 
+    hth.text(tr.translate("as .CSV"))
+    hth.lf(2)
     hth.text(tr.translate("<b>Download</b> an"))
     hth.link(tr.translate("array"),"index.py?action=ADown")
     hth.text(tr.translate("from your TXT."))
@@ -73,13 +80,14 @@ def download(obj:str):
     elif obj=="MC": hth.htmlhead("startIDE", tr.translate("Download a module as a text file"))
     elif obj=="L": hth.htmlhead("startIDE", tr.translate("Download a log file from your TXT"))
     elif obj=="C": hth.htmlhead("startIDE", tr.translate("Download a log file from your TXT"))
+    elif obj=="R": hth.htmlhead("startIDE", tr.translate("Download a profiler report from your TXT"))
     hth.separator()
     hth.lf()
     
     if obj=="A":
         hth.text(tr.translate("Please select array:"))
         hth.lf(2)
-        downloadfiles("arrays/")
+        downloadArrfiles("arrays/")
     elif obj=="P":
         hth.text(tr.translate("Please select project:"))
         hth.lf(2)
@@ -104,6 +112,10 @@ def download(obj:str):
         hth.text(tr.translate("Please select log file:"))
         hth.lf(2)
         downloadCSVfiles("logfiles/")
+    elif obj=="R":
+        hth.text(tr.translate("Please select profiler report:"))
+        hth.lf(2)
+        downloadPROFfiles("logfiles/")
     hth.lf(2)
     hth.separator()
     hth.htmlfoot("","javascript:history.back()",tr.translate("Back"))
@@ -184,6 +196,21 @@ def downloadfiles(directory:str):
         hth.link(a,directory+a,"download")
         hth.lf()    
 
+def downloadArrfiles(directory:str):
+    # binary .arr files are delivered in the text format
+    stack=os.listdir(directory)
+    for a in stack:
+        if a[-4:]==".arr" and arrfile.isBinary(directory+a): hth.link(a,"index.py?arr="+directory+a)
+        else: hth.link(a,directory+a,"download")
+        hth.lf()
+
+def arrconvert(name:str):
+    sys.stdout = open(sys.stdout.fileno(), mode='w', encoding='utf8', buffering=1)
+    print("Content-Type: text/plain; charset=UTF-8")
+    print("Content-Disposition: attachment; filename=%s" % os.path.basename(name))
+    print('')
+    sys.stdout.write(arrfile.toText(name))
+
 def downloadCfiles(directory:str):
     stack=os.listdir(directory)
     for a in stack:
@@ -193,8 +220,21 @@ def downloadCfiles(directory:str):
 def downloadCSVfiles(directory:str):
     stack=os.listdir(directory)
     for a in stack:
-        if a[-4:]==".txt":
+        if a[-4:]==".txt" or a[-4:]==".bin":
             hth.link(a,"index.py?csv="+directory+a)
+            if a[-4:]==".bin":
+                # zeitlich ausgeduennt
+                hth.text("(")
+                hth.link("1s","index.py?csv="+directory+a+"&bucket=1")
+                hth.link("10s","index.py?csv="+directory+a+"&bucket=10")
+                hth.text(")")
+            hth.lf()
+
+def downloadPROFfiles(directory:str):
+    stack=os.listdir(directory)
+    for a in stack:
+        if a[:4]=="prof" and a[-4:]==".csv":
+            hth.link(a,directory+a,"download")
             hth.lf()
 
 def uploader(obj:str, fileitem):
@@ -213,10 +253,24 @@ def uploader(obj:str, fileitem):
             if obj[0]=="I":
                 with open(filename, 'wb') as f:
                     f.write(fileitem.file.read())
+            elif obj[0]=="A":
+                # binary stays binary, text replacing a binary array is converted
+                data=fileitem.file.read()
+                if data[:len(arrfile.ARRMAGIC)]==arrfile.ARRMAGIC:
+                    with open(filename, 'wb') as f:
+                        f.write(data)
+                else:
+                    try:
+                        values=arrfile.parseText(data.decode("utf-8"))
+                    except ValueError:
+                        hth.htmlhead("startIDE", tr.translate("Upload failed"))
+                        hth.text(tr.translate("The array file may only contain integer numbers separated by ';'."))
+                        hth.htmlfoot("","index.py",tr.translate("Back"))
+                        return
+                    arrfile.writeArray(filename, values, arrfile.isBinary(filename))
             else:
                 with open(filename, 'w', encoding="utf-8") as f:
                     f.write(fileitem.file.read().decode())
-            f.close()
         else:
             stack=[]
             for line in fileitem.file:
@@ -260,62 +314,98 @@ def cconvert(name:str):
             sys.stdout.write(i+"\n")
     f.close()
 
-def csvconvert(name:str):
-    varlist=[]
-    with open(name, "r", encoding="utf-8") as f:
-        for line in f:
-            stack=line.split()
-            found=False
-            for v in varlist:
-                if v[0]==stack[0]: found=True
+# size of the output chunks written by csvconvert, and the number of
+# values it keeps in memory at most
+CSVCHUNK=16384
+CSVBUFFER=65536
+
+def csvconvert(name:str, bucket:float=0):
+    sys.stdout = open(sys.stdout.fileno(), mode='w', encoding='utf8', buffering=CSVCHUNK)
+    print("Content-Type: text/plain; charset=UTF-8")
+    print("Content-Disposition: attachment; filename=%s" % os.path.basename(name[:-4]+".csv"))
+    print('')
     
-            if not found: varlist.append([stack[0],0])
-    f.close()
+    out=[]
+    size=0
+    for line in csvLines(name, bucket):
+        out.append(line)
+        size=size+len(line)
+        if size>CSVCHUNK:
+            sys.stdout.write("".join(out))
+            out=[]
+            size=0
+    sys.stdout.write("".join(out))
+
+def csvLines(name:str, bucket:float=0):
+    # the lines of the .csv file for a log
     
-    for i in range(0,len(varlist)):
-        varlist[i][1]=open(name+"-csv-export-"+str(i), "w", encoding="utf-8")
-        varlist[i][1].write(varlist[i][0]+"\n")
+    # erster Durchlauf: Spalten und Anzahl der Werte je Variable
+    columns={}
+    counts=[]
+    timed=True
+    for (t,var,value) in readLog(name):
+        if not var in columns:
+            columns[var]=len(counts)
+            counts.append(0)
+        counts[columns[var]]+=1
+        if t==None: timed=False
     
-    with open(name, "r", encoding="utf-8") as f:
-        for line in f:
-            stack=line.split()
-            found=-1
-            for i in range(0,len(varlist)):
-                if varlist[i][0]==stack[0]: found=i
-            
-            if found>-1:
-                if len(stack)>1:
-                    varlist[found][1].write(str(stack[1])+"\n")
-                else:
-                    varlist[found][1].write("-\n")
-    f.close()
+    header=[None]*len(columns)
+    for var in columns: header[columns[var]]=var
     
-    for v in varlist:
-        v[1].close()
+    if timed and bucket>0:
+        # eine Zeile je Zeitabschnitt, mit dem letzten Wert jeder Variablen
+        yield "time;"+";".join(header)+"\n"
+        row=None
+        t0=None
+        for (t,var,value) in readLog(name):
+            if t0==None: t0=t
+            b=int((t-t0)/bucket)
+            if row==None or b!=rb:
+                if row!=None: yield ("%.3f;" % (rb*bucket))+";".join(row)+"\n"
+                row=[""]*len(header)
+                rb=b
+            stack=value.split()
+            if len(stack)>0: row[columns[var]]=stack[0]
+            else: row[columns[var]]="-"
+        if row!=None: yield ("%.3f;" % (rb*bucket))+";".join(row)+"\n"
+        return
     
-    for i in range(0,len(varlist)):
-        varlist[i][1]=open(name+"-csv-export-"+str(i), "r", encoding="utf-8")
-        
-    ofs =len(varlist)
+    # eine Spalte je Variable, Zeilen werden ausgegeben, sobald alle
+    # Spalten mit noch ausstehenden Werten einen Wert haben. Gepuffert
+    # werden je Spalte hoechstens window Werte; was nicht mehr passt, holt
+    # ein weiterer Durchlauf ab der ersten noch fehlenden Zeile.
+    yield ";".join(header)+";\n"
+    rows=max(counts, default=0)
+    window=max(1, CSVBUFFER//max(1, len(header)))
+    emitted=0
     
-    print("Content-Type: text/plain; charset=UTF-8")
-    print("Content-Disposition: attachment; filename=%s" % os.path.basename(name[:-4]+".csv"))
-    print('')
+    while emitted<rows:
+        buffers=[deque() for i in header]
+        seen=[0]*len(header)
+        waiting=len([c for c in counts if c>emitted])
         
-    while ofs>0:
-        for i in range(0, len(varlist)):
-            ln=""
-            if not varlist[i][1].closed: ln=varlist[i][1].readline()
-            if ln: sys.stdout.write(ln[:-1]+";") 
-            elif not varlist[i][1].closed:
-                varlist[i][1].close()
-                ofs=ofs-1 
-        
-        sys.stdout.write("\n")
-    
-    for i in range(0,len(varlist)):
-        varlist[i][1].close()
-        os.remove(name+"-csv-export-"+str(i))
+        for (t,var,value) in readLog(name):
+            i=columns[var]
+            n=seen[i]
+            seen[i]+=1
+            # nur der naechste Wert der Spalte, und nur solange Platz ist
+            if n!=emitted+len(buffers[i]) or len(buffers[i])>=window: continue
+            
+            stack=value.split()
+            if len(stack)>0: buffers[i].append(stack[0])
+            else: buffers[i].append("-")
+            if len(buffers[i])==1: waiting-=1
+            
+            while waiting==0 and emitted<rows:
+                row=[]
+                for i in range(0,len(buffers)):
+                    if counts[i]>emitted: row.append(buffers[i].popleft())
+                    else: row.append("")
+                emitted+=1
+                for i in range(0,len(buffers)):
+                    if counts[i]>emitted and len(buffers[i])==0: waiting+=1
+                yield ";".join(row)+";\n"
         
 # *****************************************************
 # *************** Ab hier geht's los ******************
@@ -338,6 +428,7 @@ if __name__ == "__main__":
         if form["action"].value=="MList": codelist("M")
         if form["action"].value=="LogDown": download("L")
         if form["action"].value=="LogCSV": download("C")
+        if form["action"].value=="ProfDown": download("R")
         if form["action"].value=="ADown": download("A")
         if form["action"].value=="AUp": upload("A")
         if form["action"].value=="PICUp": upload("I")
@@ -354,9 +445,13 @@ if __name__ == "__main__":
     elif "list" in form:
         filelister(form["list"].value)
     elif "csv" in form:
-        csvconvert(form["csv"].value)
+        # nur .bin Logs haben Zeitstempel zum Ausduennen
+        if "bucket" in form and form["csv"].value[-4:]==".bin": csvconvert(form["csv"].value, float(form["bucket"].value))
+        else: csvconvert(form["csv"].value)
     elif "dc" in form:
         cconvert(form["dc"].value)
+    elif "arr" in form:
+        arrconvert(form["arr"].value)
     elif "image" in form:
         uploader("I", form["image"])
     else:
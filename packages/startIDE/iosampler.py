@@ -0,0 +1,120 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# background input sampling for startIDE
+#
+# An IOSampler polls a fixed set of input channels of one interface at a
+# fixed rate and keeps the latest value of each channel in a snapshot.
+# For digital channels the rising and falling edges are counted, so that
+# no pulse gets lost while the interpreter is busy with something else.
+#
+# The pause after a sample is at least as long as the sample took, so a
+# slow bus is never kept busy by the sampler more than half of the time.
+# If the update function reports the interface as busy (returns False),
+# the sampler tries again later, waiting longer each time up to backoff.
+#
+# Commands that change an input, like CounterClear, call invalidate(). The
+# snapshot of that input is dropped, together with the result of a sample
+# already under way, until a sample started afterwards has read it again.
+#
+
+import threading, time
+
+class IOSampler(threading.Thread):
+
+    def __init__(self, name, channels, period=0.002, update=None, notify=None, backoff=0.1):
+        # channels: dict of key -> function returning the actual value
+        #           keys are tuples (mode, input), mode "S" marks digital inputs
+        # period:   pause between two samples in seconds
+        # update:   called before each sample, e.g. to wait for the next I/O cycle,
+        #           returns False if the interface is busy and nothing was read
+        # notify:   called whenever a digital input has changed
+        # backoff:  longest pause while the interface is busy in seconds
+
+        threading.Thread.__init__(self, name="IOSampler-"+name)
+        self.daemon=True
+
+        self.channels=channels
+        self.period=period
+        self.update=update
+        self.notify=notify
+        self.backoff=backoff
+
+        self.values={}
+        self.cycle=0        # number of the sample under way
+        self.invalid={}     # key -> last cycle whose value is out of date
+        self.lock=threading.Lock()
+        self.rising={}
+        self.falling={}
+        for key in channels:
+            self.rising[key]=0
+            self.falling[key]=0
+
+        self.ready=threading.Event()
+        self.running=True
+
+    def stop(self):
+        self.running=False
+
+    def invalidate(self, key):
+        # called after the input has been changed by the program
+        with self.lock:
+            self.invalid[key]=self.cycle
+            self.values.pop(key, None)
+
+    def edges(self, key):
+        return self.rising[key]+self.falling[key]
+
+    def sample(self, cycle):
+        changed=False
+
+        for key in self.channels:
+            try:
+                v=self.channels[key]()
+            except:
+                continue
+
+            with self.lock:
+                # vor einem invalidate() gelesen, der Wert ist schon alt
+                if self.invalid.get(key, -1)>=cycle: continue
+
+                if key[0]=="S" and key in self.values:
+                    try:
+                        a=int(self.values[key])
+                        b=int(v)
+                    except:
+                        continue
+                    if b>a:
+                        self.rising[key]=self.rising[key]+1
+                        changed=True
+                    elif b<a:
+                        self.falling[key]=self.falling[key]+1
+                        changed=True
+
+                self.values[key]=v
+
+        return changed
+
+    def run(self):
+        busy=0
+        while self.running:
+            t=time.time()
+            with self.lock:
+                self.cycle=self.cycle+1
+                cycle=self.cycle
+            try:
+                if self.update!=None and self.update()==False:
+                    # belegt, spaeter nochmal und jedes Mal etwas laenger warten
+                    busy=min(2*max(busy, self.period, 0.001), self.backoff)
+                    time.sleep(busy)
+                    continue
+                changed=self.sample(cycle)
+            except:
+                changed=False
+            busy=0
+
+            self.ready.set()
+
+            if changed and self.notify!=None: self.notify()
+
+            if self.period>0: time.sleep(max(self.period, time.time()-t))
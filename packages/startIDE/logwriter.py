@@ -0,0 +1,197 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# buffered logfile writer for startIDE
+#
+# The interpreter only queues timestamped messages, a
+# LogWriter thread collects them and writes them to disk in batches, so
+# that logging does not slow down the control loop. Records stay queued
+# until they are on disk; write errors are reported once through the error
+# function and the batch is tried again with the next one. Before that the
+# file is cut back to the end of the last complete batch, so a batch that
+# was written in part appears only once.
+#
+# Two file formats are supported:
+#   .txt  one "variable value" line per record, as before
+#   .bin  compact binary records with timestamps, see below
+#
+# Binary format: the file starts with LOGMAGIC and the start time <d>,
+# followed by records
+#   "N" <H index> <H length> <name>           declares a new variable name
+#   "I" <I msec> <H index> <q value>          integer value
+#   "T" <I msec> <H index> <H length> <text>  any other value
+# msec counts from the start time. All numbers are little endian.
+#
+
+import threading, time, os, struct
+from collections import deque
+from itertools import islice
+
+LOGMAGIC=b"startIDE-log-1\n"
+
+# seconds between two batches, and between two fsync calls
+LOGFLUSH=0.25
+LOGSYNC=5.0
+
+def splitRecord(message):
+    # "variable value" -> ("variable", "value")
+    a=message.split(None,1)
+    if len(a)==0: return ("","")
+    if len(a)==1: return (a[0],"")
+    return (a[0],a[1].rstrip("\n"))
+
+class LogWriter(threading.Thread):
+
+    def __init__(self, filename, binary=False, error=None):
+        # error: function message, called from the LogWriter thread when
+        #        writing fails
+        threading.Thread.__init__(self, name="LogWriter")
+        self.daemon=True
+
+        self.binary=binary
+        self.error=error
+        self.failed=False
+        self.dropped=0
+        self.names={}
+        self.queue=deque()
+        self.wakeup=threading.Event()
+        self.running=True
+
+        self.t0=time.time()
+        # ungepuffert, nach einem Fehler bleibt nichts im Puffer zurueck
+        self.file=open(filename,"wb",buffering=0)
+        if binary: self.file.write(LOGMAGIC+struct.pack("<d",self.t0))
+        self.offset=self.file.tell()   # end of the last complete batch
+
+    def put(self, message):
+        # called from the interpreter thread, deque.append is thread safe
+        self.queue.append((time.time(),message))
+
+    def close(self):
+        self.running=False
+        self.wakeup.set()
+        self.join()
+
+    def encode(self, record, names):
+        # names: the name indices, new names are added
+        t=int((record[0]-self.t0)*1000)
+        (name,value)=splitRecord(record[1])
+        data=b""
+        if not name in names:
+            if len(names)>65535: raise ValueError("more than 65536 variables")
+            names[name]=len(names)
+            n=name.encode("utf-8","replace")[:65535]
+            data=b"N"+struct.pack("<HH",names[name],len(n))+n
+
+        try:
+            if str(int(value))==value and -2**63<=int(value)<2**63:
+                return data+b"I"+struct.pack("<IHq",t,names[name],int(value))
+        except ValueError:
+            pass
+
+        v=value.encode("utf-8","replace")[:65535]
+        return data+b"T"+struct.pack("<IHH",t,names[name],len(v))+v
+
+    def write(self):
+        # the batch leaves the queue only after it has been written
+        n=len(self.queue)
+        if n==0: return
+
+        batch=list(islice(self.queue, n))
+        if self.binary:
+            names=dict(self.names)
+            data=[]
+            lost=None
+            for r in batch:
+                try:
+                    data.append(self.encode(r, names))
+                except ValueError as e:
+                    # der Datensatz passt nie ins Format und wird weggelassen
+                    lost=e
+            out=b"".join(data)
+        else:
+            out="".join([r[1]+"\n" for r in batch]).encode("utf-8","replace")
+
+        # Reste eines fehlgeschlagenen Versuchs abschneiden
+        if self.file.tell()!=self.offset:
+            self.file.seek(self.offset)
+            self.file.truncate()
+        view=memoryview(out)
+        while len(view)>0:
+            view=view[self.file.write(view):]
+        self.offset=self.offset+len(out)
+
+        for i in range(n): self.queue.popleft()
+        if self.binary:
+            self.names=names
+            if lost!=None:
+                if self.dropped==0 and self.error!=None: self.error("Logfile error:\n"+str(lost))
+                self.dropped=self.dropped+n-len(data)
+
+    def report(self, e):
+        # each failure once, until writing works again
+        if self.failed: return
+        self.failed=True
+        if self.error!=None: self.error("Logfile error:\n"+str(e))
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def run(self):
+        synced=time.time()
+        while self.running:
+            self.wakeup.wait(LOGFLUSH)
+            self.wakeup.clear()
+            try:
+                self.write()
+                if time.time()-synced>LOGSYNC:
+                    self.sync()
+                    synced=time.time()
+                self.failed=False
+            except Exception as e:
+                self.report(e)
+
+        # was jetzt nicht geschrieben wird, ist verloren
+        self.failed=False
+        try:
+            self.write()
+            self.sync()
+        except Exception as e:
+            self.report(e)
+        if self.dropped>0 and self.error!=None:
+            self.error("Logfile: "+str(self.dropped)+" records dropped")
+        try:
+            self.file.close()
+        except Exception as e:
+            self.report(e)
+
+def readLog(filename):
+    # yields (time, variable, value) for both formats, time is None for .txt files
+    with open(filename,"rb") as f:
+        if f.read(len(LOGMAGIC))!=LOGMAGIC:
+            f.seek(0)
+            for line in f:
+                (name,value)=splitRecord(line.decode("utf-8","replace"))
+                if name!="": yield (None,name,value)
+            return
+
+        names={}
+        try:
+            start=struct.unpack("<d",f.read(8))[0]
+            while True:
+                k=f.read(1)
+                if k==b"N":
+                    (i,l)=struct.unpack("<HH",f.read(4))
+                    names[i]=f.read(l).decode("utf-8","replace")
+                elif k==b"I":
+                    (t,i,v)=struct.unpack("<IHq",f.read(14))
+                    yield (start+t/1000,names[i],str(v))
+                elif k==b"T":
+                    (t,i,l)=struct.unpack("<IHH",f.read(8))
+                    yield (start+t/1000,names[i],f.read(l).decode("utf-8","replace"))
+                else:
+                    return
+        except (struct.error, KeyError):
+            # unvollstaendiger letzter Datensatz
+            return
@@ -0,0 +1,125 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# program store of the startIDE editor
+#
+# ProgramModel keeps the code lines of the project as the one list of
+# strings behind the program view. All edits go through its methods and
+# reach the view as inserted, removed, moved or changed rows, so the view
+# only redraws what is visible, even with many thousand lines. snapshot()
+# hands the lines to the execThread and to Save without walking any
+# widgets.
+#
+# The editor dialogs ask for the variables, arrays, tags and modules of the
+# program. find() and names() answer them from an index of the lines by
+# command, which is built again in one pass after an edit only.
+#
+
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+
+class ProgramModel(QAbstractListModel):
+
+    def __init__(self, lines=(), parent=None):
+        QAbstractListModel.__init__(self, parent)
+        self.lines=list(lines)
+        self.changed()
+
+    # QAbstractListModel
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid(): return 0
+        return len(self.lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row()>=len(self.lines): return None
+        if role==Qt.DisplayRole or role==Qt.EditRole: return self.lines[index.row()]
+        return None
+
+    # the program
+
+    def count(self):
+        return len(self.lines)
+
+    def text(self, row):
+        return self.lines[row]
+
+    def snapshot(self):
+        return list(self.lines)
+
+    def find(self, cmd):
+        # all lines of command cmd, in program order
+        if self.commands==None:
+            self.commands={}
+            for line in self.lines:
+                s=line.split(None, 1)
+                if len(s)>0: self.commands.setdefault(s[0], []).append(line)
+        return list(self.commands.get(cmd, []))
+
+    def names(self, cmd):
+        # the names declared by Init, ArrayInit, ..., each once
+        if not cmd in self.declared:
+            r=[]
+            seen=set()
+            for line in self.find(cmd):
+                s=line.split()
+                if len(s)>1 and not s[1] in seen:
+                    seen.add(s[1])
+                    r.append(s[1])
+            self.declared[cmd]=r
+        return list(self.declared[cmd])
+
+    # edits
+
+    def changed(self):
+        self.commands=None      # command -> lines
+        self.declared={}        # command -> names
+
+    def reset(self, lines):
+        self.beginResetModel()
+        self.lines=list(lines)
+        self.changed()
+        self.endResetModel()
+
+    def setText(self, row, text):
+        if self.lines[row]==text: return
+        self.lines[row]=text
+        self.changed()
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    def insert(self, row, lines):
+        if len(lines)==0: return
+        self.beginInsertRows(QModelIndex(), row, row+len(lines)-1)
+        self.lines[row:row]=lines
+        self.changed()
+        self.endInsertRows()
+
+    def remove(self, row, count=1):
+        self.beginRemoveRows(QModelIndex(), row, row+count-1)
+        del self.lines[row:row+count]
+        self.changed()
+        self.endRemoveRows()
+
+    def move(self, row, to):
+        # line row ends up at row to
+        if to==row: return
+        # Qt zaehlt das Ziel vor dem Entfernen der Zeile
+        if not self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), to+1 if to>row else to): return
+        self.lines.insert(to, self.lines.pop(row))
+        self.changed()
+        self.endMoveRows()
+
+class ProgramView(QListView):
+    # QListView with the row based calls of QListWidget
+
+    def __init__(self, model, parent=None):
+        QListView.__init__(self, parent)
+        self.setModel(model)
+        # alle Zeilen gleich hoch, das Layout muss nicht jede Zeile messen
+        self.setUniformItemSizes(True)
+
+    def currentRow(self):
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row):
+        self.setCurrentIndex(self.model().index(row))
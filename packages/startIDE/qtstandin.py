@@ -0,0 +1,148 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# stand-ins for PyQt4 and the TouchStyle modules
+#
+# headless.py runs the interpreter of startide.py on machines without PyQt4,
+# TouchStyle and TouchAuxiliary, e.g. a plain Linux PC or a CI runner.
+# install() puts minimal versions of the modules that can not be imported
+# into sys.modules before startide.py is imported. They provide what the
+# execThread needs at run time: QObject, QThread, pyqtSignal with direct
+# connections and QCoreApplication.translate. All other names are classes
+# that can be subclassed and created but do nothing, so that the GUI part
+# of startide.py can be defined. Real modules are always used if present.
+#
+
+import sys, threading, types
+
+# the names startide.py and its editor modules take from the star imports
+QTCORE=["QAbstractListModel", "QLocale", "QModelIndex", "QPointF", "QTimer", "QTranslator", "Qt"]
+QTGUI=["QApplication", "QColor", "QComboBox", "QCursor", "QDialog", "QFont", "QHBoxLayout", "QImage",
+       "QLabel", "QLineEdit", "QListView", "QListWidget", "QListWidgetItem", "QMouseEvent", "QPainter",
+       "QPixmap", "QPolygonF", "QPushButton", "QVBoxLayout", "QWidget"]
+TOUCHSTYLE=["TouchApplication", "TouchDialog", "TouchMessageBox", "TouchWindow"]
+TOUCHAUXILIARY=["TouchAuxKeyboard", "TouchAuxListRequester", "TouchAuxMultibutton",
+                "TouchAuxRequestInteger", "TouchAuxRequestText"]
+
+class StandInType(type):
+    # class attributes like Qt.AlignCenter
+    def __getattr__(cls, name):
+        if name.startswith("__"): raise AttributeError(name)
+        return StandIn()
+
+class StandIn(object, metaclass=StandInType):
+    # accepts everything and does nothing
+    def __init__(self, *args, **kwargs): pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"): raise AttributeError(name)
+        return StandIn()
+
+    def __call__(self, *args, **kwargs): return StandIn()
+    def __or__(self, other): return self
+    def __bool__(self): return False
+    def __int__(self): return 0
+    def __iter__(self): return iter(())
+
+class BoundSignal(object):
+    def __init__(self):
+        self.slots=[]
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot==None: self.slots=[]
+        else: self.slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in list(self.slots): slot(*args)
+
+class pyqtSignal(object):
+    # direct connections only, the slots run in the emitting thread
+    def __init__(self, *types):
+        self.name=None
+
+    def __set_name__(self, owner, name):
+        self.name="_signal_"+name
+
+    def __get__(self, obj, owner=None):
+        if obj==None: return self
+        return obj.__dict__.setdefault(self.name, BoundSignal())
+
+def pyqtSlot(*types, **kwargs):
+    return lambda f: f
+
+class QObject(StandIn):
+    def __init__(self, parent=None):
+        self.qparent=parent
+
+class QThread(QObject):
+    def start(self):
+        self.qthread=threading.Thread(target=self.run)
+        self.qthread.daemon=True
+        self.qthread.start()
+
+    def isRunning(self):
+        return hasattr(self, "qthread") and self.qthread.is_alive()
+
+    def wait(self, *args):
+        if self.isRunning(): self.qthread.join()
+        return True
+
+class QCoreApplication(QObject):
+    def __init__(self, *args):
+        QObject.__init__(self)
+
+    @staticmethod
+    def translate(context, text, *args):
+        return text
+
+    @staticmethod
+    def processEvents(*args):
+        pass
+
+    def exec_(self):
+        return 0
+
+def module(name, attrs, names):
+    m=types.ModuleType(name)
+    m.__dict__.update(attrs)
+    for n in names:
+        if not n in attrs: setattr(m, n, type(n, (StandIn,), {}))
+    m.__all__=[n for n in m.__dict__ if not n.startswith("_")]
+    sys.modules[name]=m
+    return m
+
+def importable(name):
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+def install():
+    # returns the names of the modules replaced
+    replaced=[]
+
+    if not importable("PyQt4.QtGui"):
+        core=module("PyQt4.QtCore", { "QObject": QObject, "QThread": QThread, "QCoreApplication": QCoreApplication,
+                                      "pyqtSignal": pyqtSignal, "pyqtSlot": pyqtSlot }, QTCORE)
+        gui=module("PyQt4.QtGui", {}, QTGUI)
+        module("PyQt4", { "QtCore": core, "QtGui": gui }, [])
+        replaced.append("PyQt4")
+
+    # TouchStyle und TouchAuxiliary bringen alle Qt Namen mit
+    from PyQt4 import QtCore, QtGui
+    qt={}
+    for m in [QtCore, QtGui]:
+        qt.update([(n, getattr(m, n)) for n in dir(m) if not n.startswith("_")])
+
+    if not importable("TouchStyle"):
+        module("TouchStyle", qt, TOUCHSTYLE)
+        replaced.append("TouchStyle")
+    if not importable("TouchAuxiliary"):
+        module("TouchAuxiliary", qt, TOUCHAUXILIARY)
+        replaced.append("TouchAuxiliary")
+
+    return replaced
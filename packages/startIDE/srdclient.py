@@ -0,0 +1,106 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# servoDuino (SRD) protocol client for startIDE
+#
+# The servoDuino answers every command line with exactly one reply line.
+# SrdClient keeps the serial connection open, writes commands without
+# waiting for the previous reply and lets a reader thread hand the reply
+# lines to the waiting requests in strict FIFO order. At most WINDOW
+# commands are in flight, so the small input buffer of the servoDuino
+# does not overflow.
+#
+
+import threading, time
+from collections import deque
+
+class SrdClient(threading.Thread):
+
+    def __init__(self, device, timeout=0.3, window=4):
+        # device:  open serial.Serial of the servoDuino
+        # timeout: default time to wait for a reply in seconds
+        # window:  number of commands that may wait for their reply
+
+        threading.Thread.__init__(self, name="SrdClient")
+        self.daemon=True
+
+        self.device=device
+        self.device.timeout=0.05    # so that the reader can be stopped
+        self.timeout=timeout
+        self.window=window
+
+        self.pending=deque()        # [event, reply] per command
+        self.lock=threading.Lock()
+        self.resync=False
+        self.running=True
+
+    def request(self, commands):
+        # write all commands in one go, returns their pending entries
+        while True:
+            with self.lock:
+                if len(self.pending)==0 or len(self.pending)+len(commands)<=self.window: break
+                oldest=self.pending[0]
+            if not oldest[0].wait(self.timeout):
+                # keine Antwort, Zuordnung neu beginnen
+                with self.lock: self.resync=True
+                break
+
+        entries=[[threading.Event(), "Fail"] for c in commands]
+        with self.lock:
+            if self.resync:
+                self.device.flushInput()
+                for e in self.pending: e[0].set()
+                self.pending.clear()
+                self.resync=False
+            self.pending.extend(entries)
+            try:
+                self.device.write("".join([c+"\n" for c in commands]).encode("utf-8"))
+            except:
+                for e in self.pending: e[0].set()
+                self.pending.clear()
+        return entries
+
+    def reply(self, entry, timeout=-1):
+        # waits for the reply of one entry, timeout None waits forever
+        if timeout==-1: timeout=self.timeout
+        if not entry[0].wait(timeout):
+            # Antwort verloren oder zu spaet, vor dem naechsten Befehl
+            # den Eingang leeren und die Zuordnung neu beginnen
+            with self.lock: self.resync=True
+            return "Fail"
+        return entry[1]
+
+    def comm(self, command, timeout=-1):
+        return self.reply(self.request([command])[0], timeout)
+
+    def batch(self, commands, timeout=-1):
+        return [self.reply(e, timeout) for e in self.request(commands)]
+
+    def send(self, command):
+        # fire and forget, nobody waits for the reply
+        self.request([command])
+
+    def close(self):
+        self.running=False
+        self.join(1)
+
+    def run(self):
+        buf=b""
+        while self.running:
+            try:
+                data=self.device.readline()
+            except:
+                time.sleep(0.05)
+                continue
+            if not data: continue
+
+            buf=buf+data
+            if buf[-1:]!=b"\n": continue    # Zeile noch unvollstaendig
+            line=buf.decode("utf-8","replace").rstrip("\r\n")
+            buf=b""
+
+            with self.lock:
+                if len(self.pending)==0: continue
+                e=self.pending.popleft()
+            if line!="": e[1]=line
+            e[0].set()
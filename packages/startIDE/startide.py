@@ -6,33 +6,48 @@
 #
 
 
+import time
+STARTTIME=time.time()   # for the startup report
+
 from PyQt4 import QtCore, QtGui
-import sys, time, os, json, shutil
+import sys, os, json, shutil, hashlib, importlib
 import threading as thd
-import ftrobopy as txt
-import random, math
-import serial
-import serial.tools.list_ports
+from collections import deque
+from iosampler import IOSampler
+from logwriter import LogWriter
+from ftdpipe import FtdPipe
+from srdclient import SrdClient
+from imagecache import ImageCache
+from ifprobe import IFProbe
+from programmodel import ProgramModel, ProgramView
+from editcommon import queryVarName
+import arrfile
+import codegen, calcexpr
+import random, math, bisect, operator, heapq
+from array import array
+from itertools import accumulate, repeat
 
 import translator
 
 from TouchStyle import *
 from TouchAuxiliary import *
-from robointerface import *
 from datetime import datetime
-from HAT import TxPiHat
 
-try:
-    import ftduino_direct as ftd
-    FTDUINO_DIRECT=True
-except:
-    FTDUINO_DIRECT=False
+# ftrobopy, robointerface, ftduino_direct, HAT and serial are imported
+# where they are needed, the interfaces are probed in the background
 
+# smbus2 kann mehrere I2C Nachrichten in einem Transfer (i2c_rdwr)
 try:
-    import smbus
-    i2c = smbus.SMBus(1)
+    from smbus2 import SMBus, i2c_msg
+    i2c = SMBus(1)
+    I2CRDWR=True
 except:
-    i2c = None
+    I2CRDWR=False
+    try:
+        import smbus
+        i2c = smbus.SMBus(1)
+    except:
+        i2c = None
 
 # set GPIO for display HW buttons to false until checked for display size
 try:
@@ -60,6 +75,7 @@ moddir  = os.path.join(hostdir , "modules")
 logdir  = os.path.join(hostdir , "logfiles")
 pixdir  = os.path.join(hostdir , "pixmaps")
 arrdir  = os.path.join(hostdir , "arrays")
+cachedir= os.path.join(hostdir , "cache")
 
 if not os.path.exists(projdir):
     os.mkdir(projdir)
@@ -69,6 +85,8 @@ if not os.path.exists(logdir):
     os.mkdir(logdir)
 if not os.path.exists(arrdir):
     os.mkdir(arrdir)
+if not os.path.exists(cachedir):
+    os.mkdir(cachedir)
 
 try:
     with open( os.path.join(hostdir, "manifest") ,"r", encoding="utf-8") as f:
@@ -98,6 +116,100 @@ except:
 PORTRAIT=1
 LANDSCAPE=0
 
+# canvas commands: max. number of queued drawing commands before the GUI
+# thread is asked to draw them, and the Pen commands that need a QPainter
+CANVASBATCH=256
+CANVASPAINTOPS=["plot", "lineTo", "rectTo", "boxTo", "circleTo", "discTo", "eraseTo", "areaDraw", "text"]
+
+# decoded pixmaps kept for Canvas load and Canvas blit [bytes]
+PIXCACHEMAX=8*1024*1024
+
+# servoDuino: default reply timeout [s] and commands in flight
+SRDTIMEOUT=0.3
+SRDWINDOW=4
+
+# output pane: lines buffered for the GUI, refresh rate [Hz] and lines shown
+TEXTRING=1024
+TEXTRATE=30
+TEXTLINES=255
+
+# analysed projects kept in cachedir, and the format of the entries
+CACHEMAX=32
+CACHEVERSION=2
+
+# number of lines shown in the log pane by #PROFILEON
+PROFILETOP=10
+
+# background input sampling: shortest pause between two samples [s] and
+# longest pause while the interface is used by the program [s]
+SAMPLEPERIOD={ "RIF": 0.01, "FTD": 0.005, "HAT": 0.005 }
+SAMPLEBACKOFF=0.05
+
+# arrays are kept as typed buffers of 64 bit integers
+ARRAYTYPE="q"
+ARRAYMIN=-2**63
+ARRAYMAX=2**63-1
+
+# element-wise operations of ArrayCalc, same results as Calc
+ARRAYOPS={ "+":      operator.add,
+           "-":      operator.sub,
+           "*":      operator.mul,
+           "/":      lambda a, b: int(round(a/b)),
+           "div":    lambda a, b: int(a/b),
+           "mod":    operator.mod,
+           "min":    min,
+           "max":    max,
+           "bitAnd": operator.and_,
+           "bitOr":  operator.or_,
+           "bitXOr": operator.xor }
+
+def joinArray(arr, sep):
+    # "1;2;3;" as used by the .arr files and the interface commands
+    if len(arr)==0: return ""
+    return sep.join(map(str, arr))+sep
+
+# pixel values of the Raster command, pixels are 0xFFRRGGBB (QImage.Format_RGB32)
+RASTERMODES={ "rgb": -1, "red": 16, "green": 8, "blue": 0, "gray": -2 }
+
+def rasterChannel(data, shift):
+    # bytes of one colour channel from the raw pixel data
+    if sys.byteorder=="little": return data[shift//8::4]
+    return data[3-shift//8::4]
+
+def rasterValues(data, mode):
+    # raw pixel data -> array values, without a python loop per pixel
+    shift=RASTERMODES[mode]
+    if shift==-1: return map(operator.and_, array("I", data), repeat(0xFFFFFF))
+    if shift>=0: return iter(rasterChannel(data, shift))
+    
+    # Grauwert mit 77/150/29 von 256 fuer rot/gruen/blau
+    r=map(operator.mul, rasterChannel(data, 16), repeat(77))
+    g=map(operator.mul, rasterChannel(data, 8), repeat(150))
+    b=map(operator.mul, rasterChannel(data, 0), repeat(29))
+    return map(operator.rshift, map(operator.add, map(operator.add, r, g), b), repeat(8))
+
+def rasterPixels(values, mode):
+    # array values -> raw pixel data; red, green and blue set only their
+    # channel, gray all three
+    shift=RASTERMODES[mode]
+    if shift==-1:
+        return array("I", map(operator.or_, map(operator.and_, values, repeat(0xFFFFFF)), repeat(0xFF000000))).tobytes()
+    
+    c=bytes(map(min, map(max, values, repeat(0)), repeat(255)))
+    data=bytearray(len(c)*4)
+    data[3 if sys.byteorder=="little" else 0::4]=b"\xff"*len(c)
+    for ch in [16, 8, 0]:
+        if shift==ch or shift==-2:
+            if sys.byteorder=="little": data[ch//8::4]=c
+            else: data[3-ch//8::4]=c
+    return bytes(data)
+
+# argument types of the compiled code lines
+ARGS_NONE=0
+ARGS_STACK=1
+ARGS_LINE=2
+ARGS_TEXT=3
+
 TXTsndStack = [ "---", "Plane", "Alarm", "Bell", "Brakes", "Horn(short)", "Horn(long)", "WoodCrack", "Excavator", "Fantasy1", "Fantasy2", "Fantasy3", "Fantasy4", "Farm", "Emergency", "Fireplace", "Racecar", "Helicopter", "Hydraulic", "Engine", "EngineStart", "PropPlane", "RollerCoaster", "ShipHorn", "Tractor", "Truck", "EyeBlink", "HeadUp", "HeadDown"]
 
 #
@@ -105,11 +217,38 @@ TXTsndStack = [ "---", "Plane", "Alarm", "Bell", "Brakes", "Horn(short)", "Horn(
 #
 
 def USBScan(vidpid):
+    import serial.tools.list_ports
     d=[]
     for dev in serial.tools.list_ports.grep("vid:pid="+vidpid):
         d.append(dev[0])
     return d
 
+def probeRIF():
+    from robointerface import RoboInterface
+    if RIFSERIAL!="":
+        rif=RoboInterface(serialDevice=RIFSERIAL.encode(), SerialType=RoboInterface.FT_INTELLIGENT_IF)
+    else:
+        rif=RoboInterface(bEnableDist=True)
+    
+    if rif.hasInterface() and rif.GetDeviceTypeString()!="": return rif
+    return None
+
+def probeTXT():
+    import ftrobopy
+    t=ftrobopy.ftrobopy(FTTXTADDRESS)
+    name, version = t.queryStatus()
+    return t
+
+def probeFTD():
+    import ftduino_direct
+    f=ftduino_direct.ftduino()
+    if f.getDevice()==None: return None
+    return f
+
+def probeHAT():
+    from HAT import TxPiHat
+    return TxPiHat()
+
 def clean(text,maxlen):
     res=""
     valid="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890_-."
@@ -117,28 +256,81 @@ def clean(text,maxlen):
         if ch in valid: res=res+ch
     return res[:maxlen]
 
-def queryVarName(vari, recent):        
-        if len(vari)==0:
-            t=TouchMessageBox(QCoreApplication.translate("ecl","Variables"), None)
-            t.setCancelButton()
-            t.setText(QCoreApplication.translate("ecl","No Variables defined!"))
-            t.setTextSize(2)
-            t.setBtnTextSize(2)
-            t.setPosButton(QCoreApplication.translate("ecl","Okay"))
-            (v1,v2)=t.exec_()
-            return recent
-
-        vari.sort()
-        
-        cvari=vari[0]
-        for i in vari:
-            if i==recent: cvari=recent
-            
-        (s,r)=TouchAuxListRequester(QCoreApplication.translate("ecl","Variables"),QCoreApplication.translate("ecl","Select variable"),vari,cvari,"Okay").exec_()
+def calcOp(op, v1, v2):
+    # result of Calc for the float operands v1 and v2
+    res=0
+    if op=="+": res=int(v1+v2)
+    elif op=="-": res=int(v1-v2)
+    elif op=="*": res=int(v1*v2)
+    elif op=="/": res=int(round(v1/v2))
+    elif op=="div": res=int(v1/v2)
+    elif op=="digit":
+        a=str(int(v2))
+        b=len(a)
+        if v1<=b:
+            res=int(a[(b-int(v1)):((b-int(v1))+1)])
+        else:
+            res=-1
+    elif op=="mod": res=int(v1 % v2)
+    elif op=="exp": res=int(v1 ** v2)
+    elif op=="root": res=int(v2 ** (1/v1))
+    elif op=="min": res=int(min(v1,v2))
+    elif op=="max": res=int(max(v1,v2))
+    elif op=="sgnCpy":
+        if v2<0: res=int(-1*v1)
+        elif v2>0: res=int(v1)
+        else: res=int(0)
+    elif op=="sin": res=int(v1*math.sin(math.radians(v2)))
+    elif op=="cos": res=int(v1*math.cos(math.radians(v2)))  
+    elif op=="random": res=random.randint(min(v1,v2),max(v1,v2))
+    elif op=="mean":
+        res=(float(v1)+float(v2))/2
+        if res > 0: res = int(res+0.5)
+        elif res < 0: res = int(res-0.5)
+        else: res =0
+    elif op=="&&" and (v1!=0) and (v2!=0): res=1 
+    elif op=="||" and ((v1!=0) or (v2!=0)): res=1
+    elif op=="<"  and (v1<v2): res=1  
+    elif op=="==" and (v1==v2): res=1 
+    elif op=="!=" and (v1!=v2): res=1 
+    elif op==">"  and (v1>v2): res=1 
+    elif op==">=" and (v1>=v2): res=1 
+    elif op=="<=" and (v1<=v2): res=1
+    elif op=="sign":
+        v1=int(v1)
+        v2=int(v2)
+        res=v1
+        if v1 > (2**(v2-1)): res = v1 - (2**v2)
+    elif op=="unsign":
+        v1=int(v1)
+        v2=int(v2)
+        res=v1
+        if v1 < 0: res = v1 + (2**v2)
+    elif op=="bitShift":
+        v1=int(v1)
+        v2=int(v2)
+        if v2 < 0: res = v1 >> abs(v2)
+        else: res = v1 << v2
+    elif op=="bitAnd":
+        v1=int(v1)
+        v2=int(v2)
+        res = v1 & v2
+    elif op=="bitOr":
+        v1=int(v1)
+        v2=int(v2)
+        res = v1 | v2
+    elif op=="bitXOr":
+        v1=int(v1)
+        v2=int(v2)
+        res = v1 ^ v2 
+    elif op=="tempMeingast":
+        a=2.15992060279525E-07
+        b=-0.007569625106584
+        c=77.2415400995752
+        res=int(v1/1000*(a*v2*v2+b*v2+c))
+    
+    return res
 
-        if s: return r 
-        else: return recent
-    
 class QDblPushButton(QPushButton):
     doubleClicked = pyqtSignal()
     clicked = pyqtSignal()
@@ -163,8 +355,7 @@ class QDblPushButton(QPushButton):
 #
 
 class execThread(QThread):
-    updateText=pyqtSignal(str)
-    clearText=pyqtSignal()
+    textReady=pyqtSignal()
     execThreadFinished=pyqtSignal()
     showMessage=pyqtSignal(str)
     requestKeyboard=pyqtSignal(int, str)
@@ -172,6 +363,7 @@ class execThread(QThread):
     requestBtn=pyqtSignal(str, str, list)
     requestArray=pyqtSignal(str,list,str)
     canvasSig=pyqtSignal(str)
+    canvasFlush=pyqtSignal()
     
     def __init__(self, codeList, output, starter, RIF,TXT,FTD,HAT, parent):
         QThread.__init__(self, parent)
@@ -182,11 +374,23 @@ class execThread(QThread):
         self.starter=starter
         self.msg=0 # für Messages aus dem GUI Thread
         
+        # Events zum Aufwecken des exec threads
+        self.msgEvent=thd.Event()   # Antwort aus dem GUI Thread
+        self.wakeup=thd.Event()     # Stop, Touch, Timer...
+        
         self.RIF=RIF
         self.TXT=TXT
         self.FTD=FTD
+        if FTD!=None: self.ftdPipe=FtdPipe(FTD)
+        else: self.ftdPipe=None
         self.SRD=None
+        self.srd=None
         self.hat=HAT
+        self.ftdLock=thd.Lock()
+        self.i2cLock=thd.Lock()     # lokaler I2C Bus, auch aus I2CBurst Samplern
+        self.arrLock=thd.Lock()     # Array Tausch und lutCache, auch aus Samplern
+        self.samplers={}
+        self.pySource=""    # von #PYTHON erzeugter Code
         self.parent=parent
         
         self.parent.msgBack.connect(self.msgBack)
@@ -194,7 +398,13 @@ class execThread(QThread):
         self.parent.gfxData.connect(self.gfxData)
         self.parent.mousePos.connect(self.mousePos)
         self.parent.stop.connect(self.stop)
-        self.parent.canvasReturn.connect(self.onCanvasReturn)
+        
+        # Canvas Befehle, die der GUI Thread gesammelt abarbeitet
+        self.canvasQueue=deque()
+        self.textQueue=deque(maxlen=TEXTRING)
+        self.textSkipped=0
+        self.textCleared=False
+        self.textLock=thd.Lock()
         self.parent.click.connect(self.onTouch)
         self.parent.release.connect(self.onRelease)
         
@@ -208,25 +418,21 @@ class execThread(QThread):
         self.count=0
         self.halt=False
         self.trace=False
+        self.profiling=True
+        self.blocked=0.0
         self.singlestep=False
         self.nextStep=False
         self.logging=False
         self.silent=False
         
-        self.requireTXT=False
-        self.requireRIF=False
-        self.requireFTD=False
-        self.requireSRD=False
-        self.requireHAT=False
-        
-        self.jmpTable=[]
         self.LoopStack=[]
-        self.modTable=[]
         self.modStack=[]
         self.modLStack=[]
         self.modMStack=[]
-        self.impmod=[]
-        self.memory=[]
+        self.memory={}
+        self.arrays={}
+        self.arrUnsaved={}      # array -> elements at its end not yet written by ArraySave append
+        self.lutCache={}
         
         self.getCanvasData()
 
@@ -236,181 +442,49 @@ class execThread(QThread):
         self.actXPos=0
         self.actYPos=0
 
-        cnt=0
-        mcnt=0
-        
-        rif_m = [False, False, False, False]
-        txt_m = [False, False, False, False]
-        ftd_m = [False, False, False, False]
-        rif_o = [False, False, False, False, False, False, False, False]
-        txt_o = [False, False, False, False, False, False, False, False]
-        ftd_o = [False, False, False, False, False, False, False, False]
-        rif_i = [False, False, False, False, False, False, False, False]
-        txt_i = [False, False, False, False, False, False, False, False]
-        ftd_i = [False, False, False, False, False, False, False, False]
-        
-        #input types
-        txt_it = [0,0,0,0,0,0,0,0] 
-        ftd_it = [0,0,0,0,0,0,0,0]  # 1=switch 2=voltage 3=resistance 4=distance
-        txt_c = [0,0,0,0]
-        ftd_c = [0,0,0,0]            # 1=counter 2=distance
-        
-        # scan code for interfaces, jump and module tags, output and motor channels
-        
-        txtanaloginputfailure=""
-        ftdanaloginputfailure=""
-        ftdcounterinputfailure=""
-        extmodfailure=False
-        RS=False
-        
-        self.arrays=[]
-        self.array=[]
+        # Code analysieren, unveraenderte Projekte kommen aus dem Cache
+        
+        info=self.loadCodeInfo()
+        if info==None:
+            info=self.scanCode()
+            if not info["extmodfailure"]: self.saveCodeInfo(info)
+        
+        self.codeList=info["codeList"]
+        self.requireTXT=info["requireTXT"]
+        self.requireRIF=info["requireRIF"]
+        self.requireFTD=info["requireFTD"]
+        self.requireHAT=info["requireHAT"]
+        self.requireSRD=info["requireSRD"]
+        self.profile=info["profile"]
+        self.python=info["python"]
+        self.jmpTable=info["jmpTable"]
+        self.modTable=info["modTable"]
+        self.impmod=info["impmod"]
+        
+        if info["SRDVIDPID"]!="": SRDVIDPID=info["SRDVIDPID"]
+        mcnt=info["mcnt"]
+        duptag=info["duptag"]
+        dupmod=info["dupmod"]
+        extmodfailure=info["extmodfailure"]
+        emf=info["emf"]
+        txtanaloginputfailure=info["txtanaloginputfailure"]
+        ftdanaloginputfailure=info["ftdanaloginputfailure"]
+        ftdcounterinputfailure=info["ftdcounterinputfailure"]
+        
+        rif_m=info["rif_m"]
+        txt_m=info["txt_m"]
+        ftd_m=info["ftd_m"]
+        rif_o=info["rif_o"]
+        txt_o=info["txt_o"]
+        ftd_o=info["ftd_o"]
+        rif_i=info["rif_i"]
+        txt_i=info["txt_i"]
+        ftd_i=info["ftd_i"]
+        txt_it=info["txt_it"]
+        ftd_it=info["ftd_it"]
+        txt_c=info["txt_c"]
+        ftd_c=info["ftd_c"]
         
-        for line in self.codeList:
-            a=line.split()
-            if len(a)<2: a.append("x")
-                
-            if "TXT" in a[1]:
-                self.requireTXT=True
-            elif "RIF" in a[1]:
-                self.requireRIF=True
-            elif "FTD" in a[1]:
-                self.requireFTD=True
-            elif "HAT" in a[1]:
-                self.requireHAT=True
-            elif "SRD"==a[1]:
-                self.requireSRD=True
-            elif "SRDVIDPID" in a[1]:
-                SRDVIDPID=a[2]
-            elif a[0]=="Tag": 
-                self.jmpTable.append([line[4:], cnt])
-            elif a[0]=="Module":
-                self.modTable.append([line[7:], cnt])
-                mcnt=mcnt+1
-            elif a[0]=="MEnd":
-                mcnt=mcnt-1
-            elif a[0] == "CallExt" and not (a[1] in self.impmod):
-                try:
-                    with open(os.path.join(moddir,a[1]),"r", encoding="utf-8") as f:
-                        module=json.load(f)
-                        f.close()
-                    nmp = len(self.codeList)
-                    for mline in module:
-                        self.codeList.append(mline)
-                    self.impmod.append(a[1])
-                    
-                except:
-                    extmodfailure=True
-                    emf=a[1]
-            
-            #
-            # configure i/o of the devices:
-            #
-            elif a[0]=="RIFShift":
-                if int(a[1])>0:
-                    RS=True
-                else:
-                    RS=False
-                    
-            if len(a)>2:
-                if ("Output"==a[0]) or ("WaitIn" in a[0]) or ("IfIn" in a[0]) or ("Motor" in a[0]) or ("QueryIn"==a[0]) or ("FromIn"==a[0]):
-                    if a[1]=="RIF" and RS==False: 
-                        if ("Motor" in a[0]):
-                            rif_m[int(a[2])-1]=True
-                        elif ("Output" in a[0]):
-                            rif_o[int(a[2])-1]=True
-                        elif ("IfInDig"==a[0]) or ("WaitInDig"==a[0]):
-                            rif_i[int(a[2])-1]=True
-                        elif (("IfIn"==a[0]) or ("WaitIn"==a[0])) and a[3]=="S":
-                            rif_i[int(a[2])-1]=True
-                        if "MotorP"==a[0]:
-                            rif_i[int(a[3])-1]=True
-                            rif_i[int(a[4])-1]=True
-                        if "QueryIn"==a[0]:
-                            pass
-                            #if a[3]=="D": rif_i[int(a[2])-1]=True
-                    elif a[1]=="TXT": #TXT
-                        if ("Motor" in a[0]):
-                            txt_m[int(a[2])-1]=True
-                        elif ("Output" in a[0]):
-                            txt_o[int(a[2])-1]=True
-                        elif ("IfInDig"==a[0]) or ("WaitInDig"==a[0]):
-                            txt_i[int(a[2])-1]=True
-                        if "MotorP"==a[0]:
-                            txt_i[int(a[3])-1]=True
-                            txt_i[int(a[4])-1]=True
-                        if "MotorE"==a[0]:
-                            txt_i[int(a[3])-1]=True
-                        if "MotorES"==a[0]:
-                            txt_m[int(a[3])-1]=True
-                        if "QueryIn"==a[0] or "IfIn"==a[0] or "WaitIn"==a[0] or "FromIn"==a[0]:
-                            if (a[3]=="S" or a[3]=="R" or a[3]=="V" or a[3]=="D"):
-                                txt_i[int(a[2])-1]=True
-                                if (a[3]=="S"):
-                                    if (txt_it[int(a[2])-1]==0) or (txt_it[int(a[2])-1]==1):
-                                        txt_it[int(a[2])-1]=1
-                                    else:
-                                        txtanaloginputfailure=a[2]                                    
-                                elif (a[3]=="R"):
-                                    if (txt_it[int(a[2])-1]==0) or (txt_it[int(a[2])-1]==2):
-                                        txt_it[int(a[2])-1]=2
-                                    else:
-                                        txtanaloginputfailure=a[2]  
-                                elif (a[3]=="V"):
-                                    if (txt_it[int(a[2])-1]==0) or (txt_it[int(a[2])-1]==3):
-                                        txt_it[int(a[2])-1]=3
-                                    else:
-                                        txtanaloginputfailure=a[2]  
-                                elif (a[3]=="D"):
-                                    if (txt_it[int(a[2])-1]==0) or (txt_it[int(a[2])-1]==4):
-                                        txt_it[int(a[2])-1]=4
-                                    else:
-                                        txtanaloginputfailure=a[2]
-                            elif a[3]=="C":
-                                txt_c[int(a[2])-1]=True
-                    elif a[1]=="FTD": # ftduino
-                        if ("Motor" in a[0]):
-                            ftd_m[int(a[2])-1]=True
-                        elif ("Output" in a[0]):
-                            ftd_o[int(a[2])-1]=True
-                        elif ("IfInDig"==a[0]) or ("WaitInDig"==a[0]):
-                            ftd_i[int(a[2])-1]=True
-                        if "MotorP"==a[0]:
-                            ftd_i[int(a[3])-1]=True
-                            ftd_i[int(a[4])-1]=True
-                        if "MotorE"==a[0]:
-                            ftd_i[int(a[3])-1]=True
-                        if "MotorES"==a[0]:
-                            ftd_m[int(a[3])-1]=True
-                        if "QueryIn"==a[0] or "IfIn"==a[0] or "WaitIn"==a[0] or "FromIn"==a[0]:
-                            if (a[3]=="S" or a[3]=="R" or a[3]=="V"):
-                                ftd_i[int(a[2])-1]=True
-                                if (a[3]=="S"):
-                                    if (ftd_it[int(a[2])-1]==0) or (ftd_it[int(a[2])-1]==1):
-                                        ftd_it[int(a[2])-1]=1
-                                    else:
-                                        ftdanaloginputfailure=a[2]                                    
-                                elif (a[3]=="R"):
-                                    if (ftd_it[int(a[2])-1]==0) or (ftd_it[int(a[2])-1]==2):
-                                        ftd_it[int(a[2])-1]=2
-                                    else:
-                                        ftdanaloginputfailure=a[2]  
-                                elif (a[3]=="V"):
-                                    if (ftd_it[int(a[2])-1]==0) or (ftd_it[int(a[2])-1]==3):
-                                        ftd_it[int(a[2])-1]=3
-                                    else:
-                                        ftdanaloginputfailure=a[2]  
-                            elif a[3]=="C":                                
-                                if (ftd_c[int(a[2])-1]==1) or (ftd_c[int(a[2])-1]==0):
-                                    ftd_c[int(a[2])-1]=1
-                                else:
-                                    ftdcounterinputfailure=a[2] 
-                            elif  a[3]=="D":
-                                if (ftd_c[int(a[2])-1]==2) or (ftd_c[int(a[2])-1]==0):
-                                    ftd_c[int(a[2])-1]=2
-                                else:
-                                    ftdcounterinputfailure=a[2] 
-            cnt=cnt+1
         self.clrOut()
         
         if self.requireSRD:
@@ -418,6 +492,7 @@ class execThread(QThread):
             try:
                 SRDdevices=USBScan(SRDVIDPID)
                 if len(SRDdevices)==1:
+                    import serial
                     self.SRD=serial.Serial(SRDdevices[0], 115200, timeout=0.3, writeTimeout = 0.3)
                     time.sleep(0.3)
                     self.SRD.flushInput()
@@ -437,6 +512,10 @@ class execThread(QThread):
                         self.SRD=None
                         self.msgOut(QCoreApplication.translate("exec","servoDuino not found!\nProgram terminated\n"))                
                         if not IGNOREMISSING: self.stop()
+                    else:
+                        # ab hier laufen alle Befehle ueber den Client
+                        self.srd=SrdClient(self.SRD, SRDTIMEOUT, SRDWINDOW)
+                        self.srd.start()
                 else:
                     self.msgOut(QCoreApplication.translate("exec","servoDuino detect error!\nProgram terminated\n"))                
                     if not IGNOREMISSING: self.stop()                    
@@ -465,6 +544,12 @@ class execThread(QThread):
         elif ftdcounterinputfailure!="":
             self.msgOut(QCoreApplication.translate("exec","FTD counter C")+ftdcounterinputfailure+QCoreApplication.translate("exec","\ncounter/distance mismatch!\nProgram terminated\n"))
             self.stop()
+        elif duptag!="":
+            self.msgOut("Tag '"+duptag+"'\ndefined twice!\nProgram terminated\n")
+            self.stop()
+        elif dupmod!="":
+            self.msgOut("Module '"+dupmod+"'\ndefined twice!\nProgram terminated\n")
+            self.stop()
         elif mcnt<0:
             self.msgOut(QCoreApplication.translate("exec","MEnd found with-\nout Module!\nProgram terminated\n"))
             self.stop()
@@ -559,19 +644,26 @@ class execThread(QThread):
         # FTD I/O initialisieren...
         
         if self.FTD!=None and not self.halt:
+            cmds=[]
             for i in range(0,8):           
                 if ftd_it[i]==2:
-                    self.FTD.comm("input_set_mode I"+str(i+1)+" Resistance")
+                    cmds.append("input_set_mode I"+str(i+1)+" Resistance")
                 elif ftd_it[i]==3:
-                    self.FTD.comm("input_set_mode I"+str(i+1)+" Voltage")
+                    cmds.append("input_set_mode I"+str(i+1)+" Voltage")
                 if i<4:
                     if ftd_c[i]==1:
-                        self.FTD.comm("counter_set_mode C"+str(i+1)+" Any")
+                        cmds.append("counter_set_mode C"+str(i+1)+" Any")
                         
             if ftd_c[0]==2:
-                self.FTD.comm("ultrasonic_enable True")
+                cmds.append("ultrasonic_enable True")
             else:
-                self.FTD.comm("ultrasonic_enable False")
+                cmds.append("ultrasonic_enable False")
+            self.ftdBatch(cmds)
+        
+        # Eingaenge im Hintergrund abtasten
+        
+        if not self.halt:
+            self.startSamplers(rif_i, txt_i, txt_it, txt_c, ftd_i, ftd_it, ftd_c)
         
         # und los gehts
         
@@ -583,41 +675,80 @@ class execThread(QThread):
             self.count=0
         self.parent.processEvents()        
         
-        self.interrupt=-1
+        self.interrupt=-1       # naechster faelliger Interrupt, siehe timerHeap
+        self.timerHeap=[]       # (due, module, generation)
+        self.timers={}          # module -> [period, generation]
+        self.timerStats={}      # module -> [calls, latency, max latency, overruns]
+        self.timerGen=0
+        self.inInterrupt=False
         self.timestamp=time.time()
         
+        steps=0  # Anzahl ausgefuehrter Zeilen
+        
         #if 1:
         try:
+            # Code einmalig in die Befehlstabelle uebersetzen, Fehler dabei
+            # werden wie Laufzeitfehler mit ihrer Zeile gemeldet
+            self.compileCode()
+            program=self.program
+            
             if self.trace:
-                while not self.halt and self.count<len(self.codeList):
-                    line=self.codeList[self.count]
-                    self.cmdPrint(str(self.count)+":"+line)
-                    self.parseLine(line)
+                while not self.halt and self.count<len(program):
+                    self.cmdPrint(str(self.count)+":"+self.codeList[self.count])
+                    self.execLine(program[self.count])
+                    steps=steps+1
+                    if self.singlestep:
+                        while not self.nextStep and not self.halt:
+                            self.pause()
+                        self.nextStep=False
+                        
+                    self.count=self.count+1
+            elif self.profile:
+                # wie unten, aber mit Zeitmessung je Zeile
+                self.profData=[[0, 0.0, 0.0, 0.0] for i in range(len(program))]
+                while not self.halt and self.count<len(program):
+                    n=self.count
+                    handler, args = program[n]
+                    b=self.blocked
+                    t=time.time()
+                    handler(*args)
+                    steps=steps+1
+                    if self.profiling:
+                        dt=time.time()-t
+                        p=self.profData[n]
+                        p[0]=p[0]+1
+                        p[1]=p[1]+dt
+                        if dt>p[2]: p[2]=dt
+                        p[3]=p[3]+self.blocked-b
+                    if self.interrupt>0 and time.time()>self.interrupt:
+                        self.interruptExec()
                     if self.singlestep:
                         while not self.nextStep and not self.halt:
-                            self.parent.processEvents()
-                            time.sleep(0.005)
+                            self.pause()
                         self.nextStep=False
                         
                     self.count=self.count+1
-                    self.parent.processEvents()
             else:
-                while not self.halt and self.count<len(self.codeList):
-                    line=self.codeList[self.count]
-                    self.parseLine(line)
+                if self.python: steps=self.runPython(steps)
+                while not self.halt and self.count<len(program):
+                    handler, args = program[self.count]
+                    handler(*args)
+                    steps=steps+1
+                    if self.interrupt>0 and time.time()>self.interrupt:
+                        self.interruptExec()
                     if self.singlestep:
                         while not self.nextStep and not self.halt:
-                            self.parent.processEvents()
-                            time.sleep(0.005)
+                            self.pause()
                         self.nextStep=False
                         
                     self.count=self.count+1
-                    self.parent.processEvents()
                 
         #else:
         except:
             self.cce=True
             self.halt=True
+        
+        self.steps=steps
                 
         if not self.halt: self.msgOut("<End>")
         else: 
@@ -629,12 +760,17 @@ class execThread(QThread):
                 
         try:
             if self.logging: self.logfile.close()
+            self.logging=False
         except:
             pass
         
+        if self.profile: self.profileReport()
+        
         self.cmdCanvas("Canvas hide")
         self.cmdCanvas("SHOWSTOPBTN")
         
+        self.stopSamplers()
+        
         # 
         # Alle Interfaces abschalten!
         #
@@ -651,9 +787,13 @@ class execThread(QThread):
                 self.TXT.setPwm(i,0)
         
         if self.FTD!=None:
-            self.FTD.comm("pwm_halt")
+            cmds=["pwm_halt"]
             for i in range(1,9):
-                self.FTD.comm("output_set O"+str(i)+" 1 0")
+                cmds.append("output_set O"+str(i)+" 1 0")
+            self.ftdBatch(cmds)
+            
+        if self.srd!=None:
+            self.srd.close()
             
         if self.SRD!=None:
             self.SRD.flushInput()
@@ -671,12 +811,38 @@ class execThread(QThread):
     
     def goOn(self):
         self.nextStep=True
+        self.wakeup.set()
     
     def stop(self):
         self.halt=True
+        self.wakeup.set()
     
     def msgBack(self, num):
         self.msg=num
+        self.msgEvent.set()
+    
+    def waitForMsg(self):
+        # block until the GUI thread has answered
+        t=time.time()
+        self.msgEvent.wait()
+        self.msgEvent.clear()
+        self.blocked=self.blocked+time.time()-t
+    
+    def pause(self, timeout=None):
+        # sleep until timeout or until woken up by stop, touch or a timer;
+        # an interrupt falling due meanwhile is executed right here, so the
+        # caller has to check its own condition again afterwards
+        t=time.time()
+        if self.interrupt>0 and not self.inInterrupt and (timeout==None or self.interrupt<t+timeout):
+            if self.interrupt>t: self.wakeup.wait(self.interrupt-t)
+            self.wakeup.clear()
+            self.blocked=self.blocked+time.time()-t
+            if not self.halt and time.time()>=self.interrupt: self.interruptExec(True)
+            return
+        
+        self.wakeup.wait(timeout)
+        self.wakeup.clear()
+        self.blocked=self.blocked+time.time()-t
     
     def IMsgBack(self,var):
         self.imesg=var
@@ -690,207 +856,705 @@ class execThread(QThread):
         self.CpGreen = pgreen
         self.CpBlue = pblue
         self.msg=1
-        self.can=1
+        self.msgEvent.set()
         
     def mousePos(self, x, y):
         self.actXPos=x
         self.actYPos=y
         self.msg=1
-        #self.can=1
+        self.msgEvent.set()
         
         
-    def parseLine(self,line):
-        stack=line.split()
-        if line[0:1]  == "#":
-            if "TRACEON" in line:    self.trace=True
-            elif "TRACEOFF" in line: self.trace=False
-            if "STEPON" in line:     
-                self.singlestep=True
-                self.cmdPrint("STEPON: tap screen!")
-            elif "STEPOFF" in line:  self.singlestep=False           
-            if "GETELAPSEDTIME" in line:
-                self.cmdPrint("[sec]: "+str(time.time()-self.timestamp))
-            if "TIMERCLEAR" in line:
-                self.timestamp=time.time()
-            if "MEMDUMP" in line:
-                self.cmdPrint("Memory dump")
-                self.cmdPrint("-----------")
-                for line in self.memory: self.cmdPrint(str(line))
-            if "SHOWSTOPBTN" in line:
-                self.cmdCanvas("SHOWSTOPBTN")
-            if "HIDESTOPBTN" in line:
-                self.cmdCanvas("HIDESTOPBTN")
-            if "SHOWTITLEBAR" in line:
-                self.cmdCanvas("SHOWTITLEBAR")
-            if "HIDETITLEBAR" in line:
-                self.cmdCanvas("HIDETITLEBAR")
-        elif stack[0]== "Stop":     self.count=len(self.codeList)
-        elif stack[0]== "Output":   self.cmdOutput(stack)
-        elif stack[0]== "Motor":    self.cmdMotor(stack)
-        elif stack[0]== "MotorP":   self.cmdMotorPulsewheel(stack)
-        elif stack[0]== "MotorE":   self.cmdMotorEncoder(stack)
-        elif stack[0]== "MotorES":  self.cmdMotorEncoderSync(stack)
-        elif stack[0]== "Servo":    self.cmdServo(stack)
-        elif stack[0]== "Delay":    self.cmdDelay(stack)
-        elif stack[0]== "TimerQuery": self.cmdPrint("Timer: "+str(int((time.time()-self.timestamp)*1000)))
-        elif stack[0]== "TimerClear": self.timestamp=time.time()
-        elif stack[0]== "IfTimer":  self.cmdIfTimer(stack)
-        elif stack[0]== "IfTime":   self.cmdIfTime(stack)
-        elif stack[0]== "IfDate":   self.cmdIfDate(stack)
-        elif stack[0]== "QueryNow": self.cmdQueryNow(stack)
-        elif stack[0]== "Interrupt": self.cmdInterrupt(stack)
-        elif stack[0]== "Jump":     self.cmdJump(stack)
-        elif stack[0]== "LoopTo":   self.cmdLoopTo(stack)
-        elif stack[0]== "WaitInDig": self.cmdWaitForInputDig(stack)
-        elif stack[0]== "IfInDig":  self.cmdIfInputDig(stack)
-        elif stack[0]== "WaitIn":   self.cmdWaitForInput(stack)
-        elif stack[0]== "IfIn":     self.cmdIfInput(stack)
-        elif stack[0]== "Print":    self.cmdPrint(line[6:])
-        elif stack[0]== "QueryIn":  self.cmdQueryIn(stack)
-        elif stack[0]== "Clear":    self.clrOut()
-        elif stack[0]== "Message":  self.cmdMessage(line[8:])
-        elif stack[0]== "Log":      self.cmdLog(stack)
-        elif stack[0]== "Sound":    self.cmdSound(stack)
-        elif stack[0]== "Module":   self.count=len(self.codeList)
-        elif stack[0]== "Call":     self.cmdCall(stack)
-        elif stack[0]== "CallExt":  self.cmdCall(stack)
-        elif stack[0]== "Return":   self.cmdReturn()
-        elif stack[0]== "MEnd":     self.cmdMEnd()
-        elif stack[0]== "Init":     self.cmdInit(stack)
-        elif stack[0]== "FromIn":   self.cmdFromIn(stack)
-        elif stack[0]== "FromKeypad": self.cmdFromKeypad(stack)
-        elif stack[0]== "FromDial": self.cmdFromDial(stack)
-        elif stack[0]== "FromButtons": self.cmdFromButtons(stack)
-        elif stack[0]== "FromRIIR": self.cmdFromRIIR(stack)
-        elif stack[0]== "FromPoly": self.cmdFromPoly(stack)
-        elif stack[0]== "FromSys":  self.cmdFromSys(stack)
-        elif stack[0]== "QueryVar": self.cmdQueryVar(stack)
-        elif stack[0]== "Calc":     self.cmdCalc(stack)
-        elif stack[0]== "IfVar":    self.cmdIfVar(stack)
-        elif stack[0]== "IfTouchArea": self.cmdIfTouchArea(stack)
-        elif stack[0]== "Tag":      pass
-        elif stack[0]== "Canvas":   self.cmdCanvas(line)
-        elif stack[0]== "Pen":      self.cmdPen(line)
-        elif stack[0]== "Color":    self.cmdColor(line)
-        elif stack[0]== "Text":     self.cmdText(line)
-        elif stack[0]== "VarToText": self.cmdVarToText(line)
-        elif stack[0]== "CounterClear": self.cmdCounterClear(stack)
-        elif stack[0]== "RIFShift": self.RIFShift=int(stack[1])
-        elif stack[0]== "WaitForTouch": self.cmdWaitForTouch()
-        elif stack[0]== "WaitForRelease": self.cmdWaitForRelease()
-        elif stack[0]== "ArrayInit":    self.cmdArrayInit(stack)
-        elif stack[0]== "Array":        self.cmdArray(stack)
-        elif stack[0]== "ArrayStat":    self.cmdArrayStat(stack)
-        elif stack[0]== "ArrayLoad":    self.cmdArrayLoad(stack)
-        elif stack[0]== "ArraySave":    self.cmdArraySave(stack)
-        elif stack[0]== "QueryArray":   self.cmdQueryArray(stack)
-        elif stack[0]== "LookUpTable":  self.cmdLookUpTable(stack)
-        elif stack[0]== "I2CWrite":     self.cmdI2CWrite(stack)
-        elif stack[0]== "I2CRead":      self.cmdI2CRead(stack)
-        elif stack[0]== "USBWrite":     self.cmdUSBComm(stack)
-        elif stack[0]== "USBRead":      self.cmdUSBComm(stack)
+    def scanCode(self):
+        # scan code for interfaces, jump and module tags, output and motor
+        # channels; the result has to fit into a json file for the cache
+        cnt=0
+        mcnt=0
         
-        else:
-            self.cmdPrint("DontKnowWhatToDo\nin code:\n"+line)
-            self.halt=True
-            
-        if time.time()>self.interrupt and self.interrupt>0:
-            self.interruptExec()
-    
-    def interruptExec(self):
-        self.cmdCall(self.interruptCommand.split())
-        if self.interruptTime==0:
-            self.interrupt=-1
-            return
-        else:
-            self.interrupt=time.time()+self.interruptTime
-            
-    def getVal(self,var):
-        try:
-            return int(var)
-        except:
-            for i in self.memory:
-                if i[0]==var: return int(i[1])
-        self.halt=True
-        self.cmdPrint("Variable '"+var+"'\nreferenced without\nInit!\nProgram terminated")
-        return 0
-    
-    def onTouch(self,thing):
-        self.touchEventX=thing.x()
-        self.touchEventY=thing.y()
-        self.touched=True
+        rif_m = [False, False, False, False]
+        txt_m = [False, False, False, False]
+        ftd_m = [False, False, False, False]
+        rif_o = [False, False, False, False, False, False, False, False]
+        txt_o = [False, False, False, False, False, False, False, False]
+        ftd_o = [False, False, False, False, False, False, False, False]
+        rif_i = [False, False, False, False, False, False, False, False]
+        txt_i = [False, False, False, False, False, False, False, False]
+        ftd_i = [False, False, False, False, False, False, False, False]
         
-    def onRelease(self,thing):
-        self.touchEventX=thing.x()
-        self.touchEventY=thing.y()
-        self.touched=False
+        #input types
+        txt_it = [0,0,0,0,0,0,0,0] 
+        ftd_it = [0,0,0,0,0,0,0,0]  # 1=switch 2=voltage 3=resistance 4=distance
+        txt_c = [0,0,0,0]
+        ftd_c = [0,0,0,0]            # 1=counter 2=distance
         
-    def cmdWaitForTouch(self):
-        self.touched=False        
-        while self.touched==False and not self.halt:
-            self.parent.processEvents()
-
-    def cmdWaitForRelease(self):      
-        self.touched=True
-        while self.touched==True and not self.halt:
-            self.parent.processEvents()
-    
-    def cmdLookUpTable(self, stack):
-        if not (stack[2] in self.arrays):
-            self.cmdPrint("Array '" + stack[2] + "'\nreferenced without\nArrayInit!\nProgram terminated") 
+        txtanaloginputfailure=""
+        ftdanaloginputfailure=""
+        ftdcounterinputfailure=""
+        extmodfailure=False
+        RS=False
+        
+        duptag=""
+        dupmod=""
+        emf=""
+        SRDVIDPID=""
+        profile=False
+        python=False
+        requireTXT=False
+        requireRIF=False
+        requireFTD=False
+        requireHAT=False
+        requireSRD=False
+        jmpTable={}
+        modTable={}
+        impmod=[]
+        modules={}
+        
+        codeList=list(self.codeList)
+        for line in codeList:
+            a=line.split()
+            if len(a)<2: a.append("x")
+            
+            if a[0][:1]=="#" and "PROFILEON" in line: profile=True
+            if a[0][:1]=="#" and "PYTHON" in line: python=True
+                
+            if "TXT" in a[1]:
+                requireTXT=True
+            elif "RIF" in a[1]:
+                requireRIF=True
+            elif "FTD" in a[1]:
+                requireFTD=True
+            elif "HAT" in a[1]:
+                requireHAT=True
+            elif "SRD"==a[1]:
+                requireSRD=True
+            elif "SRDVIDPID" in a[1]:
+                SRDVIDPID=a[2]
+            elif a[0]=="Tag": 
+                if line[4:] in jmpTable: duptag=line[4:]
+                jmpTable[line[4:]]=cnt
+            elif a[0]=="Module":
+                if line[7:] in modTable: dupmod=line[7:]
+                modTable[line[7:]]=cnt
+                mcnt=mcnt+1
+            elif a[0]=="MEnd":
+                mcnt=mcnt-1
+            elif a[0] == "CallExt" and not (a[1] in impmod):
+                try:
+                    with open(os.path.join(moddir,a[1]),"rb") as f:
+                        data=f.read()
+                        f.close()
+                    module=json.loads(data.decode("utf-8"))
+                    modules[a[1]]=hashlib.sha1(data).hexdigest()
+                    for mline in module:
+                        codeList.append(mline)
+                    impmod.append(a[1])
+                    
+                except:
+                    extmodfailure=True
+                    emf=a[1]
+            
+            #
+            # configure i/o of the devices:
+            #
+            elif a[0]=="RIFShift":
+                if int(a[1])>0:
+                    RS=True
+                else:
+                    RS=False
+                    
+            if len(a)>2:
+                if ("Output"==a[0]) or ("WaitIn" in a[0]) or ("IfIn" in a[0]) or ("Motor" in a[0]) or ("QueryIn"==a[0]) or ("FromIn"==a[0]):
+                    if a[1]=="RIF" and RS==False: 
+                        if ("Motor" in a[0]):
+                            rif_m[int(a[2])-1]=True
+                        elif ("Output" in a[0]):
+                            rif_o[int(a[2])-1]=True
+                        elif ("IfInDig"==a[0]) or ("WaitInDig"==a[0]):
+                            rif_i[int(a[2])-1]=True
+                        elif (("IfIn"==a[0]) or ("WaitIn"==a[0])) and a[3]=="S":
+                            rif_i[int(a[2])-1]=True
+                        if "MotorP"==a[0]:
+                            rif_i[int(a[3])-1]=True
+                            rif_i[int(a[4])-1]=True
+                        if "QueryIn"==a[0]:
+                            pass
+                            #if a[3]=="D": rif_i[int(a[2])-1]=True
+                    elif a[1]=="TXT": #TXT
+                        if ("Motor" in a[0]):
+                            txt_m[int(a[2])-1]=True
+                        elif ("Output" in a[0]):
+                            txt_o[int(a[2])-1]=True
+                        elif ("IfInDig"==a[0]) or ("WaitInDig"==a[0]):
+                            txt_i[int(a[2])-1]=True
+                        if "MotorP"==a[0]:
+                            txt_i[int(a[3])-1]=True
+                            txt_i[int(a[4])-1]=True
+                        if "MotorE"==a[0]:
+                            txt_i[int(a[3])-1]=True
+                        if "MotorES"==a[0]:
+                            txt_m[int(a[3])-1]=True
+                        if "QueryIn"==a[0] or "IfIn"==a[0] or "WaitIn"==a[0] or "FromIn"==a[0]:
+                            if (a[3]=="S" or a[3]=="R" or a[3]=="V" or a[3]=="D"):
+                                txt_i[int(a[2])-1]=True
+                                if (a[3]=="S"):
+                                    if (txt_it[int(a[2])-1]==0) or (txt_it[int(a[2])-1]==1):
+                                        txt_it[int(a[2])-1]=1
+                                    else:
+                                        txtanaloginputfailure=a[2]                                    
+                                elif (a[3]=="R"):
+                                    if (txt_it[int(a[2])-1]==0) or (txt_it[int(a[2])-1]==2):
+                                        txt_it[int(a[2])-1]=2
+                                    else:
+                                        txtanaloginputfailure=a[2]  
+                                elif (a[3]=="V"):
+                                    if (txt_it[int(a[2])-1]==0) or (txt_it[int(a[2])-1]==3):
+                                        txt_it[int(a[2])-1]=3
+                                    else:
+                                        txtanaloginputfailure=a[2]  
+                                elif (a[3]=="D"):
+                                    if (txt_it[int(a[2])-1]==0) or (txt_it[int(a[2])-1]==4):
+                                        txt_it[int(a[2])-1]=4
+                                    else:
+                                        txtanaloginputfailure=a[2]
+                            elif a[3]=="C":
+                                txt_c[int(a[2])-1]=True
+                    elif a[1]=="FTD": # ftduino
+                        if ("Motor" in a[0]):
+                            ftd_m[int(a[2])-1]=True
+                        elif ("Output" in a[0]):
+                            ftd_o[int(a[2])-1]=True
+                        elif ("IfInDig"==a[0]) or ("WaitInDig"==a[0]):
+                            ftd_i[int(a[2])-1]=True
+                        if "MotorP"==a[0]:
+                            ftd_i[int(a[3])-1]=True
+                            ftd_i[int(a[4])-1]=True
+                        if "MotorE"==a[0]:
+                            ftd_i[int(a[3])-1]=True
+                        if "MotorES"==a[0]:
+                            ftd_m[int(a[3])-1]=True
+                        if "QueryIn"==a[0] or "IfIn"==a[0] or "WaitIn"==a[0] or "FromIn"==a[0]:
+                            if (a[3]=="S" or a[3]=="R" or a[3]=="V"):
+                                ftd_i[int(a[2])-1]=True
+                                if (a[3]=="S"):
+                                    if (ftd_it[int(a[2])-1]==0) or (ftd_it[int(a[2])-1]==1):
+                                        ftd_it[int(a[2])-1]=1
+                                    else:
+                                        ftdanaloginputfailure=a[2]                                    
+                                elif (a[3]=="R"):
+                                    if (ftd_it[int(a[2])-1]==0) or (ftd_it[int(a[2])-1]==2):
+                                        ftd_it[int(a[2])-1]=2
+                                    else:
+                                        ftdanaloginputfailure=a[2]  
+                                elif (a[3]=="V"):
+                                    if (ftd_it[int(a[2])-1]==0) or (ftd_it[int(a[2])-1]==3):
+                                        ftd_it[int(a[2])-1]=3
+                                    else:
+                                        ftdanaloginputfailure=a[2]  
+                            elif a[3]=="C":                                
+                                if (ftd_c[int(a[2])-1]==1) or (ftd_c[int(a[2])-1]==0):
+                                    ftd_c[int(a[2])-1]=1
+                                else:
+                                    ftdcounterinputfailure=a[2] 
+                            elif  a[3]=="D":
+                                if (ftd_c[int(a[2])-1]==2) or (ftd_c[int(a[2])-1]==0):
+                                    ftd_c[int(a[2])-1]=2
+                                else:
+                                    ftdcounterinputfailure=a[2] 
+            cnt=cnt+1
+        
+        return { "codeList": codeList, "modules": modules,
+                 "requireTXT": requireTXT, "requireRIF": requireRIF, "requireFTD": requireFTD,
+                 "requireHAT": requireHAT, "requireSRD": requireSRD, "SRDVIDPID": SRDVIDPID,
+                 "profile": profile, "python": python, "jmpTable": jmpTable, "modTable": modTable, "impmod": impmod,
+                 "mcnt": mcnt, "duptag": duptag, "dupmod": dupmod,
+                 "extmodfailure": extmodfailure, "emf": emf,
+                 "txtanaloginputfailure": txtanaloginputfailure,
+                 "ftdanaloginputfailure": ftdanaloginputfailure,
+                 "ftdcounterinputfailure": ftdcounterinputfailure,
+                 "rif_m": rif_m, "txt_m": txt_m, "ftd_m": ftd_m,
+                 "rif_o": rif_o, "txt_o": txt_o, "ftd_o": ftd_o,
+                 "rif_i": rif_i, "txt_i": txt_i, "ftd_i": ftd_i,
+                 "txt_it": txt_it, "ftd_it": ftd_it, "txt_c": txt_c, "ftd_c": ftd_c }
+    
+    def codeKey(self):
+        return hashlib.sha1((str(CACHEVERSION)+json.dumps(self.codeList)).encode("utf-8")).hexdigest()
+    
+    def loadCodeInfo(self):
+        # analysed code from the cache, if neither the code nor one of its
+        # external modules has changed since
+        try:
+            with open(os.path.join(cachedir, self.codeKey()+".json"),"r", encoding="utf-8") as f:
+                info=json.load(f)
+                f.close()
+            for m in info["modules"]:
+                with open(os.path.join(moddir,m),"rb") as f:
+                    if hashlib.sha1(f.read()).hexdigest()!=info["modules"][m]: return None
+                    f.close()
+        except:
+            return None
+        return info
+    
+    def saveCodeInfo(self, info):
+        try:
+            with open(os.path.join(cachedir, self.codeKey()+".json"),"w", encoding="utf-8") as f:
+                json.dump(info, f)
+                f.close()
+            
+            # nur die zuletzt benutzten Eintraege behalten
+            files=[os.path.join(cachedir, i) for i in os.listdir(cachedir)]
+            files.sort(key=os.path.getmtime)
+            for i in files[:-CACHEMAX]: os.remove(i)
+        except:
+            pass
+    
+    def compileCode(self):
+        # translate the code list into a table of (handler, arguments) once,
+        # so the run loop does not need to split and compare every line again
+        
+        self.cmdTable={
+            "Stop":         (self.cmdStop,              ARGS_NONE),
+            "Output":       (self.cmdOutput,            ARGS_STACK),
+            "Motor":        (self.cmdMotor,             ARGS_STACK),
+            "MotorP":       (self.cmdMotorPulsewheel,   ARGS_STACK),
+            "MotorE":       (self.cmdMotorEncoder,      ARGS_STACK),
+            "MotorES":      (self.cmdMotorEncoderSync,  ARGS_STACK),
+            "Servo":        (self.cmdServo,             ARGS_STACK),
+            "Delay":        (self.cmdDelay,             ARGS_STACK),
+            "TimerQuery":   (self.cmdTimerQuery,        ARGS_NONE),
+            "TimerClear":   (self.cmdTimerClear,        ARGS_NONE),
+            "IfTimer":      (self.cmdIfTimer,           ARGS_STACK),
+            "IfTime":       (self.cmdIfTime,            ARGS_STACK),
+            "IfDate":       (self.cmdIfDate,            ARGS_STACK),
+            "QueryNow":     (self.cmdQueryNow,          ARGS_STACK),
+            "Interrupt":    (self.cmdInterrupt,         ARGS_STACK),
+            "Jump":         (self.cmdJump,              ARGS_STACK),
+            "LoopTo":       (self.cmdLoopTo,            ARGS_STACK),
+            "WaitInDig":    (self.cmdWaitForInputDig,   ARGS_STACK),
+            "IfInDig":      (self.cmdIfInputDig,        ARGS_STACK),
+            "WaitIn":       (self.cmdWaitForInput,      ARGS_STACK),
+            "IfIn":         (self.cmdIfInput,           ARGS_STACK),
+            "Print":        (self.cmdPrint,             ARGS_TEXT),
+            "QueryIn":      (self.cmdQueryIn,           ARGS_STACK),
+            "Clear":        (self.clrOut,               ARGS_NONE),
+            "Message":      (self.cmdMessage,           ARGS_TEXT),
+            "Log":          (self.cmdLog,               ARGS_STACK),
+            "Sound":        (self.cmdSound,             ARGS_STACK),
+            "Module":       (self.cmdStop,              ARGS_NONE),
+            "Call":         (self.cmdCall,              ARGS_STACK),
+            "CallExt":      (self.cmdCall,              ARGS_STACK),
+            "Return":       (self.cmdReturn,            ARGS_NONE),
+            "MEnd":         (self.cmdMEnd,              ARGS_NONE),
+            "Init":         (self.cmdInit,              ARGS_STACK),
+            "FromIn":       (self.cmdFromIn,            ARGS_STACK),
+            "FromKeypad":   (self.cmdFromKeypad,        ARGS_STACK),
+            "FromDial":     (self.cmdFromDial,          ARGS_STACK),
+            "FromButtons":  (self.cmdFromButtons,       ARGS_STACK),
+            "FromRIIR":     (self.cmdFromRIIR,          ARGS_STACK),
+            "FromPoly":     (self.cmdFromPoly,          ARGS_STACK),
+            "FromSys":      (self.cmdFromSys,           ARGS_STACK),
+            "QueryVar":     (self.cmdQueryVar,          ARGS_STACK),
+            "Calc":         (self.cmdCalc,              ARGS_STACK),
+            "Expr":         (self.cmdExpr,              ARGS_STACK),
+            "IfVar":        (self.cmdIfVar,             ARGS_STACK),
+            "IfTouchArea":  (self.cmdIfTouchArea,       ARGS_STACK),
+            "Tag":          (self.cmdTag,               ARGS_NONE),
+            "Canvas":       (self.cmdCanvas,            ARGS_LINE),
+            "Pen":          (self.cmdPen,               ARGS_LINE),
+            "Color":        (self.cmdColor,             ARGS_LINE),
+            "Text":         (self.cmdText,              ARGS_LINE),
+            "VarToText":    (self.cmdVarToText,         ARGS_LINE),
+            "Raster":       (self.cmdRaster,            ARGS_STACK),
+            "CounterClear": (self.cmdCounterClear,      ARGS_STACK),
+            "RIFShift":     (self.cmdRIFShift,          ARGS_STACK),
+            "WaitForTouch": (self.cmdWaitForTouch,      ARGS_NONE),
+            "WaitForRelease": (self.cmdWaitForRelease,  ARGS_NONE),
+            "ArrayInit":    (self.cmdArrayInit,         ARGS_STACK),
+            "Array":        (self.cmdArray,             ARGS_STACK),
+            "ArrayStat":    (self.cmdArrayStat,         ARGS_STACK),
+            "ArrayLoad":    (self.cmdArrayLoad,         ARGS_STACK),
+            "ArraySave":    (self.cmdArraySave,         ARGS_STACK),
+            "QueryArray":   (self.cmdQueryArray,        ARGS_STACK),
+            "LookUpTable":  (self.cmdLookUpTable,       ARGS_STACK),
+            "ArrayCalc":    (self.cmdArrayCalc,         ARGS_STACK),
+            "ArrayProc":    (self.cmdArrayProc,         ARGS_STACK),
+            "I2CWrite":     (self.cmdI2CWrite,          ARGS_STACK),
+            "I2CRead":      (self.cmdI2CRead,           ARGS_STACK),
+            "I2CScript":    (self.cmdI2CScript,         ARGS_STACK),
+            "I2CBurst":     (self.cmdI2CBurst,          ARGS_STACK),
+            "USBWrite":     (self.cmdUSBComm,           ARGS_STACK),
+            "USBRead":      (self.cmdUSBComm,           ARGS_STACK)
+            }
+        
+        self.literals={}
+        self.program=[]
+        pc=self.count
+        for line in self.codeList:
+            self.count=len(self.program)
+            self.program.append(self.compileLine(line))
+        self.count=pc
+            
+    def compileLine(self, line):
+        stack=line.split()
+        
+        if line[0:1] == "#":
+            return (self.cmdDirective, (line,))
+        
+        if len(stack)==0 or not (stack[0] in self.cmdTable):
+            return (self.cmdUnknown, (line,))
+        
+        # integer literals are converted only once
+        for token in stack[1:]:
+            if not token in self.literals:
+                try:
+                    self.literals[token]=int(token)
+                except:
+                    pass
+        
+        # jump targets are resolved only once
+        if stack[0]=="Jump" and len(stack)>1:
+            n=self.findTag(stack[1])
+            if n>-1: return (self.cmdJumpTo, (n,))
+        elif stack[0]=="LoopTo" and len(stack)>1:
+            return (self.cmdLoopTo, (stack, self.findTag(stack[1])-1))
+        
+        # Ausdruecke werden nur einmal zerlegt
+        elif stack[0]=="Expr":
+            try:
+                tree=calcexpr.parse(" ".join(stack[2:]))
+                return (self.cmdExpr, (stack[1], self.exprFunc(tree)))
+            except (ValueError, OverflowError) as e:
+                return (self.cmdExprError, (line, str(e)))
+        
+        (handler, args)=self.cmdTable[stack[0]]
+        
+        if args==ARGS_STACK:  return (handler, (stack,))
+        elif args==ARGS_LINE: return (handler, (line,))
+        elif args==ARGS_TEXT: return (handler, (line[len(stack[0])+1:],))
+        return (handler, ())
+    
+    def runPython(self, steps):
+        # #PYTHON: Programm als Python Code ausfuehren, siehe codegen.py;
+        # bei STEPON geht es im Interpreter weiter
+        (self.pySource, sizes, lines)=codegen.translate(self.codeList, self.jmpTable, self.literals)
+        blocks=codegen.load(self.pySource, self, calcOp)
+        program=self.program
+        pc=self.count
+        start=pc
+        try:
+            while not self.halt and pc<len(program) and not self.singlestep:
+                block=blocks.get(pc)
+                if block==None:
+                    # Sprung mitten in einen Block, Zeile einzeln ausfuehren
+                    self.count=pc
+                    handler, args = program[pc]
+                    handler(*args)
+                    steps=steps+1
+                    pc=self.count+1
+                else:
+                    start=pc
+                    pc=block()
+                    steps=steps+sizes[start]
+                if self.interrupt>0 and time.time()>self.interrupt:
+                    self.count=pc-1
+                    self.interruptExec()
+                    pc=self.count+1
+            self.count=pc
+        except codegen.Halt:
+            n=codegen.errorLine(lines)
+            steps=steps+n-start+1
+            self.count=n+1
+        except:
+            n=codegen.errorLine(lines)
+            if n>=0: self.count=n
+            raise
+        return steps
+    
+    def execLine(self, instruction):
+        (handler, args)=instruction
+        handler(*args)
+        
+        if self.interrupt>0 and time.time()>self.interrupt:
+            self.interruptExec()
+    
+    def parseLine(self,line):
+        self.execLine(self.compileLine(line))
+    
+    def findTag(self, tag):
+        return self.jmpTable.get(tag, -1)
+    
+    def cmdDirective(self, line):
+        if "TRACEON" in line:    self.trace=True
+        elif "TRACEOFF" in line: self.trace=False
+        if "PROFILEON" in line:    self.profiling=True
+        elif "PROFILEOFF" in line: self.profiling=False
+        if "STEPON" in line:     
+            self.singlestep=True
+            self.cmdPrint("STEPON: tap screen!")
+        elif "STEPOFF" in line:  self.singlestep=False           
+        if "GETELAPSEDTIME" in line:
+            self.cmdPrint("[sec]: "+str(time.time()-self.timestamp))
+        if "TIMERCLEAR" in line:
+            self.timestamp=time.time()
+        if "MEMDUMP" in line:
+            self.cmdPrint("Memory dump")
+            self.cmdPrint("-----------")
+            for var in self.memory: self.cmdPrint(str([var, self.memory[var]]))
+        if "SHOWSTOPBTN" in line:
+            self.cmdCanvas("SHOWSTOPBTN")
+        if "HIDESTOPBTN" in line:
+            self.cmdCanvas("HIDESTOPBTN")
+        if "SHOWTITLEBAR" in line:
+            self.cmdCanvas("SHOWTITLEBAR")
+        if "HIDETITLEBAR" in line:
+            self.cmdCanvas("HIDETITLEBAR")
+    
+    def profileReport(self):
+        # Laufzeitprofil ins Log Fenster und als .csv nach logdir
+        lines=[]
+        names={}
+        cmds={}
+        for n in range(len(self.profData)):
+            p=self.profData[n]
+            if p[0]==0: continue
+            lines.append(n)
+            a=self.codeList[n].split()
+            if len(a)==0: cmd="-"
+            elif a[0][:1]=="#": cmd="#"
+            else: cmd=a[0]
+            names[n]=cmd
+            if not cmd in cmds: cmds[cmd]=[0, 0.0, 0.0, 0.0]
+            c=cmds[cmd]
+            c[0]=c[0]+p[0]
+            c[1]=c[1]+p[1]
+            c[2]=max(c[2],p[2])
+            c[3]=c[3]+p[3]
+        
+        lines.sort(key=lambda n: self.profData[n][1], reverse=True)
+        
+        self.msgOut("Profile [ms]")
+        self.msgOut("line: hits total max blocked")
+        for n in lines[:PROFILETOP]:
+            p=self.profData[n]
+            self.msgOut(str(n)+": "+str(p[0])+" "+str(int(p[1]*1000))+" "+str(int(p[2]*1000))+" "+str(int(p[3]*1000)))
+            self.msgOut("  "+self.codeList[n])
+        
+        irq=self.interruptReport()
+        if len(irq)>0:
+            self.msgOut("Interrupts [ms]")
+            self.msgOut("module: calls latency max overruns")
+            for i in irq:
+                self.msgOut(i[0]+": "+str(i[1])+" %.1f %.1f " % (i[2], i[3])+str(i[4]))
+        
+        try:
+            pfn=os.path.join(logdir, "prof"+time.strftime("%Y%m%d-%H%M%S")+".csv")
+            while os.path.exists(pfn):
+                pfn=pfn[:-4]+"-.csv"
+            with open(pfn,"w",encoding="utf-8") as f:
+                f.write("line;command;hits;total [ms];max [ms];blocked [ms];code\n")
+                for n in lines:
+                    p=self.profData[n]
+                    f.write(str(n)+";"+names[n]+";"+str(p[0])+";"+"%.3f;%.3f;%.3f;" % (p[1]*1000, p[2]*1000, p[3]*1000)+self.codeList[n].replace(";",",")+"\n")
+                f.write("\n")
+                f.write("command;;hits;total [ms];max [ms];blocked [ms]\n")
+                for cmd in sorted(cmds, key=lambda c: cmds[c][1], reverse=True):
+                    c=cmds[cmd]
+                    f.write(cmd+";;"+str(c[0])+";"+"%.3f;%.3f;%.3f\n" % (c[1]*1000, c[2]*1000, c[3]*1000))
+                if len(irq)>0:
+                    f.write("\n")
+                    f.write("interrupt;;calls;latency [ms];max latency [ms];overruns\n")
+                    for i in irq:
+                        f.write(i[0]+";;"+str(i[1])+";"+"%.3f;%.3f;" % (i[2], i[3])+str(i[4])+"\n")
+            self.msgOut("Profile saved:\n"+os.path.basename(pfn))
+        except:
+            self.msgOut("Could not write\nprofile.")
+    
+    def cmdUnknown(self, line):
+        self.cmdPrint("DontKnowWhatToDo\nin code:\n"+line)
+        self.halt=True
+    
+    def cmdStop(self):
+        self.count=len(self.codeList)
+    
+    def cmdTag(self):
+        pass
+    
+    def cmdTimerQuery(self):
+        self.cmdPrint("Timer: "+str(int((time.time()-self.timestamp)*1000)))
+    
+    def cmdTimerClear(self):
+        self.timestamp=time.time()
+    
+    def cmdRIFShift(self, stack):
+        self.RIFShift=int(stack[1])
+    
+    def interruptExec(self, nested=False):
+        # run all due interrupt modules; periodic timers are rescheduled
+        # relative to their due time, so the period does not drift
+        now=time.time()
+        due=[]
+        while len(self.timerHeap)>0 and self.timerHeap[0][0]<=now:
+            (t, name, gen)=heapq.heappop(self.timerHeap)
+            tmr=self.timers.get(name)
+            if tmr==None or tmr[1]!=gen: continue   # abgeschaltet oder neu gestellt
+            
+            st=self.timerStats[name]
+            st[0]=st[0]+1
+            st[1]=st[1]+now-t
+            if now-t>st[2]: st[2]=now-t
+            
+            if tmr[0]>0:
+                n=int((now-t)/tmr[0])
+                st[3]=st[3]+n
+                heapq.heappush(self.timerHeap, (t+(n+1)*tmr[0], name, gen))
+            else:
+                del self.timers[name]
+            due.append(name)
+        
+        self.nextInterrupt()
+        
+        for name in due:
+            if self.halt: break
+            self.cmdCall(["Call", name, "1"])
+            if nested: self.runInterrupt()
+    
+    def runInterrupt(self):
+        # execute a module called from within a blocking command up to its MEnd,
+        # afterwards self.count points at the blocking command again
+        depth=len(self.modStack)-1
+        program=self.program
+        self.inInterrupt=True
+        self.count=self.count+1
+        while not self.halt and len(self.modStack)>depth and self.count<len(program):
+            handler, args = program[self.count]
+            handler(*args)
+            if len(self.modStack)>depth: self.count=self.count+1
+        self.inInterrupt=False
+    
+    def nextInterrupt(self):
+        while len(self.timerHeap)>0:
+            (t, name, gen)=self.timerHeap[0]
+            tmr=self.timers.get(name)
+            if tmr!=None and tmr[1]==gen:
+                self.interrupt=t
+                return
+            heapq.heappop(self.timerHeap)
+        self.interrupt=-1
+    
+    def interruptReport(self):
+        # Ausfuehrungsverzoegerung der Interrupts fuer profileReport
+        lines=[]
+        for name in sorted(self.timerStats):
+            st=self.timerStats[name]
+            if st[0]>0: lines.append([name, st[0], st[1]/st[0]*1000, st[2]*1000, st[3]])
+        return lines
+            
+    def getVal(self,var):
+        if var in self.literals: return self.literals[var]
+        if var in self.memory: return int(self.memory[var])
+        try:
+            return int(var)
+        except:
+            pass
+        self.halt=True
+        self.cmdPrint("Variable '"+var+"'\nreferenced without\nInit!\nProgram terminated")
+        return 0
+    
+    def setVar(self,var,val):
+        if var in self.memory:
+            self.memory[var]=val
+        else:
+            self.halt=True
+            self.cmdPrint("Variable '"+var+"'\nreferenced without\nInit!\nProgram terminated")
+    
+    def onTouch(self,thing):
+        self.touchEventX=thing.x()
+        self.touchEventY=thing.y()
+        self.touched=True
+        self.wakeup.set()
+        
+    def onRelease(self,thing):
+        self.touchEventX=thing.x()
+        self.touchEventY=thing.y()
+        self.touched=False
+        self.wakeup.set()
+        
+    def cmdWaitForTouch(self):
+        self.touched=False        
+        while self.touched==False and not self.halt:
+            self.pause()
+
+    def cmdWaitForRelease(self):      
+        self.touched=True
+        while self.touched==True and not self.halt:
+            self.pause()
+    
+    def cmdLookUpTable(self, stack):
+        if not (stack[2] in self.arrays):
+            self.cmdPrint("Array '" + stack[2] + "'\nreferenced without\nArrayInit!\nProgram terminated") 
             self.halt=True
         elif not (stack[4] in self.arrays):
             self.cmdPrint("Array '" + stack[4] + "'\nreferenced without\nArrayInit!\nProgram terminated") 
             self.halt=True
         else:
-            inp=self.array[self.arrays.index(stack[2])]
-            oup=self.array[self.arrays.index(stack[4])]
-            
             ival = self.getVal(stack[5])
             
-            if (ival<min(inp)) or (ival>max(inp)):
+            # Grenzen und Stuetzstellenabstaende nur einmal je Tabelle berechnen,
+            # Tabellen und Cache passend zueinander, auch wenn ein Sampler sie ersetzt
+            with self.arrLock:
+                inp=self.arrays[stack[2]]
+                oup=self.arrays[stack[4]]
+                lut=self.lutCache.get((stack[2], stack[4]))
+                if lut==None:
+                    lut=(min(inp), max(inp),
+                         list(map(operator.sub, inp[1:], inp[:-1])),
+                         list(map(operator.sub, oup[1:], oup[:-1])))
+                    self.lutCache[(stack[2], stack[4])]=lut
+            
+            if (ival<lut[0]) or (ival>lut[1]):
                 self.cmdPrint("Input out of\nArray boundaries!\nProgram terminated") 
                 self.halt=True
             elif (len(inp) != len(oup)) or len(inp)<2:
                 self.cmdPrint("Array size mismatch!\nProgram terminated") 
                 self.halt=True
             else:
-                n=0
-                while (inp[n]<ival) and n<len(inp):
-                    n=n+1
+                n=max(bisect.bisect_left(inp, ival), 1)
                 a=inp[n-1]
-                b=inp[n]
-                m=(a+b)/2
-
-                x=(ival-a)/(b-a)
+                d=lut[2][n-1]
+                
+                x=(ival-a)/d
                 
                 if stack[3]=="nearest":
-                    if ival<m: oval=oup[n-1]
+                    if ival<a+d/2: oval=oup[n-1]
                     else: oval=oup[n]
                 elif stack[3]=="linear":
-                    oval=(oup[n]-oup[n-1]) * x + oup[n-1]
+                    oval=lut[3][n-1] * x + oup[n-1]
                     
-                cc=0
-                for i in self.memory:
-                    if i[0]==stack[1]:
-                        self.memory[cc][1] = int(oval)
-                        break
-                    cc=cc+1 
+                self.setVar(stack[1], int(oval))
             
     def cmdQueryArray(self, stack):
         if stack[1] in self.arrays:
-            st=stack[1]+": "
-            for i in self.array[self.arrays.index(stack[1])]:
-                st=st+str(i)+";"
-            self.cmdPrint(st[:-1])
+            st=stack[1]+": "+";".join(map(str, self.arrays[stack[1]]))
+            self.cmdPrint(st.rstrip())
                     
         else:
             self.halt=True
             self.cmdPrint("Array '" + stack[1] + "'\nreferenced without\nArrayInit!\nProgram terminated") 
     
     def cmdArraySave(self, stack):
+        # ArraySave <array> replace|rename|userSelect [binary], or append:
+        # the elements that Array appendTo/insertTo added to the end of the
+        # array since the last append go to <array>.arr, see arrUnsaved
         if stack[1] in self.arrays:
-            if stack[2]=="replace":
+            if stack[2]=="append":
+                arr=self.arrays[stack[1]]
+                n=self.arrUnsaved.get(stack[1], 0)
+                try:
+                    arrfile.appendArray(os.path.join(arrdir, stack[1]+".arr"), arr[len(arr)-n:])
+                    self.arrUnsaved[stack[1]]=0
+                except:
+                    self.cmdPrint("Error saving array '"+stack[1]+"'.")
+                return
+            elif stack[2]=="replace":
                 fname=os.path.join(arrdir, stack[1]+".arr")
             elif stack[2]=="rename":
                 fname=os.path.join(arrdir, stack[1]+time.strftime("%Y%m%d-%H%M%S")+".arr")
@@ -903,9 +1567,9 @@ class execThread(QThread):
                 s=False
                 if len(files)>0:
                     self.msg=0
+                    self.msgEvent.clear()
                     self.requestArray.emit(QCoreApplication.translate("ecl","Save"),files,stack[1])
-                    while self.msg==0:
-                        time.sleep(0.01)
+                    self.waitForMsg()
                     r=self.imesg
                     if r!="-1": s=True
                     
@@ -921,10 +1585,7 @@ class execThread(QThread):
                 return
             
             try:
-                expfile=open(fname,"w",encoding="utf-8")
-                for i in self.array[self.arrays.index(stack[1])]:
-                    expfile.write(str(i)+";")
-                expfile.close()    
+                arrfile.writeArray(fname, self.arrays[stack[1]], len(stack)>3 and stack[3]=="binary")
             except:
                 self.cmdPrint("Error saving array '"+stack[1]+"'.")
                     
@@ -945,9 +1606,9 @@ class execThread(QThread):
                 s=False
                 if len(files)>0:
                     self.msg=0
+                    self.msgEvent.clear()
                     self.requestArray.emit(QCoreApplication.translate("ecl","Load"),files,stack[1])
-                    while self.msg==0:
-                        time.sleep(0.01)
+                    self.waitForMsg()
                     r=self.imesg
                     if r!="-1":  s=True
                     
@@ -958,13 +1619,12 @@ class execThread(QThread):
                 fname=os.path.join(arrdir, r)
             
             if os.path.exists(fname):
-                impfile=open(fname,"r",encoding="utf-8")
-                t=impfile.read().split(";")
-                t.pop()
-                for i in range(0,len(t)):
-                    t[i]=int(t[i])
-                self.array[self.arrays.index(stack[1])]=t
-                impfile.close()
+                # Text oder binaer, siehe arrfile.py
+                try:
+                    self.setArray(stack[1], arrfile.readArray(fname, ARRAYTYPE))
+                except:
+                    self.cmdPrint("Error loading array '"+stack[1]+"'.")
+                    return
             else:
                 self.cmdPrint("Error loading array '"+stack[1]+"'.")
                 return
@@ -974,15 +1634,35 @@ class execThread(QThread):
             self.cmdPrint("Array '" + stack[1] + "'\nreferenced without\nArrayInit!\nProgram terminated") 
             
     def cmdArrayInit(self,stack):
-        if stack[1] in self.arrays:
-            self.array[ self.arrays.index(stack[1]) ] = []
-        else:
-            self.arrays.append(stack[1])
-            self.array.append([])
-        if len(stack)>2:
-            self.array[ self.arrays.index(stack[1]) ] = stack[2].split(";")
-            for i in range(0, len(self.array[ self.arrays.index(stack[1]) ])):
-              self.array[ self.arrays.index(stack[1]) ][i]= int(self.array[ self.arrays.index(stack[1]) ][i])
+        try:
+            if len(stack)>2:
+                self.setArray(stack[1], map(int, stack[2].split(";")))
+            else:
+                self.setArray(stack[1], [])
+        except OverflowError:
+            self.arrayError(stack, "value out of range")
+    
+    def arrayError(self, stack, msg):
+        # wie bei Expr mit der Zeile, in der es passiert ist
+        self.cmdPrint(stack[0]+": "+msg+"\nin code:\n"+" ".join(stack)+"\nProgram terminated")
+        self.halt=True
+    
+    def setArray(self, name, data):
+        # replace the content of an array, cached lookup tables are invalid then
+        data=array(ARRAYTYPE, data)
+        with self.arrLock:
+            self.arrays[name]=data
+            self.lutCache.clear()
+            # ein ersetztes Array gilt fuer ArraySave append als geschrieben
+            self.arrUnsaved.pop(name, None)
+    
+    def setArrayData(self, name, data):
+        # answer of an interface, numbers expected
+        try:
+            self.setArray(name, map(int, data))
+        except:
+            self.setArray(name, [])
+            self.cmdPrint("Array '" + name + "'\nreceived invalid data.")
     
     def cmdArray(self,stack):
         var=stack[1]
@@ -995,46 +1675,50 @@ class execThread(QThread):
             self.halt=True
 
         if self.halt: return
+        
+        if stack[2]!="readFrom" and stack[2]!="removeFrom" and (val<ARRAYMIN or val>ARRAYMAX):
+            self.arrayError(stack, "value out of range")
+            return
+        
+        if stack[2]!="readFrom" and len(self.lutCache)>0:
+            with self.arrLock: self.lutCache.clear()
     
         if stack[2]=="appendTo":
-            self.array[self.arrays.index(arr)].append(val)
+            self.arrays[arr].append(val)
+            self.arrUnsaved[arr]=self.arrUnsaved.get(arr, 0)+1
         elif stack[2]=="writeTo":
-            if idx<len(self.array[self.arrays.index(arr)]) and (idx>=0): self.array[self.arrays.index(arr)][idx]=val
+            if idx<len(self.arrays[arr]) and (idx>=0): self.arrays[arr][idx]=val
             else:
                 self.halt=True
                 self.cmdPrint("Index exceeded\nactual array size!\nProgram terminated")
         elif stack[2]=="readFrom":
-            if idx<len(self.array[self.arrays.index(arr)]) and (idx>=0):
-                cc=0
-                for i in self.memory:
-                    if i[0]==var:
-                        self.memory[cc][1] = int(self.array[self.arrays.index(arr)][idx])
-                        break
-                    cc=cc+1            
+            if idx<len(self.arrays[arr]) and (idx>=0):
+                self.setVar(var, int(self.arrays[arr][idx]))
             else:
                 self.halt=True
                 self.cmdPrint("Index exceeded\nactual array size!\nProgram terminated")
         elif stack[2]=="insertTo":
-            if idx<len(self.array[self.arrays.index(arr)]) and (idx>=0): self.array[self.arrays.index(arr)].insert(idx, val)  
+            if idx<len(self.arrays[arr]) and (idx>=0):
+                # nur im noch nicht geschriebenen Ende zaehlt es fuer append
+                n=self.arrUnsaved.get(arr, 0)
+                if idx>=len(self.arrays[arr])-n: self.arrUnsaved[arr]=n+1
+                self.arrays[arr].insert(idx, val)
             else:
                 self.halt=True
                 self.cmdPrint("Index exceeded\nactual array size!\nProgram terminated")
         elif stack[2]=="removeFrom":
-            if idx<len(self.array[self.arrays.index(arr)]) and (idx>=0):
-                cc=0
-                for i in self.memory:
-                    if i[0]==var:
-                        self.memory[cc][1] = int(self.array[self.arrays.index(arr)][idx])
-                        del self.array[self.arrays.index(arr)][idx]
-                        break
-                    cc=cc+1            
+            if idx<len(self.arrays[arr]) and (idx>=0):
+                self.setVar(var, int(self.arrays[arr][idx]))
+                n=self.arrUnsaved.get(arr, 0)
+                if idx>=len(self.arrays[arr])-n: self.arrUnsaved[arr]=n-1
+                del self.arrays[arr][idx]
             else:
                 self.halt=True
                 self.cmdPrint("Index exceeded\nactual array size!\nProgram terminated")
                 
     def cmdArrayStat(self,stack):
         var=stack[1]
-        val=self.getVal(var)
+        self.getVal(var)   # Variable muss es geben
         arr=stack[3]
 
         if not (arr in self.arrays):
@@ -1046,112 +1730,179 @@ class execThread(QThread):
         # "sizeOf","min","max","mean","minIdx","maxIdx"
 
         if stack[2]=="sizeOf":
-            cc=0
-            for i in self.memory:
-                if i[0]==var:
-                    self.memory[cc][1] = len(self.array[self.arrays.index(arr)])
-                    break
-                cc=cc+1            
+            self.setVar(var, len(self.arrays[arr]))
         elif stack[2]=="min":
-            cc=0
-            for i in self.memory:
-                if i[0]==var:
-                    self.memory[cc][1] = min(self.array[self.arrays.index(arr)])
-                    break
-                cc=cc+1         
+            self.setVar(var, min(self.arrays[arr]))
         elif stack[2]=="max":
-            cc=0
-            for i in self.memory:
-                if i[0]==var:
-                    self.memory[cc][1] = max(self.array[self.arrays.index(arr)])
-                    break
-                cc=cc+1  
+            self.setVar(var, max(self.arrays[arr]))
         elif stack[2]=="mean":
-            mean=0
-            for i in range(0, len(self.array[self.arrays.index(arr)])):
-                mean=mean+self.array[self.arrays.index(arr)][i]
-                
-            mean=mean//len(self.array[self.arrays.index(arr)])
+            mean=sum(self.arrays[arr])//len(self.arrays[arr])
             
-            cc=0
-            for i in self.memory:
-                if i[0]==var:
-                    self.memory[cc][1] = mean
-                    break
-                cc=cc+1
+            self.setVar(var, mean)
                 
         elif stack[2]=="maxIdx" or stack[2]=="minIdx":
-            if stack[2]=="maxIdx": t=max(self.array[self.arrays.index(arr)])
-            else:  t=min(self.array[self.arrays.index(arr)])   
-            
-            cc=0
-            for i in self.memory:
-                if i[0]==var:
-                    self.memory[cc][1] = self.array[self.arrays.index(arr)].index(t)
-                    break
-                cc=cc+1            
-            
-    def cmdInterrupt(self,stack):
-        if stack[1]=="Off":
-            self.interrupt=-1
-            self.interruptTime=0
-        elif stack[1]=="After":
-            self.interruptTime=0
-            self.interrupt=time.time()+float(stack[2])/1000
-            self.interruptCommand="Call "+stack[3]+" 1"
-        elif stack[1]=="Every":
-            self.interruptTime=float(stack[2])/1000
-            self.interrupt=time.time()+self.interruptTime
-            self.interruptCommand="Call "+stack[3]+" 1"
-             
-    def waitForCanvasReturn(self):
-        while self.can==0:
-            self.parent.processEvents()
+            if stack[2]=="maxIdx": t=max(self.arrays[arr])
+            else:  t=min(self.arrays[arr])   
             
-    def onCanvasReturn(self):
-        self.can=1
-    
-    def cmdCanvas(self, line):
-        self.can=0
-        self.canvasSig.emit(line) 
-        self.waitForCanvasReturn()
+            self.setVar(var, self.arrays[arr].index(t))
     
-    def cmdPen(self, line):
-        self.can=0
-        l=line.split()
-        nl=l[0]+" "+l[1]+" "+str(self.getVal(l[2]))+" "+str(self.getVal(l[3]))
-        self.canvasSig.emit(nl)
-        self.waitForCanvasReturn()
-        
-    def cmdColor(self, line):
-        self.can=0
-        l=line.split()
-        nl=l[0]+" "+l[1]+" "+str(self.getVal(l[2]))+" "+str(self.getVal(l[3]))+" "+str(self.getVal(l[4]))
-        self.canvasSig.emit(nl)
-        self.waitForCanvasReturn()
+    def cmdArrayCalc(self, stack):
+        # ArrayCalc <result> <array> <op> <array or value>, element by element
+        for arr in [stack[1], stack[2]]:
+            if not (arr in self.arrays):
+                self.cmdPrint("Array '" + arr + "'\nreferenced without\nArrayInit!\nProgram terminated")
+                self.halt=True
+                return
+        
+        src=self.arrays[stack[2]]
+        if stack[4] in self.arrays:
+            b=self.arrays[stack[4]]
+            if len(b)!=len(src):
+                self.cmdPrint("Array size mismatch!\nProgram terminated") 
+                self.halt=True
+        else:
+            b=repeat(self.getVal(stack[4]), len(src))
+        
+        if self.halt: return
+        
+        if not stack[3] in ARRAYOPS:
+            self.arrayError(stack, "unknown operator '"+stack[3]+"'")
+            return
+        
+        try:
+            self.setArray(stack[1], map(ARRAYOPS[stack[3]], src, b))
+        except OverflowError:
+            self.arrayError(stack, "result out of range")
+        except ZeroDivisionError:
+            self.arrayError(stack, "division by zero")
+    
+    def cmdArrayProc(self, stack):
+        # ArrayProc <result> <function> <array> <value>
+        for arr in [stack[1], stack[3]]:
+            if not (arr in self.arrays):
+                self.cmdPrint("Array '" + arr + "'\nreferenced without\nArrayInit!\nProgram terminated")
+                self.halt=True
+                return
+        
+        src=self.arrays[stack[3]]
+        n=self.getVal(stack[4])
+        if self.halt: return
+        
+        if stack[2]=="sortUp":
+            self.setArray(stack[1], sorted(src))
+        elif stack[2]=="sortDown":
+            self.setArray(stack[1], sorted(src, reverse=True))
+        elif stack[2]=="movAvg":
+            # gleitender Mittelwert ueber n Werte aus den Summen
+            if n<1 or n>len(src):
+                self.cmdPrint("Window exceeds\nactual array size!\nProgram terminated")
+                self.halt=True
+                return
+            # die Summen koennen den Wertebereich der Arrays ueberschreiten
+            s=[0]
+            s.extend(accumulate(src))
+            self.setArray(stack[1], map(operator.floordiv, map(operator.sub, s[n:], s[:-n]), repeat(n)))
+        elif stack[2]=="histogram":
+            # n Klassen gleicher Breite zwischen min und max
+            if n<1 or len(src)==0:
+                self.cmdPrint("Histogram needs\nat least one class\nand one value!\nProgram terminated")
+                self.halt=True
+                return
+            s=sorted(src)
+            w=s[-1]-s[0]+1
+            idx=[bisect.bisect_left(s, s[0]+(k*w+n-1)//n) for k in range(0, n+1)]
+            self.setArray(stack[1], map(operator.sub, idx[1:], idx[:-1]))
+            
+    def cmdInterrupt(self,stack):
+        # one timer per target module, "Interrupt Off" without module stops all
+        if stack[1]=="Off":
+            if len(stack)>2:
+                if stack[2] in self.timers: del self.timers[stack[2]]
+            else:
+                self.timers={}
+        elif stack[1]=="After" or stack[1]=="Every":
+            t=float(stack[2])/1000
+            if stack[1]=="After": period=0
+            else: period=t
+            self.timerGen=self.timerGen+1
+            self.timers[stack[3]]=[period, self.timerGen]
+            if not stack[3] in self.timerStats: self.timerStats[stack[3]]=[0, 0.0, 0.0, 0]
+            heapq.heappush(self.timerHeap, (time.time()+t, stack[3], self.timerGen))
+        self.nextInterrupt()
+             
+    def canvasOut(self, stack, flush=True):
+        # queue a canvas command; the GUI thread applies all queued commands
+        # at once when flushed, drawing commands do not flush on their own
+        self.canvasQueue.append(stack)
+        if flush or len(self.canvasQueue)>=CANVASBATCH:
+            self.canvasFlush.emit()
+    
+    def cmdCanvas(self, line):
+        stack=line.split()
+        if len(stack)>3 and stack[1]=="blit":
+            # Canvas blit <pixmap> x y [sx sy w h] zeichnet wie Pen ohne flush
+            stack=stack[:3]+[self.getVal(v) for v in stack[3:]]
+            self.canvasOut(stack, False)
+        else:
+            self.canvasOut(stack)
+    
+    def cmdPen(self, line):
+        l=line.split()
+        self.canvasOut([l[0], l[1], self.getVal(l[2]), self.getVal(l[3])], False)
+        
+    def cmdColor(self, line):
+        l=line.split()
+        self.canvasOut([l[0], l[1], self.getVal(l[2]), self.getVal(l[3]), self.getVal(l[4])], False)
         
     def cmdText(self, line):
-        self.can=0
-        self.canvasSig.emit(line)
-        self.waitForCanvasReturn()
+        self.canvasOut(line.split(), False)
         
     def cmdVarToText(self, line):
-        self.can=0
         l=line.split()
-        nl="Text " + l[1] + " " + l[2] + " " + str(self.getVal(l[3]))
-        self.canvasSig.emit(nl)
-        self.waitForCanvasReturn()
+        self.canvasOut(["Text", l[1], l[2], str(self.getVal(l[3]))], False)
+        
+    def cmdRaster(self, stack):
+        # Raster read <array> x y w h [mode] copies a canvas area into an array,
+        # Raster write <array> x y w [mode] draws the array as rows of w pixels
+        if not (stack[2] in self.arrays):
+            self.cmdPrint("Array '" + stack[2] + "'\nreferenced without\nArrayInit!\nProgram terminated")
+            self.halt=True
+            return
+        
+        x=self.getVal(stack[3])
+        y=self.getVal(stack[4])
+        w=self.getVal(stack[5])
+        if stack[1]=="read":
+            h=self.getVal(stack[6])
+            mode=stack[7] if len(stack)>7 else "rgb"
+        else:
+            mode=stack[6] if len(stack)>6 else "rgb"
+        if self.halt: return
+        
+        if not mode in RASTERMODES or w<1:
+            self.cmdPrint("Raster: invalid\nmode or width!\nProgram terminated")
+            self.halt=True
+            return
         
+        if stack[1]=="read":
+            if h<1:
+                self.setArray(stack[2], [])
+                return
+            # der GUI Thread kopiert den Bereich aus dem Bildspeicher
+            self.rasterRect=(x, y, w, h)
+            self.msg=0
+            self.msgEvent.clear()
+            self.canvasSig.emit("requestRaster")
+            self.waitForMsg()
+            self.setArray(stack[2], rasterValues(self.rasterData, mode))
+        elif stack[1]=="write":
+            src=self.arrays[stack[2]]
+            h=len(src)//w
+            if h>0: self.canvasOut(["Raster", x, y, w, h, rasterPixels(src[:w*h], mode)], False)
+    
     def cmdInit(self,a):
         if len(a)<3: a.append("0")
-        cc=0
-        for i in self.memory:
-            if i[0]==a[1]:
-                self.memory[cc][1] = self.getVal(a[2])
-                break
-            cc=cc+1
-        if cc==len(self.memory):
-            self.memory.append([a[1], self.getVal(a[2])])
+        self.memory[a[1]]=self.getVal(a[2])
             
     def cmdFromKeypad(self, stack):
         v=self.getVal(stack[1])   # Variable
@@ -1161,24 +1912,16 @@ class execThread(QThread):
         if self.halt: return
         
         self.msg=0
+        self.msgEvent.clear()
         self.requestKeyboard.emit(v, stack[1])
-        while self.msg==0:
-            time.sleep(0.01)
+        self.waitForMsg()
         
         try:
             t=int(max(min(int(self.imesg),v2),v1))
         except:
             t=int(v)
         
-        cc=0
-        for i in self.memory:
-            if i[0]==stack[1]:
-                self.memory[cc][1] = t
-                break
-            cc=cc+1
-        if cc==len(self.memory):        
-            self.halt=True
-            self.cmdPrint("Variable '"+stack[1]+"'\nreferenced without\nInit!\nProgram terminated")                 
+        self.setVar(stack[1], t)
 
     def cmdFromDial(self, stack):
         v=self.getVal(stack[1])   # Variable
@@ -1192,27 +1935,19 @@ class execThread(QThread):
         if self.halt: return
         
         self.msg=0
+        self.msgEvent.clear()
         self.requestDial.emit(v3,v,v1,v2, stack[1])
-        while self.msg==0:
-            time.sleep(0.01)
+        self.waitForMsg()
         
         try:
             t=max(min(int(self.imesg),v2),v1)
         except:
             t=v
         
-        cc=0
-        for i in self.memory:
-            if i[0]==stack[1]:
-                self.memory[cc][1] = t
-                break
-            cc=cc+1
-        if cc==len(self.memory):        
-            self.halt=True
-            self.cmdPrint("Variable '"+stack[1]+"'\nreferenced without\nInit!\nProgram terminated")  
+        self.setVar(stack[1], t)
 
     def cmdFromSys(self, stack):
-        v=self.getVal(stack[1])   # Variable
+        self.getVal(stack[1])   # Variable muss es geben
         
         if stack[2]=="timer":
             t=int((time.time()-self.timestamp)*1000)
@@ -1278,27 +2013,19 @@ class execThread(QThread):
         else:
             t=-1
         
-        cc=0
-        for i in self.memory:
-            if i[0]==stack[1]:
-                self.memory[cc][1] = t
-                break
-            cc=cc+1
-        if cc==len(self.memory):        
-            self.halt=True
-            self.cmdPrint("Variable '"+stack[1]+"'\nreferenced without\nInit!\nProgram terminated") 
+        self.setVar(stack[1], t)
     
     def getCanvasData(self):
         self.msg=0
+        self.msgEvent.clear()
         self.canvasSig.emit("requestData")
-        while self.msg==0:
-            self.parent.processEvents()
+        self.waitForMsg()
     
     def getMousePos(self):
         self.msg=0
+        self.msgEvent.clear()
         self.canvasSig.emit("requestPos")
-        while self.msg==0:
-            self.parent.processEvents()
+        self.waitForMsg()
     
     def cmdFromRIIR(self, stack):        
         try:
@@ -1306,15 +2033,7 @@ class execThread(QThread):
         except:
             t=-1
         
-        cc=0
-        for i in self.memory:
-            if i[0]==stack[1]:
-                self.memory[cc][1] = t
-                break
-            cc=cc+1
-        if cc==len(self.memory):        
-            self.halt=True
-            self.cmdPrint("Variable '"+stack[1]+"'\nreferenced without\nInit!\nProgram terminated")      
+        self.setVar(stack[1], t)
 
     def cmdFromPoly(self, stack):
         a=float(stack[3])
@@ -1328,21 +2047,14 @@ class execThread(QThread):
         
         y=(a*(x*x*x)) + (b*(x*x)) + (c*x) + d
         
-        cc=0
-        for i in self.memory:
-            if i[0]==stack[1]:
-                self.memory[cc][1] = y
-                break
-            cc=cc+1
-        if cc==len(self.memory):        
-            self.halt=True
-            self.cmdPrint("Variable '"+stack[1]+"'\nreferenced without\nInit!\nProgram terminated")        
+        self.setVar(stack[1], y)
         
     def cmdCounterClear(self, stack):
         if stack[1]=="TXT":
             self.TXT.incrCounterCmdId(int(stack[2])-1)
         elif stack[1]=="FTD":
-            a=self.FTD.comm("counter_clear C"+stack[2])
+            self.ftdComm("counter_clear C"+stack[2])
+        self.inputChanged(stack[1], ("C", int(stack[2])))
             
             
     def cmdQueryVar(self, stack):
@@ -1355,112 +2067,45 @@ class execThread(QThread):
         v2=float(self.getVal(stack[4]))
         if self.halt: return
     
-        op=stack[3]
-        res=0
-        if op=="+": res=int(v1+v2)
-        elif op=="-": res=int(v1-v2)
-        elif op=="*": res=int(v1*v2)
-        elif op=="/": res=int(round(v1/v2))
-        elif op=="div": res=int(v1/v2)
-        elif op=="digit":
-            a=str(int(v2))
-            b=len(a)
-            if v1<=b:
-                res=int(a[(b-int(v1)):((b-int(v1))+1)])
-            else:
-                res=-1
-        elif op=="mod": res=int(v1 % v2)
-        elif op=="exp": res=int(v1 ** v2)
-        elif op=="root": res=int(v2 ** (1/v1))
-        elif op=="min": res=int(min(v1,v2))
-        elif op=="max": res=int(max(v1,v2))
-        elif op=="sgnCpy":
-            if v2<0: res=int(-1*v1)
-            elif v2>0: res=int(v1)
-            else: res=int(0)
-        elif op=="sin": res=int(v1*math.sin(math.radians(v2)))
-        elif op=="cos": res=int(v1*math.cos(math.radians(v2)))  
-        elif op=="random": res=random.randint(min(v1,v2),max(v1,v2))
-        elif op=="mean":
-            res=(float(v1)+float(v2))/2
-            if res > 0: res = int(res+0.5)
-            elif res < 0: res = int(res-0.5)
-            else: res =0
-        elif op=="&&" and (v1!=0) and (v2!=0): res=1 
-        elif op=="||" and ((v1!=0) or (v2!=0)): res=1
-        elif op=="<"  and (v1<v2): res=1  
-        elif op=="==" and (v1==v2): res=1 
-        elif op=="!=" and (v1!=v2): res=1 
-        elif op==">"  and (v1>v2): res=1 
-        elif op==">=" and (v1>=v2): res=1 
-        elif op=="<=" and (v1<=v2): res=1
-        elif op=="sign":
-            v1=int(v1)
-            v2=int(v2)
-            res=v1
-            if v1 > (2**(v2-1)): res = v1 - (2**v2)
-        elif op=="unsign":
-            v1=int(v1)
-            v2=int(v2)
-            res=v1
-            if v1 < 0: res = v1 + (2**v2)
-        elif op=="bitShift":
-            v1=int(v1)
-            v2=int(v2)
-            if v2 < 0: res = v1 >> abs(v2)
-            else: res = v1 << v2
-        elif op=="bitAnd":
-            v1=int(v1)
-            v2=int(v2)
-            res = v1 & v2
-        elif op=="bitOr":
-            v1=int(v1)
-            v2=int(v2)
-            res = v1 | v2
-        elif op=="bitXOr":
-            v1=int(v1)
-            v2=int(v2)
-            res = v1 ^ v2 
-        elif op=="tempMeingast":
-            a=2.15992060279525E-07
-            b=-0.007569625106584
-            c=77.2415400995752
-            res=int(v1/1000*(a*v2*v2+b*v2+c))
-        
-        cc=0
-        for i in self.memory:
-            if i[0]==stack[1]:
-                self.memory[cc][1] = res
-                break
-            cc=cc+1
-        if cc==len(self.memory):        
-            self.halt=True
-            self.cmdPrint("Variable '"+stack[1]+"'\nreferenced without\nInit!\nProgram terminated") 
-
+        self.setVar(stack[1], calcOp(stack[3], v1, v2))
+
+    def exprFunc(self, tree):
+        # Closure fuer einen Baum aus calcexpr.parse(), jeder Operator wie Calc
+        if type(tree)==int:
+            v=float(tree)
+            return lambda: v
+        if type(tree)==str:
+            getVal=self.getVal
+            return lambda: float(getVal(tree))
+        (op, a, b)=(tree[0], self.exprFunc(tree[1]), self.exprFunc(tree[2]))
+        return lambda: float(calcOp(op, a(), b()))
+    
+    def cmdExpr(self, var, func):
+        res=int(func())
+        if self.halt: return
+        
+        self.setVar(var, res)
+    
+    def cmdExprError(self, line, msg):
+        self.cmdPrint("Expr: "+msg+"\nin code:\n"+line+"\nProgram terminated")
+        self.halt=True
+    
     def cmdFromButtons(self, stack):
         v=stack[1]  # Variable
 
         if self.halt: return
       
         self.msg=0
+        self.msgEvent.clear()
         self.requestBtn.emit(v,"",stack[2:])
-        while self.msg==0:
-            time.sleep(0.01)
+        self.waitForMsg()
         
         try:
             t=int(self.imesg)
         except:
             t=-1
         
-        cc=0
-        for i in self.memory:
-            if i[0]==stack[1]:
-                self.memory[cc][1] = t
-                break
-            cc=cc+1
-        if cc==len(self.memory):        
-            self.halt=True
-            self.cmdPrint("Variable '"+stack[1]+"'\nreferenced without\nInit!\nProgram terminated") 
+        self.setVar(stack[1], t)
     
     def cmdIfVar(self,stack):
         v1=self.getVal(stack[1])
@@ -1477,11 +2122,9 @@ class execThread(QThread):
         elif    (op==">=") and (v1>=v2): res=True
         
         if res:
-            n=-1
-            for line in self.jmpTable:
-                if stack[4]==line[0]: n=line[1]-1
+            n=self.findTag(stack[4])-1
 
-            if n==-1:
+            if n<0:
                 self.msgOut("IfVar jump tag not found!")
                 self.halt=True
             else:
@@ -1495,90 +2138,34 @@ class execThread(QThread):
         if self.halt: return
 
         if (self.touchEventX >= x1) and (self.touchEventY >= y1) and (self.touchEventX <= x2) and (self.touchEventY <= y2):
-            n=-1
-            for line in self.jmpTable:
-                if stack[5]==line[0]: n=line[1]-1
+            n=self.findTag(stack[5])-1
 
-            if n==-1:
+            if n<0:
                 self.msgOut("IfTouchArea jump tag not found!")
                 self.halt=True
             else:
                 self.count=n
     
     def cmdFromIn(self, stack):
-        v = ""
-        var=stack[4]
-        
-        if stack[1] == "RIF":
-            if stack[3]=="S":
-                v=str(self.RIF.Digital(int(stack[2])+self.RIFShift*8))
-            elif stack[3]=="V":
-                if stack[2]=="1":
-                    v=str(self.RIF.GetA1()*10)
-                elif stack[2]=="2":
-                    v=str(self.RIF.GetA2()*10)
-            elif stack[3]=="R":
-                if stack[2]=="X":
-                    if self.RIFShift==0:
-                        v=str(self.RIF.GetAX())
-                    elif self.RIFShift==1:
-                        v=str(self.RIF.GetAX_Slave1())
-                    elif self.RIFShift==2:
-                        v=str(self.RIF.GetAX_Slave2())
-                    elif self.RIFShift==3:
-                        v=str(self.RIF.GetAX_Slave3())
-                elif stack[2]=="Y":
-                    v=str(self.RIF.GetAY())
-            elif stack[3]=="D":
-                if stack[2]=="1":
-                    v=str(self.RIF.GetD1())
-                elif stack[2]=="2":
-                    v=str(self.RIF.GetD2())
-            elif stack[3]=="C":
-                tx="Not yet implemented"                
-        elif stack[1]== "TXT":
-            self.TXT.updateWait()
-            if stack[3]=="S":
-                v=str(self.txt_i[int(stack[2])-1].state())
-            elif stack[3]=="V":
-                v=str(self.txt_i[int(stack[2])-1].voltage())
-            elif stack[3]=="R":
-                v=str(self.txt_i[int(stack[2])-1].value())
-            elif stack[3]=="D":
-                v=str(self.txt_i[int(stack[2])-1].distance())
-            elif stack[3]=="C":
-                v=str(self.TXT.getCurrentCounterValue(int(stack[2])-1))
-        elif stack[1]== "FTD":
-            if stack[3]=="S":
-                v=self.FTD.comm("input_get i"+stack[2])
-            elif stack[3]=="V":
-                v=self.FTD.comm("input_get i"+stack[2])
-            elif stack[3]=="R":
-                v=self.FTD.comm("input_get i"+stack[2])
-            elif stack[3]=="D":
-                v=self.FTD.comm("ultrasonic_get")
-            elif stack[3]=="C":
-                v=self.FTD.comm("counter_get c"+stack[2])
-        elif stack[1]== "HAT":
-            v = self.hat.get_input("I"+str(stack[2]))
+        v=self.getInput(stack[1], stack[2], stack[3])
+        
+        if v==None: v=""
+        elif stack[1]!="HAT": v=str(v)
             
         ### und noch der variable zuweisen...         
-        cc=0
-        for i in self.memory:
-            if i[0]==stack[4]:
-                self.memory[cc][1] = v
-                break
-            cc=cc+1
-        if cc==len(self.memory):        
-            self.halt=True
-            self.cmdPrint("Variable '"+stack[4]+"'\nreferenced without\nInit!\nProgram terminated") 
+        self.setVar(stack[4], v)
             
     def cmdLog(self, stack):
-        if stack[1][0]=="S" or stack[1][0]=="s":
+        mode=stack[1]
+        binary=False
+        if mode[0]=="S" or mode[0]=="s":
             self.silent=True
-            stack[1]="1"
+            mode="1"
+        elif mode[0]=="B" or mode[0]=="b":
+            binary=True
+            mode="1"
             
-        if stack[1]=="1" and not self.logging:
+        if mode=="1" and not self.logging:
             self.logging=True
             try:
                 self.logfile.close()
@@ -1586,22 +2173,27 @@ class execThread(QThread):
                 pass
             
             try:
-                lfn=os.path.join(logdir, "log"+time.strftime("%Y%m%d-%H%M%S")+".txt")
-                while os.path.exists(lfn):
+                lfn=os.path.join(logdir, "log"+time.strftime("%Y%m%d-%H%M%S"))
+                while os.path.exists(lfn+".txt") or os.path.exists(lfn+".bin"):
                     lfn=lfn+"-"
-                self.logfile=open(lfn,"w",encoding="utf-8")
+                if binary: lfn=lfn+".bin"
+                else: lfn=lfn+".txt"
+                
+                # geschrieben wird im Hintergrund
+                self.logfile=LogWriter(lfn, binary, self.msgOut)
+                self.logfile.start()
             except:
                 self.cmdPrint("Could not write logfile.")
                 self.logging=False
                 
-        elif stack[1]=="0":
+        elif mode=="0":
             self.logging=False
             self.silent=False
             try:
                 self.logfile.close()
             except:
                 pass
-        elif stack[1][0]=="C":
+        elif mode[0]=="C":
             try:
                 shutil.rmtree(logdir, ignore_errors=True)
                 if not os.path.exists(logdir):
@@ -1624,60 +2216,207 @@ class execThread(QThread):
             tx=tx+(stack[a])+" "
         tx=tx[:-1]
         
-        if stack[1] == "RIF":
-            if stack[3]=="S":
-                v=str(self.RIF.Digital(int(stack[2])+8*self.RIFShift))
-            elif stack[3]=="V":
-                if stack[2]=="1":
-                    v=str(self.RIF.GetA1()*10)
-                elif stack[2]=="2":
-                    v=str(self.RIF.GetA2()*10)
-            elif stack[3]=="R":
-                if stack[2]=="X":
+        if stack[1]=="RIF" and stack[3]=="C":
+            tx="Not yet implemented"
+        else:
+            v=self.getInput(stack[1], stack[2], stack[3])
+            if v==None: v=""
+        
+        self.cmdPrint(tx+" "+str(v))
+    
+    def startSamplers(self, rif_i, txt_i, txt_it, txt_c, ftd_i, ftd_it, ftd_c):
+        # poll the inputs used by the program in the background
+        self.samplers={}
+        
+        if self.TXT!=None and self.requireTXT:
+            ch={}
+            for i in range(0,8):
+                if txt_i[i]:
+                    if txt_it[i]==2:   ch[("R",i+1)]=self.txt_i[i].value
+                    elif txt_it[i]==3: ch[("V",i+1)]=self.txt_i[i].voltage
+                    elif txt_it[i]==4: ch[("D",i+1)]=self.txt_i[i].distance
+                    else:              ch[("S",i+1)]=self.txt_i[i].state
+            for i in range(0,4):
+                if txt_c[i]:
+                    ch[("C",i+1)]=lambda i=i: self.TXT.getCurrentCounterValue(i)
+            if len(ch)>0:
+                self.samplers["TXT"]=IOSampler("TXT", ch, 0, self.TXT.updateWait, self.wakeup.set)
+        
+        if self.FTD!=None and self.requireFTD:
+            # alle benutzten Eingaenge mit einem einzigen USB Zugriff lesen
+            self.ftdKeys=[]
+            self.ftdCmds=[]
+            for i in range(0,8):
+                if ftd_i[i]:
+                    if ftd_it[i]==2:   mode="R"
+                    elif ftd_it[i]==3: mode="V"
+                    else:              mode="S"
+                    self.ftdKeys.append((mode,i+1))
+                    self.ftdCmds.append("input_get i"+str(i+1))
+            for i in range(0,4):
+                if ftd_c[i]==1:
+                    self.ftdKeys.append(("C",i+1))
+                    self.ftdCmds.append("counter_get c"+str(i+1))
+            if ftd_c[0]==2:
+                self.ftdKeys.append(("D",1))
+                self.ftdCmds.append("ultrasonic_get")
+            
+            self.ftdValues={}
+            ch={}
+            for key in self.ftdKeys:
+                ch[key]=lambda key=key: self.ftdValues[key]
+            if len(ch)>0:
+                self.samplers["FTD"]=IOSampler("FTD", ch, SAMPLEPERIOD["FTD"], self.ftdSample, self.wakeup.set, SAMPLEBACKOFF)
+        
+        if self.RIF!=None and self.requireRIF:
+            ch={}
+            for i in range(0,8):
+                if rif_i[i]:
+                    ch[("S",i+1)]=lambda i=i: self.RIF.Digital(i+1)
+            if len(ch)>0:
+                self.samplers["RIF"]=IOSampler("RIF", ch, SAMPLEPERIOD["RIF"], None, self.wakeup.set)
+        
+        if self.hat!=None and self.requireHAT:
+            ch={}
+            for i in range(0,4):
+                ch[("S",i+1)]=lambda i=i: self.hat.get_input("I"+str(i+1))
+            self.samplers["HAT"]=IOSampler("HAT", ch, SAMPLEPERIOD["HAT"], None, self.wakeup.set)
+        
+        for smp in self.samplers.values():
+            smp.start()
+        for smp in self.samplers.values():
+            smp.ready.wait(1)
+    
+    def stopSamplers(self):
+        for smp in self.samplers.values():
+            smp.stop()
+        for smp in self.samplers.values():
+            smp.join(1)
+    
+    def inputKey(self, dev, pin, mode="S"):
+        n=int(pin)
+        if dev=="RIF": n=n+8*self.RIFShift
+        elif dev=="FTD" and mode=="D": n=1
+        return (mode, n)
+    
+    def sampled(self, dev, key):
+        # the sampler of the device, if it watches this input
+        smp=self.samplers.get(dev)
+        if smp!=None and key in smp.values: return smp
+        return None
+    
+    def inputChanged(self, dev, key):
+        # the program has changed the input, the sampled value is out of date
+        smp=self.samplers.get(dev)
+        if smp!=None: smp.invalidate(key)
+    
+    def getInput(self, dev, pin, mode):
+        # actual value of an input, taken from the sampler where possible
+        if mode in ["S", "R", "V", "D", "C"] and not (dev=="RIF" and mode!="S"):
+            key=self.inputKey(dev, pin, mode)
+            smp=self.sampled(dev, key)
+            if smp!=None:
+                # invalidate() kann den Wert inzwischen verworfen haben
+                v=smp.values.get(key)
+                if v!=None: return v
+        
+        t=time.time()
+        v=self.readInput(dev, pin, mode)
+        self.blocked=self.blocked+time.time()-t
+        return v
+    
+    def readInput(self, dev, pin, mode):
+        if dev=="RIF":
+            if mode=="S":
+                return self.RIF.Digital(int(pin)+8*self.RIFShift)
+            elif mode=="V":
+                if pin=="1":
+                    return self.RIF.GetA1()*10
+                elif pin=="2":
+                    return self.RIF.GetA2()*10
+            elif mode=="R":
+                if pin=="X":
                     if self.RIFShift==0:
-                        v=str(self.RIF.GetAX())
+                        return self.RIF.GetAX()
                     elif self.RIFShift==1:
-                        v=str(self.RIF.GetAX_Slave1())
+                        return self.RIF.GetAX_Slave1()
                     elif self.RIFShift==2:
-                        v=str(self.RIF.GetAX_Slave2())
+                        return self.RIF.GetAX_Slave2()
                     elif self.RIFShift==3:
-                        v=str(self.RIF.GetAX_Slave3())
-                elif stack[2]=="Y":
-                    v=str(self.RIF.GetAY())
-            elif stack[3]=="D":
-                if stack[2]=="1":
-                    v=str(self.RIF.GetD1())
-                elif stack[2]=="2":
-                    v=str(self.RIF.GetD2())
-            elif stack[3]=="C":
-                tx="Not yet implemented"                
-        elif stack[1]== "TXT":
+                        return self.RIF.GetAX_Slave3()
+                elif pin=="Y":
+                    return self.RIF.GetAY()
+            elif mode=="D":
+                if pin=="1":
+                    return self.RIF.GetD1()
+                elif pin=="2":
+                    return self.RIF.GetD2()
+        elif dev=="TXT":
             self.TXT.updateWait()
-            if stack[3]=="S":
-                v=str(self.txt_i[int(stack[2])-1].state())
-            elif stack[3]=="V":
-                v=str(self.txt_i[int(stack[2])-1].voltage())
-            elif stack[3]=="R":
-                v=str(self.txt_i[int(stack[2])-1].value())
-            elif stack[3]=="D":
-                v=str(self.txt_i[int(stack[2])-1].distance())
-            elif stack[3]=="C":
-                v=str(self.TXT.getCurrentCounterValue(int(stack[2])-1))
-        elif stack[1]== "FTD":
-            if stack[3]=="S":
-                v=self.FTD.comm("input_get i"+stack[2])
-            elif stack[3]=="V":
-                v=self.FTD.comm("input_get i"+stack[2])
-            elif stack[3]=="R":
-                v=self.FTD.comm("input_get i"+stack[2])
-            elif stack[3]=="D":
-                v=self.FTD.comm("ultrasonic_get")
-            elif stack[3]=="C":
-                v=self.FTD.comm("counter_get c"+stack[2])
-        elif stack[1]== "HAT":
-            v = str(self.hat.get_input("I"+str(stack[2])))
-        
-        self.cmdPrint(tx+" "+v)
+            if mode=="S":
+                return self.txt_i[int(pin)-1].state()
+            elif mode=="V":
+                return self.txt_i[int(pin)-1].voltage()
+            elif mode=="R":
+                return self.txt_i[int(pin)-1].value()
+            elif mode=="D":
+                return self.txt_i[int(pin)-1].distance()
+            elif mode=="C":
+                return self.TXT.getCurrentCounterValue(int(pin)-1)
+        elif dev=="FTD":
+            if mode=="S" or mode=="V" or mode=="R":
+                return self.ftdComm("input_get i"+str(pin))
+            elif mode=="D":
+                return self.ftdComm("ultrasonic_get")
+            elif mode=="C":
+                return self.ftdComm("counter_get c"+str(pin))
+        elif dev=="HAT":
+            return self.hat.get_input("I"+str(pin))
+        return None
+    
+    def getDigital(self, dev, pin):
+        v=self.getInput(dev, pin, "S")
+        if dev=="FTD": return str(v)=="1"
+        return bool(v)
+    
+    def srdComm(self, command, timeout=SRDTIMEOUT):
+        t=time.time()
+        if self.srd!=None: ret=self.srd.comm(command, timeout)
+        else: ret="Fail"
+        self.blocked=self.blocked+time.time()-t
+        return ret
+    
+    def srdSend(self, command):
+        # without waiting for the reply, only blocks while SRDWINDOW commands are pending
+        t=time.time()
+        if self.srd!=None: self.srd.send(command)
+        self.blocked=self.blocked+time.time()-t
+    
+    def ftdComm(self, command):
+        # the FTD is shared between the exec thread and its sampler
+        t=time.time()
+        with self.ftdLock:
+            ret=self.FTD.comm(command)
+        self.blocked=self.blocked+time.time()-t
+        return ret
+    
+    def ftdBatch(self, commands):
+        # several commands in one USB transfer, replies in the same order
+        t=time.time()
+        with self.ftdLock:
+            ret=self.ftdPipe.batch(commands)
+        self.blocked=self.blocked+time.time()-t
+        return ret
+    
+    def ftdSample(self):
+        # called by the FTD sampler thread before each sample, the program
+        # goes first if it is talking to the ftDuino just now
+        if not self.ftdLock.acquire(False): return False
+        try:
+            self.ftdValues=dict(zip(self.ftdKeys, self.ftdPipe.batch(self.ftdCmds)))
+        finally:
+            self.ftdLock.release()
+        return True
     
     def cmdOutput(self, stack):
         v=self.getVal(stack[3])
@@ -1688,7 +2427,7 @@ class execThread(QThread):
         elif stack[1]=="TXT":
             self.txt_o[int(stack[2])-1].setLevel(v)
         elif stack[1]=="FTD":
-                self.FTD.comm("output_set O"+stack[2]+" 1 "+str(v)) 
+                self.ftdComm("output_set O"+stack[2]+" 1 "+str(v)) 
             
     def cmdMotor(self, stack):
         v=self.getVal(stack[4])
@@ -1705,11 +2444,11 @@ class execThread(QThread):
                 self.txt_m[int(stack[2])-1].setSpeed(0-v)
         elif stack[1]=="FTD": # FTD
             if stack[3]=="s":
-                self.FTD.comm("motor_set M"+stack[2]+" brake 0")
+                self.ftdComm("motor_set M"+stack[2]+" brake 0")
             elif stack[3]=="l":
-                self.FTD.comm("motor_set M"+stack[2]+" left "+str(v))
+                self.ftdComm("motor_set M"+stack[2]+" left "+str(v))
             elif stack[3]=="r":
-                self.FTD.comm("motor_set M"+stack[2]+" right "+str(v))             
+                self.ftdComm("motor_set M"+stack[2]+" right "+str(v))             
         elif stack[1]=="HAT":
             if stack[3]=="s":
                 self.hat.m_set_mode("M"+stack[2], "Brake")
@@ -1736,6 +2475,9 @@ class execThread(QThread):
         
         self.txt_m[m-1].setDistance(n, syncto=self.txt_m[o-1])
         self.txt_m[o-1].setDistance(n, syncto=self.txt_m[m-1])
+        # setDistance beginnt die Zaehlung der Motoren neu
+        self.inputChanged("TXT", ("C", m))
+        self.inputChanged("TXT", ("C", o))
             
         self.txt_m[o-1].setSpeed(s)
         self.txt_m[m-1].setSpeed(s)
@@ -1766,6 +2508,7 @@ class execThread(QThread):
             s=0-s
 
         self.txt_m[m-1].setDistance(n)
+        self.inputChanged("TXT", ("C", m))
         self.txt_m[m-1].setSpeed(s)
 
         while not (self.txt_m[m-1].finished() or self.halt):
@@ -1786,89 +2529,55 @@ class execThread(QThread):
         
         if self.halt: return
         
-        if stack[1]=="RIF":
-            e=e+8*self.RIFShift
-            p=p+8*self.RIFShift
-            m=m+4*self.RIFShift
-            
-            if e>-1:
-                if d=="l" and self.RIF.Digital(e): return
-            
-            a=self.RIF.Digital(p)
-            self.RIF.SetMotor(m,d,s)
-            c=0
-            while c<n and not self.halt:
-                if e>-1:
-                    if d=="l" and self.RIF.Digital(e): break
-                b=a
-                a=self.RIF.Digital(p)
-                if not a==b: c=c+1
-            
-            self.RIF.SetMotor(m,"s",0)
-        elif stack[1]=="TXT": # TXT
-            if e>-1:
-                self.TXT.updateWait()
-                if d=="l" and self.txt_i[e-1].state(): return
-            
-            self.TXT.updateWait()
-            a=self.txt_i[p-1].state()
-
+        dev=stack[1]
+        if d!="l": e=-1   # end switch only counts when moving left
+        
+        if e>-1:
+            if self.getDigital(dev, e): return
+        
+        # pulses are counted by the sampler if it watches the input
+        key=self.inputKey(dev, p)
+        smp=self.sampled(dev, key)
+        if smp!=None: c0=smp.edges(key)
+        else: a=self.getDigital(dev, p)
+        
+        if dev=="RIF":
+            self.RIF.SetMotor(m+4*self.RIFShift,d,s)
+        elif dev=="TXT":
             if d=="r":
                 s=0-s
-                
             self.txt_m[m-1].setSpeed(s)
-            c=0
-            while c<n and not self.halt:
-                if e>-1:
-                    self.TXT.updateWait()
-                    if d=="l" and self.txt_i[e-1].state(): break
-                b=a
-                self.TXT.updateWait()
-                a=self.txt_i[p-1].state()
-                if not a==b: c=c+1
-            
-            self.txt_m[int(stack[2])-1].stop()  
-        elif stack[1]=="FTD": # FTD
-            if e>-1:
-                if d=="l" and (self.FTD.comm("input_get i"+str(e))=="1"): return
-            
-            a=int(self.FTD.comm("input_get i"+str(p)))
-
+        elif dev=="FTD":
             if d=="r":
-                self.FTD.comm("motor_set M"+str(m)+" right "+str(s)) 
+                self.ftdComm("motor_set M"+str(m)+" right "+str(s)) 
             else:
-                self.FTD.comm("motor_set M"+str(m)+" left "+str(s))             
-            
-            c=0
-            while c<n and not self.halt:
-                if e>-1:
-                    if d=="l" and (self.FTD.comm("input_get i"+str(e))=="1"): break
-                b=a
-                a=int(self.FTD.comm("input_get i"+str(p)))
-                if not a==b: c=c+1
-            
-            self.FTD.comm("motor_set M"+str(m)+" brake 0")
-        elif stack[1]=="HAT":
-            if e>-1:
-                if d=="l" and ((self.hat.get_input("I"+str(e)))==True): return
-            
-            a=( self.hat.get_input("I"+str(p)) == True)
-
+                self.ftdComm("motor_set M"+str(m)+" left "+str(s))             
+        elif dev=="HAT":
             if d=="r":
                 self.hat.m_set_mode("M"+str(m), "Right")
-                self.hat.m_set_pwm("M"+str(m), int(s/5.12))
             else:
                 self.hat.m_set_mode("M"+str(m), "Left")
-                self.hat.m_set_pwm("M"+str(m), int(s/5.12))             
-            
-            c=0
-            while c<n and not self.halt:
-                if e>-1:
-                    if d=="l" and ((self.hat.get_input("I"+str(e)))==True): break
+            self.hat.m_set_pwm("M"+str(m), int(s/5.12))
+        
+        c=0
+        while c<n and not self.halt:
+            if e>-1:
+                if self.getDigital(dev, e): break
+            if smp!=None:
+                self.pause(0.05)
+                c=smp.edges(key)-c0
+            else:
                 b=a
-                a=( self.hat.get_input("I"+str(p)) == True)
+                a=self.getDigital(dev, p)
                 if not a==b: c=c+1
-            
+        
+        if dev=="RIF":
+            self.RIF.SetMotor(m+4*self.RIFShift,"s",0)
+        elif dev=="TXT":
+            self.txt_m[m-1].stop()  
+        elif dev=="FTD":
+            self.ftdComm("motor_set M"+str(m)+" brake 0")
+        elif dev=="HAT":
             self.hat.m_set_mode("M"+str(m), "Brake")
             self.hat.m_set_pwm("M"+str(m), 0)            
 
@@ -1878,12 +2587,12 @@ class execThread(QThread):
         if self.halt: return
         
         if stack[1]=="SRD":
-            srdcomm(self.SRD, "pwm_set "+str(int((stack[2])[1:]))+" 0 "+str(v))
+            self.srdSend("pwm_set "+str(int((stack[2])[1:]))+" 0 "+str(v))
         elif stack[1]=="TXT":
             # self.txt_o[int(stack[2])-1].setLevel(v)
             pass
         elif stack[1]=="FTD":
-            self.FTD.comm("pwm_set "+str(int((stack[2])[1:]))+" 0 "+str(v))             
+            self.ftdComm("pwm_set "+str(int((stack[2])[1:]))+" 0 "+str(v))             
             
     def cmdDelay(self, stack):
         v=self.getVal(stack[1])
@@ -1895,18 +2604,10 @@ class execThread(QThread):
         except:
             pass
             
-        self.sleeping=True
-        self.sleeper=thd.Timer(float(v)/1000, self.wake)
-        self.sleeper.start()
-        
-        while self.sleeping and not self.halt:
-            time.sleep(0.001)
-        
-        self.sleeper.cancel()
-            
-
-    def wake(self):
-        self.sleeping=False
+        # pause() kehrt auch bei Touch oder Interrupt zurueck
+        end=time.time()+float(v)/1000
+        while not self.halt and time.time()<end:
+            self.pause(end-time.time())
         
     def cmdIfTimer(self, stack):
         v=float(self.getVal(stack[2]))
@@ -1915,11 +2616,9 @@ class execThread(QThread):
         diff=(time.time()-self.timestamp)*1000
         
         if (stack[1]=="<" and diff<v) or (stack[1]==">" and diff>v):
-            n=-1
-            for line in self.jmpTable:
-                if stack[3]==line[0]: n=line[1]-1
+            n=self.findTag(stack[3])-1
 
-            if n==-1:
+            if n<0:
                 self.msgOut("IfTimer jump tag not found!")
                 self.halt=True
             else:
@@ -1958,11 +2657,9 @@ class execThread(QThread):
             res=True
         
         if res:
-            n=-1
-            for line in self.jmpTable:
-                if stack[5]==line[0]: n=line[1]-1
+            n=self.findTag(stack[5])-1
 
-            if n==-1:
+            if n<0:
                 self.msgOut("IfTime jump tag not found!")
                 self.halt=True
             else:
@@ -2012,11 +2709,9 @@ class execThread(QThread):
             elif    (op=="!=") and (now!=then): res=True
         
         if res:
-            n=-1
-            for line in self.jmpTable:
-                if stack[6]==line[0]: n=line[1]-1
+            n=self.findTag(stack[6])-1
 
-            if n==-1:
+            if n<0:
                 self.msgOut("IfDate jump tag not found!")
                 self.halt=True
             else:
@@ -2026,16 +2721,17 @@ class execThread(QThread):
         self.cmdPrint("Now: "+time.strftime("%Y-%m-%d_%H:%M:%S"))
                 
     def cmdJump(self,stack):
-        n=-1
-        for line in self.jmpTable:
-            if stack[1]==line[0]: n=line[1]
+        n=self.findTag(stack[1])
         if n==-1:
             self.msgOut("Jump tag not found!")
             self.halt=True
         else:
             self.count=n
+    
+    def cmdJumpTo(self, n):
+        self.count=n
             
-    def cmdLoopTo(self,stack):
+    def cmdLoopTo(self, stack, tgt=None):
         v=self.getVal(stack[2])
         if self.halt: return
     
@@ -2051,10 +2747,8 @@ class execThread(QThread):
                 found=True
                 break
         if not found:
-            tgt=-1
-            for line in self.jmpTable:
-                if stack[1]==line[0]: tgt=line[1]-1
-            if tgt==-1:
+            if tgt==None: tgt=self.findTag(stack[1])-1
+            if tgt<0:
                 self.msgOut("LoopTo tag not found!")
                 self.halt=True
             else:
@@ -2066,170 +2760,58 @@ class execThread(QThread):
                     self.count=tgt
         
     def cmdWaitForInputDig(self,stack):
-        self.tOut=False
-        self.tAct=False
+        end=0
         
         if len(stack)>4:
             v=self.getVal(stack[4])
             if self.halt: return
-            if v>0:
-                self.timer = QTimer()
-                self.timer.setSingleShot(True)
-                self.timer.timeout.connect(self.timerstop)
-                self.timer.start(v)  
-                self.tAct=True
-
-        if stack[1]=="RIF":
-            inp=int(stack[2])+8*self.RIFShift
-            if stack[3]=="Raising":
-                a=self.RIF.Digital(inp)
-                b=a
-                while not (b<a or self.halt or self.tOut ): 
-                    b=a
-                    a=self.RIF.Digital(inp)
-                    self.parent.processEvents()
-                    time.sleep(0.001)
-            elif stack[3]=="Falling":
-                a=self.RIF.Digital(inp)
-                b=a
-                while not (b>a or self.halt or self.tOut ): 
-                    b=a
-                    a=self.RIF.Digital(inp)
-                    self.parent.processEvents()
-                    time.sleep(0.001)
-        elif stack[1]=="TXT": # TXT
-            if stack[3]=="Raising":
-                self.TXT.updateWait()
-                a=self.txt_i[int(stack[2])-1].state()
-                b=a
-                while not (b<a or self.halt or self.tOut ): 
-                    b=a
-                    self.TXT.updateWait()
-                    a=self.txt_i[int(stack[2])-1].state()
-                    self.parent.processEvents()
-                    time.sleep(0.001)
-            elif stack[3]=="Falling":
-                self.TXT.updateWait()
-                a=self.txt_i[int(stack[2])-1].state()
-                b=a
-                while not (b>a or self.halt or self.tOut ): 
-                    b=a
-                    self.TXT.updateWait()
-                    a=self.txt_i[int(stack[2])-1].state()
-                    self.parent.processEvents()
-                    time.sleep(0.001)
-        elif stack[1]=="FTD": # FTD
-            if stack[3]=="Raising":
-                a=int(self.FTD.comm("input_get i"+stack[2]))
-                b=a
-                while not (b<a or self.halt or self.tOut ): 
-                    b=a
-                    a=int(self.FTD.comm("input_get i"+stack[2]))
-                    self.parent.processEvents()
-                    time.sleep(0.001)
-            elif stack[3]=="Falling":
-                a=int(self.FTD.comm("input_get i"+stack[2]))
+            if v>0: end=time.time()+float(v)/1000
+        
+        dev=stack[1]
+        key=self.inputKey(dev, stack[2])
+        smp=self.sampled(dev, key)
+        
+        if smp!=None:
+            # the sampler counts the edges and wakes us up
+            if stack[3]=="Raising": edges=smp.rising
+            else: edges=smp.falling
+            c=edges[key]
+            while not (edges[key]!=c or self.halt or self.expired(end)):
+                if end>0: self.pause(max(min(0.1, end-time.time()), 0))
+                else: self.pause(0.1)
+        elif stack[3]=="Raising":
+            a=self.getDigital(dev, stack[2])
+            b=a
+            while not (b<a or self.halt or self.expired(end) ): 
                 b=a
-                while not (b>a or self.halt or self.tOut ): 
-                    b=a
-                    a=int(self.FTD.comm("input_get i"+stack[2]))
-                    self.parent.processEvents()
-                    time.sleep(0.001)
-        elif stack[1]== "HAT":
-            if stack[3]=="Raising":
-                a=self.hat.get_input("I"+str(stack[2]))
+                a=self.getDigital(dev, stack[2])
+                self.pause(0.001)
+        elif stack[3]=="Falling":
+            a=self.getDigital(dev, stack[2])
+            b=a
+            while not (b>a or self.halt or self.expired(end) ): 
                 b=a
-                while not (b<a or self.halt or self.tOut ): 
-                    b=a
-                    a=self.hat.get_input("I"+str(stack[2]))
-                    self.parent.processEvents()
-                    time.sleep(0.001)
-            elif stack[3]=="Falling":
-                a=self.hat.get_input("I"+str(stack[2]))
-                b=a
-                while not (b>a or self.halt or self.tOut ): 
-                    b=a
-                    a=self.hat.get_input("I"+str(stack[2]))
-                    self.parent.processEvents()
-                    time.sleep(0.001)                              
-        
-        if self.tAct:
-            self.timer.stop()
+                a=self.getDigital(dev, stack[2])
+                self.pause(0.001)
         
-    def timerstop(self):
-        self.tOut=True            
+    def expired(self, end):
+        # Zeitlimit der WaitIn Befehle, end=0 wartet unbegrenzt
+        return end>0 and time.time()>=end
     
     def cmdWaitForInput(self,stack):
-        tx = ""
         v=-1
-        
-        self.tOut=False
-        self.tAct=False
+        end=0
         
         if len(stack)>6:
             v=self.getVal(stack[6])
             if self.halt: return
-            if v>0:
-                self.timer = QTimer()
-                self.timer.setSingleShot(True)
-                self.timer.timeout.connect(self.timerstop)
-                self.timer.start(v)  
-                self.tAct=True
-
+            if v>0: end=time.time()+float(v)/1000
         
         j=False
-        while not (j or self.halt or self.tOut):
-            self.parent.processEvents()
-            if stack[1] == "RIF":
-                if stack[3]=="S":
-                    v=float(self.RIF.Digital(int(stack[2])+8*self.RIFShift))
-                elif stack[3]=="V":
-                    if stack[2]=="1":
-                        v=float(self.RIF.GetA1())*10
-                    elif stack[2]=="2":
-                        v=float(self.RIF.GetA2())*10
-                elif stack[3]=="R":
-                    if stack[2]=="X":
-                        if self.RIFShift==0:
-                            v=float(self.RIF.GetAX())
-                        if self.RIFShift==1:
-                            v=float(self.RIF.GetAX_Slave1())
-                        if self.RIFShift==2:
-                            v=float(self.RIF.GetAX_Slave2())
-                        if self.RIFShift==3:
-                            v=float(self.RIF.GetAX_Slave3())
-                    elif stack[2]=="Y":
-                        v=float(self.RIF.GetAY())
-                elif stack[3]=="D":
-                    if stack[2]=="1":
-                        v=float(self.RIF.GetD1())
-                    elif stack[2]=="2":
-                        v=float(self.RIF.GetD2())
-                elif stack[3]=="C":
-                    tx="Not yet implemented"                
-            elif stack[1]== "TXT":
-                self.TXT.updateWait()
-                if stack[3]=="S":
-                    v=float(self.txt_i[int(stack[2])-1].state())
-                elif stack[3]=="V":
-                    v=float(self.txt_i[int(stack[2])-1].voltage())
-                elif stack[3]=="R":
-                    v=float(self.txt_i[int(stack[2])-1].value())
-                elif stack[3]=="D":
-                    v=float(self.txt_i[int(stack[2])-1].distance())
-                elif stack[3]=="C":
-                    v=float(self.TXT.getCurrentCounterValue(int(stack[2])-1))
-            elif stack[1]== "FTD":
-                if stack[3]=="S":
-                    v=float(self.FTD.comm("input_get i"+stack[2]))
-                elif stack[3]=="V":
-                    v=float(self.FTD.comm("input_get i"+stack[2]))
-                elif stack[3]=="R":
-                    v=float(self.FTD.comm("input_get i"+stack[2]))
-                elif stack[3]=="D":
-                    v=float(self.FTD.comm("ultrasonic_get"))
-                elif stack[3]=="C":
-                    v=float(self.FTD.comm("counter_get c"+stack[2]))
+        while not (j or self.halt or self.expired(end)):
+            v=self.getInput(stack[1], stack[2], stack[3])
+            if v==None: v=-1
+            else: v=float(v)
         
             val=float(self.getVal(stack[5]))
             if self.halt: return
@@ -2242,119 +2824,23 @@ class execThread(QThread):
             elif stack[4]==">" and (v>val): j=True
             elif stack[4]==">=" and (v>=val): j=True
             elif stack[4]=="<=" and (v<=val): j=True
-            self.parent.processEvents()
-            time.sleep(0.001)
-        # stop gedrueckt?    
-        if self.tAct:
-            self.timer.stop()
-        self.parent.processEvents()
+            self.pause(0.001)
     
     def cmdIfInputDig(self,stack):
-        if stack[1]=="RIF":
-            k=self.RIF.Digital(int(stack[2])+8*self.RIFShift)
-            if (stack[3]=="True" and k) or (stack[3]=="False" and not k):
-                n=-1
-                for line in self.jmpTable:
-                    if stack[4]==line[0]: n=line[1]-1
-
-                if n==-1:
-                    self.msgOut("IfInputDig jump tag not found!")
-                    self.halt=True
-                else:
-                    self.count=n        
-        elif stack[1]=="TXT":
-            self.TXT.updateWait()
-            if (stack[3]=="True" and self.txt_i[int(stack[2])-1].state()) or (stack[3]=="False" and not self.txt_i[int(stack[2])-1].state()):
-                n=-1
-                for line in self.jmpTable:
-                    if stack[4]==line[0]: n=line[1]-1
-
-                if n==-1:
-                    self.msgOut("IfInputDig jump tag not found!")
-                    self.halt=True
-                else:
-                    self.count=n
-        elif stack[1]=="FTD":
-            v=(self.FTD.comm("input_get i"+stack[2]))
-            if (stack[3]=="True" and (v=="1")) or (stack[3]=="False" and (v!="1")):
-                n=-1
-                for line in self.jmpTable:
-                    if stack[4]==line[0]: n=line[1]-1
-
-                if n==-1:
-                    self.msgOut("IfInputDig jump tag not found!")
-                    self.halt=True
-                else:
-                    self.count=n
-        elif stack[1]=="HAT":
-            v = str(self.hat.get_input("I"+str(stack[2])))
-            if stack[3] == v:
-                n=-1
-                for line in self.jmpTable:
-                    if stack[4]==line[0]: n=line[1]-1
-
-                if n==-1:
-                    self.msgOut("IfInputDig jump tag not found!")
-                    self.halt=True
-                else:
-                    self.count=n
+        k=self.getDigital(stack[1], stack[2])
+        if (stack[3]=="True" and k) or (stack[3]=="False" and not k):
+            n=self.findTag(stack[4])-1
+
+            if n<0:
+                self.msgOut("IfInputDig jump tag not found!")
+                self.halt=True
+            else:
+                self.count=n        
             
     def cmdIfInput(self,stack):
-        tx = ""
-        v=-1
-        
-        if stack[1] == "RIF":
-            if stack[3]=="S":
-                v=float(self.RIF.Digital(int(stack[2])+8*self.RIFShift))
-            elif stack[3]=="V":
-                if stack[2]=="1":
-                    v=float(self.RIF.GetA1())*10
-                elif stack[2]=="2":
-                    v=float(self.RIF.GetA2())*10
-            elif stack[3]=="R":
-                if stack[2]=="X":
-                    if self.RIFShift==0:
-                        v=float(self.RIF.GetAX())
-                    if self.RIFShift==1:
-                        v=float(self.RIF.GetAX_Slave1())
-                    if self.RIFShift==2:
-                        v=float(self.RIF.GetAX_Slave2())
-                    if self.RIFShift==3:
-                        v=float(self.RIF.GetAX_Slave3())
-                elif stack[2]=="Y":
-                    v=float(self.RIF.GetAY())
-            elif stack[3]=="D":
-                if stack[2]=="1":
-                    v=float(self.RIF.GetD1())
-                elif stack[2]=="2":
-                    v=float(self.RIF.GetD2())
-            elif stack[3]=="C":
-                tx="Not yet implemented"                
-        elif stack[1]== "TXT":
-            self.TXT.updateWait()
-            if stack[3]=="S":
-                v=float(self.txt_i[int(stack[2])-1].state())
-            elif stack[3]=="V":
-                v=float(self.txt_i[int(stack[2])-1].voltage())
-            elif stack[3]=="R":
-                v=float(self.txt_i[int(stack[2])-1].value())
-            elif stack[3]=="D":
-                v=float(self.txt_i[int(stack[2])-1].distance())
-            elif stack[3]=="C":
-                v=float(self.TXT.getCurrentCounterValue(int(stack[2])-1))
-        elif stack[1]== "FTD":
-            if stack[3]=="S":
-                v=float(self.FTD.comm("input_get i"+stack[2]))
-            elif stack[3]=="V":
-                v=float(self.FTD.comm("input_get i"+stack[2]))
-            elif stack[3]=="R":
-                v=float(self.FTD.comm("input_get i"+stack[2]))
-            elif stack[3]=="D":
-                v=float(self.FTD.comm("ultrasonic_get"))
-            elif stack[3]=="C":
-                v=float(self.FTD.comm("counter_get c"+stack[2]))
-        elif stack[1]=="HAT":
-            v = self.hat.get_input("I"+str(stack[2]))
+        v=self.getInput(stack[1], stack[2], stack[3])
+        if v==None: v=-1
+        elif stack[1]!="HAT": v=float(v)
     
         val=float(self.getVal(stack[5]))
         if self.halt: return
@@ -2369,20 +2855,16 @@ class execThread(QThread):
         elif stack[4]=="<=" and (v<=val): j=True
         
         if j:
-            n=-1
-            for line in self.jmpTable:
-                if stack[6]==line[0]: n=line[1]-1
+            n=self.findTag(stack[6])-1
 
-            if n==-1:
+            if n<0:
                 self.msgOut("IfInput jump tag not found!")
                 self.halt=True
             else:
                 self.count=n        
                 
     def cmdCall(self, stack):
-        n=-1
-        for line in self.modTable:
-            if stack[1]==line[0]: n=line[1]
+        n=self.modTable.get(stack[1], -1)
         
         if n==-1:
             self.msgOut("Call module "+stack[1]+" not found!")
@@ -2424,28 +2906,43 @@ class execThread(QThread):
         if not self.silent:
             self.msgOut(message)
         if self.logging:
-            self.logfile.write(message+"\n")
+            self.logfile.put(message)
          
     def cmdMessage(self, rawline):
         self.msg=0
+        self.msgEvent.clear()
         self.showMessage.emit(rawline)
-        while self.msg==0:
-            time.sleep(0.001)
+        self.waitForMsg()
         self.msg=0
     
     def msgOut(self,message):
-        self.msg=0
-        self.updateText.emit(message)
-        while self.msg==0:
-            pass
-        self.msg=0
+        # nicht blockierend, die GUI holt den Text mit takeText() ab;
+        # laeuft der Ringpuffer ueber, gehen die aeltesten Zeilen verloren
+        with self.textLock:
+            if len(self.textQueue)==TEXTRING: self.textSkipped=self.textSkipped+1
+            self.textQueue.append(message)
+            first=len(self.textQueue)==1
+        if first: self.textReady.emit()
         
     def clrOut(self):
-        self.msg=0
-        self.clearText.emit()
-        while self.msg==0:
-            pass
-        self.msg=0
+        # alles in textQueue kommt nach dem Loeschen
+        with self.textLock:
+            self.textQueue.clear()
+            self.textSkipped=0
+            self.textCleared=True
+        self.textReady.emit()
+    
+    def takeText(self):
+        # returns whether the output was cleared, the number of lost lines
+        # and all lines queued since the last call
+        with self.textLock:
+            lines=list(self.textQueue)
+            self.textQueue.clear()
+            skipped=self.textSkipped
+            self.textSkipped=0
+            cleared=self.textCleared
+            self.textCleared=False
+        return (cleared, skipped, lines)
 
     def cmdI2CRead(self, stack):
         device=stack[1]
@@ -2457,24 +2954,23 @@ class execThread(QThread):
 
         if self.halt: return
         
-        data=""
-        for i in self.array[self.arrays.index(arr)]:
-            data=data+str(i)+" "  
+        data=joinArray(self.arrays[arr], " ")
             
         ret=[]
         if device=="FTD":
-            read=self.FTD.comm("i2c_read "+data)
+            read=self.ftdComm("i2c_read "+data)
             ret=read.split()
         elif device=="SRD":            
-            read=srdcomm(self.SRD, "i2c_read "+data)    
+            read=self.srdComm("i2c_read "+data)    
             ret=read.split()
         elif device=="TXT" or device=="RPI":                
-            ret=i2c.read_i2c_block_data(int(self.array[self.arrays.index(arr)][0]),int(self.array[self.arrays.index(arr)][1]),int(self.array[self.arrays.index(arr)][2]))
+            with self.i2cLock:
+                ret=i2c.read_i2c_block_data(int(self.arrays[arr][0]),int(self.arrays[arr][1]),int(self.arrays[arr][2]))
             
         if ret!=[]:
             if ret[0]=="Fail" or str(ret[0]).strip()=="": ret=[]
             
-        self.array[self.arrays.index(arr)]=ret
+        self.setArrayData(arr, ret)
 
         
     def cmdI2CWrite(self, stack):
@@ -2482,5521 +2978,186 @@ class execThread(QThread):
         arr=stack[2]
 
         if not (arr in self.arrays):
-            self.cmdPrint("Array '" + stack[1] + "'\nreferenced without\nArrayInit!\nProgram terminated")
-            self.halt=True
-
-        if self.halt: return
-        
-        data=""
-        for i in self.array[self.arrays.index(arr)]:
-            data=data+str(i)+" "
-            
-        if device=="FTD":                
-            self.FTD.comm("i2c_write "+data)
-        
-        elif device=="SRD":
-            srdcomm(self.SRD, "i2c_write "+data)
-        
-        elif device=="TXT" or device=="RPI":
-            dst=[]
-            for i in self.array[self.arrays.index(arr)]:
-                dst.append(int(i))
-                
-            if len(dst)>2:
-                i2c.write_i2c_block_data(dst[0], dst[1], dst[2:])
-            else:
-                i2c.write_byte(dst[0], dst[1])
-    
-    def cmdUSBComm(self, stack):
-        device=stack[1]
-        arr=stack[3]
-
-        if not (arr in self.arrays):
-            self.cmdPrint("Array '" + stack[1] + "'\nreferenced without\nArrayInit!\nProgram terminated")
-            self.halt=True
-
-        if self.halt: return
-        
-        data=""
-        for i in self.array[self.arrays.index(arr)]:
-            data=data+str(i)+" "
-            
-        if device=="FTD":
-            self.FTD.ftduino.timeout=None
-            ret=self.FTD.comm(stack[2]+" "+data)
-            self.FTD.ftduino.timeout=0.1
-        elif device=="SRD":
-            ret=srdcomm(self.SRD, stack[2]+" "+data, None)
-        
-        ret=ret.split()
-        
-        if (stack[0]=="USBRead"):
-            if ret!=[]:
-                if ret[0]=="Fail" or str(ret[0]).strip()=="": ret=[]
-                
-            self.array[self.arrays.index(arr)]=ret
-
-            
-#
-# servoDuino communication
-#
-
-def srdcomm(device, command, timeout=0.3):
-    try:
-        command=(command+"\n").encode("utf-8")
-        
-        device.timeout=timeout
-        device.flushInput()
-        device.flushOutput()
-        
-        device.write(command)
-        
-        data = device.readline()
-        
-        if data:
-            if len(data.decode("utf-8"))>2: return data.decode("utf-8")[:-2]
-            return "Fail"
-        else: 
-            return "Fail"
-    except:
-        return "Fail"
-
-#
-#
-# GUI classes for editing command lines
-#
-#
-
-class editWaitForInputDig(TouchDialog):
-    def __init__(self, cmdline, vari, parent):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","WaitInDig"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["RIF","TXT","FTD","HAT"])
-
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        if self.cmdline.split()[1]=="HAT": self.interface.setCurrentIndex(3)
-        
-        k1.addWidget(self.interface)
-        self.interface.currentIndexChanged.connect(self.on_if)
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        if self.interface.currentText()=="HAT":
-            self.port.addItems(["I 1","I 2","I 3","I 4"])
-        else:
-            self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-
-        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        k2.addWidget(self.port)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k1)
-        k9.addStretch()
-        k9.addLayout(k2)
-        
-        self.layout.addLayout(k9)
-        
-        l=QLabel(QCoreApplication.translate("ecl","Condition"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)     
-        
-        self.thd=QComboBox()
-        self.thd.setStyleSheet("font-size: 20px;")
-        self.thd.addItems(["Raising","Falling"])
-        if self.cmdline.split()[3]=="Falling": self.thd.setCurrentIndex(1)
-        self.layout.addWidget(self.thd)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Timeout"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[4])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_if(self):
-        self.port.clear()
-        if self.interface.currentText()=="HAT":
-            self.port.addItems(["I 1","I 2","I 3","I 4"])
-        else:
-            self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-    
-    def on_confirm(self):
-        self.cmdline="WaitInDig " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " " + self.thd.currentText() + " " + self.value.text()
-        self.close()
-
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","TOut"),a,None).exec_()
-        try:
-            t=str(max(min(int(t),99999),0))
-        except:
-            t=a
-        self.value.setText(t)
-
-class editIfInputDig(TouchDialog):
-    def __init__(self, cmdline, taglist, vari, parent):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","IfInDig"), parent)
-        
-        self.cmdline=cmdline
-        self.taglist=taglist
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["RIF","TXT","FTD","HAT"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        if self.cmdline.split()[1]=="HAT": self.interface.setCurrentIndex(3)
-        
-        k1.addWidget(self.interface)
-        self.interface.currentIndexChanged.connect(self.on_if)
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        k2.addWidget(self.port)
-
-        self.on_if()
-        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k1)
-        k9.addStretch()
-        k9.addLayout(k2)
-        
-        self.layout.addLayout(k9)
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Condition"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)     
-        
-        self.thd=QComboBox()
-        self.thd.setStyleSheet("font-size: 20px;")
-        self.thd.addItems(["True","False"])
-        if self.cmdline.split()[3]=="False": self.thd.setCurrentIndex(1)
-        self.layout.addWidget(self.thd)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Target"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)
-        
-        self.tags=QComboBox()
-        self.tags.setStyleSheet("font-size: 20px;")
-        self.tags.addItems(self.taglist)
-        
-        try:
-            t=0
-            for tag in self.taglist:
-               if self.taglist[t]==self.cmdline.split()[4]: self.tags.setCurrentIndex(t)
-               t=t+1
-        except:
-            self.tags.setCurrentIndex(0)
-
-            
-        self.layout.addWidget(self.tags)
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_if(self):
-        self.port.clear()
-        if self.interface.currentText()=="HAT":
-            self.port.addItems(["I 1","I 2","I 3","I 4"])
-        else:
-            self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-    
-    def on_confirm(self):
-        self.cmdline="IfInDig " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " " + self.thd.currentText() + " " + self.tags.itemText(self.tags.currentIndex())
-        self.close()
-
-class editCounterClear(TouchDialog):
-    def __init__(self, cmdline, parent):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","CounterClear"), parent)
-        
-        self.cmdline=cmdline
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["TXT","FTD"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(0)
-        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(1)
-
-        k1.addWidget(self.interface)
-        
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        self.port.addItems(["C 1","C 2","C 3","C 4"])
-
-        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        k2.addWidget(self.port)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k1)
-        k9.addStretch()
-        k9.addLayout(k2)
-        
-        self.layout.addLayout(k9)
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="CounterClear " +self.interface.currentText()+ " " + self.port.currentText()[2:]
-        self.close()
-
-class editOutput(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Output"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["RIF","TXT","FTD"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        self.interface.currentIndexChanged.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        #self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        self.port.addItems(["O 1","O 2","O 3","O 4","O 5","O 6","O 7","O 8"])
-
-        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        k2.addWidget(self.port)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k1)
-        k9.addStretch()
-        k9.addLayout(k2)
-        
-        self.layout.addLayout(k9)
-        
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[3])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Output " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " " + self.value.text()
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            
-            self.value.setText(a)
-            
-        self.valueChanged()
-        
-    def valueChanged(self):
-        try:            
-            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
-            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
-        except:
-            pass
-
-class editServo(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Servo"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["SRD","FTD","TXT"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(2)
-        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(1)
-        self.interface.currentIndexChanged.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        #self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        self.port.addItems(["S00","S01","S02","S03","S04","S05","S06","S07","S08","S09","S10","S11","S12","S13","S14","S15"])
-        p=self.cmdline.split()[2]
-        self.port.setCurrentIndex(int(p[1:]))
-        k2.addWidget(self.port)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k1)
-        k9.addStretch()
-        k9.addLayout(k2)
-        
-        self.layout.addLayout(k9)
-        
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[3])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Servo " +self.interface.currentText()+ " " + self.port.currentText() + " " + self.value.text()
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            
-            self.value.setText(a)
-            
-        self.valueChanged()
-        
-    def valueChanged(self):
-        try:            
-            self.value.setText(str(max(0,min(4095,int(self.value.text())))))
-        except:
-            pass
-
-
-class editMotor(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Motor"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["RIF","TXT","FTD","HAT"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        if self.cmdline.split()[1]=="HAT": self.interface.setCurrentIndex(3)
-        self.interface.currentIndexChanged.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        #self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        self.ifChanged()
-
-        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        k2.addWidget(self.port)
-        
-        k8=QHBoxLayout()
-        k8.addLayout(k1)
-        k8.addStretch()
-        k8.addLayout(k2)
-        
-        self.layout.addLayout(k8)        
-        
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 20px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[4])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        k3.addWidget(self.value)
-        
-        k4=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Direction"))
-        l.setStyleSheet("font-size: 20px;")
-        k4.addWidget(l)
-        
-        self.direction=QComboBox()
-        self.direction.setStyleSheet("font-size: 20px;")
-        self.direction.addItems([QCoreApplication.translate("ecl","right"),QCoreApplication.translate("ecl","left"),QCoreApplication.translate("ecl","stop")])
-        if self.cmdline.split()[3][:1]=="r": self.direction.setCurrentIndex(0)
-        elif self.cmdline.split()[3][:1]=="l": self.direction.setCurrentIndex(1)
-        elif self.cmdline.split()[3][:1]=="s": self.direction.setCurrentIndex(2)
-        k4.addWidget(self.direction)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k3)
-        k9.addStretch()
-        k9.addLayout(k4)
-        
-        self.layout.addLayout(k9)
-        
-        
-        self.layout.addStretch()
-        
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Motor " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
-        if self.direction.currentIndex()==0: d="r"
-        elif self.direction.currentIndex()==1: d="l"
-        elif self.direction.currentIndex()==2:
-            d="s"
-            self.value.setText("0")
-            
-        self.cmdline=self.cmdline + d + " " + self.value.text()
-        self.close()
-    
-    def ifChanged(self):
-        self.port.clear()
-        if self.interface.currentText()=="HAT":
-            self.port.addItems(["M 1","M 2"])
-        else:
-            self.port.addItems(["M 1","M 2","M 3","M 4"])
-                
-        self.valueChanged()
-        
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            
-            self.value.setText(a)
-            
-        self.valueChanged()
-        
-    def valueChanged(self):
-        try:            
-            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
-            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
-        except:
-            pass
-        
-class editMotorPulsewheel(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","MotorP"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["RIF","TXT","FTD","HAT"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        if self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        if self.cmdline.split()[1]=="HAT": self.interface.setCurrentIndex(3)
-        
-        self.interface.currentIndexChanged.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        #self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-
-
-        k2.addWidget(self.port)
-        
-        k8=QHBoxLayout()
-        k8.addLayout(k1)
-        k8.addStretch()
-        k8.addLayout(k2)
-        
-        self.layout.addLayout(k8)        
-        
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 20px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[6])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        k3.addWidget(self.value)
-        
-        k4=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Direction"))
-        l.setStyleSheet("font-size: 20px;")
-        k4.addWidget(l)
-        
-        self.direction=QComboBox()
-        self.direction.setStyleSheet("font-size: 20px;")
-        self.direction.addItems([QCoreApplication.translate("ecl","right"),QCoreApplication.translate("ecl","left"),QCoreApplication.translate("ecl","stop")])
-        if self.cmdline.split()[5][:1]=="r": self.direction.setCurrentIndex(0)
-        elif self.cmdline.split()[5][:1]=="l": self.direction.setCurrentIndex(1)
-        elif self.cmdline.split()[5][:1]=="s": self.direction.setCurrentIndex(2)
-        k4.addWidget(self.direction)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k3)
-        k9.addStretch()
-        k9.addLayout(k4)
-        
-        self.layout.addLayout(k9)
-    
-        self.layout.addStretch()
-        
-        k5=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "End Sw."))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k5.addWidget(l)
-        
-        self.endSw=QComboBox()
-        self.endSw.setStyleSheet("font-size: 20px;")
-
-        k5.addWidget(self.endSw)
-        
-        #self.layout.addStretch()
-        
-        k6=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Pulse Inp."))
-        l.setStyleSheet("font-size: 20px;")
-        k6.addWidget(l)
-        
-        self.pulseSw=QComboBox()
-        self.pulseSw.setStyleSheet("font-size: 20px;")
-        
-        k6.addWidget(self.pulseSw)
-        
-        k10=QHBoxLayout()
-        k10.addLayout(k5)
-        k10.addStretch()
-        k10.addLayout(k6)
-        
-        self.layout.addLayout(k10)
-        self.layout.addStretch()
-        
-        k13=QHBoxLayout()
-        
-        k11=QLabel("Pulses")
-        k11.setStyleSheet("font-size: 20px;")
-        
-        k13.addWidget(k11)
-        k13.addStretch()
-        
-        self.pulses=QLineEdit(self.cmdline.split()[7])
-        self.pulses.setReadOnly(True)
-        self.pulses.setStyleSheet("font-size: 20px;")
-        self.pulses.mousePressEvent=self.plsPress
-        self.pulses.mouseReleaseEvent=self.plsRelease
-        k13.addWidget(self.pulses)
-        
-        self.layout.addLayout(k13)
-        self.ifChanged()
-        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        self.endSw.setCurrentIndex(int(self.cmdline.split()[3])-1)
-        self.pulseSw.setCurrentIndex(int(self.cmdline.split()[4])-1)
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="MotorP " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
-        self.cmdline=self.cmdline + self.endSw.currentText()[2:] + " " + self.pulseSw.currentText()[2:] + " "
-        
-        if self.direction.currentIndex()==0: d="r"
-        elif self.direction.currentIndex()==1: d="l"
-        elif self.direction.currentIndex()==2:
-            d="s"
-            self.value.setText("0")
-            
-        self.cmdline=self.cmdline + d + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.pulses.text()
-        self.close()
-    
-    def ifChanged(self):
-        self.port.clear()
-        self.pulseSw.clear()
-        self.endSw.clear()
-        
-        if self.interface.currentText()=="HAT":
-            self.port.addItems(["M 1","M 2"])
-            self.pulseSw.addItems(["I 1","I 2","I 3","I 4"])
-            self.endSw.addItems(["I 1","I 2","I 3","I 4"])
-        else:
-            self.port.addItems(["M 1","M 2","M 3","M 4"])
-            self.pulseSw.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            self.endSw.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-
-        self.valueChanged()
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.pulses.setText(queryVarName(self.variables,self.pulses.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            self.value.setText(a)
-            
-        self.valueChanged()
-        
-    def valueChanged(self):
-        try:            
-            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
-            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
-        except:
-            pass
-        
-    def plsPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def plsRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.pulses.text())
-            except:
-                self.pulses.setText("0")  
-            self.getPulses(1)
-            
-    def getPulses(self,m):
-        a=self.pulses.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Pulses"),a,self).exec_()
-        try:
-            if int(t)<0: t=str(0)
-            if int(t)>9999: t=str(9999)
-            t=str(int(t))
-        except:
-            t=a
-        self.pulses.setText(t)
-      
-class editMotorEncoder(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","MotorE"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["TXT"])
-
-        self.interface.currentIndexChanged.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        #self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        self.port.addItems(["M 1","M 2","M 3","M 4"])
-
-        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        k2.addWidget(self.port)
-        
-        k8=QHBoxLayout()
-        k8.addLayout(k1)
-        k8.addStretch()
-        k8.addLayout(k2)
-        
-        self.layout.addLayout(k8)        
-        
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 20px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[5])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        k3.addWidget(self.value)
-        
-        k4=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Direction"))
-        l.setStyleSheet("font-size: 20px;")
-        k4.addWidget(l)
-        
-        self.direction=QComboBox()
-        self.direction.setStyleSheet("font-size: 20px;")
-        self.direction.addItems([QCoreApplication.translate("ecl","right"),QCoreApplication.translate("ecl","left"),QCoreApplication.translate("ecl","stop")])
-        if self.cmdline.split()[4][:1]=="r": self.direction.setCurrentIndex(0)
-        elif self.cmdline.split()[4][:1]=="l": self.direction.setCurrentIndex(1)
-        elif self.cmdline.split()[4][:1]=="s": self.direction.setCurrentIndex(2)
-        k4.addWidget(self.direction)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k3)
-        k9.addStretch()
-        k9.addLayout(k4)
-        
-        self.layout.addLayout(k9)
-    
-        self.layout.addStretch()
-        
-        k5=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "End Sw."))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k5.addWidget(l)
-        
-        self.endSw=QComboBox()
-        self.endSw.setStyleSheet("font-size: 20px;")
-        self.endSw.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-        self.endSw.setCurrentIndex(int(self.cmdline.split()[3])-1)
-
-        k5.addWidget(self.endSw)
-        
-        #self.layout.addStretch()
-
-        self.layout.addLayout(k5)
-        self.layout.addStretch()
-        
-        k13=QHBoxLayout()
-        
-        k11=QLabel("Pulses")
-        k11.setStyleSheet("font-size: 20px;")
-        
-        k13.addWidget(k11)
-        k13.addStretch()
-        
-        self.pulses=QLineEdit(self.cmdline.split()[6])
-        self.pulses.setReadOnly(True)
-        self.pulses.setStyleSheet("font-size: 20px;")
-        self.pulses.mousePressEvent=self.plsPress
-        self.pulses.mouseReleaseEvent=self.plsRelease
-        k13.addWidget(self.pulses)
-        
-        self.layout.addLayout(k13)
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="MotorE " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
-        self.cmdline=self.cmdline + self.endSw.currentText()[2:] + " "
-        
-        if self.direction.currentIndex()==0: d="r"
-        elif self.direction.currentIndex()==1: d="l"
-        elif self.direction.currentIndex()==2:
-            d="s"
-            self.value.setText("0")
-            
-        self.cmdline=self.cmdline + d + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.pulses.text()
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-        
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.pulses.setText(queryVarName(self.variables,self.pulses.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            self.value.setText(a)
-            
-        self.valueChanged()
-        
-    def valueChanged(self):
-        try:            
-            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
-            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
-        except:
-            pass
-        
-    def plsPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def plsRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.pulses.text())
-            except:
-                self.pulses.setText("0")  
-            self.getPulses(1)
-            
-    def getPulses(self,m):
-        a=self.pulses.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Pulses"),a,self).exec_()
-        try:
-            if int(t)<0: t=str(0)
-            if int(t)>9999: t=str(9999)
-            t=str(int(t))
-        except:
-            t=a
-        self.pulses.setText(t) 
-
-class editMotorEncoderSync(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","MotorES"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["TXT"])
-
-        self.interface.currentIndexChanged.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        #self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-        
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        self.port.addItems(["M 1","M 2","M 3","M 4"])
-
-        self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        k2.addWidget(self.port)
-        
-        k8=QHBoxLayout()
-        k8.addLayout(k1)
-        k8.addStretch()
-        k8.addLayout(k2)
-        
-        self.layout.addLayout(k8)        
-        
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 20px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[5])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        k3.addWidget(self.value)
-        
-        k4=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Direction"))
-        l.setStyleSheet("font-size: 20px;")
-        k4.addWidget(l)
-        
-        self.direction=QComboBox()
-        self.direction.setStyleSheet("font-size: 20px;")
-        self.direction.addItems([QCoreApplication.translate("ecl","right"),QCoreApplication.translate("ecl","left"),QCoreApplication.translate("ecl","stop")])
-        if self.cmdline.split()[4][:1]=="r": self.direction.setCurrentIndex(0)
-        elif self.cmdline.split()[4][:1]=="l": self.direction.setCurrentIndex(1)
-        elif self.cmdline.split()[4][:1]=="s": self.direction.setCurrentIndex(2)
-        k4.addWidget(self.direction)
-        
-        k9=QHBoxLayout()
-        k9.addLayout(k3)
-        k9.addStretch()
-        k9.addLayout(k4)
-        
-        self.layout.addLayout(k9)
-    
-        self.layout.addStretch()
-        
-        k5=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Sync to"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k5.addWidget(l)
-        
-        self.syncTo=QComboBox()
-        self.syncTo.setStyleSheet("font-size: 20px;")
-        self.syncTo.addItems(["M 1","M 2","M 3","M 4"])
-        self.syncTo.setCurrentIndex(int(self.cmdline.split()[3])-1)
-
-        k5.addWidget(self.syncTo)
-        
-        #self.layout.addStretch()
-
-        self.layout.addLayout(k5)
-        self.layout.addStretch()
-        
-        k13=QHBoxLayout()
-        
-        k11=QLabel("Pulses")
-        k11.setStyleSheet("font-size: 20px;")
-        
-        k13.addWidget(k11)
-        k13.addStretch()
-        
-        self.pulses=QLineEdit(self.cmdline.split()[6])
-        self.pulses.setReadOnly(True)
-        self.pulses.setStyleSheet("font-size: 20px;")
-        self.pulses.mousePressEvent=self.plsPress
-        self.pulses.mouseReleaseEvent=self.plsRelease
-        k13.addWidget(self.pulses)
-        
-        self.layout.addLayout(k13)
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="MotorES " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
-        self.cmdline=self.cmdline + self.syncTo.currentText()[2:] + " "
-        
-        if self.direction.currentIndex()==0: d="r"
-        elif self.direction.currentIndex()==1: d="l"
-        elif self.direction.currentIndex()==2:
-            d="s"
-            self.value.setText("0")
-            self.pulses.setText("0")
-            
-        self.cmdline=self.cmdline + d + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.pulses.text()
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-        
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.pulses.setText(queryVarName(self.variables,self.pulses.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            self.value.setText(a)
-            
-        self.valueChanged()
-        
-    def valueChanged(self):
-        try:            
-            if self.interface.currentIndex()==0: self.value.setText(str(max(0,min(7,int(self.value.text())))))
-            else: self.value.setText(str(max(0,min(512,int(self.value.text())))))
-        except:
-            pass
-        
-    def plsPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def plsRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.pulses.text())
-            except:
-                self.pulses.setText("0")  
-            self.getPulses(1)
-            
-    def getPulses(self,m):
-        a=self.pulses.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Pulses"),a,self).exec_()
-        try:
-            if int(t)<0: t=str(0)
-            if int(t)>9999: t=str(9999)
-            t=str(int(t))
-        except:
-            t=a
-        self.pulses.setText(t)
-              
-class editLoopTo(TouchDialog):
-    def __init__(self, cmdline, taglist, vari, parent):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","LoopTo"), parent)
-        
-        self.cmdline=cmdline
-        self.taglist=taglist
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-
-        l=QLabel(QCoreApplication.translate("ecl", "Loop target"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)
-        
-        self.tags=QListWidget()
-        self.tags.setStyleSheet("font-size: 20px;")
-        self.tags.addItems(self.taglist)
-        self.tags.setCurrentRow(0)
-        t=0
-        for tag in self.taglist:
-            if self.taglist[t]==self.cmdline.split()[1]: self.tags.setCurrentRow(t)
-            t=t+1
-            
-            
-        self.layout.addWidget(self.tags)
-        
-        self.layout.addStretch()
-
-        l=QLabel(QCoreApplication.translate("ecl", "Count"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[2])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="LoopTo " +self.tags.item(self.tags.currentRow()).text()+ " " + self.value.text()
-        self.close()
-        
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Number"),a,None).exec_()
-        try:
-            t=str(max(min(int(t),99999),1))
-        except:
-            t=a
-        self.value.setText(t)
-
-class editCall(TouchDialog):
-    def __init__(self, cmdline, taglist, vari, parent):
-        TouchDialog.__init__(self, cmdline.split()[0], parent)
-        
-        self.command=cmdline.split()[0]
-        self.cmdline=cmdline
-        self.taglist=taglist
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-    
-        self.titlebar.setCancelButton()
-        
-        self.layout=QVBoxLayout()
-        
-
-        l=QLabel(QCoreApplication.translate("ecl", "Module"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)
-        
-        self.tags=QListWidget()
-        self.tags.setStyleSheet("font-size: 20px;")
-        self.tags.addItems(self.taglist)
-        self.tags.setCurrentRow(0)
-        try:
-            t=0
-            for tag in self.taglist:
-               if self.taglist[t]==self.cmdline.split()[1]: self.tags.setCurrentRow(t)
-               t=t+1
-        except:
-            pass
-            
-        self.layout.addWidget(self.tags)
-        
-        self.layout.addStretch()
-
-        l=QLabel(QCoreApplication.translate("ecl", "Count"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)
-        
-        if len(self.cmdline.split())<3: self.cmdline=self.cmdline+" 1"
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[2])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline=self.command + " " +self.tags.item(self.tags.currentRow()).text()+ " " + self.value.text()
-        self.close()
-        
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Number"),a,None).exec_()
-        try:
-            t=str(max(min(int(t),99999),0))
-        except:
-            t=a
-        self.value.setText(t)
-        
-class editQueryIn(TouchDialog):
-    def __init__(self, cmdline, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","QueryIn"), parent)
-        
-        self.cmdline=cmdline
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["RIF","TXT","FTD","HAT"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        elif self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        elif self.cmdline.split()[1]=="HAT": self.interface.setCurrentIndex(3)
-        
-        self.interface.activated.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        #self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        self.port.addItem("d")
-        
-        k2.addWidget(self.port)
-        
-        k8=QHBoxLayout()
-        k8.addLayout(k1)
-        #k8.addStretch()
-        k8.addLayout(k2)
-        
-        self.layout.addLayout(k8)        
-        
-        
-        k4=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Inp. type"))
-        l.setStyleSheet("font-size: 20px;")
-        k4.addWidget(l)
-        
-        self.iType=QComboBox()
-        self.iType.setStyleSheet("font-size: 20px;")
-            
-        self.iType.activated.connect(self.ifChanged)
-
-        k4.addWidget(self.iType)
-                
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Text"))
-        l.setStyleSheet("font-size: 20px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        tx=""
-        for a in range(4,len(self.cmdline.split())):
-            tx=tx+(self.cmdline.split()[a])+" "
-        tx=tx[:-1]
-            
-        self.value.setText(tx)
-        self.value.mousePressEvent=self.getValue
-        k3.addWidget(self.value)
-        
-        k9=QVBoxLayout()
-        k9.addLayout(k4)
-        k9.addStretch()
-        k9.addLayout(k3)
-        
-        self.layout.addLayout(k9)
-        
-        
-        self.layout.addStretch()                
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        self.ifChanged()
-        
-        p=self.cmdline.split()[2]
-        if p=="X":self.port.setCurrentIndex(0)
-        elif p=="Y":self.port.setCurrentIndex(1)
-        else: self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        
-        if self.cmdline.split()[3][:1]=="S": self.iType.setCurrentIndex(0)
-        elif self.cmdline.split()[3][:1]=="V": self.iType.setCurrentIndex(1)
-        elif self.cmdline.split()[3][:1]=="R": self.iType.setCurrentIndex(2)
-        elif self.cmdline.split()[3][:1]=="D": self.iType.setCurrentIndex(3)
-        elif self.cmdline.split()[3][:1]=="C": self.iType.setCurrentIndex(4)
-        
-        self.ifChanged()
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="QueryIn " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
-        d="S"
-        if self.iType.currentIndex()==0: d="S"
-        elif self.iType.currentIndex()==1: d="V"
-        elif self.iType.currentIndex()==2: d="R"
-        elif self.iType.currentIndex()==3: d="D"               
-        elif self.iType.currentIndex()==4: d="C"
-        self.cmdline=self.cmdline + d + " " + self.value.text()
-        self.close()
-    
-    def ifChanged(self):
-        m=max(self.iType.currentIndex(),0)
-        self.iType.clear()
-        if self.interface.currentIndex()==0:
-            self.iType.addItems([QCoreApplication.translate("ecl","switch"),
-                                QCoreApplication.translate("ecl","voltage"),
-                                QCoreApplication.translate("ecl","resistance"),
-                                QCoreApplication.translate("ecl","distance")])
-        elif self.interface.currentText()=="TXT" or self.interface.currentText()=="FTD":
-            self.iType.addItems([QCoreApplication.translate("ecl","switch"),
-                                QCoreApplication.translate("ecl","voltage"),
-                                QCoreApplication.translate("ecl","resistance"),
-                                QCoreApplication.translate("ecl","distance"),
-                                QCoreApplication.translate("ecl","counter")])
-        else:
-            self.iType.addItems([QCoreApplication.translate("ecl","switch")])
-            
-        self.iType.setCurrentIndex(m)
-
-        m=self.port.currentIndex()
-        self.port.clear()
-        if self.interface.currentText()=="RIF":
-            if self.iType.currentIndex()==0:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==1:
-                self.port.addItems(["A 1","A 2"])
-            elif self.iType.currentIndex()==2:
-                self.port.addItems(["A X","A Y"])
-            elif self.iType.currentIndex()==3:
-                self.port.addItems(["D 1","D 2"])
-        elif self.interface.currentText()=="TXT":
-            if self.iType.currentIndex()>=0 and self.iType.currentIndex()<=3:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==4:
-                self.port.addItems(["C 1","C 2","C 3","C 4"]) 
-        elif self.interface.currentText()=="FTD":
-            if self.iType.currentIndex()>=0 and self.iType.currentIndex()<=2:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==3:
-                self.port.addItems(["C 1"]) 
-            elif self.iType.currentIndex()==4:
-                self.port.addItems(["C 1","C 2","C 3","C 4"])
-        elif self.interface.currentText()=="HAT":
-            self.port.addItems(["I 1","I 2","I 3","I 4"])
-            
-        self.port.setCurrentIndex(min(max(0,m),self.port.count()-1))
-        
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        self.value.setText(t)
-
-class editIfInput(TouchDialog):
-    def __init__(self, cmdline, taglist, varlist, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","IfInput"), parent)
-        
-        self.cmdline=cmdline
-        self.taglist=taglist
-        self.variables=varlist
-        self.parent=parent
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        # Aussenrahmen
-        self.layout=QVBoxLayout()
-        
-        # VBox
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 18px;")
-        self.interface.addItems(["RIF","TXT","FTD"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        elif self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        
-        self.interface.activated.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 18px;")
-        k2.addWidget(l)
-
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 18px;")
-        self.port.addItem("d")
-        
-        k2.addWidget(self.port)
-        
-        k8=QHBoxLayout()
-        k8.addLayout(k1)
-        #k8.addStretch()
-        k8.addLayout(k2)
-        
-        self.layout.addLayout(k8)        
-        
-        
-        k4=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Inp. type"))
-        l.setStyleSheet("font-size: 18px;")
-        k4.addWidget(l)
-        
-        self.iType=QComboBox()
-        self.iType.setStyleSheet("font-size: 18px;")
-            
-        self.iType.activated.connect(self.ifChanged)
-
-        k4.addWidget(self.iType)
-                
-        k5=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Operator"))
-        l.setStyleSheet("font-size: 18px;")
-        k5.addWidget(l)
-        
-        self.operator=QComboBox()
-        self.operator.setStyleSheet("font-size: 18px;")
-        self.operator.addItems(["  <", " <=", " ==", " !=", " >=", "  >"])
-
-        x=self.cmdline.split()[4]
-        
-        if x=="<":    self.operator.setCurrentIndex(0)
-        elif x=="<=": self.operator.setCurrentIndex(1)
-        elif x=="==": self.operator.setCurrentIndex(2)
-        elif x=="!=": self.operator.setCurrentIndex(3)
-        elif x==">=": self.operator.setCurrentIndex(4)
-        elif x==">":  self.operator.setCurrentIndex(5)
-        
-        k5.addWidget(self.operator)
-
-        k9=QHBoxLayout()
-        k9.addLayout(k4)
-        k9.addStretch()
-        k9.addLayout(k5)
-        
-        self.layout.addLayout(k9)
-        
-        
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 18px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[5])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        k3.addWidget(self.value)
-        
-        self.layout.addLayout(k3)
-        self.layout.addStretch()
-        
-        
-        kb=QVBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Target"))
-        l.setStyleSheet("font-size: 18px;")
-        kb.addWidget(l)
-        
-        self.tags=QComboBox()
-        self.tags.setStyleSheet("font-size: 18px;")
-        self.tags.addItems(self.taglist)
-        self.tags.setCurrentIndex(0)
-        if len(self.cmdline.split())>6:
-            cc=0
-            for i in self.taglist:
-                if self.cmdline.split()[6]==i: self.tags.setCurrentIndex(cc)
-                cc=cc+1
-        
-
-        
-        kb.addWidget(self.tags)
-        
-        self.layout.addLayout(kb)
-        self.layout.addStretch()                
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        self.ifChanged()
-        
-        p=self.cmdline.split()[2]
-        if p=="X":self.port.setCurrentIndex(0)
-        elif p=="Y":self.port.setCurrentIndex(1)
-        else: self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        
-        if self.cmdline.split()[3][:1]=="S": self.iType.setCurrentIndex(0)
-        elif self.cmdline.split()[3][:1]=="V": self.iType.setCurrentIndex(1)
-        elif self.cmdline.split()[3][:1]=="R": self.iType.setCurrentIndex(2)
-        elif self.cmdline.split()[3][:1]=="D": self.iType.setCurrentIndex(3)
-        elif self.cmdline.split()[3][:1]=="C": self.iType.setCurrentIndex(4)
-        
-        self.ifChanged()
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-        
-    def on_confirm(self):
-        self.cmdline="IfIn " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
-        if self.iType.currentIndex()==0:   d="S"
-        elif self.iType.currentIndex()==1: d="V"
-        elif self.iType.currentIndex()==2: d="R"
-        elif self.iType.currentIndex()==3: d="D"               
-        elif self.iType.currentIndex()==4: d="C"
-        
-        self.cmdline=self.cmdline + d + " " + self.operator.itemText(self.operator.currentIndex()).strip()
-        self.cmdline=self.cmdline + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.tags.itemText(self.tags.currentIndex())
-        
-        self.close()
-    
-    def ifChanged(self):
-        m=max(self.iType.currentIndex(),0)
-        self.iType.clear()
-        if self.interface.currentIndex()==0:
-            self.iType.addItems([QCoreApplication.translate("ecl","switch"),
-                                QCoreApplication.translate("ecl","voltage"),
-                                QCoreApplication.translate("ecl","resistance"),
-                                QCoreApplication.translate("ecl","distance")])
-        else:
-            self.iType.addItems([QCoreApplication.translate("ecl","switch"),
-                                QCoreApplication.translate("ecl","voltage"),
-                                QCoreApplication.translate("ecl","resistance"),
-                                QCoreApplication.translate("ecl","distance"),
-                                QCoreApplication.translate("ecl","counter")])
-        self.iType.setCurrentIndex(m)
-
-        m=self.port.currentIndex()
-        self.port.clear()
-        if self.interface.currentText()=="RIF":
-            if self.iType.currentIndex()==0:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==1:
-                self.port.addItems(["A 1","A 2"])
-            elif self.iType.currentIndex()==2:
-                self.port.addItems(["A X","A Y"])
-            elif self.iType.currentIndex()==3:
-                self.port.addItems(["D 1","D 2"])
-        elif self.interface.currentText()=="TXT":
-            if self.iType.currentIndex()>=0 and self.iType.currentIndex()<=3:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==4:
-                self.port.addItems(["C 1","C 2","C 3","C 4"]) 
-        elif self.interface.currentText()=="FTD":
-            if self.iType.currentIndex()>=0 and self.iType.currentIndex()<=2:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==3:
-                self.port.addItems(["C 1"]) 
-            elif self.iType.currentIndex()==4:
-                self.port.addItems(["C 1","C 2","C 3","C 4"]) 
-        self.port.setCurrentIndex(min(max(0,m),self.port.count()-1))
-        
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            int(t)
-        except:
-            t=a
-        self.value.setText(str(int(t)))
-    
-class editWaitForInput(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","WaitIn"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        # Aussenrahmen
-        self.layout=QVBoxLayout()
-        
-        # VBox
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 18px;")
-        self.interface.addItems(["RIF","TXT","FTD"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        elif self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        
-        self.interface.activated.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 18px;")
-        k2.addWidget(l)
-
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 18px;")
-        self.port.addItem("d")
-        
-        k2.addWidget(self.port)
-        
-        k8=QHBoxLayout()
-        k8.addLayout(k1)
-        #k8.addStretch()
-        k8.addLayout(k2)
-        
-        self.layout.addLayout(k8)        
-        
-        
-        k4=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Inp. type"))
-        l.setStyleSheet("font-size: 18px;")
-        k4.addWidget(l)
-        
-        self.iType=QComboBox()
-        self.iType.setStyleSheet("font-size: 18px;")
-            
-        self.iType.activated.connect(self.ifChanged)
-
-        k4.addWidget(self.iType)
-                
-        k5=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Operator"))
-        l.setStyleSheet("font-size: 18px;")
-        k5.addWidget(l)
-        
-        self.operator=QComboBox()
-        self.operator.setStyleSheet("font-size: 18px;")
-        self.operator.addItems(["  <"," <=", " ==", " !=", " >=", "  >"])
-
-        x=self.cmdline.split()[4]
-        
-        if x=="<":    self.operator.setCurrentIndex(0)
-        elif x=="<=": self.operator.setCurrentIndex(1)
-        elif x=="==": self.operator.setCurrentIndex(2)
-        elif x=="!=": self.operator.setCurrentIndex(3)
-        elif x==">=": self.operator.setCurrentIndex(4)
-        elif x==">":  self.operator.setCurrentIndex(5)
-        
-        k5.addWidget(self.operator)
-
-        k9=QHBoxLayout()
-        k9.addLayout(k4)
-        k9.addStretch()
-        k9.addLayout(k5)
-        
-        self.layout.addLayout(k9)
-        
-        
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 18px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[5])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        
-        k3.addWidget(self.value)
-        
-        self.layout.addLayout(k3)
-        self.layout.addStretch()
-        
-        
-        kb=QVBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Timeout"))
-        l.setStyleSheet("font-size: 18px;")
-        kb.addWidget(l)
-        
-        self.timeout=QLineEdit()
-        self.timeout.setReadOnly(True)
-        self.timeout.setStyleSheet("font-size: 18px;")
-        self.timeout.setText(self.cmdline.split()[6])
-        self.timeout.mousePressEvent=self.tvalPress
-        self.timeout.mouseReleaseEvent=self.tvalRelease
-        
-        kb.addWidget(self.timeout)
-        
-        self.layout.addLayout(kb)
-        self.layout.addStretch()                
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        self.ifChanged()
-        
-        p=self.cmdline.split()[2]
-        if p=="X":self.port.setCurrentIndex(0)
-        elif p=="Y":self.port.setCurrentIndex(1)
-        else: self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        
-        if self.cmdline.split()[3][:1]=="S": self.iType.setCurrentIndex(0)
-        elif self.cmdline.split()[3][:1]=="V": self.iType.setCurrentIndex(1)
-        elif self.cmdline.split()[3][:1]=="R": self.iType.setCurrentIndex(2)
-        elif self.cmdline.split()[3][:1]=="D": self.iType.setCurrentIndex(3)
-        elif self.cmdline.split()[3][:1]=="C": self.iType.setCurrentIndex(4)
-        
-        self.ifChanged()
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="WaitIn " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
-        if self.iType.currentIndex()==0:   d="S"
-        elif self.iType.currentIndex()==1: d="V"
-        elif self.iType.currentIndex()==2: d="R"
-        elif self.iType.currentIndex()==3: d="D"               
-        elif self.iType.currentIndex()==4: d="C"
-        
-        self.cmdline=self.cmdline + d + " " + self.operator.itemText(self.operator.currentIndex()).strip()
-        self.cmdline=self.cmdline + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.timeout.text()
-        
-        self.close()
-    
-    def ifChanged(self):
-        m=max(self.iType.currentIndex(),0)
-        self.iType.clear()
-        if self.interface.currentIndex()==0:
-            self.iType.addItems([QCoreApplication.translate("ecl","switch"),
-                                QCoreApplication.translate("ecl","voltage"),
-                                QCoreApplication.translate("ecl","resistance"),
-                                QCoreApplication.translate("ecl","distance")])
-        else:
-            self.iType.addItems([QCoreApplication.translate("ecl","switch"),
-                                QCoreApplication.translate("ecl","voltage"),
-                                QCoreApplication.translate("ecl","resistance"),
-                                QCoreApplication.translate("ecl","distance"),
-                                QCoreApplication.translate("ecl","counter")])
-        self.iType.setCurrentIndex(m)
-
-        m=self.port.currentIndex()
-        self.port.clear()
-        if self.interface.currentText()=="RIF":
-            if self.iType.currentIndex()==0:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==1:
-                self.port.addItems(["A 1","A 2"])
-            elif self.iType.currentIndex()==2:
-                self.port.addItems(["A X","A Y"])
-            elif self.iType.currentIndex()==3:
-                self.port.addItems(["D 1","D 2"])
-        elif self.interface.currentText()=="TXT":
-            if self.iType.currentIndex()>=0 and self.iType.currentIndex()<=3:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==4:
-                self.port.addItems(["C 1","C 2","C 3","C 4"]) 
-        elif self.interface.currentText()=="FTD":
-            if self.iType.currentIndex()>=0 and self.iType.currentIndex()<=2:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==3:
-                self.port.addItems(["C 1"]) 
-            elif self.iType.currentIndex()==4:
-                self.port.addItems(["C 1","C 2","C 3","C 4"]) 
-        self.port.setCurrentIndex(min(max(0,m),self.port.count()-1))
-        
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1:
-            self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:
-            self.timeout.setText(queryVarName(self.variables,self.timeout.text())) 
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Number"),a,None).exec_()
-        try:
-            t=str(max(min(int(t),99999),0))
-        except:
-            t=a
-        self.value.setText(t)
-        
-    def tvalPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=2
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def tvalRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.timeout.text())
-            except:
-                self.timeout.setText("0")  
-            self.getTValue(1)
-
-    def getTValue(self,m):
-        a=self.timeout.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Timeout"),a,self).exec_()
-        try:
-            t=str(max(min(int(t),99999),0))
-        except:
-            t=a
-        self.timeout.setText(t)
-
-class editIfTimer(TouchDialog):
-    def __init__(self, cmdline, taglist, vari, parent):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","IfTimer"), parent)
-        
-        self.cmdline=cmdline
-        self.taglist=taglist
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Operator"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        self.layout.addWidget(l)
-        
-        self.operator=QComboBox()
-        self.operator.setStyleSheet("font-size: 20px;")
-        self.operator.addItems(["  <  ","  >  "])
-
-        if self.cmdline.split()[1]=="<": self.operator.setCurrentIndex(0)
-        if self.cmdline.split()[1]==">": self.operator.setCurrentIndex(1)
-
-        self.layout.addWidget(self.operator)
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)     
-        
-        self.thd=QLineEdit()
-        self.thd.setReadOnly(True)
-        self.thd.setStyleSheet("font-size: 20px;")
-        self.thd.setText(self.cmdline.split()[2])
-        self.thd.mousePressEvent=self.valPress
-        self.thd.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.thd)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Target"))
-        l.setStyleSheet("font-size: 20px;")
-        self.layout.addWidget(l)
-        
-        self.tags=QComboBox()
-        self.tags.setStyleSheet("font-size: 20px;")
-        self.tags.addItems(self.taglist)
-
-        self.tags.setCurrentIndex(0)
-        if len(self.cmdline.split())>3:
-            cc=0
-            for i in self.taglist:
-                if self.cmdline.split()[3]==i: self.tags.setCurrentIndex(cc)
-                cc=cc+1
-
-        self.layout.addWidget(self.tags)
-        self.layout.addStretch() 
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="IfTimer " +self.operator.currentText().strip()+ " " + self.thd.text() + " " + self.tags.itemText(self.tags.currentIndex())
-        self.close()
-        
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.thd.setText(queryVarName(self.variables,self.thd.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.thd.text())
-            except:
-                self.thd.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.thd.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Timeout"),a,None).exec_()
-        try:
-            t=str(max(min(int(t),99999),0))
-        except:
-            t=a
-        self.thd.setText(t)
-
-class editInterrupt(TouchDialog):
-    def __init__(self, cmdline, modlist, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Interrupt"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-        self.modlist=modlist
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.layout=QVBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Interrupt"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.interrupt=QComboBox()
-        self.interrupt.setStyleSheet("font-size: 18px;")
-            
-        oplist=["After","Every","Off"]
-        self.interrupt.addItems(oplist)
-        
-        if self.cmdline.split()[1] in oplist:
-            self.interrupt.setCurrentIndex(oplist.index(self.cmdline.split()[1]))
-        else:
-            self.interrupt.setCurrentIndex(0)
-        
-        self.layout.addWidget(self.interrupt)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Time"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        try:
-            self.value.setText(self.cmdline.split()[2])
-        except:
-            self.value.setText("500")
-            
-        self.value.mousePressEvent=self.getValue
-        self.layout.addWidget(self.value)        
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Target module"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.modlist)
-
-        try:
-            self.target.setCurrentIndex(self.modlist.index(self.cmdline.split()[3]))
-        except:
-            self.target.setCurrentIndex(0)
-
-        self.layout.addWidget(self.target)
-        
-        self.layout.addStretch()
-
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Interrupt " + self.interrupt.itemText(self.interrupt.currentIndex())
-        if not "Off" in self.cmdline:
-            self.cmdline=self.cmdline + " " + self.value.text() + " "
-            self.cmdline=self.cmdline + self.target.itemText(self.target.currentIndex())
-        self.close()
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Time"),a,self).exec_()
-        try:
-            v=str(max(min(int(t),99999),0))
-            self.value.setText(v)
-        except:
-            self.value.setText(a)
-
-class editDelay(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Delay"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-    
-        self.titlebar.setCancelButton()
-        
-        self.layout=QVBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Type"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.interrupt=QComboBox()
-        self.interrupt.setStyleSheet("font-size: 18px;")
-            
-        oplist=["Fixed","Random"]
-        self.interrupt.addItems(oplist)
-        
-        if len(self.cmdline.split())>2:
-            self.interrupt.setCurrentIndex(1)
-        else:
-            self.interrupt.setCurrentIndex(0)
-        
-        self.layout.addWidget(self.interrupt)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Time"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        try:
-            self.value.setText(self.cmdline.split()[1])
-        except:
-            self.value.setText("500")
-            
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-       
-        self.layout.addWidget(self.value)        
-        
-        self.layout.addStretch()
-
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Delay " + self.value.text()
-        
-        if self.interrupt.currentIndex() == 1:
-            self.cmdline = self.cmdline + " R"
-        self.close()
-    
-    def valPress(self,sender):
-        
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            self.getValue(1)
-
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Time"),a,self).exec_()
-        try:
-            v=str(max(min(int(t),99999),0))
-            self.value.setText(v)
-        except:
-            self.value.setText(a)
-
-
-
-class editInit(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Variable"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-        self.parent=parent
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Variable name"))
-        l.setStyleSheet("font-size: 20px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[1])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        k3.addWidget(self.value)
-                
-        self.layout.addLayout(k3)
-    
-        self.layout.addStretch()
-        
-        k13=QVBoxLayout()
-        
-        k11=QLabel("Init value")
-        k11.setStyleSheet("font-size: 20px;")
-        
-        k13.addWidget(k11)
-        k13.addStretch()
-        
-        self.pulses=QLineEdit(self.cmdline.split()[2])
-        self.pulses.setReadOnly(True)
-        self.pulses.setStyleSheet("font-size: 20px;")
-        self.pulses.mousePressEvent=self.plsPress
-        self.pulses.mouseReleaseEvent=self.plsRelease
-        k13.addWidget(self.pulses)
-        
-        self.layout.addLayout(k13)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Init "
-        self.cmdline=self.cmdline + self.value.text()
-        self.cmdline=self.cmdline + " " + self.pulses.text()
-        self.close()
-    
-    def ifChanged(self):
-        pass
-    
-    def valPress(self,sender):
-        #self.value.setText(queryVarName(self.variables,self.value.text()))
-        
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.pulses.setText(queryVarName(self.variables,self.pulses.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Name"),a,self.parent).exec_()
-        if t[0] in "0123456789": t="i"+t
-        self.value.setText(t)
-        
-    def plsPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def plsRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.pulses.text())
-            except:
-                self.pulses.setText("0")  
-            self.getPulses(1)
-            
-    def getPulses(self,m):
-        a=self.pulses.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self.parent).exec_()
-        try:
-            t=str(int(t))
-        except:
-            t=a
-        self.pulses.setText(t)
-
-class editFromIn(TouchDialog):
-    def __init__(self, cmdline, varlist, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","FromIn"), parent)
-        
-        self.cmdline=cmdline
-        self.varlist=varlist
-        self.parent=parent
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.layout=QVBoxLayout()
-        
-        k1=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device"))
-        l.setStyleSheet("font-size: 20px;")
-        
-        k1.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 20px;")
-        self.interface.addItems(["RIF","TXT","FTD","HAT"])
-
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(1)
-        elif self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(2)
-        elif self.cmdline.split()[1]=="HAT": self.interface.setCurrentIndex(3)
-        
-        self.interface.activated.connect(self.ifChanged)
-        k1.addWidget(self.interface)
-        
-        #self.layout.addStretch()
-        
-        k2=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Port"))
-        l.setStyleSheet("font-size: 20px;")
-        k2.addWidget(l)
-
-        self.port=QComboBox()
-        self.port.setStyleSheet("font-size: 20px;")
-        self.port.addItem("d")
-        
-        k2.addWidget(self.port)
-        
-        k8=QHBoxLayout()
-        k8.addLayout(k1)
-        #k8.addStretch()
-        k8.addLayout(k2)
-        
-        self.layout.addLayout(k8)        
-        
-        
-        k4=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Inp. type"))
-        l.setStyleSheet("font-size: 20px;")
-        k4.addWidget(l)
-        
-        self.iType=QComboBox()
-        self.iType.setStyleSheet("font-size: 20px;")
-            
-        self.iType.activated.connect(self.ifChanged)
-
-        k4.addWidget(self.iType)
-                
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Variable"))
-        l.setStyleSheet("font-size: 20px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-
-        self.value.setText(self.cmdline.split()[4])
-        self.value.mousePressEvent=self.getValue
-        k3.addWidget(self.value)
-        
-        k9=QVBoxLayout()
-        k9.addLayout(k4)
-        k9.addStretch()
-        k9.addLayout(k3)
-        
-        self.layout.addLayout(k9)
-        
-        
-        self.layout.addStretch()                
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        self.ifChanged()
-        
-        p=self.cmdline.split()[2]
-        if p=="X":self.port.setCurrentIndex(0)
-        elif p=="Y":self.port.setCurrentIndex(1)
-        else: self.port.setCurrentIndex(int(self.cmdline.split()[2])-1)
-        
-        if self.cmdline.split()[3][:1]=="S": self.iType.setCurrentIndex(0)
-        elif self.cmdline.split()[3][:1]=="V": self.iType.setCurrentIndex(1)
-        elif self.cmdline.split()[3][:1]=="R": self.iType.setCurrentIndex(2)
-        elif self.cmdline.split()[3][:1]=="D": self.iType.setCurrentIndex(3)
-        elif self.cmdline.split()[3][:1]=="C": self.iType.setCurrentIndex(4)
-        
-        self.ifChanged()
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="FromIn " +self.interface.currentText()+ " " + self.port.currentText()[2:] + " "
-        d="S"
-        if self.iType.currentIndex()==0: d="S"
-        elif self.iType.currentIndex()==1: d="V"
-        elif self.iType.currentIndex()==2: d="R"
-        elif self.iType.currentIndex()==3: d="D"               
-        elif self.iType.currentIndex()==4: d="C"
-        self.cmdline=self.cmdline + d + " " + self.value.text()
-        self.close()
-    
-    def ifChanged(self):
-        m=max(self.iType.currentIndex(),0)
-        self.iType.clear()
-        if self.interface.currentText()=="HAT":
-            self.iType.addItems([QCoreApplication.translate("ecl","switch")])
-                                
-        elif self.interface.currentIndex()==0:
-            self.iType.addItems([QCoreApplication.translate("ecl","switch"),
-                                QCoreApplication.translate("ecl","voltage"),
-                                QCoreApplication.translate("ecl","resistance"),
-                                QCoreApplication.translate("ecl","distance")])
-        else:
-            self.iType.addItems([QCoreApplication.translate("ecl","switch"),
-                                QCoreApplication.translate("ecl","voltage"),
-                                QCoreApplication.translate("ecl","resistance"),
-                                QCoreApplication.translate("ecl","distance"),
-                                QCoreApplication.translate("ecl","counter")])
-            
-        self.iType.setCurrentIndex(m)
-
-        m=self.port.currentIndex()
-        self.port.clear()
-        if self.interface.currentText()=="RIF":
-            if self.iType.currentIndex()==0:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==1:
-                self.port.addItems(["A 1","A 2"])
-            elif self.iType.currentIndex()==2:
-                self.port.addItems(["A X","A Y"])
-            elif self.iType.currentIndex()==3:
-                self.port.addItems(["D 1","D 2"])
-        elif self.interface.currentText()=="TXT":
-            if self.iType.currentIndex()>=0 and self.iType.currentIndex()<=3:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==4:
-                self.port.addItems(["C 1","C 2","C 3","C 4"]) 
-        elif self.interface.currentText()=="FTD":
-            if self.iType.currentIndex()>=0 and self.iType.currentIndex()<=2:
-                self.port.addItems(["I 1","I 2","I 3","I 4","I 5","I 6","I 7","I 8"])
-            elif self.iType.currentIndex()==3:
-                self.port.addItems(["C 1"]) 
-            elif self.iType.currentIndex()==4:
-                self.port.addItems(["C 1","C 2","C 3","C 4"]) 
-        elif self.interface.currentText()=="HAT":
-            self.port.addItems(["I 1", "I 2","I 3","I 4"])
-            
-        self.port.setCurrentIndex(min(max(0,m),self.port.count()-1))
-        
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=queryVarName(self.varlist, a)
-        self.value.setText(t)
-
-class editIfVar(TouchDialog):
-    def __init__(self, cmdline, taglist, varlist, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","IfVar"), parent)
-        
-        self.cmdline=cmdline
-        self.taglist=taglist
-        self.variables=varlist
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        # Aussenrahmen
-        self.layout=QVBoxLayout()
-        
-        # VBox
-        l=QLabel(QCoreApplication.translate("ecl", "Variable"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 18px;")
-        self.interface.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.interface.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else: self.interface.setCurrentIndex(0)
-        
-        self.layout.addWidget(self.interface)
-        
-        self.layout.addStretch()
-                
-        l=QLabel(QCoreApplication.translate("ecl","Operator"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)
-        
-        self.operator=QComboBox()
-        self.operator.setStyleSheet("font-size: 18px;")
-        self.operator.addItems(["  <", " <=", " ==", " !=", " >=", "  >"])
-
-        x=self.cmdline.split()[2]
-        
-        if x=="<":    self.operator.setCurrentIndex(0)
-        elif x=="<=": self.operator.setCurrentIndex(1)
-        elif x=="==": self.operator.setCurrentIndex(2)
-        elif x=="!=": self.operator.setCurrentIndex(3)
-        elif x==">=": self.operator.setCurrentIndex(4)
-        elif x==">":  self.operator.setCurrentIndex(5)
-        
-        self.layout.addWidget(self.operator)
-
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Value"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[3])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Target"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)
-        
-        self.tags=QComboBox()
-        self.tags.setStyleSheet("font-size: 18px;")
-        self.tags.addItems(self.taglist)
-        self.tags.setCurrentIndex(0)
-        if len(self.cmdline.split())>4:
-            cc=0
-            for i in self.taglist:
-                if self.cmdline.split()[4]==i: self.tags.setCurrentIndex(cc)
-                cc=cc+1
-        
-        self.layout.addWidget(self.tags)
-        
-        self.layout.addStretch()                
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-        
-    def on_confirm(self):
-        self.cmdline="IfVar " +self.interface.currentText() + " " + self.operator.itemText(self.operator.currentIndex()).strip()
-
-        self.cmdline=self.cmdline + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.tags.itemText(self.tags.currentIndex())
-        
-        self.close()
-    
-    def ifChanged(self):
-        pass        
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            int(t)
-        except:
-            t=a
-        self.value.setText(str(int(t))) 
-
-class editIfTouchArea(TouchDialog):
-    def __init__(self, cmdline, taglist, varlist, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","IfTouchArea"), parent)
-        
-        self.cmdline=cmdline
-        self.taglist=taglist
-        self.variables=varlist
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        # Aussenrahmen
-        self.layout=QVBoxLayout()
-        
-        # VBox
-        
-        # HBox
-        hbm=QHBoxLayout()        
-        l=QLabel(QCoreApplication.translate("ecl","x1:"))
-        l.setStyleSheet("font-size: 18px;")
-        hbm.addWidget(l)     
-        
-        self.value1=QLineEdit()
-        self.value1.setReadOnly(True)
-        self.value1.setStyleSheet("font-size: 18px;")
-        hbm.addStretch()    
-        self.value1.setText(self.cmdline.split()[1])
-        self.value1.mousePressEvent=self.val1Press
-        self.value1.mouseReleaseEvent=self.val1Release
-        hbm.addWidget(self.value1)
-        
-        self.layout.addLayout(hbm)
-        self.layout.addStretch()
-        
-        # HBox
-        hbm=QHBoxLayout()         
-        l=QLabel(QCoreApplication.translate("ecl","y1:"))
-        l.setStyleSheet("font-size: 18px;")
-        hbm.addWidget(l)     
-        
-        self.value2=QLineEdit()
-        self.value2.setReadOnly(True)
-        self.value2.setStyleSheet("font-size: 18px;")
-        hbm.addStretch()    
-        self.value2.setText(self.cmdline.split()[2])
-        self.value2.mousePressEvent=self.val2Press
-        self.value2.mouseReleaseEvent=self.val2Release
-        hbm.addWidget(self.value2)
-        
-        self.layout.addLayout(hbm)
-        self.layout.addStretch()
-
-        # HBox
-        hbm=QHBoxLayout()         
-        l=QLabel(QCoreApplication.translate("ecl","x2:"))
-        l.setStyleSheet("font-size: 18px;")
-        hbm.addWidget(l)     
-        hbm.addStretch()
-        self.value3=QLineEdit()
-        self.value3.setReadOnly(True)
-        self.value3.setStyleSheet("font-size: 18px;")
-            
-        self.value3.setText(self.cmdline.split()[3])
-        self.value3.mousePressEvent=self.val3Press
-        self.value3.mouseReleaseEvent=self.val3Release
-        hbm.addWidget(self.value3)
-        
-        self.layout.addLayout(hbm)
-        self.layout.addStretch()
-        
-        # HBox
-        hbm=QHBoxLayout() 
-        l=QLabel(QCoreApplication.translate("ecl","y2:"))
-        l.setStyleSheet("font-size: 18px;")
-        hbm.addWidget(l)     
-        hbm.addStretch()
-        
-        self.value4=QLineEdit()
-        self.value4.setReadOnly(True)
-        self.value4.setStyleSheet("font-size: 18px;")
-            
-        self.value4.setText(self.cmdline.split()[4])
-        self.value4.mousePressEvent=self.val4Press
-        self.value4.mouseReleaseEvent=self.val4Release
-        hbm.addWidget(self.value4)
-        
-        self.layout.addLayout(hbm)
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Target"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)
-        
-        self.tags=QComboBox()
-        self.tags.setStyleSheet("font-size: 18px;")
-        self.tags.addItems(self.taglist)
-        self.tags.setCurrentIndex(0)
-        if len(self.cmdline.split())>5:
-            cc=0
-            for i in self.taglist:
-                if self.cmdline.split()[5]==i: self.tags.setCurrentIndex(cc)
-                cc=cc+1
-        
-        self.layout.addWidget(self.tags)
-        
-        self.layout.addStretch()                
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def val1Press(self,sender):
-        self.vs=1
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def val1Release(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value1.text())
-            except:
-                self.value1.setText("0")  
-            self.getValue(1)
-
-    def val2Press(self,sender):
-        self.vs=2
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def val2Release(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value2.text())
-            except:
-                self.value2.setText("0")  
-            self.getValue(2)
-
-    def val3Press(self,sender):
-        self.vs=3
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def val3Release(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value3.text())
-            except:
-                self.value1.setText("0")  
-            self.getValue(3)
-
-    def val4Press(self,sender):
-        self.vs=4
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def val4Release(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value4.text())
-            except:
-                self.value1.setText("0")  
-            self.getValue(4)
-            
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.vs==1: self.value1.setText(queryVarName(self.variables,self.value1.text()))  
-        elif self.vs==2: self.value2.setText(queryVarName(self.variables,self.value2.text()))
-        elif self.vs==3: self.value3.setText(queryVarName(self.variables,self.value3.text()))
-        elif self.vs==4: self.value4.setText(queryVarName(self.variables,self.value4.text()))
-    
-    def on_confirm(self):
-        self.cmdline="IfTouchArea"
-
-        self.cmdline=self.cmdline + " " + self.value1.text()
-        self.cmdline=self.cmdline + " " + self.value2.text()
-        self.cmdline=self.cmdline + " " + self.value3.text()
-        self.cmdline=self.cmdline + " " + self.value4.text()
-        
-        self.cmdline=self.cmdline + " " + self.tags.itemText(self.tags.currentIndex())
-        
-        self.close()
-    
-    def ifChanged(self):
-        pass        
-    
-    def getValue(self,m):
-        if m==1:  a=self.value1.text()
-        elif m==2: a=self.value2.text()
-        elif m==3: a=self.value3.text()
-        elif m==4: a=self.value4.text()
-        
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            int(t)
-        except:
-            t=a
-        
-        if m==1: self.value1.setText(str(int(t))) 
-        elif m==2: self.value2.setText(str(int(t))) 
-        elif m==3: self.value3.setText(str(int(t))) 
-        elif m==4: self.value4.setText(str(int(t))) 
-        
-class editCalc(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Calc"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "First Operand"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[2])
-        
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Operator"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)
-        
-        self.operator=QComboBox()
-        self.operator.setStyleSheet("font-size: 18px;")
-        oplist=["+", "-", "*", "/", "div", "digit", "mod", "exp",
-                "root", "min", "max", "sgnCpy","sin", "cos", "random",
-                "mean", "&&","||","<","<=","==","!=",">=", ">","sign","unsign","bitShift","bitAnd","bitOr","bitXOr"]
-        self.operator.addItems(oplist)
-        if self.cmdline.split()[3] in oplist:
-            self.operator.setCurrentIndex(oplist.index(self.cmdline.split()[3]))
-        else:
-            self.operator.setCurrentIndex(0)
-        
-        self.layout.addWidget(self.operator)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Second Operand"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value2=QLineEdit()
-        self.value2.setReadOnly(True)
-        self.value2.setStyleSheet("font-size: 18px;")
-            
-        self.value2.setText(self.cmdline.split()[4])
-        self.value2.mousePressEvent=self.val2Press
-        self.value2.mouseReleaseEvent=self.val2Release
-        self.layout.addWidget(self.value2)        
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Target variable"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.operator.setCurrentIndex(0)
-
-        self.layout.addWidget(self.target)
-
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Calc " +self.target.itemText(self.target.currentIndex())+ " " + self.value.text() + " "
-        self.cmdline=self.cmdline + self.operator.itemText(self.operator.currentIndex()) + " " + self.value2.text()
-        
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.value2.setText(queryVarName(self.variables,self.value2.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","1st Op."),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            self.value.setText(a)
-        
-    def val2Press(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def val2Release(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value2.text())
-            except:
-                self.value2.setText("0")  
-            self.getValue2(1)
-            
-    def getValue2(self,m):
-        a=self.value2.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","2nd Op."),a,self).exec_()
-        try:
-            t=str(int(t))
-        except:
-            t=a
-        self.value2.setText(t)
-
-class editFromPoly(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","FromPoly"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        #
-        h=QHBoxLayout()
-        l=QLabel("A:")
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.A=QLineEdit()
-        self.A.setReadOnly(True)
-        self.A.setStyleSheet("font-size: 18px;")
-        self.A.mousePressEvent=self.getA
-        
-        self.A.setText(self.cmdline.split()[3])
-        
-        h.addWidget(self.A)
-        self.layout.addLayout(h)
-        
-        
-        h=QHBoxLayout()
-        l=QLabel("B:")
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.B=QLineEdit()
-        self.B.setReadOnly(True)
-        self.B.setStyleSheet("font-size: 18px;")
-        
-        self.B.setText(self.cmdline.split()[4])
-        self.B.mousePressEvent=self.getB
-        
-        h.addWidget(self.B)      
-        self.layout.addLayout(h)
-        
-        h=QHBoxLayout()
-        l=QLabel("C:")
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.C=QLineEdit()
-        self.C.setReadOnly(True)
-        self.C.setStyleSheet("font-size: 18px;")
-        
-        self.C.setText(self.cmdline.split()[5])
-        self.C.mousePressEvent=self.getC
-        
-        h.addWidget(self.C)      
-        self.layout.addLayout(h)
-        
-        h=QHBoxLayout()
-        l=QLabel("D:")
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.D=QLineEdit()
-        self.D.setReadOnly(True)
-        self.D.setStyleSheet("font-size: 18px;")
-        
-        self.D.setText(self.cmdline.split()[6])
-        self.D.mousePressEvent=self.getD
-        
-        h.addWidget(self.D)      
-        self.layout.addLayout(h)
-        self.layout.addStretch()
-    
-        
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Input:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[2])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        h.addWidget(self.value)        
-        
-        self.layout.addLayout(h)
-        
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Target:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.target.setCurrentIndex(0)
-
-        h.addWidget(self.target)
-
-        self.layout.addLayout(h)
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def getA(self,b): #AChanged(self):
-        a=self.A.text()
-        try:
-            dummy=TouchAuxKeyboard(QCoreApplication.translate("ecl","A"),a,self).exec_()
-            dummy=str(float(dummy))
-            self.A.setText(dummy)
-        except:
-            self.A.setText("0.0")
-
-    def getB(self,b): #AChanged(self):
-        a=self.B.text()
-        try:
-            dummy=TouchAuxKeyboard(QCoreApplication.translate("ecl","B"),a,self).exec_()
-            dummy=str(float(dummy))
-            self.B.setText(dummy)
-        except:
-            self.B.setText("0.0")
-
-    def getC(self,b): #AChanged(self):
-        a=self.C.text()
-        try:
-            dummy=TouchAuxKeyboard(QCoreApplication.translate("ecl","C"),a,self).exec_()
-            dummy=str(float(dummy))
-            self.C.setText(dummy)
-        except:
-            self.C.setText("0.0")
-    
-    def getD(self,b): #AChanged(self):
-        a=self.D.text()
-        try:
-            dummy=TouchAuxKeyboard(QCoreApplication.translate("ecl","D"),a,self).exec_()
-            dummy=str(float(dummy))
-            self.D.setText(dummy)
-        except:
-            self.D.setText("0.0")
-
-
-    def on_confirm(self):
-        self.cmdline="FromPoly " +self.target.itemText(self.target.currentIndex())
-        self.cmdline=self.cmdline + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + str(float(self.A.text()))
-        self.cmdline=self.cmdline + " " + str(float(self.B.text()))
-        self.cmdline=self.cmdline + " " + str(float(self.C.text()))
-        self.cmdline=self.cmdline + " " + str(float(self.D.text()))
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.value2.setText(queryVarName(self.variables,self.value2.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Input"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            self.value.setText(a)
-
-class editFromSys(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","FromSys"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.layout=QVBoxLayout()
-        
-        #
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Data:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        f=["timer","hour","minute","second","year","month","day",
-           "RIIR","dispBtn",
-           "CxRes","CyRes","CxPos","CyPos","CpRed","CpGreen","CpBlue",
-           "touch","touchXPos","touchYPos","actXPos","actYPos"]
-        self.data=QComboBox()
-        self.data.setStyleSheet("font-size: 18px;")
-        self.data.addItems(f)
-
-        if self.cmdline.split()[2] in f:
-            self.data.setCurrentIndex(f.index(self.cmdline.split()[2]))
-        else:
-            self.data.setCurrentIndex(0)        
-
-        h.addWidget(self.data)
-        
-        self.layout.addLayout(h)
-
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Target:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.target.setCurrentIndex(0)
-
-        h.addWidget(self.target)
-
-        self.layout.addLayout(h)
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-
-    def on_confirm(self):
-        self.cmdline="FromSys " +self.target.itemText(self.target.currentIndex())
-        self.cmdline=self.cmdline + " " + self.data.itemText(self.data.currentIndex())
-
-        self.close()
-    
-class editFromKeypad(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","FromKeypad"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Min value"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[2])
-        
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Max value"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value2=QLineEdit()
-        self.value2.setReadOnly(True)
-        self.value2.setStyleSheet("font-size: 18px;")
-            
-        self.value2.setText(self.cmdline.split()[3])
-        self.value2.mousePressEvent=self.val2Press
-        self.value2.mouseReleaseEvent=self.val2Release
-        self.layout.addWidget(self.value2)        
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Variable"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.target.setCurrentIndex(0)
-
-        self.layout.addWidget(self.target)
-        
-        self.layout.addStretch()
-
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="FromKeypad " +self.target.itemText(self.target.currentIndex())+ " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.value2.text()
-        
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.value2.setText(queryVarName(self.variables,self.value2.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Min"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            self.value.setText(a)
-        
-    def val2Press(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def val2Release(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value2.text())
-            except:
-                self.value2.setText("0")  
-            self.getValue2(1)
-            
-    def getValue2(self,m):
-        a=self.value2.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Max"),a,self).exec_()
-        try:
-            t=str(int(t))
-        except:
-            t=a
-        self.value2.setText(t)
-
-class editFromDial(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","FromDial"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-        
-        inittext=""
-        for v in self.cmdline.split()[4:]:
-            inittext=inittext+" "+v
-        
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Message"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.text=QLineEdit()
-        self.text.setReadOnly(True)
-        self.text.setStyleSheet("font-size: 18px;")
-            
-        self.text.setText(inittext)
-        self.text.mousePressEvent=self.getText 
-        
-        self.layout.addWidget(self.text)
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Min value"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[2])
-        
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        #self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Max value"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value2=QLineEdit()
-        self.value2.setReadOnly(True)
-        self.value2.setStyleSheet("font-size: 18px;")
-            
-        self.value2.setText(self.cmdline.split()[3])
-        self.value2.mousePressEvent=self.val2Press
-        self.value2.mouseReleaseEvent=self.val2Release
-        self.layout.addWidget(self.value2)        
-        
-        #self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Variable"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.target.setCurrentIndex(0)
-
-        self.layout.addWidget(self.target)
-        
-        self.layout.addStretch()
-
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="FromDial " +self.target.itemText(self.target.currentIndex())+ " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.value2.text() + " " + self.text.text()
-        
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.value2.setText(queryVarName(self.variables,self.value2.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Min"),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            self.value.setText(a)
-        
-    def val2Press(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def val2Release(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value2.text())
-            except:
-                self.value2.setText("0")  
-            self.getValue2(1)
-            
-    def getValue2(self,m):
-        a=self.value2.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Max"),a,self).exec_()
-        try:
-            t=str(int(t))
-        except:
-            t=a
-        self.value2.setText(t)
-    
-    def getText(self,m):
-        a=self.text.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Max"),a,self).exec_()
-        self.text.setText(t)
-
-class editFromButtons(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","FromButtons"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.layout=QVBoxLayout()
-
-        l=QLabel(QCoreApplication.translate("ecl", "Buttons"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.buttons=QListWidget()
-        self.buttons.setStyleSheet("font-size: 18px;")
-        for x in self.cmdline.split()[2:]:
-            self.buttons.addItem(x)
-        self.buttons.itemDoubleClicked.connect(self.btnDblClick)
-        
-        self.layout.addWidget(self.buttons)
-        
-        h=QHBoxLayout()
-        
-        self.plus=QPushButton()
-        self.plus.setText(" + ")
-        self.plus.setStyleSheet("font-size: 18px;")
-        self.plus.clicked.connect(self.plusBtn)
-        
-        h.addWidget(self.plus)
-        
-        self.minus=QPushButton()
-        self.minus.setText(" - ")
-        self.minus.setStyleSheet("font-size: 18px;")
-        self.minus.clicked.connect(self.minusBtn)
-        
-        h.addWidget(self.minus)
-        
-        self.up=QPushButton()
-        self.up.setText(QCoreApplication.translate("ecl","Up"))
-        self.up.setStyleSheet("font-size: 18px;")
-        self.up.clicked.connect(self.upBtn)
-        
-        h.addWidget(self.up)        
-        
-        self.down=QPushButton()
-        self.down.setText(QCoreApplication.translate("ecl","Dn"))
-        self.down.setStyleSheet("font-size: 18px;")
-        self.down.clicked.connect(self.downBtn)
-        
-        h.addWidget(self.down)       
-        
-        self.layout.addLayout(h)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Variable"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.target.setCurrentIndex(0)
-
-        self.layout.addWidget(self.target)
-        
-        self.layout.addStretch()
-
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-
-    def plusBtn(self):
-        if self.buttons.count()<7:
-            t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Btn. Text"),"Btn.",self).exec_()
-            t=t.replace(" ","")
-            if len(t)>0:
-                self.buttons.addItem(t)
-    
-    def minusBtn(self):
-        self.buttons.takeItem(self.buttons.row(self.buttons.currentItem()))
-
-    def upBtn(self):
-        row=self.buttons.currentRow()
-        if row>0:
-            i=self.buttons.takeItem(row)
-            self.buttons.insertItem(row-1,i)
-            self.buttons.setCurrentRow(row-1)
-            
-    def downBtn(self):
-        row=self.buttons.currentRow()
-        if row<self.buttons.count()-1:
-            i=self.buttons.takeItem(row)
-            self.buttons.insertItem(row+1,i)
-            self.buttons.setCurrentRow(row+1)
-    
-    def btnDblClick(self):
-        t=self.buttons.currentItem().text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Btn. Text"),t,self).exec_()
-        t=t.replace(" ","")
-        if len(t)>0:
-            self.buttons.currentItem().setText(t)
-    
-    def on_confirm(self):
-        self.cmdline="FromButtons " +self.target.itemText(self.target.currentIndex())
-        
-        for i in range(0,self.buttons.count()):
-            self.cmdline=self.cmdline + " " + self.buttons.item(i).text()
-        
-class editPen(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Pen"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-
-        l=QLabel(QCoreApplication.translate("ecl", "Operation"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)
-        
-        self.operator=QComboBox()
-        self.operator.setStyleSheet("font-size: 18px;")
-        oplist=["move","plot","lineTo","rectTo","boxTo","eraseTo","circleTo","discTo","areaAdd","areaDraw","text"]
-        self.operator.addItems(oplist)
-        if self.cmdline.split()[1] in oplist:
-            self.operator.setCurrentIndex(oplist.index(self.cmdline.split()[1]))
-        else:
-            self.operator.setCurrentIndex(0)
-        
-        self.layout.addWidget(self.operator)
-        
-        self.layout.addStretch()
-        l=QLabel(QCoreApplication.translate("ecl", "x position"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[2])
-        
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "y position"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.value2=QLineEdit()
-        self.value2.setReadOnly(True)
-        self.value2.setStyleSheet("font-size: 18px;")
-            
-        self.value2.setText(self.cmdline.split()[3])
-        self.value2.mousePressEvent=self.val2Press
-        self.value2.mouseReleaseEvent=self.val2Release
-        self.layout.addWidget(self.value2)        
-        
-        self.layout.addStretch()
-        
-
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Pen " +self.operator.itemText(self.operator.currentIndex()) + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.value2.text()
-        
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1: self.value.setText(queryVarName(self.variables,self.value.text()))  
-        else:           self.value2.setText(queryVarName(self.variables,self.value2.text())) 
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","1st Op."),a,self).exec_()
-        try:
-            self.value.setText(str(int(t)))
-        except:
-            self.value.setText(a)
-        
-    def val2Press(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def val2Release(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value2.text())
-            except:
-                self.value2.setText("0")  
-            self.getValue2(1)
-            
-    def getValue2(self,m):
-        a=self.value2.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","2nd Op."),a,self).exec_()
-        try:
-            t=str(int(t))
-        except:
-            t=a
-        self.value2.setText(t)
-
-class editColor(TouchDialog):
-    def __init__(self, cmdline, vari, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Color"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        self.target=QComboBox()
-        self.target.addItems(["pen color","paper color"])
-        self.target.setStyleSheet("font-size: 18px;")
-        
-        if self.cmdline.split()[1]=="paper":
-            self.target.setCurrentIndex(1)
-        
-        self.layout.addWidget(self.target)
-        
-        h=QHBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Red:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.red=QLineEdit()
-        self.red.setReadOnly(True)
-        self.red.setStyleSheet("font-size: 18px;")
-            
-        self.red.setText(self.cmdline.split()[2])
-        
-        self.red.mousePressEvent=self.redPress
-        self.red.mouseReleaseEvent=self.redRelease
-        h.addWidget(self.red)
-        
-        self.layout.addLayout(h)
-        
-        h=QHBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Green:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.green=QLineEdit()
-        self.green.setReadOnly(True)
-        self.green.setStyleSheet("font-size: 18px;")
-            
-        self.green.setText(self.cmdline.split()[3])
-        
-        self.green.mousePressEvent=self.greenPress
-        self.green.mouseReleaseEvent=self.greenRelease
-        h.addWidget(self.green)
-        
-        self.layout.addLayout(h)
-        
-        h=QHBoxLayout()
-        
-        l=QLabel(QCoreApplication.translate("ecl", "Blue:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.blue=QLineEdit()
-        self.blue.setReadOnly(True)
-        self.blue.setStyleSheet("font-size: 18px;")
-            
-        self.blue.setText(self.cmdline.split()[4])
-        
-        self.blue.mousePressEvent=self.bluePress
-        self.blue.mouseReleaseEvent=self.blueRelease
-        h.addWidget(self.blue)
-        
-        self.layout.addLayout(h)        
-        
-        self.layout.addStretch()
-        
-        self.cbox = QPushButton()
-        self.cbox.setDisabled(True)
-        self.cbox.setAutoFillBackground(True) # This is important!!
-        color  = QtGui.QColor(int(self.red.text()),int(self.green.text()),int(self.blue.text()))
-        alpha  = 255
-        values = "{r}, {g}, {b}, {a}".format(r = color.red(),
-                                            g = color.green(),
-                                            b = color.blue(),
-                                            a = alpha
-                                            )
-        
-        self.cbox.setStyleSheet("QPushButton:disabled { background-color: rgba("+values+"); }")
-        self.layout.addWidget(self.cbox)
-        
-        self.layout.addStretch()
-        
-        self.presets=QPushButton(QCoreApplication.translate("ecl", "Presets"))
-        self.presets.setStyleSheet("font-size: 18px;")
-        
-        self.presets.clicked.connect(self.presets_clicked)
-        
-        self.layout.addWidget(self.presets)
-        
-        self.layout.addStretch()
-
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="Color " 
-        if self.target.currentIndex()==0:
-            self.cmdline=self.cmdline + "pen "
-        else:
-            self.cmdline=self.cmdline + "paper "
-        self.cmdline=self.cmdline + self.red.text() + " " +self.green.text() + " "
-        self.cmdline=self.cmdline + self.blue.text()
-        
-        self.close()
-    
-    def ifChanged(self):
-        self.valueChanged()
-    
-    def redPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        if self.btn==1:     self.red.setText(queryVarName(self.variables,self.red.text()))  
-        elif self.btn==2:   self.green.setText(queryVarName(self.variables,self.green.text())) 
-        elif self.btn==3:   self.blue.setText(queryVarName(self.variables,self.blue.text())) 
-        
-    def redRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.red.text())
-            except:
-                self.red.setText("0")  
-            self.getRed(1)
-    
-    def getRed(self,m):
-        a=self.red.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Red"),a,self).exec_()
-        try:
-            self.red.setText(str(int(t)))
-        except:
-            self.red.setText(a)
-        self.cbox_draw()
-        
-    def greenPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def greenRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.green.text())
-            except:
-                self.green.setText("0")  
-            self.getGreen(1)
-            
-    def getGreen(self,m):
-        a=self.green.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Green"),a,self).exec_()
-        try:
-            t=str(int(t))
-        except:
-            t=a
-        self.green.setText(t)
-        self.cbox_draw()
-        
-    def bluePress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=3
-        self.timer.start(500)
-     
-    def blueRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.blue.text())
-            except:
-                self.blue.setText("0")  
-            self.getBlue(1)
-            
-    def getBlue(self,m):
-        a=self.blue.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Blue"),a,self).exec_()
-        try:
-            t=str(int(t))
-        except:
-            t=a
-        self.blue.setText(t)
-        self.cbox_draw()
-        
-    def cbox_draw(self):
-        rd=max(min(int(self.red.text()),255),0)
-        gn=max(min(int(self.green.text()),255),0)
-        bl=max(min(int(self.blue.text()),255),0)
-        alpha  = 255
-        values = "{r}, {g}, {b}, {a}".format(r=rd, g=gn, b=bl, a=alpha)
-        self.cbox.setStyleSheet("QPushButton:disabled { background-color: rgba("+values+"); }")
-        self.red.setText(str(rd))
-        self.green.setText(str(gn))
-        self.blue.setText(str(bl))
-        
-    def presets_clicked(self):
-        colorlist=[QCoreApplication.translate("color","red"),
-                   QCoreApplication.translate("color","green"),
-                   QCoreApplication.translate("color","blue"),
-                   QCoreApplication.translate("color","yellow"),
-                   QCoreApplication.translate("color","cyan"),
-                   QCoreApplication.translate("color","magenta"),
-                   QCoreApplication.translate("color","cfw-blue"),
-                   QCoreApplication.translate("color","white"),
-                   QCoreApplication.translate("color","grey"),
-                   QCoreApplication.translate("color","black")]
-                   
-        (s,r)=TouchAuxListRequester(QCoreApplication.translate("color","Colors"),"",colorlist,colorlist[0],"Okay",self).exec_()        
-        if not s: return
-    
-        if r ==   QCoreApplication.translate("color","red"):
-            r=255
-            g=0
-            b=0
-        elif r == QCoreApplication.translate("color","green"):
-            r=0
-            g=255
-            b=0
-        elif r == QCoreApplication.translate("color","blue"):
-            r=0
-            g=0
-            b=255
-        elif r == QCoreApplication.translate("color","yellow"):
-            r=255
-            g=255
-            b=0
-        elif r == QCoreApplication.translate("color","cyan"):
-            r=0
-            g=255
-            b=255
-        elif r == QCoreApplication.translate("color","magenta"):
-            r=255
-            g=0
-            b=255
-        elif r == QCoreApplication.translate("color","cfw-blue"):
-            r=33
-            g=117
-            b=204
-        elif r == QCoreApplication.translate("color","white"):
-            r=255
-            g=255
-            b=255
-        elif r == QCoreApplication.translate("color","grey"):
-            r=127
-            g=127
-            b=127
-        elif r == QCoreApplication.translate("color","black"):
-            r=0
-            g=0
-            b=0
-
-        self.red.setText(str(r))
-        self.green.setText(str(g))
-        self.blue.setText(str(b))
-        self.cbox_draw()
-
-class editText(TouchDialog):
-    def __init__(self, cmdline, varlist, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Text"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=varlist
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        # Aussenrahmen
-        self.layout=QVBoxLayout()
-        
-        # VBox
-        l=QLabel(QCoreApplication.translate("ecl", "Font type"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.font=QComboBox()
-        self.font.setStyleSheet("font-size: 18px;")
-        self.font.addItems(["Times","Helvetica","Courier"])
-
-        if self.cmdline.split()[1] == "Helvetica": self.font.setCurrentIndex(1)
-        elif self.cmdline.split()[1] == "Courier": self.font.setCurrentIndex(2)
-      
-        
-        self.layout.addWidget(self.font)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Font size"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[2])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Text"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)
-        
-        self.text=QLineEdit()
-        self.text.setStyleSheet("font-size: 18px;")
-        s=self.cmdline.split()
-        self.text.setText(" ".join(s[3:]))
-        
-        self.layout.addWidget(self.text)
-        
-        self.layout.addStretch()                
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-        
-    def on_confirm(self):
-        self.cmdline="Text " +self.font.currentText() + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.text.text()
-        self.close()
-    
-    def ifChanged(self):
-        pass        
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            int(t)
-        except:
-            t=a
-        self.value.setText(str(int(t)))
-
-class editVarToText(TouchDialog):
-    def __init__(self, cmdline, varlist, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","VarToText"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=varlist
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-        
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        # Aussenrahmen
-        self.layout=QVBoxLayout()
-        
-        # VBox
-        l=QLabel(QCoreApplication.translate("ecl", "Font type"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        self.layout.addWidget(l)
-        
-        self.font=QComboBox()
-        self.font.setStyleSheet("font-size: 18px;")
-        self.font.addItems(["Times","Helvetica","Courier"])
-
-        if self.cmdline.split()[1] == "Helvetica": self.font.setCurrentIndex(1)
-        elif self.cmdline.split()[1] == "Courier": self.font.setCurrentIndex(2)
-      
-        
-        self.layout.addWidget(self.font)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Font size"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[2])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Variable"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)
-        
-        self.text=QComboBox()
-        self.text.setStyleSheet("font-size: 18px;")
-        self.text.addItems(self.variables)
-        
-        if self.cmdline.split()[3] in self.variables:
-            self.text.setCurrentIndex(self.variables.index(self.cmdline.split()[3]))
-        
-        self.layout.addWidget(self.text)
-        
-        self.layout.addStretch()                
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-        
-    def on_confirm(self):
-        self.cmdline="VarToText " +self.font.currentText() + " " + self.value.text()
-        self.cmdline=self.cmdline + " " + self.text.currentText()
-        self.close()
-    
-    def ifChanged(self):
-        pass        
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            int(t)
-        except:
-            t=a
-        self.value.setText(str(int(t)))
-
-class editArrayInit(TouchDialog):
-    def __init__(self, cmdline, arrays, parent=None):
-        TouchDialog.__init__(self, "ArrayInit", parent)
-        
-        self.cmdline=cmdline
-        self.arrays=arrays
-        self.parent=parent
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        k3=QVBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl","Array name"))
-        l.setStyleSheet("font-size: 20px;")
-        k3.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 20px;")
-        self.value.setText(self.cmdline.split()[1])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        k3.addWidget(self.value)
-                
-        self.layout.addLayout(k3)
-    
-        self.layout.addStretch()
-        
-        k13=QVBoxLayout()
-        
-        k11=QLabel("Init data")
-        k11.setStyleSheet("font-size: 20px;")
-        
-        k13.addWidget(k11)
-        k13.addStretch()
-        
-        if len(self.cmdline.split())>2:
-            iv=self.cmdline.split()[2]
-        else: iv=""
-        self.pulses=QLineEdit(iv)
-        self.pulses.setReadOnly(True)
-        self.pulses.setStyleSheet("font-size: 20px;")
-        self.pulses.mousePressEvent=self.plsPress
-        self.pulses.mouseReleaseEvent=self.plsRelease
-        k13.addWidget(self.pulses)
-        
-        self.layout.addLayout(k13)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-    
-    def on_confirm(self):
-        self.cmdline="ArrayInit "
-        self.cmdline=self.cmdline + self.value.text()
-        self.cmdline=self.cmdline + " " + self.pulses.text()
-        self.close()
-    
-    def ifChanged(self):
-        pass
-    
-    def valPress(self,sender):
-        
-        if self.timer.isActive(): self.timer.stop()
-        self.btn=1
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        
-        if self.btn==1:
-            if len(self.arrays)>0:
-                (s,r)=TouchAuxListRequester("Array","Name",self.arrays,self.arrays[0],"Okay").exec_()
-                self.value.setText(r)
-            else:
-                self.getValue(1)
-                
-        else: self.getPulses(self)
-            
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            self.getValue(1)
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Name"),a,self.parent).exec_()
-        if t[0] in "0123456789": t="i"+t
-        self.value.setText(t)
-        
-    def plsPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.btn=2
-        self.timer.start(500)
-     
-    def plsRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            self.getPulses(1)
-            
-    def getPulses(self,m):
-        a=self.pulses.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Values"),a,self.parent).exec_()
-        
-        res=""
-        for ch in t:
-          if ch in "1234567890-;": res=res+ch
-        
-        self.pulses.setText(res)
-
-class editArray(TouchDialog):
-    def __init__(self, cmdline, vari, arrays, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","Array"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-        self.arrays=arrays
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-                
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Variable:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.target.setCurrentIndex(0)
-
-        h.addWidget(self.target)
-        
-        self.layout.addLayout(h)
-        
-        #
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Action:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        f=["readFrom","writeTo","appendTo","insertTo","removeFrom"]
-        self.data=QComboBox()
-        self.data.setStyleSheet("font-size: 18px;")
-        self.data.addItems(f)
-
-        if self.cmdline.split()[2] in f:
-            self.data.setCurrentIndex(f.index(self.cmdline.split()[2]))
-        else:
-            self.data.setCurrentIndex(0)        
-
-        h.addWidget(self.data)
-        
-        self.layout.addLayout(h)
-
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Array:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.array=QComboBox()
-        self.array.setStyleSheet("font-size: 18px;")
-        self.array.addItems(self.arrays)
-
-        if self.cmdline.split()[3] in self.arrays:
-            self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[3]))
-        else:
-            self.array.setCurrentIndex(0)
-
-        h.addWidget(self.array)
-
-        self.layout.addLayout(h)
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","at index"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[4])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-
-    def on_confirm(self):
-        self.cmdline = "Array " +self.target.itemText(self.target.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.data.itemText(self.data.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.array.itemText(self.array.currentIndex()) + " "
-        if self.data.itemText(self.data.currentIndex()) == "appendTo":
-            self.cmdline = self.cmdline + "0"
-        else:
-            self.cmdline = self.cmdline + self.value.text()
-
-        self.close()
- 
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def ifChanged(self):
-        pass        
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Index"),a,self).exec_()
-        try:
-            int(t)
-        except:
-            t=a
-        self.value.setText(str(int(t)))
-        
-class editLookUpTable(TouchDialog):
-    def __init__(self, cmdline, vari, arrays, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","LookUpTable"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-        self.arrays=arrays
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-                
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timedOut)
-        
-        self.layout=QVBoxLayout()
-        
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Output variable:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.target.setCurrentIndex(0)
-
-        h.addWidget(self.target)
-        
-        self.layout.addLayout(h)
-        
-        #
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Input Array:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.array=QComboBox()
-        self.array.setStyleSheet("font-size: 18px;")
-        self.array.addItems(self.arrays)
-
-        if self.cmdline.split()[2] in self.arrays:
-            self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[2]))
-        else:
-            self.array.setCurrentIndex(0)
-
-        h.addWidget(self.array)
-
-        self.layout.addLayout(h)
-        #
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Method:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        f=["nearest","linear"]
-        self.data=QComboBox()
-        self.data.setStyleSheet("font-size: 18px;")
-        self.data.addItems(f)
-
-        if self.cmdline.split()[3] in f:
-            self.data.setCurrentIndex(f.index(self.cmdline.split()[3]))
-        else:
-            self.data.setCurrentIndex(0)        
-
-        h.addWidget(self.data)
-        
-        self.layout.addLayout(h)
-
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Output Array:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.array2=QComboBox()
-        self.array2.setStyleSheet("font-size: 18px;")
-        self.array2.addItems(self.arrays)
-
-        if self.cmdline.split()[4] in self.arrays:
-            self.array2.setCurrentIndex(self.arrays.index(self.cmdline.split()[4]))
-        else:
-            self.array2.setCurrentIndex(0)
-
-        h.addWidget(self.array2)
-
-        self.layout.addLayout(h)
-        self.layout.addStretch()
-        
-        l=QLabel(QCoreApplication.translate("ecl","Input value:"))
-        l.setStyleSheet("font-size: 18px;")
-        self.layout.addWidget(l)     
-        
-        self.value=QLineEdit()
-        self.value.setReadOnly(True)
-        self.value.setStyleSheet("font-size: 18px;")
-            
-        self.value.setText(self.cmdline.split()[5])
-        self.value.mousePressEvent=self.valPress
-        self.value.mouseReleaseEvent=self.valRelease
-        self.layout.addWidget(self.value)
-        
-        self.layout.addStretch()
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-
-    def on_confirm(self):
-        self.cmdline = "LookUpTable " +self.target.itemText(self.target.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.array.itemText(self.array.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.data.itemText(self.data.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.array2.itemText(self.array2.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.value.text()
-
-        self.close()
- 
-    def valPress(self,sender):
-        if self.timer.isActive(): self.timer.stop()
-        self.btnTimedOut=False
-        self.timer.start(500)
-    
-    def timedOut(self):
-        self.btnTimedOut=True
-        self.timer.stop()
-        self.value.setText(queryVarName(self.variables,self.value.text()))  
-    
-    def valRelease(self,sender):
-        self.timer.stop()
-        if not self.btnTimedOut:
-            try:
-                int(self.value.text())
-            except:
-                self.value.setText("0")  
-            self.getValue(1)
-    
-    def ifChanged(self):
-        pass        
-    
-    def getValue(self,m):
-        a=self.value.text()
-        t=TouchAuxKeyboard(QCoreApplication.translate("ecl","Value"),a,self).exec_()
-        try:
-            int(t)
-        except:
-            t=a
-        self.value.setText(str(int(t)))
-
-class editArrayStat(TouchDialog):
-    def __init__(self, cmdline, vari, arrays, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","ArrayStat"), parent)
-        
-        self.cmdline=cmdline
-        self.variables=vari
-        self.arrays=arrays
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        
-        self.layout=QVBoxLayout()
-        
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Variable:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.target=QComboBox()
-        self.target.setStyleSheet("font-size: 18px;")
-        self.target.addItems(self.variables)
-
-        if self.cmdline.split()[1] in self.variables:
-            self.target.setCurrentIndex(self.variables.index(self.cmdline.split()[1]))
-        else:
-            self.target.setCurrentIndex(0)
-
-        h.addWidget(self.target)
-        
-        self.layout.addLayout(h)
-        
-        #
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Function:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        f=["sizeOf","min","max","mean","minIdx","maxIdx"]
-        self.data=QComboBox()
-        self.data.setStyleSheet("font-size: 18px;")
-        self.data.addItems(f)
-
-        if self.cmdline.split()[2] in f:
-            self.data.setCurrentIndex(f.index(self.cmdline.split()[2]))
-        else:
-            self.data.setCurrentIndex(0)        
-
-        h.addWidget(self.data)
-        
-        self.layout.addLayout(h)
-
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Array:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.array=QComboBox()
-        self.array.setStyleSheet("font-size: 18px;")
-        self.array.addItems(self.arrays)
-
-        if self.cmdline.split()[3] in self.arrays:
-            self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[3]))
-        else:
-            self.array.setCurrentIndex(0)
-
-        h.addWidget(self.array)
-
-        self.layout.addLayout(h)
-        self.layout.addStretch()
-        
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-
-    def on_confirm(self):
-        self.cmdline = "ArrayStat " +self.target.itemText(self.target.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.data.itemText(self.data.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.array.itemText(self.array.currentIndex())
-
-        self.close()
-
-class editArrayLoad(TouchDialog):
-    def __init__(self, cmdline, arrays, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","ArrayLoad"), parent)
-        
-        self.cmdline=cmdline
-        self.arrays=arrays
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        
-        self.layout=QVBoxLayout()
-        
-        #
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Filename:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        f=["userSelect","byName"]
-        self.data=QComboBox()
-        self.data.setStyleSheet("font-size: 18px;")
-        self.data.addItems(f)
-
-        if self.cmdline.split()[2] in f:
-            self.data.setCurrentIndex(f.index(self.cmdline.split()[2]))
-        else:
-            self.data.setCurrentIndex(0)        
-
-        h.addWidget(self.data)
-        
-        self.layout.addLayout(h)
-
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Array:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.array=QComboBox()
-        self.array.setStyleSheet("font-size: 18px;")
-        self.array.addItems(self.arrays)
-
-        if self.cmdline.split()[1] in self.arrays:
-            self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[1]))
-        else:
-            self.array.setCurrentIndex(0)
-
-        h.addWidget(self.array)
-
-        self.layout.addLayout(h)
-        self.layout.addStretch()
-        
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-
-    def on_confirm(self):
-        self.cmdline = "ArrayLoad " + self.array.itemText(self.array.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.data.itemText(self.data.currentIndex())
-
-        self.close()
-        
-class editArraySave(TouchDialog):
-    def __init__(self, cmdline, arrays, parent=None):
-        TouchDialog.__init__(self, QCoreApplication.translate("ecl","ArraySave"), parent)
-        
-        self.cmdline=cmdline
-        self.arrays=arrays
-    
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        
-        self.layout=QVBoxLayout()
-        
-        #
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "File:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        f=["replace","rename","userSelect"]
-        self.data=QComboBox()
-        self.data.setStyleSheet("font-size: 18px;")
-        self.data.addItems(f)
-
-        if self.cmdline.split()[2] in f:
-            self.data.setCurrentIndex(f.index(self.cmdline.split()[2]))
-        else:
-            self.data.setCurrentIndex(0)        
-
-        h.addWidget(self.data)
-        
-        self.layout.addLayout(h)
-
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Array:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.array=QComboBox()
-        self.array.setStyleSheet("font-size: 18px;")
-        self.array.addItems(self.arrays)
-
-        if self.cmdline.split()[1] in self.arrays:
-            self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[1]))
-        else:
-            self.array.setCurrentIndex(0)
-
-        h.addWidget(self.array)
-
-        self.layout.addLayout(h)
-        self.layout.addStretch()
-        
-        
-        self.centralWidget.setLayout(self.layout)
-        
-        TouchDialog.exec_(self)
-        return self.cmdline
-
-    def on_confirm(self):
-        self.cmdline = "ArraySave " + self.array.itemText(self.array.currentIndex()) + " "
-        self.cmdline = self.cmdline + self.data.itemText(self.data.currentIndex())
-
-        self.close()
-
-def editI2CRead(cmdline, arrays, parent):
-    return editComm(cmdline, "I2CRead", arrays, parent).exec_()
-
-def editI2CWrite(cmdline, arrays, parent):
-    return editComm(cmdline, "I2CWrite", arrays, parent).exec_()
-
-def editUSBRead(cmdline, arrays, parent):
-    return editComm(cmdline, "USBRead", arrays, parent).exec_()
-
-def editUSBWrite(cmdline, arrays, parent):
-    return editComm(cmdline, "USBWrite", arrays, parent).exec_()
-
-class editComm(TouchDialog):    
-    def __init__(self, cmdline, xcmd, arrays, parent=None):
-        TouchDialog.__init__(self, xcmd, parent)
-        
-        self.cmdline=cmdline
-        self.arrays=arrays
-        self.xcmd=xcmd
-        
-    def exec_(self):
-    
-        self.confirm = self.titlebar.addConfirm()
-        self.confirm.clicked.connect(self.on_confirm)
-    
-        self.titlebar.setCancelButton()
-
-        
-        self.layout=QVBoxLayout()
-        
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Device:"))
-        l.setStyleSheet("font-size: 18px;")
-        
-        h.addWidget(l)
-        
-        self.layout.addLayout(h)
-
-        self.interface=QComboBox()
-        self.interface.setStyleSheet("font-size: 18px;")
-        if self.xcmd=="USBRead" or self.xcmd=="USBWrite":
-            self.interface.addItems(["SRD","FTD"])
-        else:
-            self.interface.addItems(["SRD","FTD","TXT","RPI"])
+            self.cmdPrint("Array '" + stack[1] + "'\nreferenced without\nArrayInit!\nProgram terminated")
+            self.halt=True
 
-        if self.cmdline.split()[1]=="TXT": self.interface.setCurrentIndex(2)
-        elif self.cmdline.split()[1]=="FTD": self.interface.setCurrentIndex(1)
-        elif self.cmdline.split()[1]=="RPI": self.interface.setCurrentIndex(3)
+        if self.halt: return
         
-        h.addWidget(self.interface)
-        if self.xcmd=="USBRead" or self.xcmd=="USBWrite":
-            h=QHBoxLayout()
-            l=QLabel(QCoreApplication.translate("ecl", "Command:"))
-            l.setStyleSheet("font-size: 18px;")
-            h.addWidget(l)
-            self.layout.addLayout(h)
+        data=joinArray(self.arrays[arr], " ")
             
-            self.command=QLineEdit()
-            #self.command.setReadOnly(True)
-            self.command.setStyleSheet("font-size: 18px;")
-            self.command.setText(self.cmdline.split()[2])
+        if device=="FTD":                
+            self.ftdComm("i2c_write "+data)
+        
+        elif device=="SRD":
+            self.srdSend("i2c_write "+data)
+        
+        elif device=="TXT" or device=="RPI":
+            dst=list(self.arrays[arr])
+                
+            with self.i2cLock:
+                if len(dst)>2:
+                    i2c.write_i2c_block_data(dst[0], dst[1], dst[2:])
+                else:
+                    i2c.write_byte(dst[0], dst[1])
+    
+    def i2cScript(self, dev, script):
+        # run a register script as one transaction, returns the bytes read
+        # or None on failure; the script is a sequence of
+        #   addr reg n d1..dn   write n bytes to register reg
+        #   addr reg -n         read n bytes from register reg
+        ops=[]
+        i=0
+        while i+2<len(script):
+            (a, r, n)=(script[i], script[i+1], script[i+2])
+            if n>=0:
+                ops.append((a, r, n, list(script[i+3:i+3+n])))
+                i=i+3+n
+            else:
+                ops.append((a, r, -n, None))
+                i=i+3
         
-            self.layout.addWidget(self.command)
+        try:
+            res=[]
+            if dev=="FTD" or dev=="SRD":
+                # ein Befehl je Schritt, alle in einem USB Transfer
+                cmds=[]
+                for (a, r, n, d) in ops:
+                    if d==None: cmds.append("i2c_read "+str(a)+" "+str(r)+" "+str(n))
+                    else: cmds.append("i2c_write "+" ".join(map(str, [a, r]+d)))
+                if dev=="FTD": 
+                    ret=self.ftdBatch(cmds)
+                elif self.srd!=None:
+                    t=time.time()
+                    ret=self.srd.batch(cmds)
+                    self.blocked=self.blocked+time.time()-t
+                else: return None
+                
+                for (op, rep) in zip(ops, ret):
+                    if op[3]==None:
+                        v=rep.split()
+                        if len(v)==0 or v[0]=="Fail": return None
+                        res.extend(map(int, v))
+            elif i2c==None:
+                return None
+            elif I2CRDWR:
+                msgs=[]
+                reads=[]
+                for (a, r, n, d) in ops:
+                    if d==None:
+                        msgs.append(i2c_msg.write(a, [r]))
+                        reads.append(i2c_msg.read(a, n))
+                        msgs.append(reads[-1])
+                    else:
+                        msgs.append(i2c_msg.write(a, [r]+d))
+                with self.i2cLock: i2c.i2c_rdwr(*msgs)
+                for m in reads: res.extend(list(m))
+            else:
+                # das ganze Skript ohne andere Zugriffe dazwischen
+                with self.i2cLock:
+                    for (a, r, n, d) in ops:
+                        if d==None: res.extend(i2c.read_i2c_block_data(a, r, n))
+                        elif n>0: i2c.write_i2c_block_data(a, r, d)
+                        else: i2c.write_byte(a, r)
+            return res
+        except:
+            return None
+    
+    def cmdI2CScript(self, stack):
+        # I2CScript <dev> <script> <result>
+        if not (stack[2] in self.arrays):
+            self.cmdPrint("Array '" + stack[2] + "'\nreferenced without\nArrayInit!\nProgram terminated")
+            self.halt=True
+            return
         
-        h=QHBoxLayout()
-        l=QLabel(QCoreApplication.translate("ecl", "Array:"))
-        l.setStyleSheet("font-size: 18px;")
+        res=self.i2cScript(stack[1], self.arrays[stack[2]])
+        if res==None: res=[]
+        self.setArray(stack[3], res)
+    
+    def cmdI2CBurst(self, stack):
+        # I2CBurst <dev> <script> <result> <ms>, reads in the background
+        # until stopped with a period of 0
+        v=self.getVal(stack[4])
+        if self.halt: return
         
-        h.addWidget(l)
+        if not (stack[2] in self.arrays):
+            self.cmdPrint("Array '" + stack[2] + "'\nreferenced without\nArrayInit!\nProgram terminated")
+            self.halt=True
+            return
         
-        self.array=QComboBox()
-        self.array.setStyleSheet("font-size: 18px;")
-        self.array.addItems(self.arrays)
-        self.array.setCurrentIndex(0)   
+        key="I2C "+stack[3]
+        if key in self.samplers:
+            self.samplers[key].stop()
+            del self.samplers[key]
         
-        if self.cmdline.split()[2] in self.arrays and not (self.xcmd=="USBRead" or self.xcmd=="USBWrite"):
-            self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[2]))
-        elif len(self.cmdline.split())>3:
-            if self.cmdline.split()[3] in self.arrays:
-                self.array.setCurrentIndex(self.arrays.index(self.cmdline.split()[3]))
+        if v>0:
+            script=array(ARRAYTYPE, self.arrays[stack[2]])
+            if not stack[3] in self.arrays: self.setArray(stack[3], [])
+            ch={ ("B",stack[3]): lambda: self.i2cBurst(stack[1], script, stack[3]) }
+            self.samplers[key]=IOSampler(key, ch, float(v)/1000)
+            self.samplers[key].start()
+    
+    def i2cBurst(self, dev, script, dst):
+        # runs in the sampler thread, failed reads keep the last values
+        res=self.i2cScript(dev, script)
+        if res!=None: self.setArray(dst, res)
+        return res
+    
+    def cmdUSBComm(self, stack):
+        device=stack[1]
+        arr=stack[3]
 
-        h.addWidget(self.array)
+        if not (arr in self.arrays):
+            self.cmdPrint("Array '" + stack[1] + "'\nreferenced without\nArrayInit!\nProgram terminated")
+            self.halt=True
 
-        self.layout.addLayout(h)
-        self.layout.addStretch()
+        if self.halt: return
         
+        data=joinArray(self.arrays[arr], " ")
+            
+        if device=="FTD":
+            with self.ftdLock:
+                self.FTD.ftduino.timeout=None
+                ret=self.FTD.comm(stack[2]+" "+data)
+                self.FTD.ftduino.timeout=0.1
+        elif device=="SRD":
+            ret=self.srdComm(stack[2]+" "+data, None)
         
-        self.centralWidget.setLayout(self.layout)
+        ret=ret.split()
         
-        TouchDialog.exec_(self)
-        return self.cmdline
+        if (stack[0]=="USBRead"):
+            if ret!=[]:
+                if ret[0]=="Fail" or str(ret[0]).strip()=="": ret=[]
+                
+            self.setArrayData(arr, ret)
 
-    def on_confirm(self):
-        self.cmdline = self.xcmd + " " + self.interface.itemText(self.interface.currentIndex()) + " "
-        
-        if self.xcmd=="USBRead" or self.xcmd=="USBWrite":
-            self.cmdline=self.cmdline + self.command.text() + " "
-        
-        self.cmdline = self.cmdline + self.array.itemText(self.array.currentIndex()) 
+            
+#
+#
+# GUI classes for editing command lines
+#
+#
 
-        self.close()
+# the editor dialogs live in edit*.py, a module is imported when one of
+# its dialogs is opened for the first time
+EDITORS={ "editinputs":      ["editWaitForInputDig", "editIfInputDig", "editWaitForInput", "editIfInput",
+                              "editQueryIn", "editCounterClear"],
+          "editoutputs":     ["editOutput", "editMotor", "editMotorPulsewheel", "editMotorEncoder",
+                              "editMotorEncoderSync", "editServo"],
+          "editvariables":   ["editInit", "editFromIn", "editFromKeypad", "editFromDial", "editFromButtons",
+                              "editFromPoly", "editFromSys", "editIfVar", "editCalc"],
+          "editcontrols":    ["editLoopTo", "editDelay", "editIfTimer", "editInterrupt", "editCall"],
+          "editarrays":      ["editArrayInit", "editArray", "editArrayStat", "editArrayCalc", "editArrayProc",
+                              "editLookUpTable", "editArrayLoad", "editArraySave"],
+          "editinteraction": ["editPen", "editText", "editColor", "editVarToText", "editIfTouchArea",
+                              "editI2CRead", "editI2CWrite", "editUSBRead", "editUSBWrite", "editComm"] }
+
+def lazyEditor(module, name):
+    def editor(*args, **kwargs):
+        return getattr(importlib.import_module(module), name)(*args, **kwargs)
+    return editor
+
+for module in EDITORS:
+    for name in EDITORS[module]: globals()[name]=lazyEditor(module, name)
 
 #
 # main GUI application
@@ -8009,11 +3170,14 @@ class FtcGuiApplication(TouchApplication):
     stop=pyqtSignal()
     mousePos=pyqtSignal(int, int)
     gfxData=pyqtSignal(int, int, int, int, int, int, int)
-    canvasReturn=pyqtSignal()
     click=pyqtSignal(QMouseEvent)
     release=pyqtSignal(QMouseEvent)
+    ifFound=pyqtSignal(str)
     
     def __init__(self, args):
+        # phase, seconds since STARTTIME
+        self.startupTimes=[("imports", time.time()-STARTTIME)]
+        
         TouchApplication.__init__(self, args)
         
         # some init
@@ -8021,6 +3185,9 @@ class FtcGuiApplication(TouchApplication):
         self.RIF=None
         self.TXT=None
         self.FTD=None
+        self.hat=None
+        self.ifProbe=None
+        self.ifFound.connect(self.interfaceFound)
         self.etf=False
         
         self.pred=255
@@ -8132,15 +3299,11 @@ class FtcGuiApplication(TouchApplication):
             l2=QHBoxLayout()
             l3=QVBoxLayout()
             
-        # program list widget
-        self.proglist=QListWidget()
+        # the program and its list view
+        self.program=ProgramModel(self.code)
+        self.proglist=ProgramView(self.program)
         self.proglist.setStyleSheet("font-family: 'Monospace'; font-size: 16px;")
-        self.proglist.itemDoubleClicked.connect(self.progItemDoubleClicked)
-        
-        c=0
-        for a in self.code:
-            self.proglist.addItem(a)
-            c=c+1
+        self.proglist.doubleClicked.connect(self.progItemDoubleClicked)
             
         if self.orientation==PORTRAIT:
             l.addWidget(self.proglist)
@@ -8163,6 +3326,9 @@ class FtcGuiApplication(TouchApplication):
             
         self.output.hide()
         
+        self.textTimer=QTimer()
+        self.textTimer.timeout.connect(self.updateText)
+        
         self.proglist.setCurrentRow(0)
         
         # and the controls
@@ -8213,9 +3379,15 @@ class FtcGuiApplication(TouchApplication):
         
         self.start=False
         
+        # Stand der Interface-Suche
+        self.ifStatus=QLabel()
+        self.ifStatus.setStyleSheet("font-size: 14px;")
+        
         if self.orientation==PORTRAIT:
+            l.addWidget(self.ifStatus)
             l.addWidget(self.starter)
         else:
+            l3.addWidget(self.ifStatus)
             l3.addWidget(self.starter)
             l.addLayout(l2)
  
@@ -8233,10 +3405,18 @@ class FtcGuiApplication(TouchApplication):
         self.painter=QImage(canvasSize, canvasSize, QImage.Format_RGB32)
         self.painter.setDotsPerMeterX(3780)
         self.painter.setDotsPerMeterY(3780)
+        self.canvasBuffered=False
+        self.imageCache=ImageCache(pixdir, self.loadImage, QImage.byteCount, PIXCACHEMAX)
         self.canvas.mousePressEvent=self.click.emit
         self.canvas.mouseReleaseEvent=self.release.emit
         
+        self.lastIF="TXT"
+        
+        # the interfaces are probed in the background
+        self.initIFs()
+        
         self.mainwindow.show()
+        self.startupTimes.append(("window", time.time()-STARTTIME))
         try:
             if os.path.isfile(os.path.join(hostdir,".01_firstrun")):
                 t=TouchMessageBox("first run", self.mainwindow)
@@ -8251,18 +3431,13 @@ class FtcGuiApplication(TouchApplication):
         except:
             pass
         
-        # init the interfaces
-        self.initIFs()
-        
-        self.lastIF="TXT"
-        if self.RIF != None and self.TXT==None: self.lastIF="RIF"
-        
+        QTimer.singleShot(0, self.startupInteractive)
         self.exec_()
     
     def closed(self):
         if self.start==True: self.startStop()
         
-        self.codeFromListWidget()
+        self.codeFromModel()
         
         if not self.codeSaved:
             with open(os.path.join(hostdir,".autosave"),"w", encoding="utf-8") as f:
@@ -8327,9 +3502,8 @@ class FtcGuiApplication(TouchApplication):
             
             if s !=  QCoreApplication.translate("m_project","Yes"): return
         
-        self.proglist.clear()
         self.code=[]
-        self.proglist.addItem("# new")
+        self.program.reset(["# new"])
         self.proglist.setCurrentRow(0)
         
         self.codeSaved=False
@@ -8367,8 +3541,7 @@ class FtcGuiApplication(TouchApplication):
             self.code=json.load(f)
             f.close()
         
-        self.proglist.clear()
-        self.proglist.addItems(self.code)
+        self.program.reset(self.code)
         
         self.codeSaved=True
         self.codeName=r
@@ -8393,7 +3566,7 @@ class FtcGuiApplication(TouchApplication):
             
             if s !=  QCoreApplication.translate("m_project","Yes"): return
         
-        self.codeFromListWidget()
+        self.codeFromModel()
         
         with open(os.path.join(projdir,pfn),"w", encoding="utf-8") as f:
             
@@ -8470,24 +3643,15 @@ class FtcGuiApplication(TouchApplication):
         with open(os.path.join(moddir,r),"r", encoding="utf-8") as f:
             module=json.load(f)
         
-        self.codeFromListWidget()
-
-        m=self.proglist.currentRow()
-        n=m
-        
-        for a in module:
-            self.code.insert(m+1,a)
-            m=m+1
-
-        self.proglist.clear()
-        self.proglist.addItems(self.code)
+        n=self.proglist.currentRow()
+        self.program.insert(n+1, module)
         self.proglist.setCurrentRow(n+1)
         
         self.codeSaved=False
 
     
     def modules_export(self):
-        self.codeFromListWidget()
+        self.codeFromModel()
         modTable=[]
         modList=[]
         mcnt=0
@@ -8698,7 +3862,7 @@ class FtcGuiApplication(TouchApplication):
     def on_menu_interfaces(self):
         global RIFSERIAL
         
-        self.initIFs()
+        self.initIFs(True)
         
         if self.RIF==None: s= QCoreApplication.translate("m_interfaces","No Robo device")
         else: s = self.RIF.GetDeviceTypeString()
@@ -8735,48 +3899,99 @@ class FtcGuiApplication(TouchApplication):
                 RIFSERIAL="/dev/ttyUSB0"
                 self.initIFs()
                 
-    def initIFs(self):
+    def initIFs(self, wait=False):
+        # a search still running is finished first
+        if self.ifProbe!=None and not self.ifProbe.finished():
+            self.ifProbe.wait()
+            for name in self.ifProbe.names: self.interfaceFound(name)
+        
         # close, if open
         if self.RIF:
             self.RIF.close()
             time.sleep(0.1)
-            
-        #init robo family
-        if RIFSERIAL!="":
-            self.RIF=RoboInterface(serialDevice=RIFSERIAL.encode(), SerialType=RoboInterface.FT_INTELLIGENT_IF)
-        else:
-            self.RIF=RoboInterface(bEnableDist=True)
         
-        s=""
-        if self.RIF.hasInterface(): s = self.RIF.GetDeviceTypeString()
-        
-        # print(self.RIF.IsConnected, s, len(s))
-        if s=="": self.RIF=None
-
+        self.RIF=None
         self.TXT=None
-        try:
-            self.TXT=txt.ftrobopy(FTTXTADDRESS)
-            name, version = self.TXT.queryStatus()
-        except:
-            self.TXT=None      
-            
-        if FTDUINO_DIRECT:
-            self.FTD=ftd.ftduino()
-            if self.FTD.getDevice()==None:
-                self.FTD=None
-        else:
-            self.FTD=None
+        self.FTD=None
+        self.hat=None
         
-        if self.HAT_allowed:
-            self.hat = TxPiHat()
-        else:
-            self.hat = None
-            
+        # alle Interfaces gleichzeitig suchen, jedes meldet sich ueber ifFound
+        probes={ "RIF": probeRIF, "TXT": probeTXT, "FTD": probeFTD }
+        if self.HAT_allowed: probes["HAT"]=probeHAT
+        
+        self.starter.setEnabled(False)
+        self.ifProbe=IFProbe(probes, self.ifFound.emit)
+        self.showIFStatus()
+        
+        if wait:
+            self.ifProbe.wait()
+            for name in self.ifProbe.names: self.interfaceFound(name)
+    
+    def interfaceFound(self, name):
+        # ifFound kann noch von einer frueheren Suche kommen
+        if not name in self.ifProbe.results: return
+        
+        r=self.ifProbe.results[name]
+        if name=="RIF":   self.RIF=r
+        elif name=="TXT": self.TXT=r
+        elif name=="FTD": self.FTD=r
+        elif name=="HAT": self.hat=r
+        
+        self.showIFStatus()
+        
+        if self.ifProbe.finished():
+            self.starter.setEnabled(True)
+            QTimer.singleShot(2000, self.hideIFStatus)
+            if self.startupTimes!=None:
+                if self.RIF!=None and self.TXT==None: self.lastIF="RIF"
+                self.startupReport()
+    
+    def showIFStatus(self):
+        s=[]
+        for name in self.ifProbe.names:
+            if not name in self.ifProbe.results: s.append(name+" ...")
+            elif self.ifProbe.results[name]==None: s.append(name+" -")
+            else: s.append(name+" ok")
+        
+        self.ifStatus.setText(QCoreApplication.translate("main","Interfaces:")+" "+"  ".join(s))
+        self.ifStatus.show()
+    
+    def hideIFStatus(self):
+        if self.ifProbe.finished(): self.ifStatus.hide()
+    
+    def startupInteractive(self):
+        # the event loop is running, the GUI reacts from now on
+        self.startupTimes.append(("interactive", time.time()-STARTTIME))
+        self.startupReport()
+    
+    def startupReport(self):
+        # once the GUI is interactive and all interfaces are known the
+        # startup phases go to logdir/startup.txt
+        if not "interactive" in [p[0] for p in self.startupTimes]: return
+        if not self.ifProbe.finished(): return
+        
+        t=self.startupTimes
+        self.startupTimes=None
+        
+        start=self.ifProbe.start-STARTTIME
+        for name in self.ifProbe.names:
+            if self.ifProbe.results[name]==None: t.append((name+" not found", start+self.ifProbe.times[name]))
+            else: t.append((name+" found", start+self.ifProbe.times[name]))
+        t.append(("interfaces", start+max(self.ifProbe.times.values())))
+        t.sort(key=lambda p: p[1])
         
+        try:
+            with open(os.path.join(logdir, "startup.txt"), "w", encoding="utf-8") as f:
+                f.write("startIDE "+vstring.strip()+" startup "+time.strftime("%Y-%m-%d %H:%M:%S")+"\n")
+                f.write("phase;time since start [ms]\n")
+                for p in t: f.write(p[0]+";%.0f\n" % (p[1]*1000))
+                # so lange haette das Suchen nacheinander gedauert
+                f.write("interfaces one after another;%.0f\n" % (sum(self.ifProbe.times.values())*1000))
+        except:
+            pass
             
-    def codeFromListWidget(self):
-        self.code=[]
-        for i in range(0,self.proglist.count()): self.code.append(self.proglist.item(i).text())
+    def codeFromModel(self):
+        self.code=self.program.snapshot()
         
     def startStop(self):
         self.starter.setEnabled(False)
@@ -8799,11 +4014,10 @@ class FtcGuiApplication(TouchApplication):
             self.start=not self.start
             
             if self.start:
-                self.codeFromListWidget()
+                self.codeFromModel()
                 self.setMainWindow(False)
+                self.canvasBuffered=False
                 self.et = execThread(self.code, self.output, self.starter, self.RIF, self.TXT, self.FTD, self.hat, self)
-                self.et.updateText.connect(self.updateText)
-                self.et.clearText.connect(self.clearText)
                 self.et.execThreadFinished.connect(self.execThreadFinished)
                 self.et.showMessage.connect(self.messageBox)
                 self.et.requestKeyboard.connect(self.requestKeyboard)
@@ -8811,6 +4025,8 @@ class FtcGuiApplication(TouchApplication):
                 self.et.requestBtn.connect(self.requestButton)
                 self.et.requestArray.connect(self.requestArray)
                 self.et.canvasSig.connect(self.canvasSig)
+                self.et.canvasFlush.connect(self.canvasFlush)
+                self.textTimer.start(1000//TEXTRATE)
                 self.et.start() 
             else:
                 self.stop.emit()
@@ -8820,166 +4036,104 @@ class FtcGuiApplication(TouchApplication):
         self.starter.setEnabled(True)
         self.starter.setDisabled(False)
 
-    def updateText(self, message):
-        self.output.addItem(message)
-        if self.output.count()>255: void=self.output.takeItem(0)
-        self.output.scrollToBottom()
-        self.msgBack.emit(1)
+    def updateText(self):
+        # output pane is refreshed TEXTRATE times per second with all
+        # lines printed in the meantime
+        (cleared, skipped, lines)=self.et.takeText()
+        if not cleared and skipped==0 and len(lines)==0: return
+        
+        if cleared: self.output.clear()
+        
+        if skipped>0:
+            self.output.addItem("<"+str(skipped)+" "+QCoreApplication.translate("main","lines skipped")+">")
+        # nur was sichtbar bleibt
+        self.output.addItems(lines[max(0,len(lines)-TEXTLINES):])
         
-    def clearText(self):
-        self.output.clear()
+        while self.output.count()>TEXTLINES: self.output.takeItem(0)
         self.output.scrollToBottom()
-        self.msgBack.emit(1)
     
     def execThreadFinished(self):
+        self.textTimer.stop()
+        self.updateText()
         self.starter.setText(QCoreApplication.translate("main","Close log"))
         self.etf=True
         
     def canvasSig(self, stack):
-        s=stack.split()
-
-        if s[0]=="HIDESTOPBTN":
-            self.starter.hide()
-            self.canvasReturn.emit()
-        elif s[0]=="SHOWSTOPBTN":
-            self.starter.show()
-            self.canvasReturn.emit()
-        elif s[0]=="HIDETITLEBAR":
-            self.mainwindow.titlebar.hide()
-            self.canvasReturn.emit()
-        elif s[0]=="SHOWTITLEBAR":
-            self.mainwindow.titlebar.show()
-            self.canvasReturn.emit()
-        elif s[0]=="Text":
-            self.fontStyle=s[1]
-            self.fontSize=int(s[2])
-            self.text=" ".join(s[3:])
-            self.canvasReturn.emit()
-        elif s[0]=="requestData":
+        # synchronous requests of the exec thread, all commands queued
+        # before have to be drawn first
+        self.canvasFlush()
+        
+        if stack=="requestData":
             rgb=self.painter.pixel(self.xpos,self.ypos)
             self.gfxData.emit(self.canvas.width(),
                               self.canvas.height(),
                               self.xpos,
                               self.ypos, QtGui.qRed(rgb), QtGui.qGreen(rgb), QtGui.qBlue(rgb))
-        elif s[0]=="requestPos":
+        elif stack=="requestPos":
             iix=self.canvas.mapFromGlobal(QCursor().pos())
             self.mousePos.emit(iix.x(), iix.y())
-            pass
-        elif s[1]=="show":
-            self.canvas.show()
-            self.canvasReturn.emit()
-        elif s[1]=="hide": 
-            self.canvas.hide()
-            self.canvasReturn.emit()
-        elif s[1]=="square":
-            canvasSize=min(self.mainwindow.width(),self.mainwindow.height())
-            self.canvas.setGeometry(0, 0, canvasSize, canvasSize)
-            self.canvas.setPixmap(QPixmap(canvasSize, canvasSize))
-            self.canvasReturn.emit()
-        elif s[1]=="full":
-            self.canvas.setGeometry(0, 0, self.mainwindow.width(), self.mainwindow.height())
-            self.canvas.setPixmap(QPixmap(self.mainwindow.width(), self.mainwindow.height()))
-            self.canvasReturn.emit()
-        elif s[1]=="clear":
-            self.canvas.setPixmap(QPixmap(self.canvas.width(), self.canvas.height()))
-            pm=self.painter
-            p=QPainter()
-            p.begin(pm)
-            p.setBackgroundMode(Qt.TransparentMode)
-            p.fillRect(0,0,pm.width(),pm.height(),QtGui.QColor(self.bred,self.bgreen,self.bblue,255)) #50, 125, 195
-            p.end()
-            self.canvas.setPixmap(QPixmap.fromImage(self.painter))
-            self.canvasReturn.emit()
-        elif s[1]=="update":
-            self.canvas.setPixmap(QPixmap.fromImage(self.painter))
-            self.canvas.repaint()
-            self.canvasReturn.emit()
-        elif s[1]=="origin":
-            self.painter=self.painter.copy(self.xpos, self.ypos, self.painter.width(), self.painter.height())
-            self.canvasReturn.emit()
-        elif s[1]=="log":
-            pm=self.canvas.pixmap()
-            try:
-                lfn=os.path.join(logdir, "img"+time.strftime("%Y%m%d-%H%M%S")+".png")
-                pm.save(lfn,"",90)
-            except:
-                pass
-            self.canvasReturn.emit()
-        elif s[1]=="load":
-            try:
-                self.painter.load(os.path.join(pixdir,s[2]))
-                self.painter.setDotsPerMeterX(3780)
-                self.painter.setDotsPerMeterY(3780)
-                self.canvas.setPixmap(QPixmap.fromImage(self.painter))
-            except:
-                pass
-            self.canvasReturn.emit()
-        elif s[1]=="move":
-            self.xpos=int(s[2])
-            self.ypos=int(s[3])
-            self.canvasReturn.emit()
-        elif s[1]=="plot":
-            pm=self.painter 
-            p=QPainter()
-            p.begin(pm)
+        elif stack=="requestRaster":
+            # Bereich als RGB32, direkt aus dem Bildspeicher
+            (x, y, w, h)=self.et.rasterRect
+            img=self.painter.copy(x, y, w, h).convertToFormat(QImage.Format_RGB32)
+            self.et.rasterData=img.constBits().asstring(img.byteCount())
+            self.msgBack.emit(1)
+    
+    def canvasFlush(self):
+        # draw all queued canvas commands within a single QPainter session
+        queue=self.et.canvasQueue
+        p=None
+        while len(queue)>0:
+            s=queue.popleft()
+            if (s[0]=="Pen" and s[1] in CANVASPAINTOPS) or (s[0]=="Canvas" and s[1]=="blit"):
+                if p==None:
+                    p=QPainter()
+                    p.begin(self.painter)
+                self.canvasPaint(p, s)
+            else:
+                if p!=None and not (s[0] in ["Pen", "Color", "Text"]):
+                    p.end()
+                    p=None
+                self.canvasCmd(s)
+        if p!=None: p.end()
+    
+    def canvasPaint(self, p, s):
+        if s[1]=="plot":
             p.setPen(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             p.drawPoint(self.xpos,self.ypos)
-            p.end()
-            self.canvasReturn.emit()
         elif s[1]=="lineTo":
-            pm=self.painter 
-            p=QPainter()
-            p.begin(pm)
             p.setPen(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
             ax=self.xpos
             ay=self.ypos
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             p.drawLine(ax,ay,self.xpos,self.ypos)
-            p.end()  
-            self.canvasReturn.emit()
         elif s[1]=="rectTo":
-            pm=self.painter 
-            p=QPainter()
-            p.begin(pm)
             p.setPen(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
+            p.setBrush(Qt.NoBrush)
             ax=self.xpos
             ay=self.ypos
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             p.drawRect(ax,ay,self.xpos-ax+1,self.ypos-ay+1)
-            p.end() 
-            self.canvasReturn.emit()
         elif s[1]=="boxTo":
-            pm=self.painter 
-            p=QPainter()
-            p.begin(pm)
             p.setPen(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
             ax=self.xpos
             ay=self.ypos
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             p.fillRect(ax,ay,self.xpos-ax+1,self.ypos-ay+1,QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
-            p.end() 
-            self.canvasReturn.emit()
         elif s[1]=="circleTo":
-            pm=self.painter 
-            p=QPainter()
-            p.begin(pm)
             p.setPen(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
+            p.setBrush(Qt.NoBrush)
             ax=self.xpos
             ay=self.ypos
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             p.drawEllipse(ax,ay,self.xpos-ax,self.ypos-ay)
-            p.end()
-            self.canvasReturn.emit()
         elif s[1]=="discTo":
-            pm=self.painter 
-            p=QPainter()
-            p.begin(pm)
             p.setPen(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
             p.setBrush(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
             ax=self.xpos
@@ -8987,60 +4141,124 @@ class FtcGuiApplication(TouchApplication):
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             p.drawEllipse(ax,ay,self.xpos-ax,self.ypos-ay)
-            p.end()
-            self.canvasReturn.emit()
         elif s[1]=="eraseTo":
-            pm=self.painter 
-            p=QPainter()
-            p.begin(pm)
             p.setPen(QtGui.QColor(self.bred, self.bgreen, self.bblue, 255))
             ax=self.xpos
             ay=self.ypos
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             p.fillRect(ax,ay,self.xpos-ax,self.ypos-ay,QtGui.QColor(self.bred, self.bgreen, self.bblue, 255))
-            p.end() 
-            self.canvasReturn.emit()
-        elif s[1]=="areaAdd":
-            self.xpos=int(s[2])
-            self.ypos=int(s[3])
-            self.area.append( QtCore.QPointF(self.xpos, self.ypos) )
-            self.canvasReturn.emit()
         elif s[1]=="areaDraw":
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             self.area.append( QtCore.QPointF(self.xpos, self.ypos) )
-            pm=self.painter
-            p=QPainter()
-            p.begin(pm)
             p.setPen(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
             p.setBrush(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
             p.drawPolygon(self.area)
             self.area = QtGui.QPolygonF()
-            self.canvasReturn.emit()
         elif s[1]=="text": 
-            pm=self.painter
-            p=QPainter()
-            p.begin(pm)
             p.setPen(QtGui.QColor(self.pred, self.pgreen, self.pblue, 255))
             self.xpos=int(s[2])
             self.ypos=int(s[3])
             p.setFont(QFont(self.fontStyle, self.fontSize))
             p.drawText(QtCore.QPointF(self.xpos,self.ypos), self.text) 
-            p.end()                 
-            self.canvasReturn.emit()
+        elif s[1]=="blit":
+            # Canvas blit name [x y [sx sy w h]], ohne x y an der Stiftposition
+            img=self.imageCache.get(s[2])
+            if img==None: return
+            if len(s)>4:
+                self.xpos=int(s[3])
+                self.ypos=int(s[4])
+            if len(s)>8: p.drawImage(self.xpos, self.ypos, img, int(s[5]), int(s[6]), int(s[7]), int(s[8]))
+            else: p.drawImage(self.xpos, self.ypos, img)
+    
+    def loadImage(self, path):
+        # decoded once for the imageCache, premultiplied alpha blits fastest
+        img=QImage(path)
+        if img.isNull(): return None
+        return img.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    
+    def canvasCmd(self, s):
+        if s[0]=="HIDESTOPBTN":
+            self.starter.hide()
+        elif s[0]=="SHOWSTOPBTN":
+            self.starter.show()
+        elif s[0]=="HIDETITLEBAR":
+            self.mainwindow.titlebar.hide()
+        elif s[0]=="SHOWTITLEBAR":
+            self.mainwindow.titlebar.show()
+        elif s[0]=="Text":
+            self.fontStyle=s[1]
+            self.fontSize=int(s[2])
+            self.text=" ".join(s[3:])
+        elif s[0]=="Raster":
+            # Raster x y w h data
+            p=QPainter()
+            p.begin(self.painter)
+            p.drawImage(s[1], s[2], QImage(s[5], s[3], s[4], QImage.Format_RGB32))
+            p.end()
+        elif len(s)<2:
+            pass
+        elif s[1]=="show":
+            self.canvas.show()
+        elif s[1]=="hide": 
+            self.canvas.hide()
+        elif s[1]=="square":
+            canvasSize=min(self.mainwindow.width(),self.mainwindow.height())
+            self.canvas.setGeometry(0, 0, canvasSize, canvasSize)
+            self.canvas.setPixmap(QPixmap(canvasSize, canvasSize))
+        elif s[1]=="full":
+            self.canvas.setGeometry(0, 0, self.mainwindow.width(), self.mainwindow.height())
+            self.canvas.setPixmap(QPixmap(self.mainwindow.width(), self.mainwindow.height()))
+        elif s[1]=="clear":
+            if not self.canvasBuffered: self.canvas.setPixmap(QPixmap(self.canvas.width(), self.canvas.height()))
+            pm=self.painter
+            p=QPainter()
+            p.begin(pm)
+            p.setBackgroundMode(Qt.TransparentMode)
+            p.fillRect(0,0,pm.width(),pm.height(),QtGui.QColor(self.bred,self.bgreen,self.bblue,255)) #50, 125, 195
+            p.end()
+            if not self.canvasBuffered: self.canvas.setPixmap(QPixmap.fromImage(self.painter))
+        elif s[1]=="buffer":
+            # Canvas buffer on: clear und load erscheinen erst mit update
+            self.canvasBuffered=(len(s)>2 and s[2]=="on")
+        elif s[1]=="update":
+            self.canvas.setPixmap(QPixmap.fromImage(self.painter))
+            self.canvas.repaint()
+        elif s[1]=="origin":
+            self.painter=self.painter.copy(self.xpos, self.ypos, self.painter.width(), self.painter.height())
+        elif s[1]=="log":
+            pm=self.canvas.pixmap()
+            try:
+                lfn=os.path.join(logdir, "img"+time.strftime("%Y%m%d-%H%M%S")+".png")
+                pm.save(lfn,"",90)
+            except:
+                pass
+        elif s[1]=="load":
+            try:
+                img=self.imageCache.get(s[2])
+                if img!=None:
+                    self.painter=img.convertToFormat(QImage.Format_RGB32)
+                    self.painter.setDotsPerMeterX(3780)
+                    self.painter.setDotsPerMeterY(3780)
+                    if not self.canvasBuffered: self.canvas.setPixmap(QPixmap.fromImage(self.painter))
+            except:
+                pass
+        elif s[1]=="move":
+            self.xpos=int(s[2])
+            self.ypos=int(s[3])
+        elif s[1]=="areaAdd":
+            self.xpos=int(s[2])
+            self.ypos=int(s[3])
+            self.area.append( QtCore.QPointF(self.xpos, self.ypos) )
         elif s[1]=="pen": # Color pen r g b
             self.pred=min(max(int(s[2]),0),255)
             self.pgreen=min(max(int(s[3]),0),255)
             self.pblue=min(max(int(s[4]),0),255)
-            self.canvasReturn.emit()
         elif s[1]=="paper": # Color paper r g b
             self.bred=min(max(int(s[2]),0),255)
             self.bgreen=min(max(int(s[3]),0),255)
             self.bblue=min(max(int(s[4]),0),255)
-            self.canvasReturn.emit()        
-        
-            
         
     def messageBox(self, stack):
         msg=stack.split("'")
@@ -9114,8 +4332,7 @@ class FtcGuiApplication(TouchApplication):
 
     def copyCodeLine(self):
         row=self.proglist.currentRow()
-        i=self.proglist.item(row).text()
-        self.proglist.insertItem(row+1,i)
+        self.program.insert(row+1, [self.program.text(row)])
         self.proglist.setCurrentRow(row+1)
         
         self.codeSaved=False
@@ -9195,6 +4412,7 @@ class FtcGuiApplication(TouchApplication):
                              QCoreApplication.translate("addcodeline","QueryVar"),
                              QCoreApplication.translate("addcodeline","IfVar"),
                              QCoreApplication.translate("addcodeline","Calc"),
+                             QCoreApplication.translate("addcodeline","Expr"),
                              QCoreApplication.translate("addcodeline","Arrays")
                             ]
                           )
@@ -9238,6 +4456,8 @@ class FtcGuiApplication(TouchApplication):
                     ftb.setButtons([    QCoreApplication.translate("addcodeline","ArrayInit"),
                                         QCoreApplication.translate("addcodeline","Array"),
                                         QCoreApplication.translate("addcodeline","ArrayStat"),
+                                        QCoreApplication.translate("addcodeline","ArrayCalc"),
+                                        QCoreApplication.translate("addcodeline","ArrayProc"),
                                         QCoreApplication.translate("addcodeline","QueryArray"),
                                         QCoreApplication.translate("addcodeline","LookUpTable"),
                                         QCoreApplication.translate("addcodeline","ArrayLoad"),
@@ -9255,6 +4475,8 @@ class FtcGuiApplication(TouchApplication):
                     if   p2==QCoreApplication.translate("addcodeline","ArrayInit"): self.acl_ArrayInit()
                     elif p2==QCoreApplication.translate("addcodeline","Array"):     self.acl_Array()
                     elif p2==QCoreApplication.translate("addcodeline","ArrayStat"): self.acl_ArrayStat()
+                    elif p2==QCoreApplication.translate("addcodeline","ArrayCalc"): self.acl_ArrayCalc()
+                    elif p2==QCoreApplication.translate("addcodeline","ArrayProc"): self.acl_ArrayProc()
                     elif p2==QCoreApplication.translate("addcodeline","QueryArray"): self.acl_QueryArray()
                     elif p2==QCoreApplication.translate("addcodeline","LookUpTable"): self.acl_LookUpTable()
                     elif p2==QCoreApplication.translate("addcodeline","ArrayLoad"): self.acl_ArrayLoad()
@@ -9263,6 +4485,7 @@ class FtcGuiApplication(TouchApplication):
                 elif p==QCoreApplication.translate("addcodeline","QueryVar"):   self.acl_queryVar()  
                 elif p==QCoreApplication.translate("addcodeline","IfVar"):      self.acl_ifVar()                
                 elif p==QCoreApplication.translate("addcodeline","Calc"):       self.acl_calc()
+                elif p==QCoreApplication.translate("addcodeline","Expr"):       self.acl_expr()
                 
         elif r==QCoreApplication.translate("addcodeline","Controls"):
             ftb=TouchAuxMultibutton(QCoreApplication.translate("addcodeline","Controls"), self.mainwindow)
@@ -9355,7 +4578,8 @@ class FtcGuiApplication(TouchApplication):
                                     QCoreApplication.translate("addcodeline","Pen"),
                                     QCoreApplication.translate("addcodeline","Color"),
                                     QCoreApplication.translate("addcodeline","Text"),
-                                    QCoreApplication.translate("addcodeline","VarToText")
+                                    QCoreApplication.translate("addcodeline","VarToText"),
+                                    QCoreApplication.translate("addcodeline","Raster")
                                     ]
                                 )
                     ftb.setTextSize(3)
@@ -9370,6 +4594,8 @@ class FtcGuiApplication(TouchApplication):
                                             QCoreApplication.translate("addcodeline","Update"),
                                             QCoreApplication.translate("addcodeline","Origin"),
                                             QCoreApplication.translate("addcodeline","Load"),
+                                            QCoreApplication.translate("addcodeline","Blit"),
+                                            QCoreApplication.translate("addcodeline","Buffer"),
                                             QCoreApplication.translate("addcodeline","Log")
                                             ]
                                         )
@@ -9382,12 +4608,15 @@ class FtcGuiApplication(TouchApplication):
                             elif p==QCoreApplication.translate("addcodeline","Update"):   self.acl_canvas_update()
                             elif p==QCoreApplication.translate("addcodeline","Origin"):   self.acl_canvas_origin()
                             elif p==QCoreApplication.translate("addcodeline","Load"):     self.acl_canvas_load()
+                            elif p==QCoreApplication.translate("addcodeline","Blit"):     self.acl_canvas_blit()
+                            elif p==QCoreApplication.translate("addcodeline","Buffer"):   self.acl_canvas_buffer()
                             elif p==QCoreApplication.translate("addcodeline","Log"):      self.acl_canvas_log()
                              
                         elif p==QCoreApplication.translate("addcodeline","Pen"):       self.acl_pen()
                         elif p==QCoreApplication.translate("addcodeline","Text"):      self.acl_text()
                         elif p==QCoreApplication.translate("addcodeline","Color"):     self.acl_color()
                         elif p==QCoreApplication.translate("addcodeline","VarToText"): self.acl_varToText()
+                        elif p==QCoreApplication.translate("addcodeline","Raster"):    self.acl_raster()
                 elif p==QCoreApplication.translate("addcodeline","Touch"):
                     ftb=TouchAuxMultibutton(QCoreApplication.translate("addcodeline","Touch"), self.mainwindow)
                     ftb.setButtons([ QCoreApplication.translate("addcodeline","WaitForTouch"),
@@ -9406,6 +4635,8 @@ class FtcGuiApplication(TouchApplication):
                     ftb=TouchAuxMultibutton(QCoreApplication.translate("addcodeline","Comm"), self.mainwindow)
                     ftb.setButtons([ QCoreApplication.translate("addcodeline","I2CWrite"),
                                     QCoreApplication.translate("addcodeline","I2CRead"),
+                                    QCoreApplication.translate("addcodeline","I2CScript"),
+                                    QCoreApplication.translate("addcodeline","I2CBurst"),
                                     QCoreApplication.translate("addcodeline","USBWrite"),
                                     QCoreApplication.translate("addcodeline","USBRead")
                                     ]
@@ -9416,14 +4647,17 @@ class FtcGuiApplication(TouchApplication):
                     if t:
                         if   p==QCoreApplication.translate("addcodeline","I2CWrite"):   self.acl_i2cwrite()
                         elif p==QCoreApplication.translate("addcodeline","I2CRead"): self.acl_i2cread()                          
+                        elif p==QCoreApplication.translate("addcodeline","I2CScript"): self.acl_i2cscript()
+                        elif p==QCoreApplication.translate("addcodeline","I2CBurst"): self.acl_i2cburst()
                         elif p==QCoreApplication.translate("addcodeline","USBWrite"):   self.acl_usbwrite()
                         elif p==QCoreApplication.translate("addcodeline","USBRead"): self.acl_usbread()    
     def acl(self,code):
-        self.proglist.insertItem(self.proglist.currentRow()+1,code)
-        self.proglist.setCurrentRow(self.proglist.currentRow()+1)
+        row=self.proglist.currentRow()+1
+        self.program.insert(row, [code])
+        self.proglist.setCurrentRow(row)
         self.progItemDoubleClicked()
         try:
-            s=self.proglist.item(self.proglist.currentRow()).text().split()[1]
+            s=self.program.text(self.proglist.currentRow()).split()[1]
             if s=="RIF" or s=="TXT" or s=="FTD": self.lastIF=s
         except:
             pass
@@ -9446,6 +4680,12 @@ class FtcGuiApplication(TouchApplication):
     def acl_canvas_load(self):
         self.acl("Canvas load canvas.png")        
 
+    def acl_canvas_blit(self):
+        self.acl("Canvas blit canvas.png 0 0")
+        
+    def acl_canvas_buffer(self):
+        self.acl("Canvas buffer on")
+        
     def acl_canvas_log(self):
         self.acl("Canvas log")
         
@@ -9458,6 +4698,9 @@ class FtcGuiApplication(TouchApplication):
     def acl_varToText(self):
         self.acl("VarToText Serif 15 ?")
         
+    def acl_raster(self):
+        self.acl("Raster read data 0 0 16 16 gray")
+        
     def acl_color(self):
         self.acl("Color pen 255 0 0")
     
@@ -9533,6 +4776,9 @@ class FtcGuiApplication(TouchApplication):
     def acl_calc(self):
         self.acl("Calc x 1 + 1")
     
+    def acl_expr(self):
+        self.acl("Expr x (1 + 1) * 2")
+    
     def acl_stop(self):
         self.acl("Stop")
     
@@ -9595,6 +4841,7 @@ class FtcGuiApplication(TouchApplication):
         ftb.setButtons([ QCoreApplication.translate("addcodeline","Log On"),
                             QCoreApplication.translate("addcodeline","Log Off"),
                             QCoreApplication.translate("addcodeline","Log Silent"),
+                            QCoreApplication.translate("addcodeline","Log Binary"),
                             QCoreApplication.translate("addcodeline","Log Clear")
                         ]
                         )
@@ -9605,6 +4852,7 @@ class FtcGuiApplication(TouchApplication):
             if   p == QCoreApplication.translate("addcodeline","Log On"):   self.acl("Log 1")
             elif p == QCoreApplication.translate("addcodeline","Log Off"):  self.acl("Log 0")
             elif p == QCoreApplication.translate("addcodeline","Log Silent"):  self.acl("Log silent")
+            elif p == QCoreApplication.translate("addcodeline","Log Binary"):  self.acl("Log binary")
             elif p == QCoreApplication.translate("addcodeline","Log Clear"):self.acl("Log Clear")
     
     def acl_clear(self):
@@ -9622,6 +4870,12 @@ class FtcGuiApplication(TouchApplication):
     def acl_ArrayStat(self):
         self.acl("ArrayStat integer sizeOf data")
     
+    def acl_ArrayCalc(self):
+        self.acl("ArrayCalc data data + 0")
+    
+    def acl_ArrayProc(self):
+        self.acl("ArrayProc data sortUp data 1")
+    
     def acl_ArrayLoad(self):
         self.acl("ArrayLoad data byName")
     
@@ -9640,6 +4894,12 @@ class FtcGuiApplication(TouchApplication):
     def acl_i2cread(self):
         self.acl("I2CRead FTD array")
 
+    def acl_i2cscript(self):
+        self.acl("I2CScript FTD script result")
+
+    def acl_i2cburst(self):
+        self.acl("I2CBurst FTD script result 100")
+
     def acl_usbwrite(self):
         self.acl("USBWrite FTD command array")
     
@@ -9648,9 +4908,10 @@ class FtcGuiApplication(TouchApplication):
     
     def remCodeLine(self):
         row=self.proglist.currentRow()
-        void=self.proglist.takeItem(row)
-        if self.proglist.count()==0:
-            self.proglist.addItem("# new")
+        if row<0: return
+        self.program.remove(row)
+        if self.program.count()==0:
+            self.program.insert(0, ["# new"])
             self.proglist.setCurrentRow(0)
         
         self.codeSaved=False
@@ -9658,16 +4919,14 @@ class FtcGuiApplication(TouchApplication):
     def lineUp(self):
         row=self.proglist.currentRow()
         if row>0:
-            i=self.proglist.takeItem(row)
-            self.proglist.insertItem(row-1,i)
+            self.program.move(row, row-1)
             self.proglist.setCurrentRow(row-1)
             self.codeSaved=False
     
     def lineDown(self):
         row=self.proglist.currentRow()
-        if row<self.proglist.count()-1:
-            i=self.proglist.takeItem(row)
-            self.proglist.insertItem(row+1,i)
+        if row>=0 and row<self.program.count()-1:
+            self.program.move(row, row+1)
             self.proglist.setCurrentRow(row+1)
             self.codeSaved=False
 #
@@ -9675,13 +4934,10 @@ class FtcGuiApplication(TouchApplication):
 #
     def progItemDoubleClicked(self):
         crow=self.proglist.currentRow()
-        itm=self.proglist.item(crow).text()
+        itm=self.program.text(crow)
         stack=itm.split()
         
-        vari=[]
-        for i in range(0,self.proglist.count()):
-            s=self.proglist.item(i).text().split()
-            if s[0]=="Init" and not (s[1] in vari): vari.append(s[1])
+        vari=self.program.names("Init")
         
         if   stack[0] == "CounterClear": itm=self.ecl_counterClear(itm)
         elif stack[0] == "Output":     itm=self.ecl_output(itm, vari)
@@ -9705,6 +4961,7 @@ class FtcGuiApplication(TouchApplication):
         elif stack[0] == "IfVar":      itm=self.ecl_ifVar(itm, vari)
         elif stack[0] == "IfTouchArea": itm=self.ecl_ifTouchArea(itm, vari)
         elif stack[0] == "Calc":       itm=self.ecl_calc(itm, vari)
+        elif stack[0] == "Expr":       itm=self.ecl_expr(itm, vari)
         elif stack[0] == "#":          itm=self.ecl_comment(itm)
         elif stack[0] == "Tag":        itm=self.ecl_tag(itm)
         elif stack[0] == "Jump":       itm=self.ecl_jump(itm)
@@ -9725,26 +4982,32 @@ class FtcGuiApplication(TouchApplication):
         elif stack[0] == "Color":      itm=self.ecl_color(itm, vari)
         elif stack[0] == "Text":       itm=self.ecl_text(itm, vari)
         elif stack[0] == "VarToText":  itm=self.ecl_varToText(itm, vari)
+        elif stack[0] == "Raster":     itm=self.ecl_raster(itm)
         elif stack[0] == "Canvas":
             if stack[1] == "load":     itm=self.ecl_canvas_load(itm)
+            elif stack[1] == "blit":   itm=self.ecl_canvas_blit(itm)
         elif stack[0] == "ArrayInit":  itm=self.ecl_ArrayInit(itm)
         elif stack[0] == "Array":      itm=self.ecl_Array(itm, vari)
         elif stack[0] == "ArrayStat":  itm=self.ecl_ArrayStat(itm, vari)
+        elif stack[0] == "ArrayCalc":  itm=self.ecl_ArrayCalc(itm, vari)
+        elif stack[0] == "ArrayProc":  itm=self.ecl_ArrayProc(itm, vari)
         elif stack[0] == "ArrayLoad":  itm=self.ecl_ArrayLoad(itm)
         elif stack[0] == "ArraySave":  itm=self.ecl_ArraySave(itm)
         elif stack[0] == "QueryArray": itm=self.ecl_QueryArray(itm)
         elif stack[0] == "LookUpTable": itm=self.ecl_LookUpTable(itm, vari)
         elif stack[0] == "I2CRead":     itm=self.ecl_I2CRead(itm)
         elif stack[0] == "I2CWrite":    itm=self.ecl_I2CWrite(itm)
+        elif stack[0] == "I2CScript":   itm=self.ecl_I2CScript(itm)
+        elif stack[0] == "I2CBurst":    itm=self.ecl_I2CScript(itm)
         elif stack[0] == "USBRead":     itm=self.ecl_USBRead(itm)
         elif stack[0] == "USBWrite":    itm=self.ecl_USBWrite(itm)        
         
         self.proglist.setCurrentRow(crow)
-        self.proglist.item(crow).setText(itm)
+        self.program.setText(crow, itm)
         self.codeSaved=False
         
         try:
-            s=self.proglist.item(self.proglist.currentRow()).text().split()[1]
+            s=itm.split()[1]
             if s=="RIF" or s=="TXT" or s=="FTD": self.lastIF=s
         except:
             pass
@@ -9763,11 +5026,7 @@ class FtcGuiApplication(TouchApplication):
         return True
     
     def checkArrays(self, title):
-        arrays=[]
-        for i in range(0,self.proglist.count()):
-            if self.proglist.item(i).text().split()[0]=="ArrayInit": 
-                a=self.proglist.item(i).text().split()[1]
-                if not a in arrays: arrays.append(a)
+        arrays=self.program.names("ArrayInit")
 
         if arrays==[]:
             t=TouchMessageBox(title, self.mainwindow)
@@ -9780,10 +5039,7 @@ class FtcGuiApplication(TouchApplication):
         return arrays
     
     def checkTags(self, title):
-        tagteam=[]
-  
-        for i in range(0,self.proglist.count()):
-            if self.proglist.item(i).text().split()[0]=="Tag": tagteam.append(self.proglist.item(i).text()[3:])
+        tagteam=[l[3:] for l in self.program.find("Tag")]
 
         if tagteam==[]:
             t=TouchMessageBox(title, self.mainwindow)
@@ -9896,6 +5152,15 @@ class FtcGuiApplication(TouchApplication):
         
         return editCalc(itm, varlist, self.mainwindow).exec_()
         
+    def ecl_expr(self, itm, varlist):
+        if self.checkVar(QCoreApplication.translate("ecl","Expr"),varlist)==False: return itm
+        
+        stack=itm.split()
+        if len(stack)<2: stack.append("")
+        v=queryVarName(varlist, stack[1])
+        e=" ".join(stack[2:])
+        return "Expr "+v+" "+TouchAuxKeyboard(QCoreApplication.translate("ecl","Expr"),e,self.mainwindow).exec_()
+        
     def ecl_comment(self, itm):
         return "# "+TouchAuxKeyboard(QCoreApplication.translate("ecl","Comment"),itm[2:],self.mainwindow).exec_()
     
@@ -9957,8 +5222,7 @@ class FtcGuiApplication(TouchApplication):
             tagteam=os.listdir(moddir)
             tagteam.sort()
         else:    
-            for i in range(0,self.proglist.count()):
-                if self.proglist.item(i).text().split()[0]=="Module": tagteam.append(self.proglist.item(i).text()[7:])
+            tagteam=[l[7:] for l in self.program.find("Module")]
   
         if len(tagteam)==0:
             t=TouchMessageBox(QCoreApplication.translate("ecl","Interrupt"), self.mainwindow)
@@ -9984,8 +5248,7 @@ class FtcGuiApplication(TouchApplication):
             tagteam=os.listdir(moddir)
             tagteam.sort()
         else:    
-            for i in range(0,self.proglist.count()):
-                if self.proglist.item(i).text().split()[0]=="Module": tagteam.append(self.proglist.item(i).text()[7:])
+            tagteam=[l[7:] for l in self.program.find("Module")]
   
         if len(tagteam)==0:
             t=TouchMessageBox(QCoreApplication.translate("ecl","Call"), self.mainwindow)
@@ -10028,6 +5291,11 @@ class FtcGuiApplication(TouchApplication):
         
         return "RIFShift "+str(v)
 
+    def ecl_raster(self, itm):
+        arrays=self.checkArrays("Raster")
+        if arrays==[]: return itm
+        return "Raster "+TouchAuxKeyboard(QCoreApplication.translate("ecl","Raster"),itm[7:],self.mainwindow).exec_()
+    
     def ecl_canvas_load(self, itm):
         
         select=itm.split()[2]
@@ -10052,6 +5320,12 @@ class FtcGuiApplication(TouchApplication):
 
         return itm
     
+    def ecl_canvas_blit(self, itm):
+        stack=itm.split()+["-"]
+        name=self.ecl_canvas_load("Canvas load "+stack[2]).split()[2]
+        pos=TouchAuxKeyboard(QCoreApplication.translate("ecl","x y [sx sy w h]")," ".join(stack[3:-1]),self.mainwindow).exec_()
+        return "Canvas blit "+name+" "+pos
+    
     def ecl_pen(self, itm, vari):
         return editPen(itm, vari, self.mainwindow).exec_()
     
@@ -10067,11 +5341,7 @@ class FtcGuiApplication(TouchApplication):
         return editVarToText(itm, vari, self.mainwindow).exec_()
     
     def ecl_ArrayInit(self,itm):
-        arrays=[]
-        for i in range(0,self.proglist.count()):
-            if self.proglist.item(i).text().split()[0]=="ArrayInit": 
-                a=self.proglist.item(i).text().split()[1]
-                if not a in arrays: arrays.append(a)
+        arrays=self.program.names("ArrayInit")
                 
         return editArrayInit(itm, arrays, self.mainwindow).exec_()
 
@@ -10091,6 +5361,18 @@ class FtcGuiApplication(TouchApplication):
         
         return editArrayStat(itm, vari, arrays, self.mainwindow).exec_()
     
+    def ecl_ArrayCalc(self, itm, vari):
+        arrays=self.checkArrays(QCoreApplication.translate("ecl","ArrayCalc"))
+        if arrays==[]: return itm
+        
+        return editArrayCalc(itm, vari, arrays, self.mainwindow).exec_()
+    
+    def ecl_ArrayProc(self, itm, vari):
+        arrays=self.checkArrays(QCoreApplication.translate("ecl","ArrayProc"))
+        if arrays==[]: return itm
+        
+        return editArrayProc(itm, vari, arrays, self.mainwindow).exec_()
+    
     def ecl_ArrayLoad(self, itm):
         arrays=self.checkArrays(QCoreApplication.translate("ecl","ArrayLoad"))
         if arrays==[]: return itm
@@ -10134,6 +5416,11 @@ class FtcGuiApplication(TouchApplication):
         if arrays==[]: return itm
         return editI2CWrite(itm, arrays, self.mainwindow)
 
+    def ecl_I2CScript(self, itm):
+        arrays=self.checkArrays(itm.split()[0])
+        if arrays==[]: return itm
+        return editComm(itm, itm.split()[0], arrays, self.mainwindow).exec_()
+
     
     def ecl_USBRead(self, itm):
         arrays=self.checkArrays("USBRead")
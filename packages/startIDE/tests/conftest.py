@@ -0,0 +1,3 @@
+# the startIDE modules are imported from the app directory
+import os, sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
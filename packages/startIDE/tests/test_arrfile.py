@@ -0,0 +1,71 @@
+import os
+from array import array
+
+import pytest
+
+import arrfile
+
+def test_text_round_trip(tmp_path):
+    fname=str(tmp_path/"a.arr")
+    arrfile.writeArray(fname, [1, -2, 300])
+    assert open(fname).read()=="1;-2;300;"
+    assert not arrfile.isBinary(fname)
+    assert list(arrfile.readArray(fname))==[1, -2, 300]
+
+def test_text_without_trailing_separator(tmp_path):
+    fname=str(tmp_path/"a.arr")
+    with open(fname, "w") as f: f.write("1; 2;3\n")
+    assert list(arrfile.readArray(fname))==[1, 2, 3]
+
+def test_parse_text():
+    assert arrfile.parseText("")==[]
+    assert arrfile.parseText("4;5;")==[4, 5]
+    with pytest.raises(ValueError):
+        arrfile.parseText("1;x;2;")
+
+@pytest.mark.parametrize("data,typecode", [([1, -128, 127], "b"), ([1000, -5], "h"),
+                                           ([2**31-1], "i"), ([2**40, -1], "q"), ([], "b")])
+def test_binary_round_trip(tmp_path, data, typecode):
+    fname=str(tmp_path/"a.arr")
+    arrfile.writeArray(fname, data, True)
+    assert arrfile.isBinary(fname)
+    with open(fname, "rb") as f:
+        assert arrfile.readHeader(f)==(typecode, len(data))
+    a=arrfile.readArray(fname)
+    assert a.typecode=="q"
+    assert list(a)==data
+
+def test_append_creates_binary_file(tmp_path):
+    fname=str(tmp_path/"a.arr")
+    arrfile.appendArray(fname, [1, 2])
+    arrfile.appendArray(fname, [])
+    arrfile.appendArray(fname, [3])
+    assert arrfile.isBinary(fname)
+    assert list(arrfile.readArray(fname))==[1, 2, 3]
+
+def test_append_widens_binary_file(tmp_path):
+    fname=str(tmp_path/"a.arr")
+    arrfile.writeArray(fname, [1, 2], True)
+    arrfile.appendArray(fname, [2**40])
+    with open(fname, "rb") as f:
+        assert arrfile.readHeader(f)==("q", 3)
+    assert list(arrfile.readArray(fname))==[1, 2, 2**40]
+
+def test_append_to_text_file(tmp_path):
+    fname=str(tmp_path/"a.arr")
+    arrfile.writeArray(fname, [1, 2])
+    arrfile.appendArray(fname, [3, 4])
+    assert not arrfile.isBinary(fname)
+    assert arrfile.toText(fname)=="1;2;3;4;"
+
+def test_truncated_binary_file(tmp_path):
+    # the header counts more items than the file holds
+    fname=str(tmp_path/"a.arr")
+    arrfile.writeArray(fname, [1, 2, 3, 4], True)
+    with open(fname, "r+b") as f: f.truncate(os.path.getsize(fname)-1)
+    assert list(arrfile.readArray(fname))==[1, 2, 3]
+
+def test_read_typecode(tmp_path):
+    fname=str(tmp_path/"a.arr")
+    arrfile.writeArray(fname, [5, 6], True)
+    assert arrfile.readArray(fname, "i")==array("i", [5, 6])
@@ -0,0 +1,69 @@
+import pytest
+import codegen
+
+def runBlocks(code, jmpTable, memory):
+    # the generated blocks on their own, without execThread
+    class Thread(object):
+        pass
+    et=Thread()
+    et.memory=memory
+    et.program=[]
+    et.count=0
+    literals={}
+    for line in code:
+        for token in line.split():
+            try:
+                literals[token]=int(token)
+            except ValueError:
+                pass
+    (source, sizes, lines)=codegen.translate(code, jmpTable, literals)
+    blocks=codegen.load(source, et, None)
+    n=0
+    while n<len(code): n=blocks[n]()
+    return memory
+
+def test_blocks():
+    code=["Init a 0",
+          "Init s 0",
+          "Tag top",
+          "Calc a a + 1",
+          "Calc s s + a",
+          "Expr s s - a * 0",
+          "IfVar a < 10 top"]
+    assert runBlocks(code, { "top": 2 }, {})=={ "a": 10, "s": 55 }
+
+def test_calc_like_interpreter():
+    code=["Init a 7", "Init b -2"]+["Init "+v+" 0" for v in "cdefghi"]
+    code+=["Calc c a / b", "Calc d a div b", "Calc e a mod 3",
+          "Calc f a min b", "Calc g a max b", "Calc h a < b", "Calc i a != b"]
+    m=runBlocks(code, {}, {})
+    assert (m["c"], m["d"], m["e"], m["f"], m["g"], m["h"], m["i"])==(-4, -3, 1, -2, 7, 0, 1)
+
+# the same programs run by the interpreter and as Python code
+
+PROGRAMS={
+    "loop":    ["Init a 0", "Init c 0", "Init b 0", "Tag top", "Calc a a + 1", "Calc b a mod 7",
+                "IfVar b == 3 skip", "Calc c c + b", "Tag skip", "IfVar a < 3000 top",
+                "QueryVar a", "QueryVar c"],
+    "missing": ["Init a 0", "Calc a a + 1", "Calc a q + 1", "Print no"],
+    "div0":    ["Init a 0", "Init b 1", "Calc b b / a", "Print no"],
+    "call":    ["Init a 0", "Call m 3", "QueryVar a", "Stop", "Print no", "Module m", "Calc a a + 5", "MEnd"],
+    "return":  ["Init a 0", "Call m", "QueryVar a", "Jump e", "Module m", "Calc a a + 5", "IfVar a > 3 r",
+                "Calc a a + 100", "Tag r", "Return", "MEnd", "Tag e", "Print end"],
+    "loopto":  ["Init a 0", "Tag t", "Calc a a + 1", "Expr a a * 2 - 1", "LoopTo t 3", "QueryVar a",
+                "Calc a 100 sin 30", "QueryVar a"]
+}
+
+@pytest.mark.parametrize("name", sorted(PROGRAMS))
+def test_same_as_interpreter(name, tmp_path, monkeypatch):
+    import headless
+    monkeypatch.setattr(headless.startide, "cachedir", str(tmp_path))
+
+    def run(code):
+        runner=headless.HeadlessRunner(code)
+        runner.run()
+        return [e[2] for e in runner.log.events if e[1]=="Print"]
+
+    out=run(PROGRAMS[name])
+    assert out[-1].startswith("<")
+    assert run(PROGRAMS[name]+["#PYTHON"])==out
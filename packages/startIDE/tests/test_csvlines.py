@@ -0,0 +1,40 @@
+import pytest
+
+index=pytest.importorskip("index")
+from logwriter import LogWriter
+
+def writeLog(fname, messages, binary=False):
+    w=LogWriter(fname, binary)
+    w.start()
+    for m in messages: w.put(m)
+    w.close()
+
+def csv(fname, bucket=0):
+    return [l.rstrip("\n") for l in index.csvLines(fname, bucket)]
+
+EXPECTED=["a;b;", "1;10;", "2;11;", "3;;"]
+
+@pytest.mark.parametrize("buffer", [65536, 2, 1])
+@pytest.mark.parametrize("order", [["a 1", "b 10", "a 2", "b 11", "a 3"],
+                                   ["a 1", "a 2", "a 3", "b 10", "b 11"],
+                                   ["b 10", "b 11", "a 1", "a 2", "a 3"]])
+def test_columns(tmp_path, monkeypatch, buffer, order):
+    monkeypatch.setattr(index, "CSVBUFFER", buffer)
+    fname=str(tmp_path/"log.txt")
+    writeLog(fname, order)
+    lines=csv(fname)
+    if order[0][0]=="b":
+        assert lines==["b;a;", "10;1;", "11;2;", ";3;"]
+    else:
+        assert lines==EXPECTED
+
+def test_empty_log(tmp_path):
+    fname=str(tmp_path/"log.txt")
+    writeLog(fname, [])
+    assert csv(fname)==[";"]
+
+def test_buckets(tmp_path):
+    fname=str(tmp_path/"log.bin")
+    writeLog(fname, ["a 1", "b 2", "a 3"], True)
+    lines=csv(fname, 10)
+    assert lines==["time;a;b", "0.000;3;2"]
@@ -0,0 +1,25 @@
+import pytest
+
+import headless
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(headless.startide, "cachedir", str(tmp_path))
+
+def run(code, trace=None):
+    runner=headless.HeadlessRunner(code, trace)
+    runner.run(5)
+    return [e[2] for e in runner.log.events if e[1]=="Print"]
+
+def test_outputs():
+    runner=headless.HeadlessRunner(["Output TXT 1 512", "Motor TXT 2 l 300", "Motor TXT 2 s 0"])
+    runner.run()
+    assert [e[1:] for e in runner.log.events if e[1]=="TXT"][:3]==[("TXT", "O1", 512), ("TXT", "M2", 300), ("TXT", "M2", 0)]
+
+def test_counter_clear_while_sampled():
+    out=run(["Init n 0", "Delay 100", "CounterClear TXT 1", "FromIn TXT 1 C n", "QueryVar n"], { "TXT": { "C1": 50 } })
+    assert "n: 0" in out
+
+def test_compile_error_is_reported():
+    out=run(["Init a 0", "Expr a "+"("*5000+"1"+")"*5000])
+    assert out[-1]=="<Break in line 1>"
@@ -0,0 +1,35 @@
+import threading, time
+from iosampler import IOSampler
+
+def test_invalidate_drops_sample_under_way():
+    counter=[50]
+    reading=threading.Event()
+    cleared=threading.Event()
+
+    def read():
+        # the first sample reads the counter before it is cleared
+        v=counter[0]
+        if not reading.is_set():
+            reading.set()
+            cleared.wait(1)
+        return v
+
+    smp=IOSampler("test", { ("C", 1): read }, 0.001)
+    smp.start()
+    reading.wait(1)
+
+    counter[0]=0
+    smp.invalidate(("C", 1))
+    cleared.set()
+
+    # the next sample reads the cleared counter
+    end=time.time()+1
+    while smp.values.get(("C", 1))==None and time.time()<end: time.sleep(0.001)
+    smp.stop()
+    assert smp.values[("C", 1)]==0
+
+def test_edges():
+    level=iter([0, 1, 1, 0, 1]+[1]*1000)
+    smp=IOSampler("test", { ("S", 1): lambda: next(level) }, 0)
+    for cycle in range(1, 6): smp.sample(cycle)
+    assert (smp.rising[("S", 1)], smp.falling[("S", 1)], smp.edges(("S", 1)))==(2, 1, 3)
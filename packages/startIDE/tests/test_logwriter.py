@@ -0,0 +1,75 @@
+import pytest
+
+from logwriter import LogWriter, readLog
+
+def writeLog(fname, messages, binary):
+    w=LogWriter(fname, binary)
+    w.start()
+    for m in messages: w.put(m)
+    w.close()
+
+MESSAGES=["a 1", "b -5", "a 2", "text hello world", "big "+str(2**70), "empty"]
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_round_trip(tmp_path, binary):
+    fname=str(tmp_path/("log.bin" if binary else "log.txt"))
+    writeLog(fname, MESSAGES, binary)
+    records=list(readLog(fname))
+    assert [(r[1], r[2]) for r in records]==[("a","1"), ("b","-5"), ("a","2"), ("text","hello world"),
+                                             ("big",str(2**70)), ("empty","")]
+    if binary: assert all(r[0]!=None for r in records)
+    else: assert all(r[0]==None for r in records)
+
+def test_truncated_binary_log(tmp_path):
+    fname=str(tmp_path/"log.bin")
+    writeLog(fname, ["a 1", "a 2"], True)
+    data=open(fname, "rb").read()
+    open(fname, "wb").write(data[:-3])
+    assert [r[2] for r in readLog(fname)]==["1"]
+
+class FailingFile(object):
+    # writes only a part of the data the given number of times, then fails
+    def __init__(self, f, failures):
+        self.f=f
+        self.failures=failures
+    def write(self, data):
+        if self.failures>0:
+            self.failures=self.failures-1
+            self.f.write(data[:len(data)//2+1])
+            raise OSError("disk full")
+        return self.f.write(data)
+    def tell(self): return self.f.tell()
+    def seek(self, offset): return self.f.seek(offset)
+    def truncate(self): return self.f.truncate()
+    def fileno(self): return self.f.fileno()
+    def close(self): self.f.close()
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_failed_write_keeps_records(tmp_path, binary):
+    fname=str(tmp_path/"log")
+    errors=[]
+    w=LogWriter(fname, binary, errors.append)
+    w.file=FailingFile(w.file, 2)
+    for m in ["a 1", "b 2"]: w.put(m)
+    for i in range(2):
+        with pytest.raises(OSError): w.write()
+        w.report(OSError("disk full"))
+    assert len(w.queue)==2
+    w.write()
+    assert len(w.queue)==0
+    w.file.close()
+    assert [(r[1], r[2]) for r in readLog(fname)]==[("a","1"), ("b","2")]
+    assert errors==["Logfile error:\ndisk full"]
+
+def test_too_many_names_reported(tmp_path):
+    fname=str(tmp_path/"log.bin")
+    errors=[]
+    w=LogWriter(fname, True, errors.append)
+    w.names={str(i): i for i in range(65536)}
+    w.put("new 1")
+    w.put("0 5")
+    w.write()
+    w.file.close()
+    assert len(w.queue)==0
+    assert w.dropped==1
+    assert len(errors)==1
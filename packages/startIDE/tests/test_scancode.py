@@ -0,0 +1,57 @@
+import os, json
+import pytest
+
+# headless bringt Ersatz fuer PyQt4 und TouchStyle mit, wo sie fehlen
+import headless
+import startide
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(startide, "cachedir", str(tmp_path / "cache"))
+    monkeypatch.setattr(startide, "moddir", str(tmp_path / "modules"))
+    os.mkdir(startide.cachedir)
+    os.mkdir(startide.moddir)
+    return startide.cachedir
+
+def thread(code):
+    return startide.execThread(list(code), None, None, None, None, None, None, headless.HeadlessParent())
+
+def test_key_depends_on_code_and_version(monkeypatch):
+    a=thread(["Init a 1", "Print a"])
+    assert a.codeKey()==thread(["Init a 1", "Print a"]).codeKey()
+    assert a.codeKey()!=thread(["Init a 2", "Print a"]).codeKey()
+    key=a.codeKey()
+    monkeypatch.setattr(startide, "CACHEVERSION", startide.CACHEVERSION+1)
+    assert a.codeKey()!=key
+
+def test_save_and_load(cache):
+    et=thread(["Tag top", "Output TXT 1 1", "Jump top"])
+    assert et.loadCodeInfo()==None
+    info=et.scanCode()
+    et.saveCodeInfo(info)
+    assert os.path.exists(os.path.join(cache, et.codeKey()+".json"))
+    assert et.loadCodeInfo()==json.loads(json.dumps(info))
+    assert et.loadCodeInfo()["requireTXT"]
+    assert et.loadCodeInfo()["jmpTable"]=={ "top": 0 }
+
+def test_changed_module_is_scanned_again():
+    with open(os.path.join(startide.moddir, "m"), "w", encoding="utf-8") as f:
+        json.dump(["Module m", "MEnd"], f)
+    et=thread(["CallExt m"])
+    et.saveCodeInfo(et.scanCode())
+    assert et.loadCodeInfo()["impmod"]==["m"]
+
+    with open(os.path.join(startide.moddir, "m"), "w", encoding="utf-8") as f:
+        json.dump(["Module m", "Print changed", "MEnd"], f)
+    assert et.loadCodeInfo()==None
+
+def test_eviction(cache, monkeypatch):
+    monkeypatch.setattr(startide, "CACHEMAX", 3)
+    keys=[]
+    for i in range(0, 5):
+        et=thread(["Init a "+str(i)])
+        et.saveCodeInfo(et.scanCode())
+        keys.append(et.codeKey())
+        # die Reihenfolge kommt aus der Aenderungszeit
+        os.utime(os.path.join(cache, keys[-1]+".json"), (i, i))
+    assert sorted(os.listdir(cache))==sorted([k+".json" for k in keys[-3:]])
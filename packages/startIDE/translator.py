@@ -148,6 +148,18 @@ def translate(string, locale = LOCAL):
     elif string == "to .CSV":
         if locale == "de": return "in .CSV-Format"
         if locale == "fr": return "en .CSV"
+    elif string == "as .CSV":
+        if locale == "de": return "im .CSV-Format herunter."
+        if locale == "fr": return "en .CSV"
+    elif string == "profiler report":
+        if locale == "de": return "Laufzeitprofil"
+        if locale == "fr": return "rapport de profilage"
+    elif string == "Download a profiler report from your TXT":
+        if locale == "de": return "Lade ein Laufzeitprofil vom TXT herunter:"
+        if locale == "fr": return "T&eacute;l&eacute;charger un rapport de profilage depuis le TXT"
+    elif string == "Please select profiler report:":
+        if locale == "de": return "Bitte Laufzeitprofil ausw&auml;hlen:"
+        if locale == "fr": return "Veuillez s&eacute;lectionner le rapport de profilage:"
     elif string == "<b><u>Experts corner</b></u>":
         if locale == "de": return "<b><u>Experten-Ecke</b></u>"
         if locale == "fr": return "<b><u>Paroles d'experts</b></u>"